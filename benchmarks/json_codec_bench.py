@@ -0,0 +1,98 @@
+# -------------------------------------------------------------------------
+# Copyright (c) PTC Inc. and/or all its affiliates. All rights reserved.
+# See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+# JSON Codec Benchmark - compares the encode and decode throughput of the JSON codecs available
+# to the server class on large synthetic tag payloads. No Kepware instance is needed.
+# Usage - python benchmarks/json_codec_bench.py [--tags N] [--repeat N]
+
+import os, sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import argparse
+import codecs
+import json
+import time
+from kepconfig.structures import JsonCodec
+from kepconfig.helpers.codec import _OrjsonCodec, _UjsonCodec
+
+def make_tags(count):
+    '''Returns a list of *count* tag objects shaped like those returned by Kepware.'''
+    return [{
+        "PROJECT_ID": 1234567890,
+        "common.ALLTYPES_NAME": f"Tag{x}",
+        "common.ALLTYPES_DESCRIPTION": f"Synthetic tag {x} for the codec benchmark",
+        "servermain.TAG_ADDRESS": f"R{x:05d}",
+        "servermain.TAG_DATA_TYPE": x % 10,
+        "servermain.TAG_READ_WRITE_ACCESS": 1,
+        "servermain.TAG_SCAN_RATE_MILLISECONDS": 100,
+        "servermain.TAG_AUTOGENERATED": False,
+        "servermain.TAG_SCALING_TYPE": 0,
+        "servermain.TAG_SCALING_RAW_LOW": 0,
+        "servermain.TAG_SCALING_RAW_HIGH": 1000,
+        "servermain.TAG_SCALING_SCALED_LOW": 0.0,
+        "servermain.TAG_SCALING_SCALED_HIGH": 1000.0,
+        "servermain.TAG_SCALING_UNITS": "°C"
+    } for x in range(count)]
+
+class _BaselineCodec(JsonCodec):
+    '''Encoding and decoding as done before codecs were added, with an extra copy to strip the BOM.'''
+    name = 'baseline'
+
+    def decode(self, data):
+        return json.loads(codecs.decode(data, 'utf-8-sig'))
+
+def available_codecs():
+    found = [_BaselineCodec(), JsonCodec()]
+    for codec in (_OrjsonCodec, _UjsonCodec):
+        try:
+            found.append(codec())
+        except ImportError:
+            pass
+    return found
+
+def best_time(fn, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def run(tag_count, repeat):
+    '''Returns a list of dicts with the best encode and decode times of every codec installed.'''
+    tags = make_tags(tag_count)
+    # Kepware responses start with a UTF-8 byte order mark
+    body = codecs.BOM_UTF8 + json.dumps(tags).encode('utf-8')
+    results = []
+    for codec in available_codecs():
+        assert codec.decode(body) == tags
+        encode = best_time(lambda: codec.encode(tags), repeat)
+        decode = best_time(lambda: codec.decode(body), repeat)
+        results.append({
+            'codec': codec.name,
+            'tags': tag_count,
+            'bytes': len(body),
+            'encode_seconds': encode,
+            'decode_seconds': decode,
+            'encode_mb_per_s': len(body) / encode / 1e6,
+            'decode_mb_per_s': len(body) / decode / 1e6
+        })
+    return results
+
+def main(argv = None):
+    parser = argparse.ArgumentParser(description='Compare the throughput of the JSON codecs on synthetic tag payloads.')
+    parser.add_argument('--tags', type=int, default=50000, help='number of tags in the payload (default: 50000)')
+    parser.add_argument('--repeat', type=int, default=5, help='runs per measurement, the best is kept (default: 5)')
+    args = parser.parse_args(argv)
+
+    results = run(args.tags, args.repeat)
+    print(f'{args.tags} tags, {results[0]["bytes"] / 1e6:.1f} MB body, best of {args.repeat}')
+    print(f'{"codec":<10}{"encode MB/s":>14}{"decode MB/s":>14}')
+    for r in results:
+        print(f'{r["codec"]:<10}{r["encode_mb_per_s"]:>14.1f}{r["decode_mb_per_s"]:>14.1f}')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,250 @@
+# -------------------------------------------------------------------------
+# Copyright (c) PTC Inc. and/or all its affiliates. All rights reserved.
+# See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+# SDK Benchmark - measures the throughput and latency of common SDK operations against the local
+# Configuration API stand-in at several project sizes and writes the results to a JSON file so runs
+# can be compared across versions. No Kepware instance is needed.
+# Usage - python benchmarks/sdk_bench.py [--sizes N,N | --spec SPEC] [--repeat N] [--latency SECONDS] [--output FILE]
+#         [--compare FILE] [--codec]
+
+import os, sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import argparse
+import datetime
+import json
+import math
+import platform
+import time
+import kepconfig
+from kepconfig.connectivity import channel, device, tag
+from kepconfig.helpers.codec import _default_codec
+from kepconfig.iot_gateway import agent, iot_items
+from kepconfig.testing import ProjectSpec, StandInServer, generate_project
+import json_codec_bench
+
+SCENARIOS = ('bulk_tag_add', 'structure_read', 'structure_walk', 'iot_item_add', 'log_read', 'export', 'import')
+
+CH_NAME = 'Channel1'
+AGENT_NAME = 'Agent1'
+TAGS_PER_DEVICE = 100
+LOG_PAGE_SIZE = 500
+IOT_CHUNK_SIZE = 500
+
+def make_tags(count):
+    return [{"common.ALLTYPES_NAME": f"Tag{x}", "servermain.TAG_ADDRESS": f"K{x:05d}", "servermain.TAG_DATA_TYPE": 5}
+        for x in range(count)]
+
+def spec_for_size(tag_count):
+    '''Returns the spec of a project of about *tag_count* tags in one channel, with devices holding
+    TAGS_PER_DEVICE tags, half of them in a tag group.'''
+    return ProjectSpec(1, max(1, math.ceil(tag_count / TAGS_PER_DEVICE)), 1, TAGS_PER_DEVICE // 2)
+
+def percentile(values, q):
+    '''Returns the *q* percentile of *values* with the nearest rank method.'''
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(q / 100 * len(ordered)) - 1)]
+
+class _Recorder:
+    '''Collects the latency of every request sent by a server through its request hooks.'''
+    def __init__(self, server):
+        self.durations = []
+        self.errors = 0
+        self.bytes = 0
+        self.server = server
+        server.add_hook('after', self._after)
+        server.add_hook('error', self._error)
+
+    def close(self):
+        self.server.remove_hook('after', self._after)
+        self.server.remove_hook('error', self._error)
+
+    def _after(self, info):
+        self.durations.append(info.duration)
+        self.bytes += (info.request_bytes or 0) + (info.response_bytes or 0)
+
+    def _error(self, info):
+        self.durations.append(info.duration)
+        self.errors += 1
+
+#
+# Scenarios - each prepares the stand-in and returns the operation to time
+#
+
+def _bulk_tag_add(stand_in, server, spec, project):
+    def prepare():
+        stand_in.reset()
+        channel.add_channel(server, {"common.ALLTYPES_NAME": CH_NAME, "servermain.MULTIPLE_TYPES_DEVICE_DRIVER": "Simulator"})
+        device.add_device(server, CH_NAME, {"common.ALLTYPES_NAME": "Device1", "servermain.MULTIPLE_TYPES_DEVICE_DRIVER": "Simulator"})
+    tags = make_tags(spec.tag_count)
+    return prepare, lambda: tag.bulk_add_tags(server, {f'{CH_NAME}.Device1': {'tags': tags}})
+
+def _structure_read(stand_in, server, spec, project, serialize = True):
+    devices = [f'Channel{c + 1}.Device{d + 1}' for c in range(spec.channels) for d in range(spec.devices)]
+    def run():
+        for path in devices:
+            tag.get_full_tag_structure(server, path, recursive= True, serialize= serialize)
+    return lambda: stand_in.load_project(project), run
+
+def _iot_item_add(stand_in, server, spec, project):
+    items = [{"iot_gateway.IOT_ITEM_SERVER_TAG": spec.tag_path(i), "iot_gateway.IOT_ITEM_SCAN_RATE_MS": 1000}
+        for i in range(spec.tag_count)]
+    def prepare():
+        stand_in.load_project(project)
+        agent.add_iot_agent(server, {"common.ALLTYPES_NAME": AGENT_NAME}, kepconfig.iot_gateway.MQTT_CLIENT_AGENT)
+    def run():
+        for i in range(0, len(items), IOT_CHUNK_SIZE):
+            iot_items.add_iot_item(server, items[i:i + IOT_CHUNK_SIZE], AGENT_NAME, kepconfig.iot_gateway.MQTT_CLIENT_AGENT)
+    return prepare, run
+
+def _log_read(stand_in, server, spec, project):
+    def prepare():
+        stand_in.reset()
+        stand_in.populate_logs(spec.tag_count)
+    def run():
+        page = 1
+        while True:
+            entries = [e for e in server.get_event_log(options= {'pageSize': LOG_PAGE_SIZE, 'pageNumber': page}) if 'pagination' not in e]
+            if len(entries) < LOG_PAGE_SIZE:
+                break
+            page += 1
+    return prepare, run
+
+def _export(stand_in, server, spec, project):
+    return lambda: stand_in.load_project(project), server.export_project_configuration
+
+def _import(stand_in, server, spec, project):
+    def run():
+        job = server.import_project_configuration(project)
+        if not server.wait_for_jobs([job], timeout= 300, poll_interval= 0.01)[0].complete:
+            raise RuntimeError('JsonProjectLoad did not complete')
+    return stand_in.reset, run
+
+_SCENARIO_FUNCTIONS = {
+    'bulk_tag_add': _bulk_tag_add,
+    'structure_read': _structure_read,
+    'structure_walk': lambda *args: _structure_read(*args, serialize= False),
+    'iot_item_add': _iot_item_add,
+    'log_read': _log_read,
+    'export': _export,
+    'import': _import
+}
+
+def run_scenario(stand_in, name, spec, repeat):
+    '''Runs scenario *name* *repeat* times on the project described by the `ProjectSpec` *spec* and returns
+    a dict of its results.'''
+    server = stand_in.client()
+    project = generate_project(spec)
+    prepare, operation = _SCENARIO_FUNCTIONS[name](stand_in, server, spec, project)
+    op_durations = []
+    requests = []
+    errors = transferred = 0
+    for _ in range(repeat):
+        prepare()
+        recorder = _Recorder(server)
+        start = time.perf_counter()
+        operation()
+        op_durations.append(time.perf_counter() - start)
+        recorder.close()
+        requests += recorder.durations
+        errors += recorder.errors
+        transferred += recorder.bytes
+    server.close()
+    total = sum(op_durations)
+    return {
+        'scenario': name,
+        'project_spec': str(spec),
+        'project_size': spec.tag_count,
+        'operations': repeat,
+        'requests': len(requests),
+        'errors': errors,
+        'seconds': total,
+        'requests_per_s': len(requests) / total if total else None,
+        'tags_per_s': spec.tag_count * repeat / total if total else None,
+        'bytes': transferred,
+        'operation_p50_ms': percentile(op_durations, 50) * 1000,
+        'request_p50_ms': _ms(percentile(requests, 50)),
+        'request_p99_ms': _ms(percentile(requests, 99))
+    }
+
+def run(specs, repeat, scenarios = SCENARIOS, latency = None):
+    '''Returns the list of results of every scenario for every `ProjectSpec` in *specs*.'''
+    results = []
+    with StandInServer(latency= latency, job_duration= 0, max_log_entries= max(s.tag_count for s in specs)) as stand_in:
+        for spec in specs:
+            for name in scenarios:
+                results.append(run_scenario(stand_in, name, spec, repeat))
+    return results
+
+def compare(results, baseline):
+    '''Returns lines comparing *results* with the results of a previous run.'''
+    previous = {(r['scenario'], r['project_size']): r for r in baseline['results']}
+    lines = [f'{"scenario":<16}{"size":>8}{"req/s change":>14}{"p99 change":>12}']
+    for r in results:
+        old = previous.get((r['scenario'], r['project_size']))
+        if old is None:
+            continue
+        lines.append(f'{r["scenario"]:<16}{r["project_size"]:>8}{_change(r["requests_per_s"], old["requests_per_s"]):>14}'
+            f'{_change(r["request_p99_ms"], old["request_p99_ms"]):>12}')
+    return lines
+
+def _ms(seconds):
+    return None if seconds is None else seconds * 1000
+
+def _change(new, old):
+    if not new or not old:
+        return 'n/a'
+    return f'{(new / old - 1) * 100:+.1f}%'
+
+def main(argv = None):
+    parser = argparse.ArgumentParser(description='Measure SDK throughput and latency against the local Configuration API stand-in.')
+    parser.add_argument('--sizes', default='1000,10000', help='comma separated project sizes in tags (default: 1000,10000)')
+    parser.add_argument('--spec', action='append', default=[], help='project in the compact form of ProjectSpec, such as '
+        '"2x50x4/2x20", used instead of --sizes. Can be repeated')
+    parser.add_argument('--repeat', type=int, default=3, help='runs of every scenario (default: 3)')
+    parser.add_argument('--scenarios', default=','.join(SCENARIOS), help=f'comma separated scenarios (default: {",".join(SCENARIOS)})')
+    parser.add_argument('--latency', type=float, default=None, help='delay in seconds added by the stand-in to every request (default: none)')
+    parser.add_argument('--output', default='sdk_bench_results.json', help='JSON file the results are written to (default: sdk_bench_results.json)')
+    parser.add_argument('--compare', default=None, help='results file of a previous run to compare with')
+    parser.add_argument('--codec', action='store_true', help='also run the JSON codec benchmark and store its results')
+    args = parser.parse_args(argv)
+
+    specs = [ProjectSpec.parse(s) for s in args.spec] or [spec_for_size(int(s)) for s in args.sizes.split(',')]
+    scenarios = [s.strip() for s in args.scenarios.split(',')]
+    unknown = set(scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f'unknown scenarios: {", ".join(sorted(unknown))}')
+
+    results = run(specs, args.repeat, scenarios, args.latency)
+    output = {
+        'metadata': {
+            'kepconfig_version': kepconfig.__version__,
+            'python_version': platform.python_version(),
+            'platform': platform.platform(),
+            'json_codec': _default_codec().name,
+            'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            'repeat': args.repeat,
+            'latency': args.latency
+        },
+        'results': results
+    }
+    if args.codec:
+        output['json_codec'] = json_codec_bench.run(max(s.tag_count for s in specs), args.repeat)
+    with open(args.output, 'w') as f:
+        json.dump(output, f, indent= 2)
+
+    print(f'{"scenario":<16}{"size":>8}{"requests":>10}{"req/s":>10}{"p50 ms":>9}{"p99 ms":>9}{"op p50 ms":>11}')
+    for r in results:
+        print(f'{r["scenario"]:<16}{r["project_size"]:>8}{r["requests"]:>10}{r["requests_per_s"]:>10.0f}'
+            f'{r["request_p50_ms"]:>9.2f}{r["request_p99_ms"]:>9.2f}{r["operation_p50_ms"]:>11.1f}')
+    print(f'Results written to {args.output}')
+    if args.compare:
+        with open(args.compare) as f:
+            print('\n'.join(compare(results, json.load(f))))
+
+if __name__ == '__main__':
+    main()
@@ -10,6 +10,7 @@ the Kepware Administration through the Kepware Configuration API
 from .. import connection
 from typing import Union
 from ..error import KepHTTPError, KepError
+from ..tracing import _traced
 
 
 
@@ -60,6 +61,7 @@ class lls_config:
     def __str__(self) -> str:
         return "{}".format(self._get_dict())
 
+@_traced
 def get_lls_config(server: connection.server) -> lls_config:
     '''Returns the properties of the Local License server connection properties. Returned object is `lls_config` class object.
     
@@ -74,6 +76,7 @@ def get_lls_config(server: connection.server) -> lls_config:
     r = server._config_get(server.url + LLS_ROOT)
     return lls_config(r.payload)
 
+@_traced
 def update_lls_config(server: connection.server, config: lls_config) -> bool:
     '''Updates the Local License Server connection properties for Kepware.
     
@@ -89,8 +92,9 @@ def update_lls_config(server: connection.server, config: lls_config) -> bool:
     DATA = config._get_dict()
     r = server._config_update(server.url + LLS_ROOT, DATA)
     if r.code == 200: return True 
-    else: raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+    else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
 
+@_traced
 def enable_lls(server: connection.server) -> bool:
     '''Enables the Local License Server connection for Kepware.
     
@@ -104,8 +108,9 @@ def enable_lls(server: connection.server) -> bool:
 
     r = server._config_update(server.url + LLS_ROOT, {LICENSING_SERVER_ENABLE: True})
     if r.code == 200: return True 
-    else: raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+    else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
 
+@_traced
 def disable_lls(server: connection.server) -> bool:
     '''Disables the Local License Server connection for Kepware.
     
@@ -119,8 +124,9 @@ def disable_lls(server: connection.server) -> bool:
 
     r = server._config_update(server.url + LLS_ROOT, {LICENSING_SERVER_ENABLE: False})
     if r.code == 200: return True 
-    else: raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+    else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
 
+@_traced
 def force_license_check(server: connection.server, job_ttl: int = None):
     '''Executes a ForceLicenseCheck service call to the Kepware instance. This triggers the server to verify the 
     license state of the license received from the Local License Server.
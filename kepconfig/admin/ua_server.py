@@ -7,10 +7,11 @@
 r"""`ua_server` exposes an API to allow modifications (add, delete, modify) to 
 OPC UA Server endpoints within the Kepware Administration through the Kepware Configuration API
 """
-from typing import Union
+from typing import Union, Iterator
 from ..error import KepHTTPError, KepError
 from ..connection import server
-from ..utils import _url_parse_object
+from ..utils import _url_parse_object, _add_result, _multi_status_data, _iter_pages
+from ..tracing import _traced
 
 
 UA_ROOT = '/admin/ua_endpoints'
@@ -27,12 +28,15 @@ def _create_url(endpoint = None):
     else:
         return '{}/{}'.format(UA_ROOT, _url_parse_object(endpoint))
 
-def add_endpoint(server: server, DATA: Union[dict, list]) -> Union[bool, list]:
+@_traced
+def add_endpoint(server: server, DATA: Union[dict, list], *, multi_status: bool = False) -> Union[bool, list]:
     '''Add an `"endpoint"` or multiple `"endpoint"` objects to Kepware UA Server by passing a 
     list of endpoints to be added all at once.
 
     :param server: instance of the `server` class
     :param DATA: Dict or List of Dicts of the UA Endpoints to add
+    :param multi_status: *(optional)* If True, returns a `MultiStatusResult` with the status of every object instead of 
+    True or the list of failures. (default= False)
 
     :return: True - If a "HTTP 201 - Created" is received from Kepware server
     :return: If a "HTTP 207 - Multi-Status" is received from Kepware with a list of dict error responses for all 
@@ -42,16 +46,11 @@ def add_endpoint(server: server, DATA: Union[dict, list]) -> Union[bool, list]:
     :raises KepURLError: If urllib provides an URLError
     '''
 
+    DATA = _multi_status_data(DATA, multi_status)
     r = server._config_add(server.url + _create_url(), DATA)
-    if r.code == 201: return True
-    elif r.code == 207:
-        errors = [] 
-        for item in r.payload:
-            if item['code'] != 201:
-                errors.append(item)
-        return errors
-    else: raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+    return _add_result(r, DATA, multi_status, lambda items: add_endpoint(server, items, multi_status= True))
 
+@_traced
 def del_endpoint(server: server, endpoint: str) -> bool:
     '''Delete an `"endpoint"` object in Kepware UA Server
     
@@ -66,8 +65,9 @@ def del_endpoint(server: server, endpoint: str) -> bool:
 
     r = server._config_del(server.url + _create_url(endpoint))
     if r.code == 200: return True 
-    else: raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+    else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
 
+@_traced
 def modify_endpoint(server: server, DATA: dict, endpoint: str = None) -> bool:
     '''Modify a `"endpoint"` object and it's properties in Kepware UA Server. If a `"endpoint"` is not provided as an input,
     you need to identify the endpoint in the *'common.ALLTYPES_NAME'* property field in the `"DATA"`. It will 
@@ -87,15 +87,16 @@ def modify_endpoint(server: server, DATA: dict, endpoint: str = None) -> bool:
         try:
             r = server._config_update(server.url + _create_url(DATA['common.ALLTYPES_NAME']), DATA)
             if r.code == 200: return True 
-            else: raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+            else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
         except KeyError as err:
             err_msg = 'Error: No UA Endpoint identified in DATA | Key Error: {}'.format(err)
             raise KepError(err_msg)
     else:
         r = server._config_update(server.url + _create_url(endpoint), DATA)
         if r.code == 200: return True 
-        else: raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+        else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
 
+@_traced
 def get_endpoint(server: server, endpoint: str) -> dict:
     '''Returns the properties of the `"endpoint"` object.
     
@@ -111,6 +112,7 @@ def get_endpoint(server: server, endpoint: str) -> dict:
     r = server._config_get(server.url + _create_url(endpoint))
     return r.payload
 
+@_traced
 def get_all_endpoints(server: server, *, options: dict = None) -> list:
     '''Returns list of all `"endpoint"` objects and their properties.
     
@@ -125,4 +127,23 @@ def get_all_endpoints(server: server, *, options: dict = None) -> list:
     '''
 
     r = server._config_get(f'{server.url}{_create_url()}', params= options)
-    return r.payload
\ No newline at end of file
+    return r.payload
+
+def iter_all_endpoints(server: server, *, options: dict = None, page_size: int = 100, prefetch: bool = True) -> Iterator[dict]:
+    '''Returns a generator of all `"UA endpoint"` objects and their properties. The UA endpoints are read from Kepware 
+    one page at a time and the next page is requested while the current page is processed, so large 
+    collections don't have to be held in memory.
+
+    :param server: instance of the `server` class
+    :param options: *(optional)* Dict of parameters to filter or sort the list of UA endpoints. Options are `filter`, 
+        `sortOrder` and `sortProperty`. `pageNumber` sets the first page to read
+    :param page_size: *(optional)* Number of UA endpoints read per request, or None to read all UA endpoints with one 
+        request that is parsed as it is received (default= 100)
+    :param prefetch: *(optional)* Request the next page while the current page is processed (default= True)
+
+    :return: Generator of the data for each UA endpoint
+
+    :raises KepHTTPError: If urllib provides an HTTPError
+    :raises KepURLError: If urllib provides an URLError
+    '''
+    return _iter_pages(lambda o: get_all_endpoints(server, options= o), options, page_size, prefetch)
@@ -7,10 +7,11 @@
 r"""`user_groups` exposes an API to allow modifications (add, delete, modify) to 
 user groups within the Kepware Administration User Manager through the Kepware Configuration API
 """
-from typing import Union
+from typing import Union, Iterator
 from ..error import KepHTTPError, KepError
 from ..connection import server
-from ..utils import _url_parse_object
+from ..utils import _url_parse_object, _add_result, _multi_status_data, _iter_pages
+from ..tracing import _traced
 
 
 USERGROUPS_ROOT = '/admin/server_usergroups'
@@ -28,12 +29,15 @@ def _create_url(user_group = None):
     else:
         return '{}/{}'.format(USERGROUPS_ROOT, _url_parse_object(user_group))
 
-def add_user_group(server: server, DATA: Union[dict, list]) -> Union[bool, list]:
+@_traced
+def add_user_group(server: server, DATA: Union[dict, list], *, multi_status: bool = False) -> Union[bool, list]:
     '''Add a `"user group"` or multiple `"user group"` objects to Kepware User Manager by passing a 
     list of user groups to be added all at once.
 
     :param server: instance of the `server` class
     :param DATA: Dict or List of Dicts of the user groups to add
+    :param multi_status: *(optional)* If True, returns a `MultiStatusResult` with the status of every object instead of 
+    True or the list of failures. (default= False)
 
     :return: True - If a "HTTP 201 - Created" is received from Kepware server
     :return: If a "HTTP 207 - Multi-Status" is received from Kepware with a list of dict error responses for all 
@@ -43,16 +47,11 @@ def add_user_group(server: server, DATA: Union[dict, list]) -> Union[bool, list]
     :raises KepURLError: If urllib provides an URLError
     '''
 
+    DATA = _multi_status_data(DATA, multi_status)
     r = server._config_add(server.url + _create_url(), DATA)
-    if r.code == 201: return True 
-    elif r.code == 207:
-        errors = [] 
-        for item in r.payload:
-            if item['code'] != 201:
-                errors.append(item)
-        return errors
-    else: raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+    return _add_result(r, DATA, multi_status, lambda items: add_user_group(server, items, multi_status= True))
 
+@_traced
 def del_user_group(server: server, user_group: str) -> bool:
     '''Delete a `"user group"` object in Kepware User Manager
     
@@ -67,8 +66,9 @@ def del_user_group(server: server, user_group: str) -> bool:
 
     r = server._config_del(server.url + _create_url(user_group))
     if r.code == 200: return True 
-    else: raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+    else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
 
+@_traced
 def modify_user_group(server: server, DATA: dict, *, user_group: str = None) -> bool:
     '''Modify a `"user group"` object and it's properties in Kepware User Manager. If a `"user group"` is not provided as an input,
     you need to identify the user group in the *'common.ALLTYPES_NAME'* property field in the `"DATA"`. It will 
@@ -88,15 +88,16 @@ def modify_user_group(server: server, DATA: dict, *, user_group: str = None) ->
         try:
             r = server._config_update(server.url + _create_url(DATA['common.ALLTYPES_NAME']), DATA)
             if r.code == 200: return True 
-            else: raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+            else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
         except KeyError as err:
             err_msg = 'Error: No User Group identified in DATA | Key Error: {}'.format(err)
             raise KepError(err_msg)
     else:
         r = server._config_update(server.url + _create_url(user_group), DATA)
         if r.code == 200: return True 
-        else: raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+        else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
 
+@_traced
 def get_user_group(server: server, user_group: str) -> dict:
     '''Returns the properties of the `"user group"` object.
     
@@ -112,6 +113,7 @@ def get_user_group(server: server, user_group: str) -> dict:
     r = server._config_get(server.url + _create_url(user_group))
     return r.payload
 
+@_traced
 def get_all_user_groups(server: server, *, options: dict = None) -> list:
     '''Returns list of all `"user group"` objects and their properties.
     
@@ -128,6 +130,26 @@ def get_all_user_groups(server: server, *, options: dict = None) -> list:
     r = server._config_get(f'{server.url}{_create_url()}', params= options)
     return r.payload
 
+def iter_all_user_groups(server: server, *, options: dict = None, page_size: int = 100, prefetch: bool = True) -> Iterator[dict]:
+    '''Returns a generator of all `"user group"` objects and their properties. The user groups are read from Kepware 
+    one page at a time and the next page is requested while the current page is processed, so large 
+    collections don't have to be held in memory.
+
+    :param server: instance of the `server` class
+    :param options: *(optional)* Dict of parameters to filter or sort the list of user groups. Options are `filter`, 
+        `sortOrder` and `sortProperty`. `pageNumber` sets the first page to read
+    :param page_size: *(optional)* Number of user groups read per request, or None to read all user groups with one 
+        request that is parsed as it is received (default= 100)
+    :param prefetch: *(optional)* Request the next page while the current page is processed (default= True)
+
+    :return: Generator of the data for each user group
+
+    :raises KepHTTPError: If urllib provides an HTTPError
+    :raises KepURLError: If urllib provides an URLError
+    '''
+    return _iter_pages(lambda o: get_all_user_groups(server, options= o), options, page_size, prefetch)
+
+@_traced
 def enable_user_group(server: server, user_group: str) -> bool:
     '''Enable the `"user group"`.
     
@@ -142,6 +164,7 @@ def enable_user_group(server: server, user_group: str) -> bool:
     DATA = {ENABLE_PROPERTY: True}
     return modify_user_group(server, DATA, user_group= user_group)
 
+@_traced
 def disable_user_group(server: server, user_group: str) -> bool:
     '''Disable the `"user group"`.
     
@@ -154,4 +177,4 @@ def disable_user_group(server: server, user_group: str) -> bool:
     :raises KepURLError: If urllib provides an URLError
     '''
     DATA = {ENABLE_PROPERTY: False}
-    return modify_user_group(server, DATA, user_group= user_group)
\ No newline at end of file
+    return modify_user_group(server, DATA, user_group= user_group)
@@ -14,8 +14,9 @@ tag group objects within the Kepware Configuration API
 
 from ..connection import KepServiceResponse, server
 from ..error import KepHTTPError, KepError
-from ..utils import _url_parse_object, path_split
-from typing import Union
+from ..utils import _url_parse_object, path_split, _add_result, _multi_status_data, _iter_pages
+from ..tracing import _traced
+from typing import Union, Iterator
 from .. import adv_tags
 import inspect
 
@@ -52,7 +53,8 @@ def _create_adv_tags_group_url(path_obj):
         raise KepError(err_msg)
     return url
 
-def add_tag_group(server: server, adv_tag_group_path: str, DATA: Union[dict, list]) -> Union[bool, list]:
+@_traced
+def add_tag_group(server: server, adv_tag_group_path: str, DATA: Union[dict, list], *, multi_status: bool = False) -> Union[bool, list]:
     # TODO: confirm adding tag types in this folder
     # TODO: Do we need to require the tag group path if we are adding a tag group at the root? (i.e. _advancedtags)
     '''Add a `"tag group"` or multiple `"tag group"` objects to a device in Kepware. Can be used to pass children of a tag group object 
@@ -66,7 +68,9 @@ def add_tag_group(server: server, adv_tag_group_path: str, DATA: Union[dict, lis
     notation string such as "_advancedtags.AdvTagGroup1" or "_advancedtags.AdvTagGroup1.AdvTagGroupChild"
     :param DATA: Dict or List of Dicts of the tag group(s) and its children
     expected by Kepware Configuration API
-    
+    :param multi_status: *(optional)* If True, returns a `MultiStatusResult` with the status of every object instead of 
+    True or the list of failures. (default= False)
+
     :return: True - If a "HTTP 201 - Created" is received from Kepware server
     :return: If a "HTTP 207 - Multi-Status" is received from Kepware with a list of dict error responses for all 
     tag groups added that failed.
@@ -77,17 +81,11 @@ def add_tag_group(server: server, adv_tag_group_path: str, DATA: Union[dict, lis
     path_obj = adv_tags._adv_tag_path_split(adv_tag_group_path, isItem=False)
     url = adv_tags._create_adv_tags_base_url(server.url, path_obj) + _create_url()
     
+    DATA = _multi_status_data(DATA, multi_status)
     r = server._config_add(url, DATA)
-    if r.code == 201: return True
-    elif r.code == 207:
-        errors = []
-        for item in r.payload:
-            if item['code'] != 201:
-                errors.append(item)
-        return errors
-    else:
-        raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+    return _add_result(r, DATA, multi_status, lambda items: add_tag_group(server, adv_tag_group_path, items, multi_status= True))
 
+@_traced
 def del_tag_group(server: server, adv_tag_group_path: str) -> bool:
     '''Delete a `"tag group"` object in Kepware. This will delete all children as well.
 
@@ -106,8 +104,9 @@ def del_tag_group(server: server, adv_tag_group_path: str) -> bool:
     url = adv_tags._create_adv_tags_base_url(server.url, path_obj) + _create_url(path_obj['item'])
     r = server._config_del(url)
     if r.code == 200: return True
-    else: raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+    else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
 
+@_traced
 def modify_tag_group(server: server, adv_tag_group_path: str, DATA: dict, force: bool = False) -> bool:
     '''Modify a tag group object and its properties in Kepware.
 
@@ -129,8 +128,9 @@ def modify_tag_group(server: server, adv_tag_group_path: str, DATA: dict, force:
 
     r = server._config_update(url, tag_group_data)
     if r.code == 200: return True
-    else: raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+    else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
 
+@_traced
 def get_tag_group(server: server, adv_tag_group_path: str) -> dict:
     '''Returns the properties of the tag group object.
 
@@ -148,6 +148,7 @@ def get_tag_group(server: server, adv_tag_group_path: str) -> dict:
     r = server._config_get(url)
     return r.payload
 
+@_traced
 def get_all_tag_groups(server: server, adv_tag_group_path: str, *, options: dict = None) -> list:
     '''Returns list of all tag group objects and their properties within a tag group. Returned object is JSON list.
     
@@ -164,3 +165,24 @@ def get_all_tag_groups(server: server, adv_tag_group_path: str, *, options: dict
     url = adv_tags._create_adv_tags_base_url(server.url, path_obj) + _create_url()
     r = server._config_get(url, params=options)
     return r.payload
+
+def iter_all_tag_groups(server: server, adv_tag_group_path: str, *, options: dict = None, page_size: int = 100, prefetch: bool = True) -> Iterator[dict]:
+    '''Returns a generator of all `"advanced tag group"` objects and their properties. The advanced tag groups are read from Kepware 
+    one page at a time and the next page is requested while the current page is processed, so large 
+    collections don't have to be held in memory.
+
+    :param server: instance of the `server` class
+    :param adv_tag_group_path: path identifying the advanced tag group collection to retrieve. Standard Kepware address decimal
+    notation string such as "_advancedtags.AdvTagGroup1" or "_advancedtags.AdvTagGroup1.AdvTagGroupChild"
+    :param options: *(optional)* Dict of parameters to filter or sort the list of advanced tag groups. Options are `filter`, 
+        `sortOrder` and `sortProperty`. `pageNumber` sets the first page to read
+    :param page_size: *(optional)* Number of advanced tag groups read per request, or None to read all advanced tag groups with one 
+        request that is parsed as it is received (default= 100)
+    :param prefetch: *(optional)* Request the next page while the current page is processed (default= True)
+
+    :return: Generator of the data for each advanced tag group
+
+    :raises KepHTTPError: If urllib provides an HTTPError
+    :raises KepURLError: If urllib provides an URLError
+    '''
+    return _iter_pages(lambda o: get_all_tag_groups(server, adv_tag_group_path, options= o), options, page_size, prefetch)
@@ -13,8 +13,9 @@ complex tag objects within the Kepware Configuration API
 
 from ..connection import server
 from ..error import KepError, KepHTTPError
-from ..utils import _url_parse_object
-from typing import Union
+from ..utils import _url_parse_object, _add_result, _multi_status_data, _iter_pages
+from ..tracing import _traced
+from typing import Union, Iterator
 from .. import adv_tags
 
 COMPLEX_TAGS_ROOT = '/complex_tags'
@@ -29,7 +30,8 @@ def _get_complex_tags_url(tag: str = None) -> str:
     else:
         return f'{COMPLEX_TAGS_ROOT}/{_url_parse_object(tag)}'
 
-def add_complex_tag(server: server, adv_tag_group_path: str, DATA: Union[dict, list]) -> Union[bool, list]:
+@_traced
+def add_complex_tag(server: server, adv_tag_group_path: str, DATA: Union[dict, list], *, multi_status: bool = False) -> Union[bool, list]:
     '''Add `"complex_tag"` or multiple `"complex_tag"` objects to a specific path in Kepware.
     Can be used to pass a list of complex tags to be added at one path location.
 
@@ -37,6 +39,8 @@ def add_complex_tag(server: server, adv_tag_group_path: str, DATA: Union[dict, l
     :param adv_tag_group_path: path identifying where to add complex tag(s). Standard Kepware address decimal 
     notation string such as "_advancedtags.AdvTagGroup1" or "_advancedtags.AdvTagGroup1.AdvTagGroupChild"
     :param DATA: Dict or List of Dicts of the complex tag(s) to add
+    :param multi_status: *(optional)* If True, returns a `MultiStatusResult` with the status of every object instead of 
+    True or the list of failures. (default= False)
 
     :return: True - If a "HTTP 201 - Created" is received from Kepware server
     :return: If a "HTTP 207 - Multi-Status" is received from Kepware with a list of dict error responses for all 
@@ -48,15 +52,11 @@ def add_complex_tag(server: server, adv_tag_group_path: str, DATA: Union[dict, l
     path_obj = adv_tags._adv_tag_path_split(adv_tag_group_path, isItem=False)
     url = adv_tags._create_adv_tags_base_url(server.url, path_obj) + _get_complex_tags_url()
 
+    DATA = _multi_status_data(DATA, multi_status)
     r = server._config_add(url, DATA)
-    if r.code == 201:
-        return True
-    elif r.code == 207:
-        errors = [item for item in r.payload if item['code'] != 201]
-        return errors
-    else:
-        raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+    return _add_result(r, DATA, multi_status, lambda items: add_complex_tag(server, adv_tag_group_path, items, multi_status= True))
 
+@_traced
 def modify_complex_tag(server: server, complex_tag_path: str, DATA: dict, force: bool = False) -> bool:
     '''Modify a `"complex_tag"` object and its properties in Kepware.
 
@@ -79,8 +79,9 @@ def modify_complex_tag(server: server, complex_tag_path: str, DATA: dict, force:
     if r.code == 200:
         return True
     else:
-        raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+        raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
 
+@_traced
 def del_complex_tag(server: server, complex_tag_path: str) -> bool:
     '''Delete `"complex_tag"` object at a specific path in Kepware.
 
@@ -100,8 +101,9 @@ def del_complex_tag(server: server, complex_tag_path: str) -> bool:
     if r.code == 200:
         return True
     else:
-        raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+        raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
 
+@_traced
 def get_complex_tag(server: server, complex_tag_path: str) -> dict:
     '''Returns the properties of the `"complex_tag"` object at a specific path in Kepware.
 
@@ -120,6 +122,7 @@ def get_complex_tag(server: server, complex_tag_path: str) -> dict:
     r = server._config_get(url)
     return r.payload
 
+@_traced
 def get_all_complex_tags(server: server, adv_tag_group_path: str, *, options: dict = None) -> list:
     '''Returns the properties of all `"complex_tag"` objects at a specific path in Kepware.
 
@@ -138,4 +141,25 @@ def get_all_complex_tags(server: server, adv_tag_group_path: str, *, options: di
     url = adv_tags._create_adv_tags_base_url(server.url, path_obj) + _get_complex_tags_url()
 
     r = server._config_get(url, params=options)
-    return r.payload
\ No newline at end of file
+    return r.payload
+
+def iter_all_complex_tags(server: server, adv_tag_group_path: str, *, options: dict = None, page_size: int = 100, prefetch: bool = True) -> Iterator[dict]:
+    '''Returns a generator of all `"complex tag"` objects and their properties. The complex tags are read from Kepware 
+    one page at a time and the next page is requested while the current page is processed, so large 
+    collections don't have to be held in memory.
+
+    :param server: instance of the `server` class
+    :param adv_tag_group_path: path identifying location to retrieve complex tag list. Standard Kepware address decimal
+    notation string such as "_advancedtags.AdvTagGroup1" or "_advancedtags.AdvTagGroup1.AdvTagGroupChild"
+    :param options: *(optional)* Dict of parameters to filter or sort the list of complex tags. Options are `filter`, 
+        `sortOrder` and `sortProperty`. `pageNumber` sets the first page to read
+    :param page_size: *(optional)* Number of complex tags read per request, or None to read all complex tags with one 
+        request that is parsed as it is received (default= 100)
+    :param prefetch: *(optional)* Request the next page while the current page is processed (default= True)
+
+    :return: Generator of the data for each complex tag
+
+    :raises KepHTTPError: If urllib provides an HTTPError
+    :raises KepURLError: If urllib provides an URLError
+    '''
+    return _iter_pages(lambda o: get_all_complex_tags(server, adv_tag_group_path, options= o), options, page_size, prefetch)
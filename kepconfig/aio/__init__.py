@@ -0,0 +1,26 @@
+# -------------------------------------------------------------------------
+# Copyright (c) PTC Inc. and/or all its affiliates. All rights reserved.
+# See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+r"""`aio` provides an asyncio based counterpart of the Kepconfig API. The `AsyncServer` class
+replaces `kepconfig.connection.server` and the `connectivity`, `iot_gateway`, `datalogger`,
+`ua_gateway`, `adv_tags` and `admin` modules expose coroutine versions of the functions 
+with the same names and parameters.
+
+Example:
+
+    import asyncio
+    from kepconfig.aio import AsyncServer
+    from kepconfig.aio.connectivity import channel
+
+    async def main():
+        async with AsyncServer('127.0.0.1', 57412, 'Administrator', '') as server:
+            channels = await asyncio.gather(*[channel.get_channel(server, name) for name in ['Ch1', 'Ch2']])
+
+    asyncio.run(main())
+"""
+
+from . import connection
+from .connection import AsyncServer
@@ -0,0 +1,11 @@
+# -------------------------------------------------------------------------
+# Copyright (c) PTC Inc. and/or all its affiliates. All rights reserved.
+# See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+r"""`admin` provides coroutine versions of the `kepconfig.admin` module functions for use
+with `kepconfig.aio.connection.AsyncServer`.
+"""
+
+from . import users, user_groups, ua_server, lls
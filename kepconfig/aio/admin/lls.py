@@ -0,0 +1,64 @@
+# -------------------------------------------------------------------------
+# Copyright (c) PTC Inc. and/or all its affiliates. All rights reserved.
+# See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+r"""`lls` provides coroutine versions of the `kepconfig.admin.lls` API for use
+with `kepconfig.aio.connection.AsyncServer`.
+"""
+
+from ..connection import AsyncServer
+from ...error import KepHTTPError
+from ...tracing import _traced
+from ...admin.lls import (
+    LLS_ROOT, FORCE_CHECK_URL, LICENSING_SERVER_PORT, LICENSING_SERVER_NAME,
+    LICENSING_SERVER_ENABLE, LICENSING_CHECK_PERIOD_MINS, LICENSING_SERVER_SSL_PORT,
+    LICENSING_SERVER_ALLOW_INSECURE_COMMS, LICENSING_SERVER_ALLOW_SELF_SIGNED_CERTS,
+    LICENSING_CLIENT_ALIAS, lls_config
+)
+
+@_traced
+async def get_lls_config(server: AsyncServer) -> lls_config:
+    '''Coroutine version of `kepconfig.admin.lls.get_lls_config`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+
+    r = await server._config_get(server.url + LLS_ROOT)
+    return lls_config(r.payload)
+
+@_traced
+async def update_lls_config(server: AsyncServer, config: lls_config) -> bool:
+    '''Coroutine version of `kepconfig.admin.lls.update_lls_config`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+
+    DATA = config._get_dict()
+    r = await server._config_update(server.url + LLS_ROOT, DATA)
+    if r.code == 200: return True 
+    else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
+
+@_traced
+async def enable_lls(server: AsyncServer) -> bool:
+    '''Coroutine version of `kepconfig.admin.lls.enable_lls`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+
+    r = await server._config_update(server.url + LLS_ROOT, {LICENSING_SERVER_ENABLE: True})
+    if r.code == 200: return True 
+    else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
+
+@_traced
+async def disable_lls(server: AsyncServer) -> bool:
+    '''Coroutine version of `kepconfig.admin.lls.disable_lls`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+
+    r = await server._config_update(server.url + LLS_ROOT, {LICENSING_SERVER_ENABLE: False})
+    if r.code == 200: return True 
+    else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
+
+@_traced
+async def force_license_check(server: AsyncServer, job_ttl: int = None):
+    '''Coroutine version of `kepconfig.admin.lls.force_license_check`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+
+    url = f'{server.url}{FORCE_CHECK_URL}'
+    job = await server._kep_service_execute(url, None, job_ttl)
+    return job
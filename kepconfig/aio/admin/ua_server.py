@@ -0,0 +1,73 @@
+# -------------------------------------------------------------------------
+# Copyright (c) PTC Inc. and/or all its affiliates. All rights reserved.
+# See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+r"""`ua_server` provides coroutine versions of the `kepconfig.admin.ua_server` API for use
+with `kepconfig.aio.connection.AsyncServer`.
+"""
+
+from typing import Union, AsyncIterator
+from ...error import KepHTTPError, KepError
+from ...utils import _add_result, _multi_status_data, _iter_pages_async
+from ...tracing import _traced
+from ..connection import AsyncServer
+from ...admin.ua_server import UA_ROOT, _create_url
+
+@_traced
+async def add_endpoint(server: AsyncServer, DATA: Union[dict, list], *, multi_status: bool = False) -> Union[bool, list]:
+    '''Coroutine version of `kepconfig.admin.ua_server.add_endpoint`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+
+    DATA = _multi_status_data(DATA, multi_status)
+    r = await server._config_add(server.url + _create_url(), DATA)
+    return _add_result(r, DATA, multi_status, lambda items: add_endpoint(server, items, multi_status= True))
+
+@_traced
+async def del_endpoint(server: AsyncServer, endpoint: str) -> bool:
+    '''Coroutine version of `kepconfig.admin.ua_server.del_endpoint`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+
+    r = await server._config_del(server.url + _create_url(endpoint))
+    if r.code == 200: return True 
+    else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
+
+@_traced
+async def modify_endpoint(server: AsyncServer, DATA: dict, endpoint: str = None) -> bool:
+    '''Coroutine version of `kepconfig.admin.ua_server.modify_endpoint`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+
+    if endpoint == None:
+        try:
+            r = await server._config_update(server.url + _create_url(DATA['common.ALLTYPES_NAME']), DATA)
+            if r.code == 200: return True 
+            else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
+        except KeyError as err:
+            err_msg = 'Error: No UA Endpoint identified in DATA | Key Error: {}'.format(err)
+            raise KepError(err_msg)
+    else:
+        r = await server._config_update(server.url + _create_url(endpoint), DATA)
+        if r.code == 200: return True 
+        else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
+
+@_traced
+async def get_endpoint(server: AsyncServer, endpoint: str) -> dict:
+    '''Coroutine version of `kepconfig.admin.ua_server.get_endpoint`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+
+    r = await server._config_get(server.url + _create_url(endpoint))
+    return r.payload
+
+@_traced
+async def get_all_endpoints(server: AsyncServer, *, options: dict = None) -> list:
+    '''Coroutine version of `kepconfig.admin.ua_server.get_all_endpoints`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+
+    r = await server._config_get(f'{server.url}{_create_url()}', params= options)
+    return r.payload
+
+def iter_all_endpoints(server: AsyncServer, *, options: dict = None, page_size: int = 100, prefetch: bool = True) -> AsyncIterator[dict]:
+    '''Async generator version of `kepconfig.admin.ua_server.iter_all_endpoints`. Parameters are the same, with `server` 
+    being an instance of `AsyncServer`. Use with `async for`.'''
+    return _iter_pages_async(lambda o: get_all_endpoints(server, options= o), options, page_size, prefetch)
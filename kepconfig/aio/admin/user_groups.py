@@ -0,0 +1,87 @@
+# -------------------------------------------------------------------------
+# Copyright (c) PTC Inc. and/or all its affiliates. All rights reserved.
+# See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+r"""`user_groups` provides coroutine versions of the `kepconfig.admin.user_groups` API for use
+with `kepconfig.aio.connection.AsyncServer`.
+"""
+
+from typing import Union, AsyncIterator
+from ...error import KepHTTPError, KepError
+from ...utils import _add_result, _multi_status_data, _iter_pages_async
+from ...tracing import _traced
+from ..connection import AsyncServer
+from ...admin.user_groups import USERGROUPS_ROOT, ENABLE_PROPERTY, _create_url
+
+@_traced
+async def add_user_group(server: AsyncServer, DATA: Union[dict, list], *, multi_status: bool = False) -> Union[bool, list]:
+    '''Coroutine version of `kepconfig.admin.user_groups.add_user_group`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+
+    DATA = _multi_status_data(DATA, multi_status)
+    r = await server._config_add(server.url + _create_url(), DATA)
+    return _add_result(r, DATA, multi_status, lambda items: add_user_group(server, items, multi_status= True))
+
+@_traced
+async def del_user_group(server: AsyncServer, user_group: str) -> bool:
+    '''Coroutine version of `kepconfig.admin.user_groups.del_user_group`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+
+    r = await server._config_del(server.url + _create_url(user_group))
+    if r.code == 200: return True 
+    else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
+
+@_traced
+async def modify_user_group(server: AsyncServer, DATA: dict, *, user_group: str = None) -> bool:
+    '''Coroutine version of `kepconfig.admin.user_groups.modify_user_group`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    
+    if user_group == None:
+        try:
+            r = await server._config_update(server.url + _create_url(DATA['common.ALLTYPES_NAME']), DATA)
+            if r.code == 200: return True 
+            else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
+        except KeyError as err:
+            err_msg = 'Error: No User Group identified in DATA | Key Error: {}'.format(err)
+            raise KepError(err_msg)
+    else:
+        r = await server._config_update(server.url + _create_url(user_group), DATA)
+        if r.code == 200: return True 
+        else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
+
+@_traced
+async def get_user_group(server: AsyncServer, user_group: str) -> dict:
+    '''Coroutine version of `kepconfig.admin.user_groups.get_user_group`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+
+    r = await server._config_get(server.url + _create_url(user_group))
+    return r.payload
+
+@_traced
+async def get_all_user_groups(server: AsyncServer, *, options: dict = None) -> list:
+    '''Coroutine version of `kepconfig.admin.user_groups.get_all_user_groups`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+
+    r = await server._config_get(f'{server.url}{_create_url()}', params= options)
+    return r.payload
+
+def iter_all_user_groups(server: AsyncServer, *, options: dict = None, page_size: int = 100, prefetch: bool = True) -> AsyncIterator[dict]:
+    '''Async generator version of `kepconfig.admin.user_groups.iter_all_user_groups`. Parameters are the same, with `server` 
+    being an instance of `AsyncServer`. Use with `async for`.'''
+    return _iter_pages_async(lambda o: get_all_user_groups(server, options= o), options, page_size, prefetch)
+
+@_traced
+async def enable_user_group(server: AsyncServer, user_group: str) -> bool:
+    '''Coroutine version of `kepconfig.admin.user_groups.enable_user_group`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    DATA = {ENABLE_PROPERTY: True}
+    return await modify_user_group(server, DATA, user_group= user_group)
+
+@_traced
+async def disable_user_group(server: AsyncServer, user_group: str) -> bool:
+    '''Coroutine version of `kepconfig.admin.user_groups.disable_user_group`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    DATA = {ENABLE_PROPERTY: False}
+    return await modify_user_group(server, DATA, user_group= user_group)
@@ -0,0 +1,87 @@
+# -------------------------------------------------------------------------
+# Copyright (c) PTC Inc. and/or all its affiliates. All rights reserved.
+# See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+r"""`users` provides coroutine versions of the `kepconfig.admin.users` API for use
+with `kepconfig.aio.connection.AsyncServer`.
+"""
+
+from typing import Union, AsyncIterator
+from ...error import KepError, KepHTTPError
+from ...utils import _add_result, _multi_status_data, _iter_pages_async
+from ...tracing import _traced
+from ..connection import AsyncServer
+from ...admin.users import USERS_ROOT, ENABLE_PROPERTY, _create_url
+
+@_traced
+async def add_user(server: AsyncServer, DATA: Union[dict, list], *, multi_status: bool = False) -> Union[bool, list]:
+    '''Coroutine version of `kepconfig.admin.users.add_user`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+
+    DATA = _multi_status_data(DATA, multi_status)
+    r = await server._config_add(server.url + _create_url(), DATA)
+    return _add_result(r, DATA, multi_status, lambda items: add_user(server, items, multi_status= True))
+
+@_traced
+async def del_user(server: AsyncServer, user: str) -> bool:
+    '''Coroutine version of `kepconfig.admin.users.del_user`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+
+    r = await server._config_del(server.url + _create_url(user))
+    if r.code == 200: return True 
+    else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
+
+@_traced
+async def modify_user(server: AsyncServer , DATA: dict, *, user: str = None) -> bool:
+    '''Coroutine version of `kepconfig.admin.users.modify_user`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+
+    if user == None:
+        try:
+            r = await server._config_update(server.url + _create_url(DATA['common.ALLTYPES_NAME']), DATA)
+            if r.code == 200: return True 
+            else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
+        except KeyError as err:
+            err_msg = 'Error: No User identified in DATA | Key Error: {}'.format(err)
+            raise KepError(err_msg)
+    else:
+        r = await server._config_update(server.url + _create_url(user), DATA)
+        if r.code == 200: return True 
+        else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
+
+@_traced
+async def get_user(server: AsyncServer, user: str) -> dict:
+    '''Coroutine version of `kepconfig.admin.users.get_user`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+
+    r = await server._config_get(server.url + _create_url(user))
+    return r.payload
+
+@_traced
+async def get_all_users(server: AsyncServer, *, options: dict = None) -> list:
+    '''Coroutine version of `kepconfig.admin.users.get_all_users`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+
+    r = await server._config_get(f'{server.url}{_create_url()}', params= options)
+    return r.payload
+
+def iter_all_users(server: AsyncServer, *, options: dict = None, page_size: int = 100, prefetch: bool = True) -> AsyncIterator[dict]:
+    '''Async generator version of `kepconfig.admin.users.iter_all_users`. Parameters are the same, with `server` 
+    being an instance of `AsyncServer`. Use with `async for`.'''
+    return _iter_pages_async(lambda o: get_all_users(server, options= o), options, page_size, prefetch)
+
+@_traced
+async def enable_user(server: AsyncServer, user: str) -> bool:
+    '''Coroutine version of `kepconfig.admin.users.enable_user`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    DATA = {ENABLE_PROPERTY: True}
+    return await modify_user(server, DATA, user= user)
+
+@_traced
+async def disable_user(server: AsyncServer, user: str) -> bool:
+    '''Coroutine version of `kepconfig.admin.users.disable_user`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    DATA = {ENABLE_PROPERTY: False}
+    return await modify_user(server, DATA, user= user)
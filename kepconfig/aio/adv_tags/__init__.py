@@ -0,0 +1,15 @@
+# -------------------------------------------------------------------------
+# Copyright (c) PTC Inc. and/or all its affiliates. All rights reserved.
+# See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+r"""`adv_tags` provides coroutine versions of the `kepconfig.adv_tags` module functions for use
+with `kepconfig.aio.connection.AsyncServer`.
+"""
+
+from . import (
+    adv_tag_group, average_tags, derived_tags, complex_tags, cumulative_tags, min_tags, max_tags,
+    link_tags
+)
+from ...adv_tags import ADV_TAGS_ROOT, _adv_tag_path_split, _create_adv_tags_base_url
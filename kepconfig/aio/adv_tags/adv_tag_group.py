@@ -0,0 +1,78 @@
+# -------------------------------------------------------------------------
+# Copyright (c) PTC Inc. and/or all its affiliates. All rights reserved.
+# See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+r"""`adv_tag_group` provides coroutine versions of the `kepconfig.adv_tags.adv_tag_group` API for use
+with `kepconfig.aio.connection.AsyncServer`.
+"""
+
+from ..connection import AsyncServer
+from ...error import KepHTTPError
+from ...utils import _add_result, _multi_status_data, _iter_pages_async
+from ...tracing import _traced
+from typing import Union, AsyncIterator
+from .. import adv_tags
+from ...adv_tags.adv_tag_group import TAG_GROUP_ROOT, _create_url, _create_adv_tags_group_url
+
+@_traced
+async def add_tag_group(server: AsyncServer, adv_tag_group_path: str, DATA: Union[dict, list], *, multi_status: bool = False) -> Union[bool, list]:
+    # TODO: confirm adding tag types in this folder
+    # TODO: Do we need to require the tag group path if we are adding a tag group at the root? (i.e. _advancedtags)
+    '''Coroutine version of `kepconfig.adv_tags.adv_tag_group.add_tag_group`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    path_obj = adv_tags._adv_tag_path_split(adv_tag_group_path, isItem=False)
+    url = adv_tags._create_adv_tags_base_url(server.url, path_obj) + _create_url()
+    
+    DATA = _multi_status_data(DATA, multi_status)
+    r = await server._config_add(url, DATA)
+    return _add_result(r, DATA, multi_status, lambda items: add_tag_group(server, adv_tag_group_path, items, multi_status= True))
+
+@_traced
+async def del_tag_group(server: AsyncServer, adv_tag_group_path: str) -> bool:
+    '''Coroutine version of `kepconfig.adv_tags.adv_tag_group.del_tag_group`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+
+    # url = _create_url(server.url, adv_tag_group_path, isItem=True)
+    path_obj = adv_tags._adv_tag_path_split(adv_tag_group_path, isItem=True)
+    url = adv_tags._create_adv_tags_base_url(server.url, path_obj) + _create_url(path_obj['item'])
+    r = await server._config_del(url)
+    if r.code == 200: return True
+    else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
+
+@_traced
+async def modify_tag_group(server: AsyncServer, adv_tag_group_path: str, DATA: dict, force: bool = False) -> bool:
+    '''Coroutine version of `kepconfig.adv_tags.adv_tag_group.modify_tag_group`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+
+    tag_group_data = await server._force_update_check(force, DATA)
+    path_obj = adv_tags._adv_tag_path_split(adv_tag_group_path, isItem=True)
+    url = adv_tags._create_adv_tags_base_url(server.url, path_obj) + _create_url(path_obj['item'])
+
+    r = await server._config_update(url, tag_group_data)
+    if r.code == 200: return True
+    else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
+
+@_traced
+async def get_tag_group(server: AsyncServer, adv_tag_group_path: str) -> dict:
+    '''Coroutine version of `kepconfig.adv_tags.adv_tag_group.get_tag_group`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    path_obj = adv_tags._adv_tag_path_split(adv_tag_group_path, isItem=True)
+    url = adv_tags._create_adv_tags_base_url(server.url, path_obj) + _create_url(path_obj['item'])
+    r = await server._config_get(url)
+    return r.payload
+
+@_traced
+async def get_all_tag_groups(server: AsyncServer, adv_tag_group_path: str, *, options: dict = None) -> list:
+    '''Coroutine version of `kepconfig.adv_tags.adv_tag_group.get_all_tag_groups`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    path_obj = adv_tags._adv_tag_path_split(adv_tag_group_path, isItem=True)
+    url = adv_tags._create_adv_tags_base_url(server.url, path_obj) + _create_url()
+    r = await server._config_get(url, params=options)
+    return r.payload
+
+def iter_all_tag_groups(server: AsyncServer, adv_tag_group_path: str, *, options: dict = None, page_size: int = 100, prefetch: bool = True) -> AsyncIterator[dict]:
+    '''Async generator version of `kepconfig.adv_tags.adv_tag_group.iter_all_tag_groups`. Parameters are the same, with `server` 
+    being an instance of `AsyncServer`. Use with `async for`.'''
+    return _iter_pages_async(lambda o: get_all_tag_groups(server, adv_tag_group_path, options= o), options, page_size, prefetch)
@@ -0,0 +1,80 @@
+# -------------------------------------------------------------------------
+# Copyright (c) PTC Inc. and/or all its affiliates. All rights reserved.
+# See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+r"""`derived_tags` provides coroutine versions of the `kepconfig.adv_tags.derived_tags` API for use
+with `kepconfig.aio.connection.AsyncServer`.
+"""
+
+from ..connection import AsyncServer
+from ...error import KepHTTPError
+from ...utils import _add_result, _multi_status_data, _iter_pages_async
+from ...tracing import _traced
+from typing import Union, AsyncIterator
+from .. import adv_tags
+from ...adv_tags.derived_tags import DERIVED_TAGS_ROOT, _get_derived_tags_url
+
+@_traced
+async def add_derived_tag(server: AsyncServer, adv_tag_group_path: str, DATA: Union[dict, list], *, multi_status: bool = False) -> Union[bool, list]:
+    '''Coroutine version of `kepconfig.adv_tags.derived_tags.add_derived_tag`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    path_obj = adv_tags._adv_tag_path_split(adv_tag_group_path, isItem=False)
+    url = adv_tags._create_adv_tags_base_url(server.url, path_obj) + _get_derived_tags_url()
+
+    DATA = _multi_status_data(DATA, multi_status)
+    r = await server._config_add(url, DATA)
+    return _add_result(r, DATA, multi_status, lambda items: add_derived_tag(server, adv_tag_group_path, items, multi_status= True))
+
+@_traced
+async def modify_derived_tag(server: AsyncServer, derived_tag_path: str, DATA: dict, force: bool = False) -> bool:
+    '''Coroutine version of `kepconfig.adv_tags.derived_tags.modify_derived_tag`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    derived_tag_data = await server._force_update_check(force, DATA)
+    path_obj = adv_tags._adv_tag_path_split(derived_tag_path, isItem=True)
+    url = adv_tags._create_adv_tags_base_url(server.url, path_obj) + _get_derived_tags_url(path_obj['item'])
+
+    r = await server._config_update(url, derived_tag_data)
+    if r.code == 200:
+        return True
+    else:
+        raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
+
+@_traced
+async def del_derived_tag(server: AsyncServer, derived_tag_path: str) -> bool:
+    '''Coroutine version of `kepconfig.adv_tags.derived_tags.del_derived_tag`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    path_obj = adv_tags._adv_tag_path_split(derived_tag_path, isItem=True)
+    url = adv_tags._create_adv_tags_base_url(server.url, path_obj) + _get_derived_tags_url(path_obj['item'])
+
+    r = await server._config_del(url)
+    if r.code == 200:
+        return True
+    else:
+        raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
+
+@_traced
+async def get_derived_tag(server: AsyncServer, derived_tag_path: str) -> dict:
+    '''Coroutine version of `kepconfig.adv_tags.derived_tags.get_derived_tag`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    path_obj = adv_tags._adv_tag_path_split(derived_tag_path, isItem=True)
+    url = adv_tags._create_adv_tags_base_url(server.url, path_obj) + _get_derived_tags_url(path_obj['item'])
+
+    r = await server._config_get(url)
+    return r.payload
+
+@_traced
+async def get_all_derived_tags(server: AsyncServer, adv_tag_group_path: str, *, options: dict = None) -> list:
+    '''Coroutine version of `kepconfig.adv_tags.derived_tags.get_all_derived_tags`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    path_obj = adv_tags._adv_tag_path_split(adv_tag_group_path, isItem=False)
+    url = adv_tags._create_adv_tags_base_url(server.url, path_obj) + _get_derived_tags_url()
+
+    r = await server._config_get(url, params=options)
+    return r.payload
+
+def iter_all_derived_tags(server: AsyncServer, adv_tag_group_path: str, *, options: dict = None, page_size: int = 100, prefetch: bool = True) -> AsyncIterator[dict]:
+    '''Async generator version of `kepconfig.adv_tags.derived_tags.iter_all_derived_tags`. Parameters are the same, with `server` 
+    being an instance of `AsyncServer`. Use with `async for`.'''
+    return _iter_pages_async(lambda o: get_all_derived_tags(server, adv_tag_group_path, options= o), options, page_size, prefetch)
@@ -0,0 +1,394 @@
+# -------------------------------------------------------------------------
+# Copyright (c) PTC Inc. and/or all its affiliates. All rights reserved.
+# See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+r"""`connection` exposes an `AsyncServer` class, the asyncio counterpart of
+`kepconfig.connection.server`. All RESTful requests are made with a non-blocking
+HTTP transport so many configuration calls can run concurrently on one event loop.
+"""
+
+import datetime
+import asyncio
+import heapq
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Union
+from ..connection import server, _content_length, _FileWriter
+from ..helpers.cache import _cache_key
+from ..helpers.adaptive import _latency_class
+from ..error import KepError, KepHTTPError, KepURLError
+from ..structures import KepServiceResponse, KepServiceStatus, _HttpDataAbstract, Filter
+from ..helpers.async_connection_pool import _AsyncPoolManager
+from ..helpers.json_stream import _aiter_body, _aiter_response, _ASYNC_READ_ERRORS
+
+
+class AsyncServer(server):
+    '''A class to represent a connection to an instance of Kepware for use with asyncio. Connection
+    parameters and properties are the same as `kepconfig.connection.server`, while every method that
+    communicates with Kepware is a coroutine. Use this class with the functions in the `kepconfig.aio`
+    modules.
+
+    The instance should only be used from a single event loop. HTTP proxies configured in the
+    environment are not used by the async transport.
+
+    :param host: host name or IP address
+    :param port: port of Configuration API
+    :param username: username to conduct "Basic Authentication"
+    :param password: password to conduct "Basic Authentication"
+    :param https: Sets `SSL_on` to use HTTPS connection (Default: False)
+    :param max_connections: Maximum number of requests in flight at once per host/port. Additional
+        requests wait for a connection to become available (Default: 100)
+    :param timeout: Time in seconds allowed to connect and for every read and write on a connection, 
+        or None to wait without limit (Default: 60)
+
+    Example:
+
+        async with AsyncServer('127.0.0.1', 57412, 'Administrator', '') as server:
+            info = await server.get_info()
+    '''
+
+    def __init__(self, host: str, port: int, user: str, pw: str, https: bool = False, *, max_connections: int = 100,
+                 timeout: float = 60.0):
+        super().__init__(host, port, user, pw, https)
+        self.__pool = _AsyncPoolManager(max_connections=max_connections, timeout=timeout)
+
+    @property
+    def pool_size(self):
+        return self.__pool.maxsize
+
+    @pool_size.setter
+    def pool_size(self, val):
+        if isinstance(val, int) and val > 0:
+            self.__pool.maxsize = val
+
+    @property
+    def max_connections(self):
+        return self.__pool.max_connections
+
+    @max_connections.setter
+    def max_connections(self, val):
+        if isinstance(val, int) and val > 0:
+            self.__pool.max_connections = val
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def get_status(self) -> dict:
+        '''Coroutine version of `kepconfig.connection.server.get_status`.'''
+        r = await self._config_get(f'{self.url}/status')
+        return r.payload
+
+    async def get_info(self) -> dict:
+        '''Coroutine version of `kepconfig.connection.server.get_info`.'''
+        r = await self._config_get(f'{self.url}/about')
+        return r.payload
+
+    async def reinitialize(self, job_ttl: int = None) -> KepServiceResponse:
+        '''Coroutine version of `kepconfig.connection.server.reinitialize`.'''
+        url = self.url + self._project_services_url + '/ReinitializeRuntime'
+        return await self._kep_service_execute(url, None, job_ttl)
+
+    async def get_transaction_log(self, limit: int = None, start: datetime.datetime = None, end: datetime.datetime = None) -> list:
+        '''Coroutine version of `kepconfig.connection.server.get_transaction_log`.'''
+        query = self._create_query(start, end, limit)
+        r = await self._config_get(f'{self.url}{self._trans_log_url}', params= query)
+        return r.payload
+
+    async def get_event_log(self, limit: int = None, start: datetime.datetime = None, end: datetime.datetime = None, *, options: dict = None) -> list:
+        '''Coroutine version of `kepconfig.connection.server.get_event_log`.'''
+        query = self._create_query(start, end, limit, options)
+        r = await self._config_get(f'{self.url}{self._event_log_url}', params= query)
+        return r.payload
+
+    async def get_audit_log(self, limit: int = None, *, filters: list[Filter] = None, options: dict = None) -> list:
+        '''Coroutine version of `kepconfig.connection.server.get_audit_log`.'''
+        query = self._create_filter_query(filters, limit, options)
+        r = await self._config_get(f'{self.url}{self._audit_log_url}', params= query)
+        return r.payload
+
+    async def get_project_properties(self) -> dict:
+        '''Coroutine version of `kepconfig.connection.server.get_project_properties`.'''
+        r = await self._config_get(self.url + '/project')
+        return r.payload
+
+    async def modify_project_properties(self, DATA: dict, force: bool = False) -> bool:
+        '''Coroutine version of `kepconfig.connection.server.modify_project_properties`.'''
+        prop_data = await self._force_update_check(force, DATA)
+        r = await self._config_update(self.url + '/project', prop_data)
+        return self._modify_result(self.url + '/project', r)
+
+    async def import_empty_project(self) -> KepServiceResponse:
+        '''Coroutine version of `kepconfig.connection.server.import_empty_project`.'''
+        return await self.import_project_configuration({"project":{}})
+
+    async def import_project_configuration(self, DATA: dict, *, stream: bool = False) -> KepServiceResponse:
+        '''Coroutine version of `kepconfig.connection.server.import_project_configuration`.'''
+        url = self.url + self._project_services_url + '/JsonProjectLoad'
+        return await self._kep_service_execute(url, DATA, stream= stream)
+
+    async def export_project_configuration(self) -> dict:
+        '''Coroutine version of `kepconfig.connection.server.export_project_configuration`.'''
+        return await self._config_get_structure(self.url + '/project')
+
+    async def iter_project_configuration(self):
+        '''Async generator version of `kepconfig.connection.server.iter_project_configuration`. The response 
+        is parsed in a worker thread as it is received. Use with `async for`.'''
+        r = await self._connect('GET', self._url_validate(self.url + '/project?content=serialize'), stream= 'tree')
+        async for item in r.payload:
+            yield item
+
+    async def export_project_to_file(self, filename: str, *, compress: bool = None, chunk_size: int = 65536) -> int:
+        '''Coroutine version of `kepconfig.connection.server.export_project_to_file`. The response is 
+        written to the file as it is received, the file is written in a worker thread so the event loop 
+        isn't blocked.'''
+        r = await self._config_get(self.url + '/project', params= {"content": "serialize"}, raw= chunk_size)
+        chunks = r.payload
+        loop = asyncio.get_running_loop()
+        # A single worker thread keeps the writes in order, also when the export is cancelled
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            try:
+                writer = await loop.run_in_executor(executor, _FileWriter, filename, compress)
+                try:
+                    async for chunk in chunks:
+                        await loop.run_in_executor(executor, writer.write, chunk)
+                except BaseException:
+                    executor.submit(writer.abort)
+                    raise
+                await loop.run_in_executor(executor, writer.commit)
+            finally:
+                await chunks.aclose()
+        return writer.size
+
+    async def save_project(self, filename: str, password: str = None, job_ttl: int = None) -> KepServiceResponse:
+        '''Coroutine version of `kepconfig.connection.server.save_project`.'''
+        url = self.url + self._project_services_url + '/ProjectSave'
+        prop_data = self._project_file_data(filename, password)
+        return await self._kep_service_execute(url, prop_data, job_ttl)
+
+    async def load_project(self, filename: str, password: str = None, job_ttl: int = None) -> KepServiceResponse:
+        '''Coroutine version of `kepconfig.connection.server.load_project`.'''
+        url = self.url + self._project_services_url + '/ProjectLoad'
+        prop_data = self._project_file_data(filename, password)
+        return await self._kep_service_execute(url, prop_data, job_ttl)
+
+    async def get_project_backup_info(self) -> dict:
+        '''Coroutine version of `kepconfig.connection.server.get_project_backup_info`.'''
+        r = await self._config_get(self.url + '/project/backups')
+        return r.payload
+
+    async def backup_project(self, job_ttl: int = None) -> KepServiceResponse:
+        '''Coroutine version of `kepconfig.connection.server.backup_project`.'''
+        url = self.url + self._project_services_url + '/CreateBackup'
+        return await self._kep_service_execute(url, TTL= job_ttl)
+
+    async def service_status(self, resp: KepServiceResponse):
+        '''Coroutine version of `kepconfig.connection.server.service_status`.'''
+        r = await self._config_get(self.url + self._job_url(resp))
+        return self._job_status(r)
+
+    async def wait_for_jobs(self, jobs: Union[KepServiceResponse, list], timeout: Union[float, list] = None, *, 
+                            poll_interval: float = 0.1, max_poll_interval: float = 5.0, backoff: float = 2.0) -> Union[KepServiceStatus, list]:
+        '''Coroutine version of `kepconfig.connection.server.wait_for_jobs`. Jobs that are due at the same 
+        time are polled concurrently.'''
+        single = isinstance(jobs, KepServiceResponse)
+        job_list = [jobs] if single else list(jobs)
+        results, schedule = self._schedule_jobs(job_list, timeout, poll_interval)
+        while schedule:
+            delay = schedule[0][0] - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            now = time.monotonic()
+            due = []
+            while schedule and schedule[0][0] <= now:
+                due.append(heapq.heappop(schedule))
+            polls = await asyncio.gather(*[self.service_status(job_list[i]) for _, i, _, _ in due], return_exceptions=True)
+            for (_, i, interval, deadline), status in zip(due, polls):
+                if isinstance(status, KepHTTPError):
+                    results[i] = KepServiceStatus(False, '', str(status.payload))
+                elif isinstance(status, BaseException):
+                    raise status
+                else:
+                    self._reschedule_job(schedule, results, i, status, interval, deadline, max_poll_interval, backoff)
+        return results[0] if single else results
+
+    async def close(self):
+        '''Closes all idle keep-alive connections held for this server.'''
+        self._clear_pool()
+
+    # The request building and response handling of these functions is shared with 
+    # `kepconfig.connection.server`, only the requests are awaited
+
+    async def _config_add(self, url, DATA):
+        data = self._add_body(DATA)
+        url_obj = self._url_validate(url)
+        try:
+            r = await self._connect('POST', url_obj, data)
+        finally:
+            self._invalidate_reads(url_obj)
+        self._note_write(url_obj, r)
+        return r
+
+    async def _config_del(self, url):
+        url_obj = self._url_validate(url)
+        try:
+            r = await self._connect('DELETE', url_obj)
+        finally:
+            self._invalidate_reads(url_obj)
+        self._note_write(url_obj, r)
+        return r
+
+    async def _config_update(self, url, DATA = None, *, stream = False):
+        url_obj = self._url_validate(url)
+        try:
+            r = await self._connect('PUT', url_obj, self._update_body(DATA, stream))
+        except KepHTTPError as err:
+            if not self._is_project_id_conflict(err, DATA):
+                raise err
+            if not self._update_project_id(DATA, await self._refresh_project_id()):
+                raise err
+            r = await self._connect('PUT', url_obj, self._update_body(DATA, stream))
+        finally:
+            self._invalidate_reads(url_obj)
+        self._note_write(url_obj, r)
+        return r
+
+    async def _config_get(self, url, *, params = None, cached = True, raw = None):
+        url_obj = self._get_url(url, params)
+        stream = self._get_stream(raw)
+        if stream is not None:
+            return await self._connect('GET', url_obj, stream= stream)
+        r, cache, generation = self._cache_lookup(url_obj, cached)
+        if r is not None:
+            return r
+        r = await self._coalesced_get(url_obj)
+        if cache is not None:
+            cache.put(url_obj, r.payload, generation)
+        return r
+
+    async def _coalesced_get(self, url):
+        flights = self._flights
+        if flights is None:
+            return await self._connect('GET', url)
+        return await flights.do_async(_cache_key(url)[0], lambda: self._connect('GET', url))
+
+    async def _config_get_serialized(self, url):
+        if not self._serialize_supported:
+            return None
+        try:
+            payload = await self._config_get_structure(url)
+        except KepHTTPError as err:
+            if self._serialize_unsupported(err):
+                return None
+            raise err
+        return payload if isinstance(payload, dict) else None
+
+    async def _config_get_structure(self, url):
+        disk = self._disk_cache
+        if disk is None:
+            return (await self._config_get(url, params= {"content": "serialize"})).payload
+        url_obj = self._url_validate(url)
+        project_id = self._tracked_project_id()
+        tracked = project_id is not None
+        if not tracked:
+            project_id = await self._read_project_id()
+        if project_id is not None:
+            payload = disk.load(self.username, url_obj, project_id)
+            if payload is not None:
+                return payload
+        payload = (await self._config_get(url, params= {"content": "serialize"})).payload
+        current = self._tracked_project_id() if tracked else await self._read_project_id()
+        if project_id is not None and current == project_id:
+            disk.store(self.username, url_obj, project_id, payload)
+        return payload
+
+    async def _force_update_check(self, force, DATA):
+        if self._needs_project_id(force, DATA):
+            project_id = self._tracked_project_id()
+            if project_id is None:
+                project_id = await self._refresh_project_id()
+            self._set_project_id(DATA, project_id)
+        return DATA
+
+    async def _refresh_project_id(self):
+        if self._project_id_tracker is not None:
+            self._project_id_tracker.note_refresh()
+        return await self._read_project_id()
+
+    async def _read_project_id(self):
+        try:
+            project_data = await self._config_get(self.url + '/project', cached= False)
+        except KepError:
+            return None
+        return self._project_id_of(project_data)
+
+    async def _kep_service_execute(self, url, DATA = None, TTL = None, *, stream = False):
+        try:
+            r = await self._config_update(url, self._service_data(DATA, TTL), stream= stream)
+            return self._service_job(r)
+        except KepHTTPError as err:
+            return self._service_error(err)
+
+    # General connect call to manage HTTP responses for all methods
+    # Retries requests rejected as too busy based on the retry policy. Bodies that are consumed 
+    # as they are sent are never retried
+    async def _connect(self, method, url, body = None, stream = None):
+        limiter = self._limiter_for(method)
+        attempt = 1
+        while True:
+            if limiter is not None:
+                await limiter.acquire_async()
+            adaptive = self._adaptive_limiter
+            start = None
+            error = None
+            info = None
+            try:
+                if adaptive is not None:
+                    start = await adaptive.acquire_async()
+                if self._instrumented:
+                    info = self._request_started(method, url, attempt)
+                r = await self._send(method, url, body, stream)
+                if info is not None:
+                    self._request_finished(info, body, r)
+                return r
+            except (KepHTTPError, KepURLError) as err:
+                error = err
+                delay = self._attempt_failed(info, body, err, attempt)
+                if delay is None:
+                    raise err
+            finally:
+                if start is not None:
+                    adaptive.release(start, error, _latency_class(method, url))
+                if limiter is not None:
+                    limiter.release_async()
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _send(self, method, url, body = None, stream = None):
+        data = _HttpDataAbstract()
+        try:
+            resp = await self.__pool.urlopen(method, url, body, self._request_headers(), ssl_context=self._ssl_context,
+                                             stream= stream is not None)
+            if stream is not None and not 200 <= resp.status < 300:
+                try:
+                    resp.body = await resp.read()
+                finally:
+                    resp.release()
+        except _ASYNC_READ_ERRORS as err:
+            raise KepURLError(msg=err, url=url)
+        if stream is None or resp.body is not None:
+            return self._response_data(url, resp.status, resp.reason, resp.headers, resp.body)
+        # The body is received as the payload is consumed
+        data.size = _content_length(resp.headers)
+        data.payload = _aiter_body(resp, stream) if isinstance(stream, int) else _aiter_response(resp, tree= stream == 'tree')
+        data.code = resp.status
+        data.reason = resp.reason
+        return data
+
+    def _clear_pool(self):
+        super()._clear_pool()
+        self.__pool.clear()
@@ -0,0 +1,11 @@
+# -------------------------------------------------------------------------
+# Copyright (c) PTC Inc. and/or all its affiliates. All rights reserved.
+# See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+r"""`connectivity` provides coroutine versions of the `kepconfig.connectivity` module functions for use
+with `kepconfig.aio.connection.AsyncServer`.
+"""
+
+from . import channel, device, tag, egd, udd
@@ -0,0 +1,103 @@
+# -------------------------------------------------------------------------
+# Copyright (c) PTC Inc. and/or all its affiliates. All rights reserved.
+# See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+r"""`channel` provides coroutine versions of the `kepconfig.connectivity.channel` API for use
+with `kepconfig.aio.connection.AsyncServer`.
+"""
+
+import inspect
+from ..connection import AsyncServer
+from ...error import KepHTTPError, KepError
+from ...utils import _add_result, _multi_status_data, _iter_pages_async
+from ...tracing import _traced
+from typing import Union, AsyncIterator
+from . import device
+from ...connectivity.channel import CHANNEL_ROOT, _create_url
+from ...connectivity.tag import _normalize_tag_structure
+
+@_traced
+async def add_channel(server: AsyncServer, DATA: Union[dict, list], *, multi_status: bool = False) -> Union[bool, list]:
+    '''Coroutine version of `kepconfig.connectivity.channel.add_channel`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+
+    DATA = _multi_status_data(DATA, multi_status)
+    r = await server._config_add(server.url + _create_url(), DATA)
+    return _add_result(r, DATA, multi_status, lambda items: add_channel(server, items, multi_status= True))
+
+@_traced
+async def del_channel(server: AsyncServer, channel: str) -> bool:
+    '''Coroutine version of `kepconfig.connectivity.channel.del_channel`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+
+    r = await server._config_del(server.url + _create_url(channel))
+    if r.code == 200: return True 
+    else: 
+        raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
+
+@_traced
+async def modify_channel(server: AsyncServer, DATA: dict, *, channel: str = None, force: bool = False) -> bool:
+    '''Coroutine version of `kepconfig.connectivity.channel.modify_channel`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    
+    channel_data = await server._force_update_check(force, DATA)
+    if channel == None:
+        try:
+            r = await server._config_update(server.url + _create_url(channel_data['common.ALLTYPES_NAME']), channel_data)
+            if r.code == 200: return True 
+            else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
+        except KeyError as err:
+            err_msg = 'Error: No Channel identified in DATA | Key Error: {}'.format(err)
+            raise KepError(err_msg)
+        # except Exception as e:
+        #     return 'Error: Error with {}: {}'.format(inspect.currentframe().f_code.co_name, str(e))
+    else:
+        r = await server._config_update(server.url + _create_url(channel), channel_data)
+        if r.code == 200: return True 
+        else: 
+            raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
+
+@_traced
+async def get_channel(server: AsyncServer, channel: str)  -> dict:
+    '''Coroutine version of `kepconfig.connectivity.channel.get_channel`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+
+    r = await server._config_get(server.url + _create_url(channel))
+    return r.payload
+
+@_traced
+async def get_all_channels(server: AsyncServer, *, options: dict = None) -> list:
+    '''Coroutine version of `kepconfig.connectivity.channel.get_all_channels`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+
+    r = await server._config_get(server.url + _create_url(), params= options)
+    return r.payload
+
+def iter_all_channels(server: AsyncServer, *, options: dict = None, page_size: int = 100, prefetch: bool = True) -> AsyncIterator[dict]:
+    '''Async generator version of `kepconfig.connectivity.channel.iter_all_channels`. Parameters are the same, with `server` 
+    being an instance of `AsyncServer`. Use with `async for`.'''
+    return _iter_pages_async(lambda o: get_all_channels(server, options= o), options, page_size, prefetch)
+
+@_traced
+async def get_channel_structure(server: AsyncServer, channel: str, *, serialize: bool = False) -> dict:
+    '''Coroutine version of `kepconfig.connectivity.channel.get_channel_structure`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+
+    if serialize:
+        r = await server._config_get_serialized(server.url + _create_url(channel))
+        if r is not None and 'devices' in r:
+            # Devices are returned under 'device' by both paths
+            r['device'] = r.pop('devices')
+            for dev in r['device']:
+                _normalize_tag_structure(dev)
+            return r
+
+    channel_properties = await get_channel(server, channel)
+    device_list = await device.get_all_devices(server,channel)
+    device_properties = []
+    for dev in device_list:
+        dev_struct = await device.get_device_structure(server,channel + '.' + dev['common.ALLTYPES_NAME'], serialize=False)
+        device_properties.append(dev_struct)
+    return {**channel_properties,'device': device_properties}
@@ -0,0 +1,121 @@
+# -------------------------------------------------------------------------
+# Copyright (c) PTC Inc. and/or all its affiliates. All rights reserved.
+# See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+r"""`device` provides coroutine versions of the `kepconfig.connectivity.device` API for use
+with `kepconfig.aio.connection.AsyncServer`.
+"""
+
+from ...structures import KepServiceResponse
+from ..connection import AsyncServer
+from ...error import KepHTTPError, KepError
+from ...utils import path_split, _add_result, _multi_status_data, _iter_pages_async
+from ...tracing import _traced
+from typing import Union, AsyncIterator
+from . import channel, tag
+import inspect
+from ...connectivity.device import DEVICE_ROOT, ATG_URL, _create_url
+from ...connectivity.tag import _create_path_url, _has_tag_children, _normalize_tag_structure
+
+@_traced
+async def add_device(server: AsyncServer, channel_name: str, DATA: Union[dict, list], *, multi_status: bool = False) -> Union[bool, list]:
+    '''Coroutine version of `kepconfig.connectivity.device.add_device`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+
+    DATA = _multi_status_data(DATA, multi_status)
+    r = await server._config_add(server.url + channel._create_url(channel_name) + _create_url(), DATA)
+    return _add_result(r, DATA, multi_status, lambda items: add_device(server, channel_name, items, multi_status= True))
+
+@_traced
+async def del_device(server: AsyncServer, device_path: str) -> bool:
+    '''Coroutine version of `kepconfig.connectivity.device.del_device`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+
+    path_obj = path_split(device_path)
+    try:
+        r = await server._config_del(server.url + channel._create_url(path_obj['channel']) + _create_url(path_obj['device']))
+        if r.code == 200: return True 
+        else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
+    except KeyError as err:
+        err_msg = 'Error: No {} identified in {} | Function: {}'.format(err,'device_path', inspect.currentframe().f_code.co_name)
+        raise KepError(err_msg)
+
+@_traced
+async def modify_device(server: AsyncServer, device_path: str, DATA: dict, *, force: bool = False) -> bool:
+    '''Coroutine version of `kepconfig.connectivity.device.modify_device`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+
+    device_data = await server._force_update_check(force, DATA)
+
+    path_obj = path_split(device_path)
+    try:
+        r = await server._config_update(server.url + channel._create_url(path_obj['channel']) + _create_url(path_obj['device']), device_data)
+        if r.code == 200: return True 
+        else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
+    except KeyError as err:
+            err_msg = 'Error: No {} identified in {} | Function: {}'.format(err,'device_path', inspect.currentframe().f_code.co_name)
+            raise KepError(err_msg)
+
+@_traced
+async def get_device(server: AsyncServer, device_path: str) -> dict:
+    '''Coroutine version of `kepconfig.connectivity.device.get_device`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+
+    path_obj = path_split(device_path)
+    try:
+        r = await server._config_get(server.url + channel._create_url(path_obj['channel']) + _create_url(path_obj['device']))
+        return r.payload
+    except KeyError as err:
+        err_msg = 'Error: No {} identified in {} | Function: {}'.format(err,'device_path', inspect.currentframe().f_code.co_name)
+        raise KepError(err_msg)
+
+@_traced
+async def get_all_devices(server: AsyncServer, channel_name: str, *, options: dict = None) -> list:
+    '''Coroutine version of `kepconfig.connectivity.device.get_all_devices`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    r = await server._config_get(f'{server.url}{channel._create_url(channel_name)}{_create_url()}', params= options)
+    return r.payload
+
+def iter_all_devices(server: AsyncServer, channel_name: str, *, options: dict = None, page_size: int = 100, prefetch: bool = True) -> AsyncIterator[dict]:
+    '''Async generator version of `kepconfig.connectivity.device.iter_all_devices`. Parameters are the same, with `server` 
+    being an instance of `AsyncServer`. Use with `async for`.'''
+    return _iter_pages_async(lambda o: get_all_devices(server, channel_name, options= o), options, page_size, prefetch)
+
+@_traced
+async def auto_tag_gen(server: AsyncServer, device_path: str, job_ttl: int = None) -> KepServiceResponse:
+    '''Coroutine version of `kepconfig.connectivity.device.auto_tag_gen`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    
+    path_obj = path_split(device_path)
+    try:
+        url = server.url +channel._create_url(path_obj['channel']) + _create_url(path_obj['device']) + ATG_URL
+        job = await server._kep_service_execute(url, None, job_ttl)
+        return job
+    except KeyError as err:
+        err_msg = 'Error: No {} identified in {} | Function: {}'.format(err,'device_path', inspect.currentframe().f_code.co_name)
+        raise KepError(err_msg)
+
+@_traced
+async def get_all_tags_tag_groups(server: AsyncServer, device_path: str) -> dict:
+    '''Coroutine version of `kepconfig.connectivity.device.get_all_tags_tag_groups`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+
+    r = await tag.get_full_tag_structure(server, device_path,recursive=True)
+    return r
+
+@_traced
+async def get_device_structure(server, device_path, *, serialize: bool = False) -> dict:
+    '''Coroutine version of `kepconfig.connectivity.device.get_device_structure`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+
+    if serialize:
+        r = await server._config_get_serialized(_create_path_url(server, device_path))
+        if _has_tag_children(r):
+            _normalize_tag_structure(r)
+            return r
+
+    tags = await tag.get_full_tag_structure(server, device_path,recursive=True, serialize=False)
+    device_properties = await get_device(server,device_path)
+    return {**device_properties, **tags}
@@ -0,0 +1,12 @@
+# -------------------------------------------------------------------------
+# Copyright (c) PTC Inc. and/or all its affiliates. All rights reserved.
+# See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+r"""`egd` provides coroutine versions of the `kepconfig.connectivity.egd` module functions for use
+with `kepconfig.aio.connection.AsyncServer`.
+"""
+
+from . import exchange, range, name
+from ....connectivity.egd import CONSUMER_EXCHANGE, PRODUCER_EXCHANGE
@@ -0,0 +1,73 @@
+# -------------------------------------------------------------------------
+# Copyright (c) PTC Inc. and/or all its affiliates. All rights reserved.
+# See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+r"""`exchange` provides coroutine versions of the `kepconfig.connectivity.egd.exchange` API for use
+with `kepconfig.aio.connection.AsyncServer`.
+"""
+
+from ...connection import AsyncServer
+from ....error import KepHTTPError, KepError
+from ....utils import _add_result, _multi_status_data
+from ....tracing import _traced
+from typing import Union
+from .. import egd as EGD
+from ....connectivity.egd.exchange import CONSUMER_ROOT, PRODUCER_ROOT, _create_url
+
+@_traced
+async def add_exchange(server: AsyncServer, device_path: str, ex_type: str, DATA: Union[dict, list], *, multi_status: bool = False) -> Union[bool, list]:
+    '''Coroutine version of `kepconfig.connectivity.egd.exchange.add_exchange`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+
+    DATA = _multi_status_data(DATA, multi_status)
+    r = await server._config_add(server.url + _create_url(device_path, ex_type), DATA)
+    return _add_result(r, DATA, multi_status, lambda items: add_exchange(server, device_path, ex_type, items, multi_status= True))
+
+@_traced
+async def del_exchange(server: AsyncServer, device_path: str, ex_type: str, exchange_name: str) -> bool:
+    '''Coroutine version of `kepconfig.connectivity.egd.exchange.del_exchange`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+
+    r = await server._config_del(server.url + _create_url(device_path, ex_type, exchange_name))
+    if r.code == 200: return True 
+    else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
+
+@_traced
+async def modify_exchange(server: AsyncServer, device_path: str, ex_type: str, DATA: dict, *, exchange_name: str = None, force: bool = False) -> bool:
+    '''Coroutine version of `kepconfig.connectivity.egd.exchange.modify_exchange`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    
+    exchange_data = await server._force_update_check(force, DATA)
+    if exchange_name == None:
+        try:
+            r = await server._config_update(server.url + _create_url(device_path, ex_type, exchange_data['common.ALLTYPES_NAME']), exchange_data)
+            if r.code == 200: return True 
+            else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
+        except KeyError as err:
+            err_msg = f'Error: No exchange identified in DATA | Key Error: {type(DATA)}'
+            raise KepError(err_msg) 
+    else:
+        r = await server._config_update(server.url + _create_url(device_path, ex_type, exchange_name), exchange_data)
+        if r.code == 200: return True 
+        else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
+
+@_traced
+async def get_exchange(server: AsyncServer, device_path: str, ex_type: str, exchange_name: str = None, *, options: dict = None) -> Union[dict, list]:
+    '''Coroutine version of `kepconfig.connectivity.egd.exchange.get_exchange`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    if exchange_name == None:
+        r = await server._config_get(f'{server.url}{_create_url(device_path, ex_type)}', params= options)
+    else:
+        r = await server._config_get(f'{server.url}{_create_url(device_path, ex_type, exchange_name)}')
+    return r.payload
+
+@_traced
+async def get_all_exchanges(server: AsyncServer, device_path: str, *, options: dict = None) -> list[list, list]:
+    '''Coroutine version of `kepconfig.connectivity.egd.exchange.get_all_exchanges`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    exchange_list = []
+    exchange_list.append(await get_exchange(server, device_path, EGD.CONSUMER_EXCHANGE, options= options))
+    exchange_list.append(await get_exchange(server, device_path, EGD.PRODUCER_EXCHANGE, options= options))
+    return exchange_list
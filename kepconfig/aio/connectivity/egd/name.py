@@ -0,0 +1,64 @@
+# -------------------------------------------------------------------------
+# Copyright (c) PTC Inc. and/or all its affiliates. All rights reserved.
+# See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+r"""`name` provides coroutine versions of the `kepconfig.connectivity.egd.name` API for use
+with `kepconfig.aio.connection.AsyncServer`.
+"""
+
+from ...connection import AsyncServer
+from ....error import KepHTTPError, KepError
+from ....utils import _add_result, _multi_status_data
+from ....tracing import _traced
+from typing import Union
+from ....connectivity.egd.name import NAMES_ROOT, _create_url
+
+@_traced
+async def add_name_resolution(server: AsyncServer, device_path: str, DATA: Union[dict, list], *, multi_status: bool = False) -> Union[bool, list]:
+    '''Coroutine version of `kepconfig.connectivity.egd.name.add_name_resolution`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+
+    DATA = _multi_status_data(DATA, multi_status)
+    r = await server._config_add(server.url + _create_url(device_path), DATA)
+    return _add_result(r, DATA, multi_status, lambda items: add_name_resolution(server, device_path, items, multi_status= True))
+
+@_traced
+async def del_name_resolution(server: AsyncServer, device_path: str, name: str) -> bool:
+    '''Coroutine version of `kepconfig.connectivity.egd.name.del_name_resolution`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+
+    r = await server._config_del(server.url + _create_url(device_path, name))
+    if r.code == 200: return True 
+    else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
+
+@_traced
+async def modify_name_resolution(server: AsyncServer, device_path: str, DATA: dict, *, name: str = None, force: bool = False) -> bool:
+    '''Coroutine version of `kepconfig.connectivity.egd.name.modify_name_resolution`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    
+    name_data = await server._force_update_check(force, DATA)
+    if name == None:
+        try:
+            r = await server._config_update(server.url + _create_url(device_path, name_data['common.ALLTYPES_NAME']), name_data)
+            if r.code == 200: return True 
+            else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
+        except KeyError as err:
+            err_msg = f'Error: No name resolution identified in DATA | Key Error: {type(DATA)}'
+            raise KepError(err_msg) 
+    else:
+        r = await server._config_update(server.url + _create_url(device_path, name), name_data)
+        if r.code == 200: return True 
+        else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
+
+@_traced
+async def get_name_resolution(server: AsyncServer, device_path: str, name: str = None, *, options: dict = None) -> Union[dict, list]:
+    '''Coroutine version of `kepconfig.connectivity.egd.name.get_name_resolution`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+
+    if name == None:
+        r = await server._config_get(f'{server.url}{_create_url(device_path)}', params= options)
+    else:
+        r = await server._config_get(f'{server.url}{_create_url(device_path, name)}')
+    return r.payload
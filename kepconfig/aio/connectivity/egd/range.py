@@ -0,0 +1,63 @@
+# -------------------------------------------------------------------------
+# Copyright (c) PTC Inc. and/or all its affiliates. All rights reserved.
+# See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+r"""`range` provides coroutine versions of the `kepconfig.connectivity.egd.range` API for use
+with `kepconfig.aio.connection.AsyncServer`.
+"""
+
+from typing import Union
+from ...connection import AsyncServer
+from ....error import KepError, KepHTTPError
+from ....utils import _add_result, _multi_status_data
+from ....tracing import _traced
+from ....connectivity.egd.range import RANGES_ROOT, _create_url
+
+@_traced
+async def add_range(server: AsyncServer, device_path: str, ex_type: str, exchange_name: str, DATA: Union[dict, list], *, multi_status: bool = False) -> Union[bool, list]:
+    '''Coroutine version of `kepconfig.connectivity.egd.range.add_range`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+
+    DATA = _multi_status_data(DATA, multi_status)
+    r = await server._config_add(server.url + _create_url(device_path, ex_type, exchange_name), DATA)
+    return _add_result(r, DATA, multi_status, lambda items: add_range(server, device_path, ex_type, exchange_name, items, multi_status= True))
+
+@_traced
+async def del_range(server: AsyncServer, device_path: str, ex_type: str, exchange_name: str, range_name: str) -> bool:
+    '''Coroutine version of `kepconfig.connectivity.egd.range.del_range`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+
+    r = await server._config_del(server.url + _create_url(device_path, ex_type, exchange_name, range_name))
+    if r.code == 200: return True 
+    else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
+
+@_traced
+async def modify_range(server: AsyncServer, device_path: str, ex_type: str, exchange_name: str, DATA: dict, *, range_name: str = None, force: bool = False) -> bool:
+    '''Coroutine version of `kepconfig.connectivity.egd.range.modify_range`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    
+    range_data = await server._force_update_check(force, DATA)
+    if range_name == None:
+        try:
+            r = await server._config_update(server.url + _create_url(device_path, ex_type, exchange_name, range_data['common.ALLTYPES_NAME']), range_data)
+            if r.code == 200: return True 
+            else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
+        except KeyError as err:
+            err_msg = 'Error: No range identified in DATA | Key Error: {}'.format(err)
+            raise KepError(err_msg)
+    else:
+        r = await server._config_update(server.url + _create_url(device_path, ex_type, exchange_name, range_name), range_data)
+        if r.code == 200: return True 
+        else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
+
+@_traced
+async def get_range(server: AsyncServer, device_path: str, ex_type: str, exchange_name: str, range_name: str = None, *, options: dict = None) -> Union[dict, list]:
+    '''Coroutine version of `kepconfig.connectivity.egd.range.get_range`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    if range_name == None:
+        r = await server._config_get(f'{server.url}{_create_url(device_path, ex_type, exchange_name)}', params= options)
+    else:
+        r = await server._config_get(f'{server.url}{_create_url(device_path, ex_type, exchange_name, range_name)}')
+    return r.payload
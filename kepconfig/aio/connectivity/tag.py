@@ -0,0 +1,337 @@
+# -------------------------------------------------------------------------
+# Copyright (c) PTC Inc. and/or all its affiliates. All rights reserved.
+# See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+r"""`tag` provides coroutine versions of the `kepconfig.connectivity.tag` API for use
+with `kepconfig.aio.connection.AsyncServer`.
+"""
+
+from ..connection import AsyncServer
+from ...error import KepError, KepHTTPError, KepURLError
+from ...utils import path_split, _add_result, _multi_status_data, _iter_pages_async
+from ...structures import MultiStatusResult
+from ...tracing import _traced
+from typing import Union, AsyncIterator
+from . import channel, device
+import inspect
+import asyncio
+from ...connectivity.tag import (TAGS_ROOT, TAG_GRP_ROOT, _create_tags_url, _create_tag_groups_url, _create_path_url,
+                                 _has_tag_children, _normalize_tag_structure, _bulk_work_by_device, _bulk_chunks,
+                                 _bulk_record_result, _bulk_resubmit_data)
+
+@_traced
+async def add_tag(server: AsyncServer, tag_path: str, DATA: Union[dict, list], *, multi_status: bool = False) -> Union[bool, list]:
+    '''Coroutine version of `kepconfig.connectivity.tag.add_tag`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+
+    path_obj = path_split(tag_path)
+    try:
+        url = server.url+channel._create_url(path_obj['channel'])+device._create_url(path_obj['device'])
+        if 'tag_path' in path_obj:
+            for tg in path_obj['tag_path']:
+                url += _create_tag_groups_url(tag_group=tg)
+        url += _create_tags_url()
+    except KeyError as err:
+        err_msg = 'Error: No key {} identified | Function: {}'.format(err, inspect.currentframe().f_code.co_name)
+        raise KepError(err_msg)
+    except Exception as e:
+        err_msg = 'Error: Error with {}: {}'.format(inspect.currentframe().f_code.co_name, str(e))
+        raise KepError(err_msg)
+    DATA = _multi_status_data(DATA, multi_status)
+    r = await server._config_add(url, DATA)
+    return _add_result(r, DATA, multi_status, lambda items: add_tag(server, tag_path, items, multi_status= True))
+
+@_traced
+async def add_tag_group(server: AsyncServer, tag_group_path: str, DATA: Union[dict, list], *, multi_status: bool = False) -> Union[bool, list]:
+    '''Coroutine version of `kepconfig.connectivity.tag.add_tag_group`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+
+    path_obj = path_split(tag_group_path)
+    try:
+        url = server.url+channel._create_url(path_obj['channel'])+device._create_url(path_obj['device'])
+        if 'tag_path' in path_obj:
+            for tg in path_obj['tag_path']:
+                url += _create_tag_groups_url(tag_group=tg)
+        url += _create_tag_groups_url()
+    except KeyError as err:
+        err_msg = 'Error: No key {} identified | Function: {}'.format(err, inspect.currentframe().f_code.co_name)
+        raise KepError(err_msg)
+    except Exception as e:
+        err_msg = 'Error: Error with {}: {}'.format(inspect.currentframe().f_code.co_name, str(e))
+        raise KepError(err_msg)
+    DATA = _multi_status_data(DATA, multi_status)
+    r = await server._config_add(url, DATA)
+    return _add_result(r, DATA, multi_status, lambda items: add_tag_group(server, tag_group_path, items, multi_status= True))
+
+@_traced
+async def add_all_tags(server: AsyncServer, ch_dev_path: str, DATA: dict) -> Union[bool, list]:
+    '''Coroutine version of `kepconfig.connectivity.tag.add_all_tags`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    
+    tags_result = False
+    tag_groups_result = False
+
+    # check to see if there are dict entries for tags or tag groups
+    if ('tag_groups' not in DATA) and ('tags' not in DATA):
+        return False
+
+    if 'tags' in DATA:
+        tags_result = await add_tag(server, ch_dev_path, DATA['tags'])
+    if 'tag_groups' in DATA:
+        #Add all Tag Groups
+        tag_groups_result = await add_tag_group(server, ch_dev_path, DATA['tag_groups'])
+    
+    # build results return from both calls
+    if tags_result == True and tag_groups_result == True:
+        return True
+    elif tags_result == True:
+        return [[], tag_groups_result]
+    elif tag_groups_result == True:
+        return [tags_result, []]
+    else:
+        # mixed results from both tags and tag groups
+        return [tags_result, tag_groups_result]
+
+@_traced
+async def bulk_add_tags(server: AsyncServer, DATA: dict, *, max_items: int = 500, max_bytes: int = 1048576, max_workers: int = 4) -> MultiStatusResult:
+    '''Coroutine version of `kepconfig.connectivity.tag.bulk_add_tags`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    work = _bulk_work_by_device(DATA)
+    sources = {}
+    result = MultiStatusResult(resubmit= lambda items: bulk_add_tags(server, _bulk_resubmit_data(items, sources), 
+                                max_items= max_items, max_bytes= max_bytes, max_workers= max_workers))
+    semaphore = asyncio.Semaphore(max_workers)
+
+    async def add_to_device(queue):
+        async with semaphore:
+            while queue:
+                path, kind, items = queue.popleft()
+                url = _create_path_url(server, path) + (_create_tags_url() if kind == 'tags' else _create_tag_groups_url())
+                for chunk, deferred in _bulk_chunks(items, kind, max_items, max_bytes):
+                    try:
+                        r = await server._config_add(url, chunk)
+                    except (KepHTTPError, KepURLError) as err:
+                        r = err
+                    queue.extend(_bulk_record_result(path, kind, chunk, deferred, r, result, sources))
+
+    await asyncio.gather(*[add_to_device(queue) for queue in work.values()])
+    return result
+
+@_traced
+async def modify_tag(server: AsyncServer, full_tag_path: str, DATA: dict, force: bool = False) -> bool:
+    '''Coroutine version of `kepconfig.connectivity.tag.modify_tag`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+
+    tag_data = await server._force_update_check(force, DATA)
+
+    path_obj = path_split(full_tag_path)
+    try:
+        url = server.url+channel._create_url(path_obj['channel'])+device._create_url(path_obj['device'])
+        for x in range(0, len(path_obj['tag_path'])-1):
+            url += _create_tag_groups_url(tag_group=path_obj['tag_path'][x])
+        url += _create_tags_url(tag=path_obj['tag_path'][len(path_obj['tag_path'])-1])
+    except KeyError as err:
+        err_msg = 'Error: No key {} identified | Function: {}'.format(err, inspect.currentframe().f_code.co_name)
+        raise KepError(err_msg)
+    except Exception as e:
+        err_msg = 'Error: Error with {}: {}'.format(inspect.currentframe().f_code.co_name, str(e))
+        raise KepError(err_msg)
+    r = await server._config_update(url, tag_data)
+    if r.code == 200: return True 
+    else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
+
+@_traced
+async def modify_tag_group(server: AsyncServer, tag_group_path: str, DATA: dict, force: bool = False) -> bool:
+    '''Coroutine version of `kepconfig.connectivity.tag.modify_tag_group`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+
+    tag_group_data = await server._force_update_check(force, DATA)
+
+    path_obj = path_split(tag_group_path)
+    try:
+        url = server.url+channel._create_url(path_obj['channel'])+device._create_url(path_obj['device'])
+        for tg in path_obj['tag_path']:
+            url += _create_tag_groups_url(tag_group=tg)
+    except KeyError as err:
+        err_msg = 'Error: No key {} identified | Function: {}'.format(err, inspect.currentframe().f_code.co_name)
+        raise KepError(err_msg)
+    except Exception as e:
+        err_msg = 'Error: Error with {}: {}'.format(inspect.currentframe().f_code.co_name, str(e))
+        raise KepError(err_msg)
+    r = await server._config_update(url, tag_group_data)
+    if r.code == 200: return True 
+    else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
+
+@_traced
+async def del_tag(server: AsyncServer, full_tag_path: str) -> bool:
+    '''Coroutine version of `kepconfig.connectivity.tag.del_tag`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+
+    path_obj = path_split(full_tag_path)
+    try:
+        url = server.url+channel._create_url(path_obj['channel'])+device._create_url(path_obj['device'])
+        for x in range(0, len(path_obj['tag_path'])-1):
+            url += _create_tag_groups_url(tag_group=path_obj['tag_path'][x])
+        url += _create_tags_url(tag=path_obj['tag_path'][len(path_obj['tag_path'])-1])
+    except KeyError as err:
+        err_msg = 'Error: No key {} identified | Function: {}'.format(err, inspect.currentframe().f_code.co_name)
+        raise KepError(err_msg)
+    except Exception as e:
+        err_msg = 'Error: Error with {}: {}'.format(inspect.currentframe().f_code.co_name, str(e))
+        raise KepError(err_msg)
+    r = await server._config_del(url)
+    if r.code == 200: return True 
+    else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
+
+@_traced
+async def del_tag_group(server: AsyncServer, tag_group_path: str) -> bool:
+    '''Coroutine version of `kepconfig.connectivity.tag.del_tag_group`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+
+    path_obj = path_split(tag_group_path)
+    try:
+        url = server.url+channel._create_url(path_obj['channel'])+device._create_url(path_obj['device'])
+        for tg in path_obj['tag_path']:
+            url += _create_tag_groups_url(tag_group=tg)
+    except KeyError as err:
+        err_msg = 'Error: No key {} identified | Function: {}'.format(err, inspect.currentframe().f_code.co_name)
+        raise KepError(err_msg)
+    except Exception as err:
+        err_msg = 'Error: Error with {}: {}'.format(inspect.currentframe().f_code.co_name, str(err))
+        raise KepError(err_msg)
+    r = await server._config_del(url)
+    if r.code == 200: return True 
+    else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
+
+@_traced
+async def get_tag(server: AsyncServer, full_tag_path: str) -> dict:
+    '''Coroutine version of `kepconfig.connectivity.tag.get_tag`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+
+    path_obj = path_split(full_tag_path)
+    try:
+        url = server.url+channel._create_url(path_obj['channel'])+device._create_url(path_obj['device'])
+        for x in range(0, len(path_obj['tag_path'])-1):
+            url += _create_tag_groups_url(tag_group=path_obj['tag_path'][x])
+        url += _create_tags_url(tag=path_obj['tag_path'][len(path_obj['tag_path'])-1])
+    except KeyError as err:
+        err_msg = 'Error: No key {} identified | Function: {}'.format(err, inspect.currentframe().f_code.co_name)
+        raise KepError(err_msg)
+    except Exception as e:
+        err_msg = 'Error: Error with {}: {}'.format(inspect.currentframe().f_code.co_name, str(e))
+        raise KepError(err_msg)
+    r = await server._config_get(url)
+    return r.payload
+
+@_traced
+async def get_all_tags(server: AsyncServer, full_tag_path: str, *, options: dict = None) -> list:
+    '''Coroutine version of `kepconfig.connectivity.tag.get_all_tags`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+
+    path_obj = path_split(full_tag_path)
+    try:
+        url = f"{server.url}{channel._create_url(path_obj['channel'])}{device._create_url(path_obj['device'])}"
+        if 'tag_path' in path_obj:
+            for tg in path_obj['tag_path']:
+                url += _create_tag_groups_url(tag_group=tg)
+        url += _create_tags_url()
+    except KeyError as err:
+        err_msg = 'Error: No key {} identified | Function: {}'.format(err, inspect.currentframe().f_code.co_name)
+        raise KepError(err_msg)
+    except Exception as e:
+        err_msg = 'Error: Error with {}: {}'.format(inspect.currentframe().f_code.co_name, str(e))
+        raise KepError(err_msg)
+    r = await server._config_get(url, params= options)
+    return r.payload
+
+def iter_all_tags(server: AsyncServer, full_tag_path: str, *, options: dict = None, page_size: int = 100, prefetch: bool = True) -> AsyncIterator[dict]:
+    '''Async generator version of `kepconfig.connectivity.tag.iter_all_tags`. Parameters are the same, with `server` 
+    being an instance of `AsyncServer`. Use with `async for`.'''
+    return _iter_pages_async(lambda o: get_all_tags(server, full_tag_path, options= o), options, page_size, prefetch)
+
+@_traced
+async def get_tag_group(server: AsyncServer, tag_group_path: str) -> dict:
+    '''Coroutine version of `kepconfig.connectivity.tag.get_tag_group`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    path_obj = path_split(tag_group_path)
+    try:
+        url = server.url+channel._create_url(path_obj['channel'])+device._create_url(path_obj['device'])
+        for tg in path_obj['tag_path']:
+            url += _create_tag_groups_url(tag_group=tg)
+    except KeyError as err:
+        err_msg = 'Error: No key {} identified | Function: {}'.format(err, inspect.currentframe().f_code.co_name)
+        raise KepError(err_msg)
+    except Exception as e:
+        err_msg = 'Error: Error with {}: {}'.format(inspect.currentframe().f_code.co_name, str(e))
+        raise KepError(err_msg)
+    r = await server._config_get(url)
+    return r.payload
+
+@_traced
+async def get_all_tag_groups(server: AsyncServer, tag_group_path: str, *, options: dict = None) -> list:
+    '''Coroutine version of `kepconfig.connectivity.tag.get_all_tag_groups`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    path_obj = path_split(tag_group_path)
+    try:
+        url = f"{server.url}{channel._create_url(path_obj['channel'])}{device._create_url(path_obj['device'])}"
+        if 'tag_path' in path_obj:
+            for tg in path_obj['tag_path']:
+                url += _create_tag_groups_url(tag_group=tg)
+        url += _create_tag_groups_url()
+    except KeyError as err:
+        err_msg = 'Error: No key {} identified | Function: {}'.format(err, inspect.currentframe().f_code.co_name)
+        raise KepError(err_msg)
+    except Exception as e:
+        err_msg = 'Error: Error with {}: {}'.format(inspect.currentframe().f_code.co_name, str(e))
+        raise KepError(err_msg)
+    r = await server._config_get(url, params= options)
+    return r.payload
+
+def iter_all_tag_groups(server: AsyncServer, tag_group_path: str, *, options: dict = None, page_size: int = 100, prefetch: bool = True) -> AsyncIterator[dict]:
+    '''Async generator version of `kepconfig.connectivity.tag.iter_all_tag_groups`. Parameters are the same, with `server` 
+    being an instance of `AsyncServer`. Use with `async for`.'''
+    return _iter_pages_async(lambda o: get_all_tag_groups(server, tag_group_path, options= o), options, page_size, prefetch)
+
+@_traced
+async def get_full_tag_structure(server: AsyncServer, path: str, *, recursive: bool = False, options: dict = None, max_workers: int = None, serialize: bool = False) -> dict:
+    '''Coroutine version of `kepconfig.connectivity.tag.get_full_tag_structure`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    r = {}
+        
+    # Remove pagination options, if present. Not useful with this method since it is designed to get the full tree of items.
+    if options is not None:
+        remove_list = ['pageNumber','pageSize']
+        [options.pop(x) for x in remove_list]
+
+    if recursive and serialize and not options:
+        res = await server._config_get_serialized(_create_path_url(server, path))
+        if _has_tag_children(res):
+            _normalize_tag_structure(res)
+            return {'tags': res['tags'], 'tag_groups': res['tag_groups']}
+
+    if recursive and max_workers is not None and max_workers > 1:
+        return await _get_full_tag_structure_concurrent(server, path, options, asyncio.Semaphore(max_workers))
+    
+    r['tags'] = await get_all_tags(server, path, options= options)
+    r['tag_groups'] = await get_all_tag_groups(server, path, options= options)
+    if recursive:
+        for group in r['tag_groups']:
+            res = await get_full_tag_structure(server, path + '.' + group['common.ALLTYPES_NAME'], recursive= recursive, options= options, serialize= False)
+            group.update(res)
+    return r
+
+async def _get_full_tag_structure_concurrent(server: AsyncServer, path: str, options: dict, semaphore: asyncio.Semaphore) -> dict:
+    async def limited(coro):
+        async with semaphore:
+            return await coro
+
+    r = {}
+    r['tags'], r['tag_groups'] = await asyncio.gather(limited(get_all_tags(server, path, options= options)),
+                                                      limited(get_all_tag_groups(server, path, options= options)))
+    results = await asyncio.gather(*[_get_full_tag_structure_concurrent(server, path + '.' + group['common.ALLTYPES_NAME'], options, semaphore)
+                                     for group in r['tag_groups']])
+    for group, res in zip(r['tag_groups'], results):
+        group.update(res)
+    return r
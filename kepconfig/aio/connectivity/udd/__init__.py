@@ -0,0 +1,11 @@
+# -------------------------------------------------------------------------
+# Copyright (c) PTC Inc. and/or all its affiliates. All rights reserved.
+# See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+r"""`udd` provides coroutine versions of the `kepconfig.connectivity.udd` module functions for use
+with `kepconfig.aio.connection.AsyncServer`.
+"""
+
+from . import profile
@@ -0,0 +1,75 @@
+# -------------------------------------------------------------------------
+# Copyright (c) PTC Inc. and/or all its affiliates. All rights reserved.
+# See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+r"""`profile` provides coroutine versions of the `kepconfig.connectivity.udd.profile` API for use
+with `kepconfig.aio.connection.AsyncServer`.
+"""
+
+from ...connection import AsyncServer
+from ....error import KepHTTPError, KepError
+from ....utils import _add_result, _multi_status_data, _iter_pages_async
+from ....tracing import _traced
+from typing import Union, AsyncIterator
+from ....connectivity.udd.profile import PROFILE_ROOT
+
+@_traced
+async def add_profile(server: AsyncServer, DATA: Union[dict, list], *, multi_status: bool = False) -> Union[bool, list]:
+    '''Coroutine version of `kepconfig.connectivity.udd.profile.add_profile`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+
+    DATA = _multi_status_data(DATA, multi_status)
+    r = await server._config_add(f'{server.url}{PROFILE_ROOT}', DATA)
+    return _add_result(r, DATA, multi_status, lambda items: add_profile(server, items, multi_status= True))
+
+@_traced
+async def del_profile(server: AsyncServer, profile_name: str) -> bool:
+    '''Coroutine version of `kepconfig.connectivity.udd.profile.del_profile`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+
+    r = await server._config_del(f'{server.url}{PROFILE_ROOT}/{profile_name}')
+    if r.code == 200: return True 
+    else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
+
+@_traced
+async def modify_profile(server: AsyncServer, DATA: dict, profile_name: str = None, force: bool = False) -> bool:
+    '''Coroutine version of `kepconfig.connectivity.udd.profile.modify_profile`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    
+    profile_data = await server._force_update_check(force, DATA)
+    if profile_name == None:
+        try:
+            r = await server._config_update(f"{server.url}{PROFILE_ROOT}/{profile_data['common.ALLTYPES_NAME']}", profile_data)
+            if r.code == 200: return True 
+            else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
+        except KeyError as err:
+            err_msg = 'Error: No profile identified in DATA | Key Error: {}'.format(err)
+            raise KepError(err_msg)
+    else:
+        r = await server._config_update(f'{server.url}{PROFILE_ROOT}/{profile_name}', profile_data)
+        if r.code == 200: return True 
+        else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
+
+@_traced
+async def get_profile(server: AsyncServer, profile_name: str = None, *, options: dict = None) -> Union[dict, list]:
+    '''Coroutine version of `kepconfig.connectivity.udd.profile.get_profile`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+
+    if profile_name == None:
+        r = await server._config_get(f'{server.url}{PROFILE_ROOT}', params= options)
+    else:
+        r = await server._config_get(f'{server.url}{PROFILE_ROOT}/{profile_name}')
+    return r.payload
+
+@_traced
+async def get_all_profiles(server: AsyncServer, *, options: dict = None):
+    '''Coroutine version of `kepconfig.connectivity.udd.profile.get_all_profiles`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    return await get_profile(server, options= options)
+
+def iter_all_profiles(server: AsyncServer, *, options: dict = None, page_size: int = 100, prefetch: bool = True) -> AsyncIterator[dict]:
+    '''Async generator version of `kepconfig.connectivity.udd.profile.iter_all_profiles`. Parameters are the same, with `server` 
+    being an instance of `AsyncServer`. Use with `async for`.'''
+    return _iter_pages_async(lambda o: get_all_profiles(server, options= o), options, page_size, prefetch)
@@ -0,0 +1,96 @@
+# -------------------------------------------------------------------------
+# Copyright (c) PTC Inc. and/or all its affiliates. All rights reserved.
+# See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+r"""`log_group` provides coroutine versions of the `kepconfig.datalogger.log_group` API for use
+with `kepconfig.aio.connection.AsyncServer`.
+"""
+
+from typing import Union, AsyncIterator
+from ...structures import KepServiceResponse
+from ..connection import AsyncServer
+from ...error import KepError, KepHTTPError
+from ...utils import _add_result, _multi_status_data, _iter_pages_async
+from ...tracing import _traced
+from ...datalogger.log_group import ENABLE_PROPERTY, LOG_GROUP_ROOT, SERVICES_ROOT, _create_url
+
+@_traced
+async def add_log_group(server: AsyncServer, DATA: Union[dict, list], *, multi_status: bool = False) -> Union[bool, list]:
+    '''Coroutine version of `kepconfig.datalogger.log_group.add_log_group`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+
+    DATA = _multi_status_data(DATA, multi_status)
+    r = await server._config_add(server.url + _create_url(), DATA)
+    return _add_result(r, DATA, multi_status, lambda items: add_log_group(server, items, multi_status= True))
+
+@_traced
+async def del_log_group(server: AsyncServer, log_group: str) -> bool:
+    '''Coroutine version of `kepconfig.datalogger.log_group.del_log_group`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    r = await server._config_del(server.url + _create_url(log_group))
+    if r.code == 200: return True 
+    else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
+
+@_traced
+async def modify_log_group(server: AsyncServer, DATA: dict, *, log_group: str = None, force: bool = False) -> bool:
+    '''Coroutine version of `kepconfig.datalogger.log_group.modify_log_group`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    
+    log_group_data = await server._force_update_check(force, DATA)
+    
+    if log_group == None:
+        try:
+            r = await server._config_update(server.url + _create_url(log_group_data['common.ALLTYPES_NAME']), log_group_data)
+            if r.code == 200: return True 
+            else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
+        except KeyError as err:
+            err_msg = 'Error: No log group identified in DATA | Key Error: {}'.format(err)
+            raise KepError(err_msg)
+    else:
+        r = await server._config_update(server.url + _create_url(log_group), log_group_data)
+        if r.code == 200: return True 
+        else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
+
+@_traced
+async def get_log_group(server: AsyncServer, log_group: str) -> dict:
+    '''Coroutine version of `kepconfig.datalogger.log_group.get_log_group`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    r = await server._config_get(server.url + _create_url(log_group))
+    return r.payload
+
+@_traced
+async def get_all_log_groups(server: AsyncServer, *, options: dict = None) -> list:
+    '''Coroutine version of `kepconfig.datalogger.log_group.get_all_log_groups`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    r = await server._config_get(f'{server.url}{_create_url()}', params= options)
+    return r.payload
+
+def iter_all_log_groups(server: AsyncServer, *, options: dict = None, page_size: int = 100, prefetch: bool = True) -> AsyncIterator[dict]:
+    '''Async generator version of `kepconfig.datalogger.log_group.iter_all_log_groups`. Parameters are the same, with `server` 
+    being an instance of `AsyncServer`. Use with `async for`.'''
+    return _iter_pages_async(lambda o: get_all_log_groups(server, options= o), options, page_size, prefetch)
+
+@_traced
+async def enable_log_group(server: AsyncServer, log_group: str) -> bool:
+    '''Coroutine version of `kepconfig.datalogger.log_group.enable_log_group`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    DATA = {ENABLE_PROPERTY: True}
+    return await modify_log_group(server, DATA, log_group= log_group)
+
+@_traced
+async def disable_log_group(server: AsyncServer, log_group: str) -> bool:
+    '''Coroutine version of `kepconfig.datalogger.log_group.disable_log_group`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    DATA = {ENABLE_PROPERTY: False}
+    return await modify_log_group(server, DATA, log_group= log_group)
+
+@_traced
+async def reset_column_mapping_service(server: AsyncServer, log_group: str, job_ttl: int = None) -> KepServiceResponse:
+    '''Coroutine version of `kepconfig.datalogger.log_group.reset_column_mapping_service`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+
+    url = server.url + _create_url(log_group) + SERVICES_ROOT + '/ResetColumnMapping'
+    job = await server._kep_service_execute(url, None, job_ttl)
+    return job
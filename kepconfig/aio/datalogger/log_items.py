@@ -0,0 +1,73 @@
+# -------------------------------------------------------------------------
+# Copyright (c) PTC Inc. and/or all its affiliates. All rights reserved.
+# See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+r"""`log_items` provides coroutine versions of the `kepconfig.datalogger.log_items` API for use
+with `kepconfig.aio.connection.AsyncServer`.
+"""
+
+from typing import Union, AsyncIterator
+from . import log_group as Log_Group
+from ...error import KepError, KepHTTPError
+from ...utils import _add_result, _multi_status_data, _iter_pages_async
+from ...tracing import _traced
+from ..connection import AsyncServer
+from ...datalogger.log_items import LOG_ITEMS_ROOT, _create_url
+
+@_traced
+async def add_log_item(server: AsyncServer, log_group: str, DATA: Union[dict, list], *, multi_status: bool = False) -> Union[bool, list]:
+    '''Coroutine version of `kepconfig.datalogger.log_items.add_log_item`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+
+    DATA = _multi_status_data(DATA, multi_status)
+    r = await server._config_add(server.url + Log_Group._create_url(log_group) + _create_url(), DATA)
+    return _add_result(r, DATA, multi_status, lambda items: add_log_item(server, log_group, items, multi_status= True))
+
+@_traced
+async def del_log_item(server: AsyncServer, log_group: str, log_item: str) -> bool:
+    '''Coroutine version of `kepconfig.datalogger.log_items.del_log_item`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    r = await server._config_del(server.url + Log_Group._create_url(log_group) + _create_url(log_item))
+    if r.code == 200: return True 
+    else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
+
+@_traced
+async def modify_log_item(server: AsyncServer, log_group: str, DATA: dict, *, log_item: str = None, force: bool = False) -> bool:
+    '''Coroutine version of `kepconfig.datalogger.log_items.modify_log_item`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    
+    log_item_data = await server._force_update_check(force, DATA)
+    
+    if log_item == None:
+        try:
+            r = await server._config_update(server.url + Log_Group._create_url(log_group) + _create_url(log_item_data['common.ALLTYPES_NAME']), log_item_data)
+            if r.code == 200: return True 
+            else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
+        except KeyError as err:
+            err_msg ='Error: No log item identified in DATA | Key Error: {}'.format(err)
+            raise KepError(err_msg)
+    else:
+        r = await server._config_update(server.url + Log_Group._create_url(log_group) + _create_url(log_item), log_item_data)
+        if r.code == 200: return True 
+        else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
+
+@_traced
+async def get_log_item(server, log_group, log_item) -> dict:
+    '''Coroutine version of `kepconfig.datalogger.log_items.get_log_item`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    r = await server._config_get(server.url + Log_Group._create_url(log_group) + _create_url(log_item))
+    return r.payload
+
+@_traced
+async def get_all_log_items(server: AsyncServer, log_group: str, *, options: dict = None) -> list:
+    '''Coroutine version of `kepconfig.datalogger.log_items.get_all_log_items`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    r = await server._config_get(f'{server.url}{Log_Group._create_url(log_group)}{_create_url()}', params= options)
+    return r.payload
+
+def iter_all_log_items(server: AsyncServer, log_group: str, *, options: dict = None, page_size: int = 100, prefetch: bool = True) -> AsyncIterator[dict]:
+    '''Async generator version of `kepconfig.datalogger.log_items.iter_all_log_items`. Parameters are the same, with `server` 
+    being an instance of `AsyncServer`. Use with `async for`.'''
+    return _iter_pages_async(lambda o: get_all_log_items(server, log_group, options= o), options, page_size, prefetch)
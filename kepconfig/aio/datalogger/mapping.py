@@ -0,0 +1,56 @@
+# -------------------------------------------------------------------------
+# Copyright (c) PTC Inc. and/or all its affiliates. All rights reserved.
+# See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+r"""`mapping` provides coroutine versions of the `kepconfig.datalogger.mapping` API for use
+with `kepconfig.aio.connection.AsyncServer`.
+"""
+
+from . import log_group as Log_Group
+from ...error import KepError, KepHTTPError
+from ..connection import AsyncServer
+from ...datalogger.mapping import MAPPING_ROOT, _create_url
+from ...utils import _iter_pages_async
+from ...tracing import _traced
+from typing import AsyncIterator
+
+@_traced
+async def modify_mapping(server: AsyncServer, log_group: str, DATA: dict, *, mapping: str = None, force: bool = False) -> bool:
+    '''Coroutine version of `kepconfig.datalogger.mapping.modify_mapping`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    
+    mapping_data = await server._force_update_check(force, DATA)
+    
+    if mapping == None:
+        try:
+            r = await server._config_update(server.url + Log_Group._create_url(log_group) + _create_url(mapping_data['common.ALLTYPES_NAME']), mapping_data)
+            if r.code == 200: return True 
+            else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
+        except KeyError as err:
+            err_msg = 'Error: No column mapping identified in DATA | Key Error: {}'.format(err)
+            raise KepError(err_msg)
+    else:
+        r = await server._config_update(server.url + Log_Group._create_url(log_group) + _create_url(mapping), mapping_data)
+        if r.code == 200: return True 
+        else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
+
+@_traced
+async def get_mapping(server: AsyncServer, log_group: str, mapping: str) -> dict:
+    '''Coroutine version of `kepconfig.datalogger.mapping.get_mapping`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    r = await server._config_get(server.url + Log_Group._create_url(log_group) + _create_url(mapping))
+    return r.payload
+
+@_traced
+async def get_all_mappings(server: AsyncServer, log_group: str, *, options: dict = None) -> list:
+    '''Coroutine version of `kepconfig.datalogger.mapping.get_all_mappings`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    r = await server._config_get(f'{server.url}{Log_Group._create_url(log_group)}{_create_url()}', params= options)
+    return r.payload
+
+def iter_all_mappings(server: AsyncServer, log_group: str, *, options: dict = None, page_size: int = 100, prefetch: bool = True) -> AsyncIterator[dict]:
+    '''Async generator version of `kepconfig.datalogger.mapping.iter_all_mappings`. Parameters are the same, with `server` 
+    being an instance of `AsyncServer`. Use with `async for`.'''
+    return _iter_pages_async(lambda o: get_all_mappings(server, log_group, options= o), options, page_size, prefetch)
@@ -0,0 +1,75 @@
+# -------------------------------------------------------------------------
+# Copyright (c) PTC Inc. and/or all its affiliates. All rights reserved.
+# See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+r"""`triggers` provides coroutine versions of the `kepconfig.datalogger.triggers` API for use
+with `kepconfig.aio.connection.AsyncServer`.
+"""
+
+from typing import Union, AsyncIterator
+from . import log_group as Log_Group
+from ...error import KepError, KepHTTPError
+from ...utils import _add_result, _multi_status_data, _iter_pages_async
+from ...tracing import _traced
+from ..connection import AsyncServer
+from ...datalogger.triggers import TRIGGERS_ROOT, _create_url
+
+@_traced
+async def add_trigger(server: AsyncServer, log_group: str, DATA: Union[dict, list], *, multi_status: bool = False) -> Union[bool, list]:
+    '''Coroutine version of `kepconfig.datalogger.triggers.add_trigger`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+
+    DATA = _multi_status_data(DATA, multi_status)
+    r = await server._config_add(server.url + Log_Group._create_url(log_group) + _create_url(), DATA)
+    return _add_result(r, DATA, multi_status, lambda items: add_trigger(server, log_group, items, multi_status= True))
+
+@_traced
+async def del_trigger(server: AsyncServer, log_group: str, trigger: str) -> bool:
+    '''Coroutine version of `kepconfig.datalogger.triggers.del_trigger`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    r = await server._config_del(server.url + Log_Group._create_url(log_group) + _create_url(trigger))
+    if r.code == 200: return True
+    else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
+
+@_traced
+async def modify_trigger(server: AsyncServer, log_group: str, DATA: dict, *, trigger: str = None, force: bool = False)  -> bool:
+    '''Coroutine version of `kepconfig.datalogger.triggers.modify_trigger`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    
+    trigger_data = await server._force_update_check(force, DATA)
+    
+    if trigger == None:
+        try:
+            r = await server._config_update(server.url + Log_Group._create_url(log_group) + _create_url(trigger_data['common.ALLTYPES_NAME']), trigger_data)
+            if r.code == 200: return True 
+            else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
+        except KeyError as err:
+            err_msg = 'Error: No trigger identified in DATA | Key Error: {}'.format(err)
+            raise KepError(err_msg)
+        # except:
+        #     return 'Error: Error with {}'.format(inspect.currentframe().f_code.co_name)
+    else:
+        r = await server._config_update(server.url + Log_Group._create_url(log_group) + _create_url(trigger), trigger_data)
+        if r.code == 200: return True 
+        else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
+
+@_traced
+async def get_trigger(server, log_group, trigger) -> dict:
+    '''Coroutine version of `kepconfig.datalogger.triggers.get_trigger`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    r = await server._config_get(server.url + Log_Group._create_url(log_group) + _create_url(trigger))
+    return r.payload
+
+@_traced
+async def get_all_triggers(server: AsyncServer, log_group: str, *, options: dict = None) -> list:
+    '''Coroutine version of `kepconfig.datalogger.triggers.get_all_triggers`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    r = await server._config_get(f'{server.url}{Log_Group._create_url(log_group)}{_create_url()}', params= options)
+    return r.payload
+
+def iter_all_triggers(server: AsyncServer, log_group: str, *, options: dict = None, page_size: int = 100, prefetch: bool = True) -> AsyncIterator[dict]:
+    '''Async generator version of `kepconfig.datalogger.triggers.iter_all_triggers`. Parameters are the same, with `server` 
+    being an instance of `AsyncServer`. Use with `async for`.'''
+    return _iter_pages_async(lambda o: get_all_triggers(server, log_group, options= o), options, page_size, prefetch)
@@ -0,0 +1,12 @@
+# -------------------------------------------------------------------------
+# Copyright (c) PTC Inc. and/or all its affiliates. All rights reserved.
+# See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+r"""`iot_gateway` provides coroutine versions of the `kepconfig.iot_gateway` module functions for use
+with `kepconfig.aio.connection.AsyncServer`.
+"""
+
+from . import agent, iot_items
+from ...iot_gateway import MQTT_CLIENT_AGENT, REST_CLIENT_AGENT, REST_SERVER_AGENT, THINGWORX_AGENT
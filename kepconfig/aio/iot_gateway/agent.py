@@ -0,0 +1,90 @@
+# -------------------------------------------------------------------------
+# Copyright (c) PTC Inc. and/or all its affiliates. All rights reserved.
+# See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+r"""`agent` provides coroutine versions of the `kepconfig.iot_gateway.agent` API for use
+with `kepconfig.aio.connection.AsyncServer`.
+"""
+
+from typing import Union, AsyncIterator
+from ..connection import AsyncServer
+from ...error import KepError, KepHTTPError
+from ...utils import _add_result, _multi_status_data, _iter_pages_async
+from ...tracing import _traced
+import inspect
+from ...iot_gateway.agent import (
+    IOT_ROOT_URL, MQTT_CLIENT_URL, REST_CLIENT_URL, REST_SERVER_URL, THINGWORX_URL, _create_url
+)
+
+@_traced
+async def add_iot_agent(server: AsyncServer, DATA: Union[dict, list], agent_type: str = None, *, multi_status: bool = False) -> Union[bool, list]:
+    '''Coroutine version of `kepconfig.iot_gateway.agent.add_iot_agent`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    
+    if agent_type == None:
+        try:
+            # If it's a list, use the first agents type
+            if isinstance(DATA, list): agent_type = DATA[0]['iot_gateway.AGENTTYPES_TYPE']
+            else: agent_type = DATA['iot_gateway.AGENTTYPES_TYPE']
+        except KeyError as err:
+            err_msg = 'Error: No agent identified in DATA | Key Error: {}'.format(err)
+            raise KepError(err_msg)
+    
+    DATA = _multi_status_data(DATA, multi_status)
+    r = await server._config_add(server.url + _create_url(agent_type), DATA)
+    return _add_result(r, DATA, multi_status, lambda items: add_iot_agent(server, items, agent_type, multi_status= True))
+
+@_traced
+async def del_iot_agent(server: AsyncServer, agent: str, agent_type: str) -> bool:
+    '''Coroutine version of `kepconfig.iot_gateway.agent.del_iot_agent`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    r = await server._config_del(server.url + _create_url(agent_type, agent))
+    if r.code == 200: return True 
+    else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
+
+@_traced
+async def modify_iot_agent(server: AsyncServer, DATA: dict, *, agent: str = None, agent_type: str = None, force: bool = False) -> bool:
+    '''Coroutine version of `kepconfig.iot_gateway.agent.modify_iot_agent`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    
+    agent_data = await server._force_update_check(force, DATA)
+    
+    if agent_type == None:
+        if 'iot_gateway.AGENTTYPES_TYPE' in DATA:
+            agent_type = DATA['iot_gateway.AGENTTYPES_TYPE']
+        else:
+            err_msg = 'Error: Error with {}: {}'.format(inspect.currentframe().f_code.co_name, 'No Agent type defined.')
+            raise KepError(err_msg)
+    if agent == None:
+        try:
+            r = await server._config_update(server.url + _create_url(agent_type, agent_data['common.ALLTYPES_NAME']), agent_data)
+            if r.code == 200: return True 
+            else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
+        except KeyError as err:
+            err_msg = 'Error: No agent identified in DATA | Key Error: {}'.format(err)
+            raise KepError(err_msg)
+    else:
+        r = await server._config_update(server.url + _create_url(agent_type, agent), agent_data)
+        if r.code == 200: return True 
+        else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
+
+@_traced
+async def get_iot_agent(server: AsyncServer, agent: str, agent_type: str) -> dict:
+    '''Coroutine version of `kepconfig.iot_gateway.agent.get_iot_agent`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    r = await server._config_get(server.url + _create_url(agent_type, agent))
+    return r.payload
+
+@_traced
+async def get_all_iot_agents(server: AsyncServer, agent_type: str, *, options: dict = None) -> list:
+    '''Coroutine version of `kepconfig.iot_gateway.agent.get_all_iot_agents`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    r = await server._config_get(f'{server.url}{_create_url(agent_type)}', params= options)
+    return r.payload
+
+def iter_all_iot_agents(server: AsyncServer, agent_type: str, *, options: dict = None, page_size: int = 100, prefetch: bool = True) -> AsyncIterator[dict]:
+    '''Async generator version of `kepconfig.iot_gateway.agent.iter_all_iot_agents`. Parameters are the same, with `server` 
+    being an instance of `AsyncServer`. Use with `async for`.'''
+    return _iter_pages_async(lambda o: get_all_iot_agents(server, agent_type, options= o), options, page_size, prefetch)
@@ -0,0 +1,71 @@
+# -------------------------------------------------------------------------
+# Copyright (c) PTC Inc. and/or all its affiliates. All rights reserved.
+# See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+r"""`iot_items` provides coroutine versions of the `kepconfig.iot_gateway.iot_items` API for use
+with `kepconfig.aio.connection.AsyncServer`.
+"""
+
+from typing import Union, AsyncIterator
+from ..connection import AsyncServer
+from .. import iot_gateway as IOT
+from ...error import KepError, KepHTTPError
+from ...utils import _add_result, _multi_status_data, _iter_pages_async
+from ...tracing import _traced
+from ...iot_gateway.iot_items import IOT_ITEMS_ROOT, _create_url
+
+@_traced
+async def add_iot_item(server: AsyncServer, DATA: Union[dict, list], agent: str, agent_type: str, *, multi_status: bool = False) -> Union[bool, list]:
+    '''Coroutine version of `kepconfig.iot_gateway.iot_items.add_iot_item`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    DATA = _multi_status_data(DATA, multi_status)
+    r = await server._config_add(server.url + IOT.agent._create_url(agent_type, agent) + _create_url(), DATA)
+    return _add_result(r, DATA, multi_status, lambda items: add_iot_item(server, items, agent, agent_type, multi_status= True))
+
+@_traced
+async def del_iot_item(server: AsyncServer, iot_item: str, agent: str, agent_type: str) -> bool:
+    '''Coroutine version of `kepconfig.iot_gateway.iot_items.del_iot_item`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    r = await server._config_del(server.url + IOT.agent._create_url(agent_type, agent) + _create_url(iot_item))
+    if r.code == 200: return True 
+    else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
+
+@_traced
+async def modify_iot_item(server: AsyncServer, DATA: dict, agent: str, agent_type: str, *, iot_item: str = None, force: bool = False) -> bool:
+    '''Coroutine version of `kepconfig.iot_gateway.iot_items.modify_iot_item`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    
+    agent_data = await server._force_update_check(force, DATA)
+    if iot_item == None:
+        try:
+            r = await server._config_update(server.url + IOT.agent._create_url(agent_type, agent) + _create_url(agent_data['common.ALLTYPES_NAME']), agent_data)
+            if r.code == 200: return True 
+            else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
+        except KeyError as err:
+            err_msg = 'Error: No agent identified in DATA | Key Error: {}'.format(err)
+            raise KepError(err_msg)
+    else:
+        r = await server._config_update(server.url + IOT.agent._create_url(agent_type, agent) + _create_url(iot_item), agent_data)
+        if r.code == 200: return True 
+        else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
+
+@_traced
+async def get_iot_item(server: AsyncServer, iot_item: str, agent: str, agent_type: str)-> dict:
+    '''Coroutine version of `kepconfig.iot_gateway.iot_items.get_iot_item`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    r = await server._config_get(server.url + IOT.agent._create_url(agent_type, agent) + _create_url(iot_item))
+    return r.payload
+
+@_traced
+async def get_all_iot_items(server: AsyncServer, agent: str, agent_type: str, *, options: dict = None) -> list:
+    '''Coroutine version of `kepconfig.iot_gateway.iot_items.get_all_iot_items`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    r = await server._config_get(f'{server.url}{IOT.agent._create_url(agent_type, agent)}{_create_url()}', params= options)
+    return r.payload
+
+def iter_all_iot_items(server: AsyncServer, agent: str, agent_type: str, *, options: dict = None, page_size: int = 100, prefetch: bool = True) -> AsyncIterator[dict]:
+    '''Async generator version of `kepconfig.iot_gateway.iot_items.iter_all_iot_items`. Parameters are the same, with `server` 
+    being an instance of `AsyncServer`. Use with `async for`.'''
+    return _iter_pages_async(lambda o: get_all_iot_items(server, agent, agent_type, options= o), options, page_size, prefetch)
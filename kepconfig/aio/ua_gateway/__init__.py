@@ -0,0 +1,11 @@
+# -------------------------------------------------------------------------
+# Copyright (c) PTC Inc. and/or all its affiliates. All rights reserved.
+# See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+r"""`ua_gateway` provides coroutine versions of the `kepconfig.ua_gateway` module functions for use
+with `kepconfig.aio.connection.AsyncServer`.
+"""
+
+from . import certificates, client, server
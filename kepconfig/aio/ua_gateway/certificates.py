@@ -0,0 +1,33 @@
+# -------------------------------------------------------------------------
+# Copyright (c) PTC Inc. and/or all its affiliates. All rights reserved.
+# See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+r"""`certificates` provides coroutine versions of the `kepconfig.ua_gateway.certificates` API for use
+with `kepconfig.aio.connection.AsyncServer`.
+"""
+
+from ..connection import AsyncServer
+from ...error import KepHTTPError
+from ...tracing import _traced
+from .common import _INTER_TYPE, _create_url_cert, INSTANCE_CERTIFICATE
+from ...helpers.deprecation_utils import _deprecated
+
+@_deprecated("This function is deprecated and will be removed in a future release. Use `get_instance_certificate()` in UAG client or server module instead.")
+@_traced
+async def get_instance_certificate(server: AsyncServer) -> dict:
+    '''Coroutine version of `kepconfig.ua_gateway.certificates.get_instance_certificate`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    r = await server._config_get(server.url + _create_url_cert(_INTER_TYPE.CERTS, INSTANCE_CERTIFICATE))
+    return r.payload
+
+@_deprecated("This function is deprecated and will be removed in a future release. Use `TBD` instead.")
+@_traced
+async def reissue_self_signed_instance_certificate(server: AsyncServer) -> bool:
+    '''Coroutine version of `kepconfig.ua_gateway.certificates.reissue_self_signed_instance_certificate`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    r = await server._config_del(server.url + _create_url_cert(_INTER_TYPE.CERTS, INSTANCE_CERTIFICATE))
+    if r.code == 200: return True 
+    else: 
+        raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
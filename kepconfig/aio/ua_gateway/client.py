@@ -0,0 +1,129 @@
+# -------------------------------------------------------------------------
+# Copyright (c) PTC Inc. and/or all its affiliates. All rights reserved.
+# See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+r"""`client` provides coroutine versions of the `kepconfig.ua_gateway.client` API for use
+with `kepconfig.aio.connection.AsyncServer`.
+"""
+
+from typing import Union, AsyncIterator
+from ...structures import KepServiceResponse
+from ..connection import AsyncServer
+from ...error import KepError, KepHTTPError
+from ...utils import _add_result, _multi_status_data, _iter_pages_async
+from ...tracing import _traced
+from .common import (
+    _INTER_TYPE, _change_cert_trust, _create_url_cert, _create_url_client, _delete_cert_truststore,
+    _create_url_inst_cert
+)
+from ...ua_gateway.client import CLIENT_INSTANCE_CERTIFICATE
+
+@_traced
+async def get_ua_client_connection(server: AsyncServer, ua_client_connection: str) -> dict:
+    '''Coroutine version of `kepconfig.ua_gateway.client.get_ua_client_connection`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    r = await server._config_get(server.url + _create_url_client(ua_client_connection))
+    return r.payload
+
+@_traced
+async def get_all_ua_client_connections(server: AsyncServer,  *, options: dict = None) -> dict:
+    '''Coroutine version of `kepconfig.ua_gateway.client.get_all_ua_client_connections`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    r = await server._config_get(server.url + _create_url_client())
+    return r.payload
+
+@_traced
+async def add_ua_client_connection(server: AsyncServer, DATA: Union[dict, list], *, multi_status: bool = False) -> Union[bool, list]:
+    '''Coroutine version of `kepconfig.ua_gateway.client.add_ua_client_connection`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    DATA = _multi_status_data(DATA, multi_status)
+    r = await server._config_add(server.url + _create_url_client(), DATA)
+    return _add_result(r, DATA, multi_status, lambda items: add_ua_client_connection(server, items, multi_status= True))
+
+@_traced
+async def modify_ua_client_connection(server: AsyncServer, DATA: dict, *, ua_client_connection: str = None, force: bool = False) -> bool:
+    '''Coroutine version of `kepconfig.ua_gateway.client.modify_ua_client_connection`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    client_data = await server._force_update_check(force, DATA)
+    if ua_client_connection == None:
+        try:
+            r = await server._config_update(server.url + _create_url_client(client_data['common.ALLTYPES_NAME']), client_data)
+            if r.code == 200: return True 
+            else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
+        except KeyError as err:
+            err_msg = 'Error: No Channel identified in DATA | Key Error: {}'.format(err)
+            raise KepError(err_msg)
+        # except Exception as e:
+        #     return 'Error: Error with {}: {}'.format(inspect.currentframe().f_code.co_name, str(e))
+    else:
+        r = await server._config_update(server.url + _create_url_client(ua_client_connection), client_data)
+        if r.code == 200: return True 
+        else: 
+            raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
+
+@_traced
+async def del_ua_client_connection(server: AsyncServer, ua_client_connection: str) -> bool:
+    '''Coroutine version of `kepconfig.ua_gateway.client.del_ua_client_connection`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    r = await server._config_del(server.url + _create_url_client(ua_client_connection))
+    if r.code == 200: return True 
+    else: 
+        raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
+
+@_traced
+async def get_certificate(server: AsyncServer, certificate: str) -> dict:
+    '''Coroutine version of `kepconfig.ua_gateway.client.get_certificate`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    r = await server._config_get(server.url + _create_url_cert(_INTER_TYPE.CLIENT, certificate))
+    return r.payload
+
+@_traced
+async def get_all_certificates(server: AsyncServer,  *, options: dict = None) -> list:
+    '''Coroutine version of `kepconfig.ua_gateway.client.get_all_certificates`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    r = await server._config_get(server.url + _create_url_cert(_INTER_TYPE.CLIENT), params= options)
+    return r.payload
+
+def iter_all_certificates(server: AsyncServer, *, options: dict = None, page_size: int = 100, prefetch: bool = True) -> AsyncIterator[dict]:
+    '''Async generator version of `kepconfig.ua_gateway.client.iter_all_certificates`. Parameters are the same, with `server` 
+    being an instance of `AsyncServer`. Use with `async for`.'''
+    return _iter_pages_async(lambda o: get_all_certificates(server, options= o), options, page_size, prefetch)
+
+@_traced
+async def trust_certificate(server: AsyncServer, certificate: str) -> bool:
+    '''Coroutine version of `kepconfig.ua_gateway.client.trust_certificate`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    return await _change_cert_trust(server, _INTER_TYPE.CLIENT, certificate, True)
+
+@_traced
+async def reject_certificate(server: AsyncServer, certificate: str) -> bool:
+    '''Coroutine version of `kepconfig.ua_gateway.client.reject_certificate`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+
+    return await _change_cert_trust(server, _INTER_TYPE.CLIENT, certificate, False)
+
+@_traced
+async def delete_certificate(server: AsyncServer, certificate: str) -> bool:
+    '''Coroutine version of `kepconfig.ua_gateway.client.delete_certificate`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    return await _delete_cert_truststore(server, _INTER_TYPE.CLIENT, certificate)
+
+@_traced
+async def get_instance_certificate(server: AsyncServer) -> dict:
+    '''Coroutine version of `kepconfig.ua_gateway.client.get_instance_certificate`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    r = await server._config_get(server.url + _create_url_inst_cert(_INTER_TYPE.CLIENT, CLIENT_INSTANCE_CERTIFICATE))
+    return r.payload
+
+@_traced
+async def reissue_self_signed_instance_certificate(server: AsyncServer, job_ttl: int = None) -> KepServiceResponse:
+    '''Coroutine version of `kepconfig.ua_gateway.client.reissue_self_signed_instance_certificate`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    url = server.url + _create_url_inst_cert(_INTER_TYPE.CLIENT, CLIENT_INSTANCE_CERTIFICATE) + '/services/ReIssueInstanceCertificate'
+    try:
+        job = await server._kep_service_execute(url, TTL= job_ttl)
+        return job
+    except Exception as err:
+        raise err
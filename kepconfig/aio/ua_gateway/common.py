@@ -0,0 +1,35 @@
+# -------------------------------------------------------------------------
+# Copyright (c) PTC Inc. and/or all its affiliates. All rights reserved.
+# See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+r"""`common` provides coroutine versions of the `kepconfig.ua_gateway.common` API for use
+with `kepconfig.aio.connection.AsyncServer`.
+"""
+
+from ..connection import AsyncServer
+from ...error import KepHTTPError
+from ...ua_gateway.common import (
+    CERT_TRUST_KEY, UA_GATEWAY_ROOT, CERT_ROOT, CLIENT_ROOT, CONN_ROOT, CLIENT_CERT_ROOT,
+    CLIENT_INST_CERT_ROOT, SERVER_ROOT, ENDPOINT_ROOT, SERVER_CERT_ROOT, SERVER_INST_CERT_ROOT,
+    _INTER_TYPE, INSTANCE_CERTIFICATE, _create_url_cert, _create_url_inst_cert, _create_url_server,
+    _create_url_client
+)
+
+async def _change_cert_trust(server: AsyncServer, inter_type, certificate: str, trust: bool):
+    DATA = {
+        CERT_TRUST_KEY: int(trust)
+    }
+
+    cert_data = await server._force_update_check(True, DATA)
+    r = await server._config_update(server.url + _create_url_cert(inter_type, certificate), cert_data)
+    if r.code == 200: return True 
+    else: 
+        raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
+
+async def _delete_cert_truststore(server: AsyncServer, inter_type, certificate: str):
+    r = await server._config_del(server.url + _create_url_cert(inter_type, certificate))
+    if r.code == 200: return True 
+    else: 
+        raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
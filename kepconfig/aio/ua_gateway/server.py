@@ -0,0 +1,147 @@
+# -------------------------------------------------------------------------
+# Copyright (c) PTC Inc. and/or all its affiliates. All rights reserved.
+# See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+r"""`server` provides coroutine versions of the `kepconfig.ua_gateway.server` API for use
+with `kepconfig.aio.connection.AsyncServer`.
+"""
+
+from typing import Union, AsyncIterator
+from ...structures import KepServiceResponse
+from ..connection import AsyncServer
+from ...error import KepError, KepHTTPError
+from ...utils import _add_result, _multi_status_data, _iter_pages_async
+from ...tracing import _traced
+from .common import (
+    _INTER_TYPE, _change_cert_trust, _create_url_cert, _create_url_server, _delete_cert_truststore,
+    SERVER_ROOT, _create_url_inst_cert
+)
+from ...ua_gateway.server import SERVER_INSTANCE_CERTIFICATE
+
+@_traced
+async def get_uag_server_interface_properties(server: AsyncServer) -> dict:
+    '''Coroutine version of `kepconfig.ua_gateway.server.get_uag_server_interface_properties`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+
+    r = await server._config_get(server.url + SERVER_ROOT)
+    return r.payload
+
+@_traced
+async def modify_uag_server_interface_properties(server: AsyncServer, DATA: dict, force: bool = False) -> bool:
+    '''Coroutine version of `kepconfig.ua_gateway.server.modify_uag_server_interface_properties`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+
+    prop_data = await server._force_update_check(force, DATA)
+    r = await server._config_update(server.url + SERVER_ROOT, prop_data)
+    if r.code == 200: return True 
+    else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
+
+@_traced
+async def get_ua_server_endpoint(server: AsyncServer, ua_server_endpoint: str) -> dict:
+    '''Coroutine version of `kepconfig.ua_gateway.server.get_ua_server_endpoint`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    r = await server._config_get(server.url + _create_url_server(ua_server_endpoint))
+    return r.payload
+
+@_traced
+async def get_all_ua_server_endpoints(server: AsyncServer,  *, options: dict = None) -> dict:
+    '''Coroutine version of `kepconfig.ua_gateway.server.get_all_ua_server_endpoints`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    r = await server._config_get(server.url + _create_url_server())
+    return r.payload
+
+@_traced
+async def add_ua_server_endpoint(server: AsyncServer, DATA: Union[dict, list], *, multi_status: bool = False) -> Union[bool, list]:
+    '''Coroutine version of `kepconfig.ua_gateway.server.add_ua_server_endpoint`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    DATA = _multi_status_data(DATA, multi_status)
+    r = await server._config_add(server.url + _create_url_server(), DATA)
+    return _add_result(r, DATA, multi_status, lambda items: add_ua_server_endpoint(server, items, multi_status= True))
+
+@_traced
+async def modify_ua_server_endpoint(server: AsyncServer, DATA: dict, *, ua_server_endpoint: str = None, force: bool = False) -> bool:
+    '''Coroutine version of `kepconfig.ua_gateway.server.modify_ua_server_endpoint`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+
+    server_data = await server._force_update_check(force, DATA)
+    if ua_server_endpoint == None:
+        try:
+            r = await server._config_update(server.url + _create_url_server(server_data['common.ALLTYPES_NAME']), server_data)
+            if r.code == 200: return True 
+            else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
+        except KeyError as err:
+            err_msg = 'Error: No Channel identified in DATA | Key Error: {}'.format(err)
+            raise KepError(err_msg)
+        # except Exception as e:
+        #     return 'Error: Error with {}: {}'.format(inspect.currentframe().f_code.co_name, str(e))
+    else:
+        r = await server._config_update(server.url + _create_url_server(ua_server_endpoint), server_data)
+        if r.code == 200: return True 
+        else: 
+            raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
+
+@_traced
+async def del_ua_server_endpoint(server: AsyncServer, ua_server_endpoint: str) -> bool:
+    '''Coroutine version of `kepconfig.ua_gateway.server.del_ua_server_endpoint`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    r = await server._config_del(server.url + _create_url_server(ua_server_endpoint))
+    if r.code == 200: return True 
+    else: 
+        raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
+
+@_traced
+async def get_certificate(server: AsyncServer, certificate: str) -> dict:
+    '''Coroutine version of `kepconfig.ua_gateway.server.get_certificate`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    r = await server._config_get(server.url + _create_url_cert(_INTER_TYPE.SERVER, certificate))
+    return r.payload
+
+@_traced
+async def get_all_certificates(server: AsyncServer, *, options: dict = None) -> list:
+    '''Coroutine version of `kepconfig.ua_gateway.server.get_all_certificates`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    r = await server._config_get(server.url + _create_url_cert(_INTER_TYPE.SERVER), params= options)
+    return r.payload
+
+def iter_all_certificates(server: AsyncServer, *, options: dict = None, page_size: int = 100, prefetch: bool = True) -> AsyncIterator[dict]:
+    '''Async generator version of `kepconfig.ua_gateway.server.iter_all_certificates`. Parameters are the same, with `server` 
+    being an instance of `AsyncServer`. Use with `async for`.'''
+    return _iter_pages_async(lambda o: get_all_certificates(server, options= o), options, page_size, prefetch)
+
+@_traced
+async def trust_certificate(server: AsyncServer, certificate: str) -> bool:
+    '''Coroutine version of `kepconfig.ua_gateway.server.trust_certificate`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    return await _change_cert_trust(server, _INTER_TYPE.SERVER, certificate, True)
+
+@_traced
+async def reject_certificate(server: AsyncServer, certificate: str) -> bool:
+    '''Coroutine version of `kepconfig.ua_gateway.server.reject_certificate`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    return await _change_cert_trust(server, _INTER_TYPE.SERVER, certificate, False)
+
+@_traced
+async def delete_certificate(server: AsyncServer, certificate: str) -> bool:
+    '''Coroutine version of `kepconfig.ua_gateway.server.delete_certificate`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    return await _delete_cert_truststore(server, _INTER_TYPE.SERVER, certificate)
+
+@_traced
+async def get_instance_certificate(server: AsyncServer) -> dict:
+    '''Coroutine version of `kepconfig.ua_gateway.server.get_instance_certificate`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    r = await server._config_get(server.url + _create_url_inst_cert(_INTER_TYPE.SERVER, SERVER_INSTANCE_CERTIFICATE))
+    return r.payload
+
+@_traced
+async def reissue_self_signed_instance_certificate(server: AsyncServer, job_ttl: int = None) -> KepServiceResponse:
+    '''Coroutine version of `kepconfig.ua_gateway.server.reissue_self_signed_instance_certificate`. Parameters and return values
+    are the same, with `server` being an instance of `AsyncServer`.'''
+    url = server.url + _create_url_inst_cert(_INTER_TYPE.SERVER, SERVER_INSTANCE_CERTIFICATE) + '/services/ReIssueInstanceCertificate'
+    try:
+        job = await server._kep_service_execute(url, TTL= job_ttl)
+        return job
+    except Exception as err:
+        raise err
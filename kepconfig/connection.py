@@ -8,16 +8,44 @@ r"""`connection` exposes an `server` class that manages the connection
 information and RESTful requests for the Kepware Configuration API Library.
 """
 
-import json
 import codecs
 import datetime
-from urllib import request, parse, error
+import http.client
+from urllib import parse
 from base64 import b64encode
 from .error import KepError, KepHTTPError, KepURLError
 import socket
 import ssl
-from .structures import KepServiceResponse, KepServiceStatus, _HttpDataAbstract, Filter
-
+import os
+import gzip
+import tempfile
+import time
+import heapq
+import re
+from typing import Union
+from .structures import KepServiceResponse, KepServiceStatus, _HttpDataAbstract, Filter, RetryPolicy, RateLimit, AdaptiveConcurrency, CachePolicy, DiskCache, JsonCodec, RequestInfo
+from .helpers.connection_pool import _PoolManager
+from .helpers.retry import _RetryStats, _parse_retry_after
+from .helpers.rate_limit import _RequestLimiter
+from .helpers.adaptive import _AdaptiveLimiter, _latency_class
+from .helpers.project_id import _ProjectIdTracker, _autofilled
+from .helpers.cache import _ResponseCache, _cache_key
+from .helpers.disk_cache import _DiskStructureCache
+from .helpers.singleflight import _SingleFlight
+from .helpers.json_stream import _iter_response, _iter_body, _stream_response
+from .helpers.json_body import _JsonBody, _encode_json, _is_replayable
+from .helpers.codec import _default_codec
+from .metrics import MetricsRegistry, _endpoint_template
+from .tracing import Tracer
+
+# HTTP codes returned by Kepware versions that don't support content=serialize on an object. A 400 
+# response only shows this when its message refers to the parameter, otherwise it is an error for the object
+_SERIALIZE_UNSUPPORTED_CODES = (400, 405, 501)
+_SERIALIZE_PARAMETER = re.compile(r'content|serializ', re.IGNORECASE)
+# HTTP codes returned by Kepware when a modify call has an outdated PROJECT_ID
+_PROJECT_ID_CONFLICT_CODES = (400, 409)
+# Service calls that replace the whole project, all cached reads are dropped when they are sent
+_PROJECT_LOAD_SERVICES = ('/project/services/JsonProjectLoad', '/project/services/ProjectLoad')
 
 class server:
     '''A class to represent a connection to an instance of Kepware. This object is used to 
@@ -34,6 +62,48 @@ class server:
     :param SSL_trust_all_certs: (insecure) - During certificate validation trust any certificate - if True, 
         will "set SSL_ignore_hostname" to true
     :param url: base URL for the server connection
+    :param pool_size: Maximum number of idle keep-alive connections kept per host/port for 
+        reuse between requests (Default: 10)
+    :param retry_policy: `RetryPolicy` used when Kepware responds that it is too busy (HTTP 429), 
+        or None to disable retries (Default: `RetryPolicy()`)
+    :param retry_stats: Dict of counters for the retries done by this instance: `retried_requests`, 
+        `retries`, `exhausted` (requests that still failed after the last attempt) and `wait_time` (seconds)
+    :param read_limit: `RateLimit` applied to read (GET) requests, or None for no limit (Default: None)
+    :param write_limit: `RateLimit` applied to write (POST, PUT and DELETE) requests, or None for no limit (Default: None)
+    :param adaptive_concurrency: `AdaptiveConcurrency` setting that adjusts the number of requests in flight 
+        to what Kepware can sustain, or None to disable (Default: None)
+    :param adaptive_stats: Dict with the current `window` of requests in flight, `in_flight`, `average_latency` 
+        (seconds), and the number of `increases` and `decreases` of the window, or None if adaptive concurrency is disabled
+    :param project_id_tracking: If True, modify calls without `force` use the last PROJECT_ID reported by Kepware 
+        instead of reading the project properties before every call. The PROJECT_ID is taken from any response 
+        that includes it, such as reading the object before modifying it, and is advanced by one after a write 
+        that did not report the new PROJECT_ID, since Kepware increments it with every change. A modify call 
+        rejected because the PROJECT_ID is outdated reads the current PROJECT_ID and is sent again once. (Default: False)
+    :param project_id_stats: Dict with the tracked `project_id` and the number of `hits` (modify calls that used 
+        the tracked PROJECT_ID), `refreshes` (reads of the project properties) and `conflicts`, or None if 
+        tracking is disabled
+    :param cache_policy: `CachePolicy` used to cache configuration reads, or None to disable caching (Default: None)
+    :param cache_stats: Dict with the number of cache `hits`, `misses`, cached `entries`, `invalidations` 
+        (entries dropped because of a write or PROJECT_ID change) and `evictions`, or None if caching is disabled
+    :param disk_cache: `DiskCache` used to keep structure reads on local disk between processes, or None to 
+        disable it (Default: None)
+    :param disk_cache_stats: Dict with the number of `hits`, `misses` and `stores` of the disk cache, or None 
+        if it is disabled
+    :param coalesce_reads: If True, identical GET requests made at the same time by several threads or tasks 
+        share one request to Kepware and each receive a copy of the result. A read started after a write 
+        through this instance doesn't share a request started before the write. (Default: False)
+    :param coalesce_stats: Dict with the number of GET `requests` sent and the number of reads `coalesced` 
+        into a request already in flight, or None if coalescing is disabled
+    :param json_codec: `JsonCodec` used to encode request bodies and decode response bodies. Set to None to 
+        select the default again, which is the fastest of orjson, ujson and the standard library json module 
+        that is installed (Default: fastest installed)
+    :param compress_responses: If True, Kepware is asked to send gzip or deflate compressed responses, which 
+        are decompressed as they are received. Useful for servers connected over slow links, since structure 
+        reads, logs and tag listings compress well. (Default: False)
+    :param metrics: `MetricsRegistry` that records the latency, status codes, retries and bytes of every request, 
+        or None to disable metrics (Default: None)
+    :param tracer: `Tracer` that records nested spans for the configuration calls and HTTP requests made with 
+        this instance, or None to disable tracing (Default: None)
 
     **Methods**
 
@@ -55,18 +125,32 @@ class server:
 
     :meth:`service_status` - retrive service job status
 
+    :meth:`wait_for_jobs` - wait for one or many service jobs to complete
+
     :meth:`export_project_configuration` - export the current project configuration in JSON format
 
+    :meth:`iter_project_configuration` - export the current project configuration one object at a time
+
+    :meth:`export_project_to_file` - export the current project configuration to a JSON file
+
     :meth:`save_project` - save the current project to a file
 
     :meth:`load_project` - load a project from a file
+
+    :meth:`close` - close all pooled connections to the Kepware server
+
+    :meth:`clear_cache` - drop all cached configuration reads
+
+    :meth:`add_hook` - add a callback called before or after every HTTP request
+
+    :meth:`remove_hook` - remove a callback added with `add_hook`
     '''
-    __root_url = '/config'
-    __version_url = '/v1'
-    __project_services_url = '/project/services'
-    __event_log_url = '/event_log'
-    __trans_log_url = '/log'
-    __audit_log_url = '/audit_log'
+    _root_url = '/config'
+    _version_url = '/v1'
+    _project_services_url = '/project/services'
+    _event_log_url = '/event_log'
+    _trans_log_url = '/log'
+    _audit_log_url = '/audit_log'
 
 
 
@@ -75,8 +159,25 @@ class server:
         self.port = port
         self.username = user
         self.password = pw
-        self.__ssl_context = ssl.create_default_context()
+        self._ssl_context = ssl.create_default_context()
         self.__SSL_on = https
+        self.__pool = _PoolManager()
+        self._serialize_supported = True
+        self.__retry_policy = RetryPolicy()
+        self._retry_stats = _RetryStats()
+        self._read_limiter = None
+        self._write_limiter = None
+        self._adaptive_limiter = None
+        self._project_id_tracker = None
+        self._cache = None
+        self._disk_cache = None
+        self._flights = None
+        self._codec = _default_codec()
+        self._compress_responses = False
+        self._hooks = {'before': [], 'after': [], 'error': []}
+        self._metrics = None
+        self._tracer = None
+        self._instrumented = False
     
     @property
     def url(self):
@@ -84,7 +185,7 @@ class server:
             proto = 'https'
         else:
             proto = 'http'
-        return  f'{proto}://{self.host}:{self.port}{self.__root_url}{self.__version_url}'
+        return  f'{proto}://{self.host}:{self.port}{self._root_url}{self._version_url}'
     
     @property
     def SSL_on(self):
@@ -96,22 +197,189 @@ class server:
         if isinstance(val, bool):
             self.__SSL_on = val
 
+    @property
+    def pool_size(self):
+        return self.__pool.maxsize
+
+    @pool_size.setter
+    def pool_size(self, val):
+        if isinstance(val, int) and val > 0:
+            self.__pool.maxsize = val
+
+    @property
+    def retry_policy(self):
+        return self.__retry_policy
+
+    @retry_policy.setter
+    def retry_policy(self, val):
+        if val is None or isinstance(val, RetryPolicy):
+            self.__retry_policy = val
+
+    @property
+    def retry_stats(self):
+        return self._retry_stats.as_dict()
+
+    @property
+    def read_limit(self):
+        return None if self._read_limiter is None else self._read_limiter.limit
+
+    @read_limit.setter
+    def read_limit(self, val):
+        if val is None:
+            self._read_limiter = None
+        elif isinstance(val, RateLimit):
+            self._read_limiter = _RequestLimiter(val)
+
+    @property
+    def write_limit(self):
+        return None if self._write_limiter is None else self._write_limiter.limit
+
+    @write_limit.setter
+    def write_limit(self, val):
+        if val is None:
+            self._write_limiter = None
+        elif isinstance(val, RateLimit):
+            self._write_limiter = _RequestLimiter(val)
+
+    @property
+    def adaptive_concurrency(self):
+        return None if self._adaptive_limiter is None else self._adaptive_limiter.config
+
+    @adaptive_concurrency.setter
+    def adaptive_concurrency(self, val):
+        if val is None:
+            self._adaptive_limiter = None
+        elif isinstance(val, AdaptiveConcurrency):
+            self._adaptive_limiter = _AdaptiveLimiter(val)
+
+    @property
+    def adaptive_stats(self):
+        return None if self._adaptive_limiter is None else self._adaptive_limiter.as_dict()
+
+    @property
+    def project_id_tracking(self):
+        return self._project_id_tracker is not None
+
+    @project_id_tracking.setter
+    def project_id_tracking(self, val):
+        if isinstance(val, bool):
+            if not val:
+                self._project_id_tracker = None
+            elif self._project_id_tracker is None:
+                self._project_id_tracker = _ProjectIdTracker()
+
+    @property
+    def project_id_stats(self):
+        return None if self._project_id_tracker is None else self._project_id_tracker.as_dict()
+
+    @property
+    def cache_policy(self):
+        return None if self._cache is None else self._cache.policy
+
+    @cache_policy.setter
+    def cache_policy(self, val):
+        if val is None:
+            self._cache = None
+        elif isinstance(val, CachePolicy):
+            self._cache = _ResponseCache(val, self._root_url + self._version_url)
+
+    @property
+    def cache_stats(self):
+        return None if self._cache is None else self._cache.as_dict()
+
+    @property
+    def disk_cache(self):
+        return None if self._disk_cache is None else self._disk_cache.config
+
+    @disk_cache.setter
+    def disk_cache(self, val):
+        if val is None:
+            self._disk_cache = None
+        elif isinstance(val, DiskCache):
+            self._disk_cache = _DiskStructureCache(val)
+
+    @property
+    def disk_cache_stats(self):
+        return None if self._disk_cache is None else self._disk_cache.as_dict()
+
+    @property
+    def coalesce_reads(self):
+        return self._flights is not None
+
+    @coalesce_reads.setter
+    def coalesce_reads(self, val):
+        if isinstance(val, bool):
+            if not val:
+                self._flights = None
+            elif self._flights is None:
+                self._flights = _SingleFlight()
+
+    @property
+    def coalesce_stats(self):
+        return None if self._flights is None else self._flights.as_dict()
+
+    @property
+    def json_codec(self):
+        return self._codec
+
+    @json_codec.setter
+    def json_codec(self, val):
+        if val is None:
+            self._codec = _default_codec()
+        elif isinstance(val, JsonCodec):
+            self._codec = val
+
+    @property
+    def compress_responses(self):
+        return self._compress_responses
+
+    @compress_responses.setter
+    def compress_responses(self, val):
+        if isinstance(val, bool):
+            self._compress_responses = val
+
+    @property
+    def metrics(self):
+        return self._metrics
+
+    @metrics.setter
+    def metrics(self, val):
+        if val is None:
+            self._metrics = None
+        elif isinstance(val, MetricsRegistry):
+            self._metrics = val
+        self._update_instrumented()
+
+    @property
+    def tracer(self):
+        return self._tracer
+
+    @tracer.setter
+    def tracer(self, val):
+        if val is None:
+            self._tracer = None
+        elif isinstance(val, Tracer):
+            self._tracer = val
+        self._update_instrumented()
+
     @property
     def SSL_ignore_hostname(self):
-        return not self.__ssl_context.check_hostname
+        return not self._ssl_context.check_hostname
 
     @SSL_ignore_hostname.setter
     def SSL_ignore_hostname(self, val):
         if isinstance(val, bool):
             if val == True:
-                self.__ssl_context.check_hostname = False
+                self._ssl_context.check_hostname = False
             else:
-                self.__ssl_context.check_hostname = True
+                self._ssl_context.check_hostname = True
+            # Established connections were validated with the previous settings
+            self._clear_pool()
 
     
     @property
     def SSL_trust_all_certs(self):
-        if self.__ssl_context.verify_mode == ssl.CERT_NONE:
+        if self._ssl_context.verify_mode == ssl.CERT_NONE:
             return True
         else:
             return False
@@ -120,11 +388,13 @@ class server:
     def SSL_trust_all_certs(self, val):
         if isinstance(val, bool):
             if val == True:
-                if self.__ssl_context.check_hostname == True:
-                    self.__ssl_context.check_hostname = False
-                self.__ssl_context.verify_mode = ssl.CERT_NONE
+                if self._ssl_context.check_hostname == True:
+                    self._ssl_context.check_hostname = False
+                self._ssl_context.verify_mode = ssl.CERT_NONE
             else:
-                self.__ssl_context.verify_mode = ssl.CERT_REQUIRED
+                self._ssl_context.verify_mode = ssl.CERT_REQUIRED
+            # Established connections were validated with the previous settings
+            self._clear_pool()
 
 
     def get_status(self) -> dict:
@@ -161,7 +431,7 @@ class server:
         :raises KepHTTPError: If urllib provides an HTTPError (If not HTTP code 202 [Accepted] or 429 [Too Busy] returned)
         :raises KepURLError: If urllib provides an URLError
         '''
-        url = self.url + self.__project_services_url + '/ReinitializeRuntime' 
+        url = self.url + self._project_services_url + '/ReinitializeRuntime' 
         try:
             job = self._kep_service_execute(url, None, job_ttl)
             return job
@@ -178,8 +448,8 @@ class server:
         :raises KepHTTPError: If urllib provides an HTTPError
         :raises KepURLError: If urllib provides an URLError
         '''
-        query = self.__create_query(start, end, limit)
-        url = f'{self.url}{self.__trans_log_url}'
+        query = self._create_query(start, end, limit)
+        url = f'{self.url}{self._trans_log_url}'
         r = self._config_get(url, params= query)
         return r.payload
 
@@ -195,10 +465,8 @@ class server:
         :raises KepHTTPError: If urllib provides an HTTPError
         :raises KepURLError: If urllib provides an URLError
         '''
-        query = self.__create_query(start, end, limit)
-        if options is not None:
-            query = {**query, **options}
-        url = f'{self.url}{self.__event_log_url}'
+        query = self._create_query(start, end, limit, options)
+        url = f'{self.url}{self._event_log_url}'
         r = self._config_get(url, params= query)
         return r.payload
 
@@ -213,12 +481,8 @@ class server:
         :raises KepHTTPError: If urllib provides an HTTPError
         :raises KepURLError: If urllib provides an URLError
         '''
-        query = self.__create_filter_query(filters)
-        if limit is not None:
-            query['limit'] = limit
-        if options is not None:
-            query = {**query, **options}
-        url = f'{self.url}{self.__audit_log_url}'
+        query = self._create_filter_query(filters, limit, options)
+        url = f'{self.url}{self._audit_log_url}'
         r = self._config_get(url, params= query)
         return r.payload
     
@@ -248,8 +512,7 @@ class server:
 
         prop_data = self._force_update_check(force, DATA)
         r = self._config_update(self.url + '/project', prop_data)
-        if r.code == 200: return True 
-        else: raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+        return self._modify_result(self.url + '/project', r)
     
     def import_empty_project(self) -> KepServiceResponse:
         '''Executes JsonProjectLoad Service call to the Kepware instance with an empty project. This service 
@@ -264,21 +527,24 @@ class server:
         return self.import_project_configuration({"project":{}})
 
 
-    def import_project_configuration(self, DATA: dict) -> KepServiceResponse:
+    def import_project_configuration(self, DATA: dict, *, stream: bool = False) -> KepServiceResponse:
         '''Executes JsonProjectLoad Service call to the Kepware instance. This service imports project configuration 
         data, expecting a complete project file in JSON/dict format. This service acts like a FILE->OPEN action and 
         stop communications while the new project replaces the current project in the Kepware runtime. 
     
         :param DATA: Complete project configuration data in JSON/dict format. 
+        :param stream: *(optional)* If True, the project is encoded in chunks as it is sent with chunked transfer 
+        encoding, so the JSON text of a large project is never held in memory in full. The request can't be 
+        sent again by the retry policy. (default= False)
 
         :return: `KepServiceResponse` instance with job information
         
         :raises KepHTTPError: If urllib provides an HTTPError (If not HTTP code 202 [Accepted] or 429 [Too Busy] returned)
         :raises KepURLError: If urllib provides an URLError
         '''
-        url = self.url + self.__project_services_url + '/JsonProjectLoad'
+        url = self.url + self._project_services_url + '/JsonProjectLoad'
         try:
-            job = self._kep_service_execute(url, DATA)
+            job = self._kep_service_execute(url, DATA, stream= stream)
             return job
         except Exception as err:
             raise err
@@ -292,8 +558,50 @@ class server:
         :raises KepHTTPError: If urllib provides an HTTPError
         :raises KepURLError: If urllib provides an URLError
         '''
-        r = self._config_get(self.url + '/project', params= {"content": "serialize"})
-        return r.payload
+        return self._config_get_structure(self.url + '/project')
+
+    def iter_project_configuration(self):
+        '''Streaming version of `export_project_configuration` for large projects. The response is parsed 
+        as it is received and every object is returned as soon as it has been decoded, so the complete 
+        project is never held in memory.
+
+        Every object is returned without its child collections, which are returned as separate objects. 
+        Children are returned before their parent and the project itself is returned last.
+
+        Example return values:
+
+            (('Channel1', 'Device1', 'Group1'), 'tags', {tag properties})
+            (('Channel1',), 'devices', {device properties})
+            ((), 'channels', {channel properties})
+            ((), None, {'project': {project properties}})
+
+        :return: Generator of tuples of (path, collection, object). *path* is the tuple of the names of the 
+            objects the object is nested in and *collection* is the name of the collection it belongs to, 
+            such as "channels", "devices", "tags" or "tag_groups"
+
+        :raises KepHTTPError: If urllib provides an HTTPError
+        :raises KepURLError: If urllib provides an URLError
+        '''
+        url_obj = self._url_validate(self.url + '/project?content=serialize')
+        return self.__connect('GET', url_obj, stream= 'tree').payload
+
+    def export_project_to_file(self, filename: str, *, compress: bool = None, chunk_size: int = 65536) -> int:
+        '''Export the project configuration, as returned by `export_project_configuration`, directly to a 
+        JSON file. The response is written to the file as it is received without being decoded. The file 
+        is written under a temporary name and only replaces *filename* once the export is complete.
+
+        :param filename: path of the file to write
+        :param compress: *(optional)* gzip compress the file. If None the file is compressed when *filename* 
+            ends with ".gz" (default= None)
+        :param chunk_size: *(optional)* size in bytes of the chunks read from the response (default= 65536)
+
+        :return: Number of bytes of JSON received
+
+        :raises KepHTTPError: If urllib provides an HTTPError
+        :raises KepURLError: If urllib provides an URLError
+        '''
+        r = self._config_get(self.url + '/project', params= {"content": "serialize"}, raw= chunk_size)
+        return _write_chunks(filename, r.payload, compress)
     
     def save_project(self, filename: str, password: str = None, job_ttl: int = None) -> KepServiceResponse:
         '''Executes a ProjectSave Service call to the Kepware instance. This saves 
@@ -316,9 +624,8 @@ class server:
         :raises KepHTTPError: If urllib provides an HTTPError (If not HTTP code 202 [Accepted] or 429 [Too Busy] returned)
         :raises KepURLError: If urllib provides an URLError
         '''
-        url = self.url + self.__project_services_url + '/ProjectSave'
-        prop_data = {'servermain.PROJECT_FILENAME': filename}
-        if password != None: prop_data['servermain.PROJECT_PASSWORD'] = password
+        url = self.url + self._project_services_url + '/ProjectSave'
+        prop_data = self._project_file_data(filename, password)
         try:
             job = self._kep_service_execute(url, prop_data, job_ttl)
             return job
@@ -345,9 +652,8 @@ class server:
         :raises KepHTTPError: If urllib provides an HTTPError (If not HTTP code 202 [Accepted] or 429 [Too Busy] returned)
         :raises KepURLError: If urllib provides an URLError
         '''
-        url = self.url + self.__project_services_url + '/ProjectLoad'
-        prop_data = {'servermain.PROJECT_FILENAME': filename}
-        if password != None: prop_data['servermain.PROJECT_PASSWORD'] = password
+        url = self.url + self._project_services_url + '/ProjectLoad'
+        prop_data = self._project_file_data(filename, password)
         try:
             job = self._kep_service_execute(url, prop_data, job_ttl)
             return job
@@ -377,7 +683,7 @@ class server:
         :raises KepHTTPError: If urllib provides an HTTPError (If not HTTP code 202 [Accepted] or 429 [Too Busy] returned)
         :raises KepURLError: If urllib provides an URLError
         '''
-        url = self.url + self.__project_services_url + '/CreateBackup'
+        url = self.url + self._project_services_url + '/CreateBackup'
         try:
             job = self._kep_service_execute(url, TTL= job_ttl)
             return job
@@ -395,66 +701,208 @@ class server:
         :raises KepHTTPError: If urllib provides an HTTPError
         :raises KepURLError: If urllib provides an URLError
         '''
-        # need to remove part of job href
-        loc = resp.href.find(self.__root_url + self.__version_url)
-        job_url = resp.href[loc + len(self.__root_url + self.__version_url):]
+        r = self._config_get(self.url + self._job_url(resp))
+        return self._job_status(r)
+
+    def wait_for_jobs(self, jobs: Union[KepServiceResponse, list], timeout: Union[float, list] = None, *, 
+                      poll_interval: float = 0.1, max_poll_interval: float = 5.0, backoff: float = 2.0) -> Union[KepServiceStatus, list]:
+        '''Waits for one or many service jobs to complete and returns their final status. All jobs are 
+        polled from the calling thread. Each job is first polled after `poll_interval` seconds and the interval 
+        between polls of the job grows by `backoff` up to `max_poll_interval`, so short jobs complete quickly 
+        while long jobs don't flood Kepware with status requests.
 
-        r = self._config_get(self.url + job_url)
-        job = KepServiceStatus(r.payload['servermain.JOB_COMPLETE'],r.payload['servermain.JOB_STATUS'], r.payload['servermain.JOB_STATUS_MSG'])
-        return job
+        A job that did not start (such as a service call rejected with HTTP 429) or whose status can't be 
+        read (such as a job that expired) is returned with `complete` False and the error in `message`. 
+        A job that is still running when its timeout expires is returned with its last status.
+
+        :param jobs: `KepServiceResponse` instance or list of instances returned by service calls
+        :param timeout: *(optional)* Maximum time in seconds to wait for each job, either one value for all 
+        jobs or a list with a value per job. None waits until the job completes. (default= None)
+        :param poll_interval: *(optional)* Delay in seconds before the first poll of a job (default= 0.1)
+        :param max_poll_interval: *(optional)* Maximum delay in seconds between polls of a job (default= 5.0)
+        :param backoff: *(optional)* Factor applied to the delay after each poll of a job (default= 2.0)
+
+        :return: `KepServiceStatus` instance, or list of instances in the same order as `jobs`
+
+        :raises KepURLError: If urllib provides an URLError
+        '''
+        single = isinstance(jobs, KepServiceResponse)
+        job_list = [jobs] if single else list(jobs)
+        results, schedule = self._schedule_jobs(job_list, timeout, poll_interval)
+        while schedule:
+            due, i, interval, deadline = heapq.heappop(schedule)
+            delay = due - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            try:
+                status = self.service_status(job_list[i])
+            except KepHTTPError as err:
+                results[i] = KepServiceStatus(False, '', str(err.payload))
+                continue
+            self._reschedule_job(schedule, results, i, status, interval, deadline, max_poll_interval, backoff)
+        return results[0] if single else results
+
+    def close(self):
+        '''Closes all idle keep-alive connections held for this server. Connections are 
+        re-established as needed if the instance is used again.
+        '''
+        self.__pool.clear()
+
+    def add_hook(self, event: str, callback):
+        '''Adds a callback that is called for every HTTP request sent to Kepware, including each attempt of 
+        a retried request. The callback receives a `RequestInfo` describing the request. Exceptions raised 
+        by a callback are raised to the caller of the configuration call.
+
+        :param event: "before" - called before the request is sent, "after" - called when a successful 
+        response is received, "error" - called when the request fails with a `KepHTTPError` or `KepURLError`
+        :param callback: function that takes a `RequestInfo`
+
+        :raises ValueError: If *event* is not "before", "after" or "error"
+        '''
+        if event not in self._hooks:
+            raise ValueError(f'Unknown hook event: {event}')
+        self._hooks[event] = self._hooks[event] + [callback]
+        self._update_instrumented()
+
+    def remove_hook(self, event: str, callback):
+        '''Removes a callback added with `add_hook`.
+
+        :param event: "before", "after" or "error"
+        :param callback: function passed to `add_hook`
+
+        :raises ValueError: If *event* is not "before", "after" or "error" or the callback was not added
+        '''
+        if event not in self._hooks:
+            raise ValueError(f'Unknown hook event: {event}')
+        hooks = list(self._hooks[event])
+        hooks.remove(callback)
+        self._hooks[event] = hooks
+        self._update_instrumented()
+
+    def clear_cache(self):
+        '''Drops all configuration reads cached based on `cache_policy`. Use this after the project 
+        is changed by other clients to read the current configuration before the cached reads expire.
+        '''
+        if self._cache is not None:
+            self._cache.clear()
 
 
     #Function used to Add an object to Kepware (HTTP POST)
     def _config_add(self, url, DATA):
         '''Conducts an POST method at *url* to add an object in the Kepware Configuration
         *DATA* is required to be a properly JSON object (dict) of the item to be posted to *url* 
+        or a list of them. Any other iterable of items is encoded as it is consumed and sent as a 
+        JSON array with chunked transfer encoding. Such a body can't be sent again, so it is not retried.
         '''
-        if len(DATA) == 0:
-            err_msg = f'Error: Empty List or Dict in DATA | DATA type: {type(DATA)}'
-            raise KepError(err_msg) 
-        data = json.dumps(DATA).encode('utf-8')
-        url_obj = self.__url_validate(url)
-        q = request.Request(url_obj, data, method='POST')
-        r = self.__connect(q)
+        data = self._add_body(DATA)
+        url_obj = self._url_validate(url)
+        try:
+            r = self.__connect('POST', url_obj, data)
+        finally:
+            self._invalidate_reads(url_obj)
+        self._note_write(url_obj, r)
         return r
 
     #Function used to del an object to Kepware (HTTP DELETE)
     def _config_del(self, url):
         '''Conducts an DELETE method at *url* to delete an object in the Kepware Configuration'''
-        url_obj = self.__url_validate(url)
-        q = request.Request(url_obj, method='DELETE')
-        r = self.__connect(q)
+        url_obj = self._url_validate(url)
+        try:
+            r = self.__connect('DELETE', url_obj)
+        finally:
+            self._invalidate_reads(url_obj)
+        self._note_write(url_obj, r)
         return r
 
     #Function used to Update an object to Kepware (HTTP PUT)
-    def _config_update(self, url, DATA = None):
+    def _config_update(self, url, DATA = None, *, stream = False):
         '''Conducts an PUT method at *url* to modify an object in the Kepware Configuration.
-        *DATA* is required to be a properly JSON object (dict) of the item to be put to *url*
+        *DATA* is required to be a properly JSON object (dict) of the item to be put to *url*. 
+        With *stream* set *DATA* is encoded in chunks as it is sent instead of at once.
         '''
-        url_obj = self.__url_validate(url)
-        if DATA == None:            
-            q = request.Request(url_obj, method='PUT')
-        else:
-            data = json.dumps(DATA).encode('utf-8')
-            q = request.Request(url_obj, data, method='PUT')
-        r = self.__connect(q)
+        url_obj = self._url_validate(url)
+        try:
+            r = self.__connect('PUT', url_obj, self._update_body(DATA, stream))
+        except KepHTTPError as err:
+            if not self._is_project_id_conflict(err, DATA):
+                raise err
+            # PROJECT_ID filled in by the tracker was outdated, send again with the current one
+            if not self._update_project_id(DATA, self._refresh_project_id()):
+                raise err
+            r = self.__connect('PUT', url_obj, self._update_body(DATA, stream))
+        finally:
+            self._invalidate_reads(url_obj)
+        self._note_write(url_obj, r)
         return r
 
     #Function used to Read an object from Kepware (HTTP GET) and return the JSON response
-    def _config_get(self, url, *, params = None):
+    def _config_get(self, url, *, params = None, cached = True, raw = None):
         '''
         Conducts an GET method at *url* to retrieve an objects properties with query parameters in 
-        the Kepware Configuration.
+        the Kepware Configuration. The response is served from and stored in the cache when 
+        `cache_policy` is set, unless *cached* is False. If *raw* is set to a chunk size the payload 
+        is a generator of the undecoded chunks of the response body instead.
         '''
-        # Add parameters when necessary
-        if params is not None and params != {}:
-            qparams = parse.urlencode(params)
-            url = f'{url}?{qparams}'
-        url_obj = self.__url_validate(url)
-        q = request.Request(url_obj, method='GET')
-        r = self.__connect(q)
+        url_obj = self._get_url(url, params)
+        stream = self._get_stream(raw)
+        if stream is not None:
+            return self.__connect('GET', url_obj, stream= stream)
+        r, cache, generation = self._cache_lookup(url_obj, cached)
+        if r is not None:
+            return r
+        r = self._coalesced_get(url_obj)
+        if cache is not None:
+            cache.put(url_obj, r.payload, generation)
         return r
 
+    # Sends a GET request, sharing a request already in flight for the same URL
+    def _coalesced_get(self, url):
+        flights = self._flights
+        if flights is None:
+            return self.__connect('GET', url)
+        return flights.do(_cache_key(url)[0], lambda: self.__connect('GET', url))
+
+    def _config_get_serialized(self, url):
+        '''
+        Conducts a GET method at *url* with `content=serialize` to retrieve an object and all of its 
+        children in one request. Returns the payload, or None if the Kepware instance rejects 
+        serialized content for the object so the caller can fall back to walking the tree.
+        '''
+        if not self._serialize_supported:
+            return None
+        try:
+            payload = self._config_get_structure(url)
+        except KepHTTPError as err:
+            if self._serialize_unsupported(err):
+                return None
+            raise err
+        return payload if isinstance(payload, dict) else None
+
+    def _config_get_structure(self, url):
+        '''
+        Conducts a GET method at *url* with `content=serialize` and returns the payload. When `disk_cache` 
+        is set, the payload is loaded from disk if it was stored for the current PROJECT_ID, and stored 
+        otherwise if the PROJECT_ID didn't change while it was read. The tracked PROJECT_ID is used when 
+        `project_id_tracking` knows it, otherwise it is read from Kepware.
+        '''
+        disk = self._disk_cache
+        if disk is None:
+            return self._config_get(url, params= {"content": "serialize"}).payload
+        url_obj = self._url_validate(url)
+        project_id = self._tracked_project_id()
+        tracked = project_id is not None
+        if not tracked:
+            project_id = self._read_project_id()
+        if project_id is not None:
+            payload = disk.load(self.username, url_obj, project_id)
+            if payload is not None:
+                return payload
+        payload = self._config_get(url, params= {"content": "serialize"}).payload
+        current = self._tracked_project_id() if tracked else self._read_project_id()
+        if project_id is not None and current == project_id:
+            disk.store(self.username, url_obj, project_id, payload)
+        return payload
+
     
     def _force_update_check(self, force, DATA):
         '''
@@ -463,80 +911,422 @@ class server:
         to provide the current 'PROJECT_ID'. If 'PROJECT_ID' is not present in DATA, this will automatically 
         retreive it from the active server.
         '''
-        if force == True:
-            DATA['FORCE_UPDATE'] = True
-        else:
-            # Get Project ID if it doesn't exist and if FORCE_UPDATE is existing and FALSE
-            if 'PROJECT_ID' not in DATA:
-                if 'FORCE_UPDATE' in DATA:
-                    if 'FORCE_UPDATE' == False:
-                        try:
-                            project_data = self._config_get(self.url + '/project')
-                            DATA['PROJECT_ID'] = project_data.payload['PROJECT_ID']
-                        except:
-                            #NEED TO COVER ERROR CONDITION
-                            pass
-                else:
-                    try:
-                        project_data = self._config_get(self.url + '/project')
-                        DATA['PROJECT_ID'] = project_data.payload['PROJECT_ID']
-                    except:
-                        #NEED TO COVER ERROR CONDITION
-                        pass
+        if self._needs_project_id(force, DATA):
+            project_id = self._tracked_project_id()
+            if project_id is None:
+                project_id = self._refresh_project_id()
+            self._set_project_id(DATA, project_id)
         return DATA
+
+    # Reads the current PROJECT_ID, counted as a refresh of the tracker. Returns None if it can't be read
+    def _refresh_project_id(self):
+        if self._project_id_tracker is not None:
+            self._project_id_tracker.note_refresh()
+        return self._read_project_id()
+
+    # Reads the current PROJECT_ID from Kepware. Returns None if it can't be read
+    def _read_project_id(self):
+        try:
+            project_data = self._config_get(self.url + '/project', cached= False)
+        except KepError:
+            return None
+        return self._project_id_of(project_data)
+
+    # True if a modify call failed because the PROJECT_ID filled in by the tracker was outdated
+    def _is_project_id_conflict(self, err, DATA):
+        if DATA is None or _autofilled.get() is not DATA:
+            return False
+        _autofilled.set(None)
+        if self._project_id_tracker is None or err.code not in _PROJECT_ID_CONFLICT_CODES:
+            return False
+        # Other validation errors of the modify are raised as they are
+        if 'PROJECT_ID' not in str(err.payload):
+            return False
+        self._project_id_tracker.note_conflict()
+        return True
+
+    # Builds the response returned for a cache hit
+    def _cached_response(self, payload):
+        data = _HttpDataAbstract()
+        data.payload = payload
+        data.code = 200
+        data.reason = 'OK'
+        return data
+
+    # Drops cached reads touched by a write to *url*, or all of them if the write replaces the project, and 
+    # stops new reads from sharing requests sent before the write
+    def _invalidate_reads(self, url):
+        replaced = parse.urlsplit(url).path.rstrip('/').endswith(_PROJECT_LOAD_SERVICES)
+        if self._cache is not None:
+            if replaced:
+                self._cache.clear(replaced= True)
+            else:
+                self._cache.invalidate(url)
+        if self._disk_cache is not None and replaced:
+            self._disk_cache.clear()
+        if self._flights is not None:
+            self._flights.invalidate()
+
+    # Advances the tracked PROJECT_ID after a successful write. A project load replaces the project, so 
+    # its PROJECT_ID is read again, while other service calls don't change it
+    def _note_write(self, url, r):
+        tracker = self._project_id_tracker
+        if tracker is None:
+            return
+        path = parse.urlsplit(url).path.rstrip('/')
+        if path.endswith(_PROJECT_LOAD_SERVICES):
+            tracker.set(None)
+        elif self._project_services_url not in path:
+            tracker.note_write(r.payload)
+
+    # Tracks the PROJECT_ID reported in a response for the tracker and the cache
+    def _note_response(self, payload):
+        if self._project_id_tracker is not None:
+            self._project_id_tracker.note_response(payload)
+        if self._cache is not None and isinstance(payload, dict) and payload.get('PROJECT_ID') is not None:
+            self._cache.note_project_id(payload['PROJECT_ID'])
+
     # General service call handler
-    def _kep_service_execute(self, url, DATA = None, TTL = None):
+    def _kep_service_execute(self, url, DATA = None, TTL = None, *, stream = False):
         try:
-            if TTL != None:
-                if DATA == None: DATA = {}
-                DATA["servermain.JOB_TIME_TO_LIVE_SECONDS"]= TTL
-            r = self._config_update(url, DATA)
-            job = KepServiceResponse(r.payload['code'],r.payload['message'], r.payload['href'])
-            return job
+            r = self._config_update(url, self._service_data(DATA, TTL), stream= stream)
+            return self._service_job(r)
         except KepHTTPError as err:
-            if err.code == 429:
-                job = KepServiceResponse()
-                job.code = err.code
-                job.message = err.payload
-                return job
-            else:
-                raise err
+            return self._service_error(err)
 
 # 
 # Supporting Functions
 #
 
+    # Path of a service job below the base url
+    def _job_url(self, resp):
+        # need to remove part of job href
+        loc = resp.href.find(self._root_url + self._version_url)
+        return resp.href[loc + len(self._root_url + self._version_url):]
+
+    # Returns the initial results and poll schedule for wait_for_jobs. The schedule is a heap 
+    # of (next poll time, job index, poll interval, deadline)
+    def _schedule_jobs(self, jobs, timeout, poll_interval):
+        timeouts = timeout if isinstance(timeout, (list, tuple)) else [timeout] * len(jobs)
+        if len(timeouts) != len(jobs):
+            raise KepError('Error: timeout list length does not match jobs | Function: wait_for_jobs')
+        now = time.monotonic()
+        results = [None] * len(jobs)
+        schedule = []
+        for i, job in enumerate(jobs):
+            if not job.href:
+                results[i] = KepServiceStatus(False, '', str(job.message))
+                continue
+            deadline = None if timeouts[i] is None else now + timeouts[i]
+            due = now + poll_interval if deadline is None else min(now + poll_interval, deadline)
+            heapq.heappush(schedule, (due, i, poll_interval, deadline))
+        return results, schedule
+
+    # Records the status of a polled job or schedules the next poll
+    def _reschedule_job(self, schedule, results, i, status, interval, deadline, max_poll_interval, backoff):
+        now = time.monotonic()
+        if status.complete or (deadline is not None and now >= deadline):
+            results[i] = status
+            return
+        interval = min(interval * backoff, max_poll_interval)
+        due = now + interval if deadline is None else min(now + interval, deadline)
+        heapq.heappush(schedule, (due, i, interval, deadline))
+
     # General connect call to manage HTTP responses for all methods
+    # Retries requests rejected as too busy based on the retry policy. Bodies that are consumed 
+    # as they are sent are never retried
+    def __connect(self, method, url, body = None, stream = None):
+        limiter = self._limiter_for(method)
+        attempt = 1
+        while True:
+            if limiter is not None:
+                limiter.acquire()
+            adaptive = self._adaptive_limiter
+            start = None
+            error = None
+            info = None
+            try:
+                if adaptive is not None:
+                    start = adaptive.acquire()
+                if self._instrumented:
+                    info = self._request_started(method, url, attempt)
+                r = self.__send(method, url, body, stream)
+                if info is not None:
+                    self._request_finished(info, body, r)
+                return r
+            except (KepHTTPError, KepURLError) as err:
+                error = err
+                delay = self._attempt_failed(info, body, err, attempt)
+                if delay is None:
+                    raise err
+            finally:
+                if start is not None:
+                    adaptive.release(start, error, _latency_class(method, url))
+                if limiter is not None:
+                    limiter.release()
+            time.sleep(delay)
+            attempt += 1
+
+    # Hooks, metrics and tracing are only called when at least one is set
+    def _update_instrumented(self):
+        self._instrumented = self._metrics is not None or self._tracer is not None or any(self._hooks.values())
+
+    # Calls the before hooks and returns the RequestInfo of the request
+    def _request_started(self, method, url, attempt):
+        info = RequestInfo(method, url, _endpoint_template(url), attempt)
+        for callback in self._hooks['before']:
+            callback(info)
+        info.start = time.perf_counter()
+        return info
+
+    # Records a successful request and calls the after hooks
+    def _request_finished(self, info, body, r):
+        info.duration = time.perf_counter() - info.start
+        info.request_bytes = _body_size(body)
+        info.status = r.code
+        info.response_bytes = r.size
+        if self._metrics is not None:
+            self._metrics.record(info)
+        if self._tracer is not None:
+            self._tracer.record_request(info)
+        for callback in self._hooks['after']:
+            callback(info)
+
+    # Records a failed request and calls the error hooks
+    def _request_failed(self, info, body, err):
+        info.duration = time.perf_counter() - info.start
+        info.request_bytes = _body_size(body)
+        info.error = err
+        if isinstance(err, KepHTTPError):
+            info.status = err.code
+            info.response_bytes = _content_length(err.hdrs)
+        if self._metrics is not None:
+            self._metrics.record(info)
+        if self._tracer is not None:
+            self._tracer.record_request(info)
+        for callback in self._hooks['error']:
+            callback(info)
+
+    # Records a failed attempt and returns the delay before the next attempt, or None if *err* should be raised
+    def _attempt_failed(self, info, body, err, attempt):
+        if info is not None:
+            self._request_failed(info, body, err)
+        if isinstance(err, KepHTTPError) and _is_replayable(body):
+            return self._retry_delay(err, attempt)
+        return None
+
+    # Returns the limiter for reads or writes based on the HTTP method
+    def _limiter_for(self, method):
+        if method == 'GET':
+            return self._read_limiter
+        return self._write_limiter
+
+    # Returns the delay before the next attempt, or None if the error should be raised
+    def _retry_delay(self, err, attempt):
+        policy = self.retry_policy
+        if policy is None or err.code not in policy.status_codes:
+            return None
+        if not policy.is_retry(err.code, attempt):
+            if attempt > 1:
+                self._retry_stats.record_exhausted()
+            return None
+        delay = policy.get_backoff(attempt, _parse_retry_after(err.hdrs))
+        self._retry_stats.record_retry(attempt, delay)
+        return delay
+
+    # Sends a single request
     # Returns the response object for the method to handle as appropriate
+    # With *stream* set to 'items' or 'tree' the payload of a successful response is a generator 
+    # of the objects in the body, parsed as the body is received. With *stream* set to a chunk size
+    # the payload is a generator of the raw chunks of the body
     # Raises Errors as found
-    def __connect(self,request_obj):
+    def __send(self, method, url, body = None, stream = None):
         # Fill appropriate header information
         data = _HttpDataAbstract()
-        request_obj.add_header("Authorization", "Basic %s" % self.__build_auth_str(self.username, self.password))
-        request_obj.add_header("Content-Type", "application/json")
-        request_obj.add_header("Accept", "application/json")
+        headers = self._request_headers()
         try:
-            # context is sent regardless of HTTP or HTTPS - seems to be ignored if HTTP URL
-            with request.urlopen(request_obj, context=self.__ssl_context) as server:
-                try:
-                    payload = server.read()
-                    data.payload = json.loads(codecs.decode(payload,'utf-8-sig'))
-                except:
-                    pass
-                data.code = server.code
+            # Requests are sent over pooled keep-alive connections. The SSL context is only used for HTTPS URLs
+            server = self.__pool.urlopen(method, url, body, headers, ssl_context=self._ssl_context)
+            if stream is not None and 200 <= server.status < 300:
+                data.size = _content_length(server.headers)
+            if isinstance(stream, int) and 200 <= server.status < 300:
+                data.payload = _iter_body(server, stream)
+                data.code = server.status
                 data.reason = server.reason
                 return data
-        except error.HTTPError as err:
-            payload = json.loads(codecs.decode(err.read(),'utf-8-sig'))
-            # print('HTTP Code: {}\n{}'.format(err.code,payload), file=sys.stderr)
-            raise KepHTTPError(url=err.url, code=err.code, msg=err.msg, hdrs=err.hdrs, payload=payload)
-        except error.URLError as err:
-            # print('URLError: {} URL: {}'.format(err.reason, request_obj.get_full_url()), file=sys.stderr)
-            raise KepURLError(msg=err.reason, url=request_obj.get_full_url())
+            if stream is not None and 200 <= server.status < 300:
+                data.payload = _iter_response(server, tree= stream == 'tree')
+                data.code = server.status
+                data.reason = server.reason
+                return data
+            with server:
+                payload = server.read()
+        except (OSError, http.client.HTTPException) as err:
+            # print('URLError: {} URL: {}'.format(err, url), file=sys.stderr)
+            raise KepURLError(msg=err, url=url)
+        return self._response_data(url, server.status, server.reason, server.headers, payload)
+
+    # Decodes the body of a response that was read completely. Raises KepHTTPError if the request failed
+    def _response_data(self, url, status, reason, headers, body):
+        if not 200 <= status < 300:
+            try:
+                payload = self._codec.decode(body)
+            except ValueError:
+                payload = codecs.decode(body,'utf-8-sig', errors='replace')
+            # print('HTTP Code: {}\n{}'.format(status,payload), file=sys.stderr)
+            raise KepHTTPError(url=url, code=status, msg=reason, hdrs=headers, payload=payload)
+        data = _HttpDataAbstract()
+        try:
+            data.payload = self._codec.decode(body)
+        except:
+            pass
+        data.code = status
+        data.reason = reason
+        data.size = len(body)
+        self._note_response(data.payload)
+        return data
+
+    # Body of an add call
+    def _add_body(self, DATA):
+        if isinstance(DATA, (dict, list)) and len(DATA) == 0:
+            err_msg = f'Error: Empty List or Dict in DATA | DATA type: {type(DATA)}'
+            raise KepError(err_msg)
+        return _encode_json(DATA, self._codec)
+
+    # Body of a modify call. With *stream* set DATA is encoded in chunks as it is sent
+    def _update_body(self, DATA, stream = False):
+        if DATA == None:
+            return None
+        if stream:
+            return _JsonBody(DATA)
+        return self._codec.encode(DATA)
+
+    # URL of a read with the query parameters when necessary
+    def _get_url(self, url, params = None):
+        if params is not None and params != {}:
+            url = f'{url}?{parse.urlencode(params)}'
+        return self._url_validate(url)
+
+    # Returns how the response of a read is streamed, or None if it is decoded at once. Reads made by 
+    # an iter_all_* function return a generator of the objects in the response
+    def _get_stream(self, raw = None):
+        if raw is not None:
+            return raw
+        if _stream_response.get():
+            return 'items'
+        return None
+
+    # Returns (response, cache, generation) for a read of *url*. The response is set for a cache hit. Otherwise 
+    # the payload read should be stored in *cache* with *generation* when *cache* is set
+    def _cache_lookup(self, url, cached = True):
+        cache = self._cache if cached else None
+        if cache is None or not cache.is_cacheable(url):
+            return None, None, None
+        payload, generation = cache.get(url)
+        if generation is None:
+            return self._cached_response(payload), None, None
+        return None, cache, generation
+
+    # True if *err* shows that the Kepware instance doesn't support content=serialize, in which case it 
+    # isn't used again with this instance. Other errors, such as a 400 for a path that isn't valid, are raised
+    def _serialize_unsupported(self, err):
+        if err.code not in _SERIALIZE_UNSUPPORTED_CODES:
+            return False
+        if err.code == 400:
+            payload = err.payload
+            message = payload.get('message', '') if isinstance(payload, dict) else payload
+            if not isinstance(message, str) or not _SERIALIZE_PARAMETER.search(message):
+                return False
+        self._serialize_supported = False
+        return True
+
+    # Applies *force* to DATA and returns True if the current PROJECT_ID must be added to DATA
+    def _needs_project_id(self, force, DATA):
+        if force == True:
+            DATA['FORCE_UPDATE'] = True
+            return False
+        return 'PROJECT_ID' not in DATA and 'FORCE_UPDATE' not in DATA
+
+    # PROJECT_ID kept by the tracker, or None if it must be read
+    def _tracked_project_id(self):
+        return None if self._project_id_tracker is None else self._project_id_tracker.get()
+
+    # Adds *project_id* to DATA. A PROJECT_ID added with tracking enabled is marked so the call 
+    # is sent again if it is outdated
+    def _set_project_id(self, DATA, project_id):
+        if project_id is not None:
+            DATA['PROJECT_ID'] = project_id
+            if self._project_id_tracker is not None:
+                _autofilled.set(DATA)
+
+    # Replaces an outdated PROJECT_ID in DATA. Returns False if the call can't be sent again
+    def _update_project_id(self, DATA, project_id):
+        if project_id is None or project_id == DATA['PROJECT_ID']:
+            return False
+        DATA['PROJECT_ID'] = project_id
+        return True
+
+    # PROJECT_ID in the response of a read of the project properties, or None
+    def _project_id_of(self, r):
+        try:
+            return r.payload['PROJECT_ID']
+        except (KeyError, TypeError):
+            return None
+
+    # Result of a modify call
+    def _modify_result(self, url, r):
+        if r.code == 200:
+            return True
+        raise KepHTTPError(url=url, code=r.code, msg=r.reason, payload=r.payload)
+
+    # Properties of a ProjectSave or ProjectLoad service call
+    def _project_file_data(self, filename, password = None):
+        prop_data = {'servermain.PROJECT_FILENAME': filename}
+        if password != None: prop_data['servermain.PROJECT_PASSWORD'] = password
+        return prop_data
+
+    # Properties of a service call with the job time to live when set
+    def _service_data(self, DATA = None, TTL = None):
+        if TTL != None:
+            if DATA == None: DATA = {}
+            DATA["servermain.JOB_TIME_TO_LIVE_SECONDS"]= TTL
+        return DATA
+
+    # Job started by a service call
+    def _service_job(self, r):
+        return KepServiceResponse(r.payload['code'],r.payload['message'], r.payload['href'])
+
+    # Job returned when Kepware is too busy to start a service call, other errors are raised
+    def _service_error(self, err):
+        if err.code == 429:
+            job = KepServiceResponse()
+            job.code = err.code
+            job.message = err.payload
+            return job
+        raise err
+
+    # Status of a service job
+    def _job_status(self, r):
+        return KepServiceStatus(r.payload['servermain.JOB_COMPLETE'],r.payload['servermain.JOB_STATUS'], r.payload['servermain.JOB_STATUS_MSG'])
+
+    # Header information sent with every request
+    def _request_headers(self):
+        headers = {
+            "Authorization": "Basic %s" % self._build_auth_str(self.username, self.password),
+            "Content-Type": "application/json",
+            "Accept": "application/json"
+        }
+        if self._compress_responses:
+            headers["Accept-Encoding"] = "gzip, deflate"
+        return headers
+
+    # Closes idle pooled connections so new connections pick up changed settings
+    def _clear_pool(self):
+        self.__pool.clear()
 
     # Fucntion used to ensure special characters are handled in the URL
     # Ex: Space will be turned to %20
-    def __url_validate(self, url):
+    def _url_validate(self, url):
         # Configuration API does not use fragments in URL so ignore to allow # as a character
         # Objects in Kepware can include # as part of the object names
         parsed_url = parse.urlparse(url, allow_fragments= False)
@@ -553,7 +1343,7 @@ class server:
         return parsed_url._replace(path=updated_path).geturl()
 
     # Function used to build the basic authentication string
-    def __build_auth_str(self, username, password):
+    def _build_auth_str(self, username, password):
         if isinstance(username, str):
             username = username.encode('latin1')
         if isinstance(password, str):
@@ -562,7 +1352,7 @@ class server:
         return authstr
     
     # Create parameters for log queries
-    def __create_query(self, start = None, end = None, limit = None):
+    def _create_query(self, start = None, end = None, limit = None, options = None):
         query = {}
         if start != None and isinstance(start, datetime.datetime):
             query['start'] = start.isoformat()
@@ -570,15 +1360,107 @@ class server:
             query['end'] = end.isoformat()
         if limit != None:
             query['limit'] = limit
+        if options is not None:
+            query = {**query, **options}
         return query
 
     # Create filter query for log queries
-    def __create_filter_query(self, filters: list[Filter] = None):
+    def _create_filter_query(self, filters: list[Filter] = None, limit = None, options = None):
         query = {}
-        if filters is None:
-            return query
-        for f in filters:
-            # Ensure we use the value of the Enum, not the Enum object itself
-            key = f"filter[{f.field.value}][{f.modifier.value}]"
-            query[key] = f.value
-        return query
\ No newline at end of file
+        if filters is not None:
+            for f in filters:
+                # Ensure we use the value of the Enum, not the Enum object itself
+                key = f"filter[{f.field.value}][{f.modifier.value}]"
+                query[key] = f.value
+        if limit is not None:
+            query['limit'] = limit
+        if options is not None:
+            query = {**query, **options}
+        return query
+
+def _body_size(body):
+    '''Size of a request body, or None for bodies that are encoded as they are sent, unless the size 
+    of a `_JsonBody` was counted while it was sent.'''
+    if body is None:
+        return 0
+    if isinstance(body, _JsonBody):
+        return body._length
+    if isinstance(body, (bytes, bytearray, str)):
+        return len(body)
+    return None
+
+def _content_length(headers):
+    '''Content-Length of a response, or None if it is not known.'''
+    if headers is None:
+        return None
+    try:
+        return int(headers.get('Content-Length'))
+    except (TypeError, ValueError):
+        return None
+
+class _FileWriter:
+    '''Writes chunks of bytes to a temporary file next to *filename*, gzip compressed if *compress* is True 
+    or None and *filename* ends with ".gz". `commit` renames it to *filename* and `abort` removes it. `size` 
+    is the number of bytes written before compression.'''
+    def __init__(self, filename, compress = None):
+        if compress is None:
+            compress = filename.lower().endswith('.gz')
+        self.filename = filename
+        self.size = 0
+        directory = os.path.dirname(os.path.abspath(filename))
+        fd, self._tmp = tempfile.mkstemp(dir=directory, prefix='.kepconfig-', suffix='.tmp')
+        try:
+            self._file = os.fdopen(fd, 'wb')
+        except BaseException:
+            os.close(fd)
+            os.unlink(self._tmp)
+            raise
+        self._out = gzip.GzipFile(filename=os.path.basename(filename)[:-3] if filename.lower().endswith('.gz') else '',
+                                  mode='wb', fileobj=self._file) if compress else self._file
+
+    def write(self, chunk):
+        self._out.write(chunk)
+        self.size += len(chunk)
+
+    def commit(self):
+        try:
+            self._close()
+            os.replace(self._tmp, self.filename)
+        except BaseException:
+            self.abort()
+            raise
+
+    def abort(self):
+        try:
+            self._close()
+        except OSError:
+            pass
+        try:
+            os.unlink(self._tmp)
+        except OSError:
+            pass
+
+    def _close(self):
+        try:
+            if self._out is not self._file:
+                self._out.close()
+        finally:
+            self._file.close()
+
+def _write_chunks(filename, chunks, compress = None):
+    '''Writes *chunks* of bytes to a temporary file next to *filename* and renames it to *filename* once 
+    all chunks are written. Returns the number of bytes written before compression.'''
+    try:
+        writer = _FileWriter(filename, compress)
+        try:
+            for chunk in chunks:
+                writer.write(chunk)
+        except BaseException:
+            writer.abort()
+            raise
+        writer.commit()
+    except BaseException:
+        if hasattr(chunks, 'close'):
+            chunks.close()
+        raise
+    return writer.size
@@ -13,9 +13,10 @@ channel objects within the Kepware Configuration API
 import inspect
 from ..connection import server
 from ..error import KepHTTPError, KepError
-from ..utils import _url_parse_object
-from typing import Union
-from . import device
+from ..utils import _url_parse_object, _add_result, _multi_status_data, _iter_pages
+from ..tracing import _traced
+from typing import Union, Iterator
+from . import device, tag
 
 CHANNEL_ROOT = '/project/channels'
 
@@ -31,7 +32,8 @@ def _create_url(channel = None):
     else:
         return '{}/{}'.format(CHANNEL_ROOT,_url_parse_object(channel))
 
-def add_channel(server: server, DATA: Union[dict, list]) -> Union[bool, list]:
+@_traced
+def add_channel(server: server, DATA: Union[dict, list], *, multi_status: bool = False) -> Union[bool, list]:
     '''Add a `"channel"` or multiple `"channel"` objects to Kepware. Can be used to pass children of a channel object 
     such as devices and tags/tag groups. This allows you to create a channel, it's devices and tags 
     all in one function, if desired.
@@ -41,6 +43,8 @@ def add_channel(server: server, DATA: Union[dict, list]) -> Union[bool, list]:
     :param server: instance of the `server` class
     :param DATA: Dict of the channel and it's children
     expected by Kepware Configuration API
+    :param multi_status: *(optional)* If True, returns a `MultiStatusResult` with the status of every object instead of 
+    True or the list of failures. (default= False)
 
     :return: True - If a "HTTP 201 - Created" is received from Kepware server
     :return: If a "HTTP 207 - Multi-Status" is received from Kepware with a list of dict error responses for all 
@@ -50,17 +54,11 @@ def add_channel(server: server, DATA: Union[dict, list]) -> Union[bool, list]:
     :raises KepURLError: If urllib provides an URLError
     '''
 
+    DATA = _multi_status_data(DATA, multi_status)
     r = server._config_add(server.url + _create_url(), DATA)
-    if r.code == 201: return True
-    elif r.code == 207:
-        errors = [] 
-        for item in r.payload:
-            if item['code'] != 201:
-                errors.append(item)
-        return errors
-    else: 
-        raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+    return _add_result(r, DATA, multi_status, lambda items: add_channel(server, items, multi_status= True))
 
+@_traced
 def del_channel(server: server, channel: str) -> bool:
     '''Delete a `"channel"` object in Kepware. This will delete all children as well
     
@@ -76,8 +74,9 @@ def del_channel(server: server, channel: str) -> bool:
     r = server._config_del(server.url + _create_url(channel))
     if r.code == 200: return True 
     else: 
-        raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+        raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
 
+@_traced
 def modify_channel(server: server, DATA: dict, *, channel: str = None, force: bool = False) -> bool:
     '''Modify a channel object and it's properties in Kepware. If a `"channel"` is not provided as an input,
     you need to identify the channel in the *'common.ALLTYPES_NAME'* property field in `"DATA"`. It will 
@@ -99,7 +98,7 @@ def modify_channel(server: server, DATA: dict, *, channel: str = None, force: bo
         try:
             r = server._config_update(server.url + _create_url(channel_data['common.ALLTYPES_NAME']), channel_data)
             if r.code == 200: return True 
-            else: raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+            else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
         except KeyError as err:
             err_msg = 'Error: No Channel identified in DATA | Key Error: {}'.format(err)
             raise KepError(err_msg)
@@ -109,8 +108,9 @@ def modify_channel(server: server, DATA: dict, *, channel: str = None, force: bo
         r = server._config_update(server.url + _create_url(channel), channel_data)
         if r.code == 200: return True 
         else: 
-            raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+            raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
 
+@_traced
 def get_channel(server: server, channel: str)  -> dict:
     '''Returns the properties of the channel object.
     
@@ -126,6 +126,7 @@ def get_channel(server: server, channel: str)  -> dict:
     r = server._config_get(server.url + _create_url(channel))
     return r.payload
 
+@_traced
 def get_all_channels(server: server, *, options: dict = None) -> list:
     '''Returns list of all channel objects and their properties.
     
@@ -142,7 +143,27 @@ def get_all_channels(server: server, *, options: dict = None) -> list:
     r = server._config_get(server.url + _create_url(), params= options)
     return r.payload
 
-def get_channel_structure(server: server, channel: str) -> dict:
+def iter_all_channels(server: server, *, options: dict = None, page_size: int = 100, prefetch: bool = True) -> Iterator[dict]:
+    '''Returns a generator of all `"channel"` objects and their properties. The channels are read from Kepware 
+    one page at a time and the next page is requested while the current page is processed, so large 
+    collections don't have to be held in memory.
+
+    :param server: instance of the `server` class
+    :param options: *(optional)* Dict of parameters to filter or sort the list of channels. Options are `filter`, 
+        `sortOrder` and `sortProperty`. `pageNumber` sets the first page to read
+    :param page_size: *(optional)* Number of channels read per request, or None to read all channels with one 
+        request that is parsed as it is received (default= 100)
+    :param prefetch: *(optional)* Request the next page while the current page is processed (default= True)
+
+    :return: Generator of the data for each channel
+
+    :raises KepHTTPError: If urllib provides an HTTPError
+    :raises KepURLError: If urllib provides an URLError
+    '''
+    return _iter_pages(lambda o: get_all_channels(server, options= o), options, page_size, prefetch)
+
+@_traced
+def get_channel_structure(server: server, channel: str, *, serialize: bool = False) -> dict:
     '''Returns the properties of `"channel"` and includes all `"devices"` and the `"tag"` and `"tag group"` objects for a 
     channel in Kepware. Returned object is a dict of channel properties including a device list with 
     tag lists and tag group lists.
@@ -154,7 +175,7 @@ def get_channel_structure(server: server, channel: str) -> dict:
     
         {
             channel_properties,
-            'devices: [
+            'device': [
                 {
                     device1_properties,
                     'tags': [tag1_dict, tag2_dict,...],
@@ -175,16 +196,29 @@ def get_channel_structure(server: server, channel: str) -> dict:
     :param server: instance of the `server` class
     :param channel: name of channel
 
+    :param serialize: *(optional)* If True, the complete structure is requested in a single call using serialized 
+    content. Falls back to requesting each device and walking its tag groups if the Kepware instance doesn't 
+    support serialized content for the channel. (default= False)
+
     :return: Dict of data for the channel structure requested for `"channel"`
 
     :raises KepHTTPError: If urllib provides an HTTPError
     :raises KepURLError: If urllib provides an URLError
     '''
 
+    if serialize:
+        r = server._config_get_serialized(server.url + _create_url(channel))
+        if r is not None and 'devices' in r:
+            # Devices are returned under 'device' by both paths
+            r['device'] = r.pop('devices')
+            for dev in r['device']:
+                tag._normalize_tag_structure(dev)
+            return r
+
     channel_properties = get_channel(server, channel)
     device_list = device.get_all_devices(server,channel)
+    device_properties = []
     for dev in device_list:
-        device_properties = []
-        dev_struct = device.get_device_structure(server,channel + '.' + dev['common.ALLTYPES_NAME'])
+        dev_struct = device.get_device_structure(server,channel + '.' + dev['common.ALLTYPES_NAME'], serialize=False)
         device_properties.append(dev_struct)
-    return {**channel_properties,'device': device_properties}
\ No newline at end of file
+    return {**channel_properties,'device': device_properties}
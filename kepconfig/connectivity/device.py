@@ -11,8 +11,9 @@ device objects within the Kepware Configuration API
 
 from ..connection import KepServiceResponse, server
 from ..error import KepHTTPError, KepError
-from ..utils import _url_parse_object, path_split
-from typing import Union
+from ..utils import _url_parse_object, path_split, _add_result, _multi_status_data, _iter_pages
+from ..tracing import _traced
+from typing import Union, Iterator
 from . import channel, tag
 import inspect
 
@@ -30,7 +31,8 @@ def _create_url(device = None):
     else:
         return '{}/{}'.format(DEVICE_ROOT,_url_parse_object(device))
 
-def add_device(server: server, channel_name: str, DATA: Union[dict, list]) -> Union[bool, list]:
+@_traced
+def add_device(server: server, channel_name: str, DATA: Union[dict, list], *, multi_status: bool = False) -> Union[bool, list]:
     '''Add a `"device"` or multiple `"device"` objects to a channel in Kepware. Can be used to pass children of a device object 
     such as tags and tag groups. This allows you to create a device and tags 
     all in one function, if desired.
@@ -41,7 +43,9 @@ def add_device(server: server, channel_name: str, DATA: Union[dict, list]) -> Un
     :param channel_name: channel to add the device object(s)
     :param DATA: Dict or List of Dicts of the device(s) and it's children
     expected by Kepware Configuration API
-    
+    :param multi_status: *(optional)* If True, returns a `MultiStatusResult` with the status of every object instead of 
+    True or the list of failures. (default= False)
+
     :return: True - If a "HTTP 201 - Created" is received from Kepware server
     :return: If a "HTTP 207 - Multi-Status" is received from Kepware with a list of dict error responses for all 
     devices added that failed.
@@ -50,17 +54,11 @@ def add_device(server: server, channel_name: str, DATA: Union[dict, list]) -> Un
     :raises KepURLError: If urllib provides an URLError
     '''
 
+    DATA = _multi_status_data(DATA, multi_status)
     r = server._config_add(server.url + channel._create_url(channel_name) + _create_url(), DATA)
-    if r.code == 201: return True
-    elif r.code == 207:
-        errors = [] 
-        for item in r.payload:
-            if item['code'] != 201:
-                errors.append(item)
-        return errors
-    else: 
-        raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+    return _add_result(r, DATA, multi_status, lambda items: add_device(server, channel_name, items, multi_status= True))
 
+@_traced
 def del_device(server: server, device_path: str) -> bool:
     '''Delete a `"device"` object in Kepware. This will delete all children as well.
 
@@ -78,11 +76,12 @@ def del_device(server: server, device_path: str) -> bool:
     try:
         r = server._config_del(server.url + channel._create_url(path_obj['channel']) + _create_url(path_obj['device']))
         if r.code == 200: return True 
-        else: raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+        else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
     except KeyError as err:
         err_msg = 'Error: No {} identified in {} | Function: {}'.format(err,'device_path', inspect.currentframe().f_code.co_name)
         raise KepError(err_msg)
 
+@_traced
 def modify_device(server: server, device_path: str, DATA: dict, *, force: bool = False) -> bool:
     '''Modify a device object and it's properties in Kepware.
 
@@ -104,11 +103,12 @@ def modify_device(server: server, device_path: str, DATA: dict, *, force: bool =
     try:
         r = server._config_update(server.url + channel._create_url(path_obj['channel']) + _create_url(path_obj['device']), device_data)
         if r.code == 200: return True 
-        else: raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+        else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
     except KeyError as err:
             err_msg = 'Error: No {} identified in {} | Function: {}'.format(err,'device_path', inspect.currentframe().f_code.co_name)
             raise KepError(err_msg)
 
+@_traced
 def get_device(server: server, device_path: str) -> dict:
     '''Returns the properties of the device object.
 
@@ -133,6 +133,7 @@ def get_device(server: server, device_path: str) -> dict:
     #     print('Error: Error with {}: {}'.format(inspect.currentframe().f_code.co_name, str(err)))
     #     raise err
 
+@_traced
 def get_all_devices(server: server, channel_name: str, *, options: dict = None) -> list:
     '''Returns list of all device objects and their properties within a channel. Returned object is JSON list.
     
@@ -149,6 +150,27 @@ def get_all_devices(server: server, channel_name: str, *, options: dict = None)
     r = server._config_get(f'{server.url}{channel._create_url(channel_name)}{_create_url()}', params= options)
     return r.payload
 
+def iter_all_devices(server: server, channel_name: str, *, options: dict = None, page_size: int = 100, prefetch: bool = True) -> Iterator[dict]:
+    '''Returns a generator of all `"device"` objects and their properties. The devices are read from Kepware 
+    one page at a time and the next page is requested while the current page is processed, so large 
+    collections don't have to be held in memory.
+
+    :param server: instance of the `server` class
+    :param channel_name: name of channel
+    :param options: *(optional)* Dict of parameters to filter or sort the list of devices. Options are `filter`, 
+        `sortOrder` and `sortProperty`. `pageNumber` sets the first page to read
+    :param page_size: *(optional)* Number of devices read per request, or None to read all devices with one 
+        request that is parsed as it is received (default= 100)
+    :param prefetch: *(optional)* Request the next page while the current page is processed (default= True)
+
+    :return: Generator of the data for each device
+
+    :raises KepHTTPError: If urllib provides an HTTPError
+    :raises KepURLError: If urllib provides an URLError
+    '''
+    return _iter_pages(lambda o: get_all_devices(server, channel_name, options= o), options, page_size, prefetch)
+
+@_traced
 def auto_tag_gen(server: server, device_path: str, job_ttl: int = None) -> KepServiceResponse:
     '''Executes Auto Tag Generation function on devices that support the feature in Kepware
     
@@ -173,6 +195,7 @@ def auto_tag_gen(server: server, device_path: str, job_ttl: int = None) -> KepSe
         err_msg = 'Error: No {} identified in {} | Function: {}'.format(err,'device_path', inspect.currentframe().f_code.co_name)
         raise KepError(err_msg)
 
+@_traced
 def get_all_tags_tag_groups(server: server, device_path: str) -> dict:
     '''Returns the properties of all `"tag"` and `"tag group"` objects for as specific
     device in Kepware. Returned object is a dict of tag list and tag group list.
@@ -210,7 +233,8 @@ def get_all_tags_tag_groups(server: server, device_path: str) -> dict:
     r = tag.get_full_tag_structure(server, device_path,recursive=True)
     return r
 
-def get_device_structure(server, device_path) -> dict:
+@_traced
+def get_device_structure(server, device_path, *, serialize: bool = False) -> dict:
     '''Returns the properties of `"device"` and includes all `"tag"` and `"tag group"` objects for as specific
     device in Kepware. Returned object is a dict of device properties including a tag list and tag group list.
 
@@ -239,12 +263,22 @@ def get_device_structure(server, device_path) -> dict:
     :param device_path: path identifying device to modffy. Standard Kepware address decimal notation string including the 
     device such as `"channel1.device1"`
 
+    :param serialize: *(optional)* If True, the complete structure is requested in a single call using serialized 
+    content. Falls back to requesting the device and walking its tag groups if the Kepware instance doesn't 
+    support serialized content for the device. (default= False)
+
     :return: Dict of data for the device structure at `"device_path"` location
 
     :raises KepHTTPError: If urllib provides an HTTPError
     :raises KepURLError: If urllib provides an URLError
     '''
 
-    tags = tag.get_full_tag_structure(server, device_path,recursive=True)
+    if serialize:
+        r = server._config_get_serialized(tag._create_path_url(server, device_path))
+        if tag._has_tag_children(r):
+            tag._normalize_tag_structure(r)
+            return r
+
+    tags = tag.get_full_tag_structure(server, device_path,recursive=True, serialize=False)
     device_properties = get_device(server,device_path)
     return {**device_properties, **tags}
@@ -11,7 +11,8 @@ exchange objects for EGD devices within the Kepware Configuration API
 
 from ...connection import server
 from ...error import KepHTTPError, KepError
-from ...utils import _url_parse_object, path_split
+from ...utils import _url_parse_object, path_split, _add_result, _multi_status_data
+from ...tracing import _traced
 from typing import Union
 from .. import egd as EGD, channel, device
 
@@ -38,7 +39,8 @@ def _create_url(device_path, ex_type, exchange_name = None):
         else:
             return '{}{}/{}'.format(device_root,PRODUCER_ROOT,_url_parse_object(exchange_name))
 
-def add_exchange(server: server, device_path: str, ex_type: str, DATA: Union[dict, list]) -> Union[bool, list]:
+@_traced
+def add_exchange(server: server, device_path: str, ex_type: str, DATA: Union[dict, list], *, multi_status: bool = False) -> Union[bool, list]:
     '''Add a `"exchange"` or multiple `"exchange"` objects to Kepware. Can be used to pass children of a exchange object 
     such as ranges. This allows you to create a exchange and ranges for the exchange all in one function, if desired.
 
@@ -50,6 +52,8 @@ def add_exchange(server: server, device_path: str, ex_type: str, DATA: Union[dic
     :param ex_type: type of exchange, either `CONSUMER` or `PRODUCER`
     :param DATA: Dict or List of Dicts of the exchange(s) and it's children
     expected by Kepware Configuration API
+    :param multi_status: *(optional)* If True, returns a `MultiStatusResult` with the status of every object instead of 
+    True or the list of failures. (default= False)
 
     :return: True - If a "HTTP 201 - Created" is received from Kepware server
     :return: If a "HTTP 207 - Multi-Status" is received from Kepware with a list of dict error responses for all 
@@ -59,17 +63,11 @@ def add_exchange(server: server, device_path: str, ex_type: str, DATA: Union[dic
     :raises KepURLError: If urllib provides an URLError
     '''
 
+    DATA = _multi_status_data(DATA, multi_status)
     r = server._config_add(server.url + _create_url(device_path, ex_type), DATA)
-    if r.code == 201: return True
-    elif r.code == 207:
-        errors = [] 
-        for item in r.payload:
-            if item['code'] != 201:
-                errors.append(item)
-        return errors
-    else: 
-        raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+    return _add_result(r, DATA, multi_status, lambda items: add_exchange(server, device_path, ex_type, items, multi_status= True))
 
+@_traced
 def del_exchange(server: server, device_path: str, ex_type: str, exchange_name: str) -> bool:
     '''Delete an `"exchange"` object in Kepware. This will delete all children as well
     
@@ -87,8 +85,9 @@ def del_exchange(server: server, device_path: str, ex_type: str, exchange_name:
 
     r = server._config_del(server.url + _create_url(device_path, ex_type, exchange_name))
     if r.code == 200: return True 
-    else: raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+    else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
 
+@_traced
 def modify_exchange(server: server, device_path: str, ex_type: str, DATA: dict, *, exchange_name: str = None, force: bool = False) -> bool:
     '''Modify a `"exchange"` object and it's properties in Kepware. If a `"exchange_name"` is not provided as an input,
     you need to identify the exchange in the *'common.ALLTYPES_NAME'* property field in the `"DATA"`. It will 
@@ -113,15 +112,16 @@ def modify_exchange(server: server, device_path: str, ex_type: str, DATA: dict,
         try:
             r = server._config_update(server.url + _create_url(device_path, ex_type, exchange_data['common.ALLTYPES_NAME']), exchange_data)
             if r.code == 200: return True 
-            else: raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+            else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
         except KeyError as err:
             err_msg = f'Error: No exchange identified in DATA | Key Error: {type(DATA)}'
             raise KepError(err_msg) 
     else:
         r = server._config_update(server.url + _create_url(device_path, ex_type, exchange_name), exchange_data)
         if r.code == 200: return True 
-        else: raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+        else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
 
+@_traced
 def get_exchange(server: server, device_path: str, ex_type: str, exchange_name: str = None, *, options: dict = None) -> Union[dict, list]:
     '''Returns the properties of the exchange object or a list of all exchanges and their 
     properties for the type input. Returned object is JSON.
@@ -145,6 +145,7 @@ def get_exchange(server: server, device_path: str, ex_type: str, exchange_name:
         r = server._config_get(f'{server.url}{_create_url(device_path, ex_type, exchange_name)}')
     return r.payload
 
+@_traced
 def get_all_exchanges(server: server, device_path: str, *, options: dict = None) -> list[list, list]:
     '''Returns list of all `"exchange"` objects (both CONSUMER and PRODUCER) and their properties. Returned object is JSON list.
     
@@ -9,7 +9,8 @@ r"""`names` exposes an API to allow modifications (add, delete, modify) to
 name resolution objects for EGD devices within the Kepware Configuration API
 """
 
-from ...utils import _url_parse_object, path_split
+from ...utils import _url_parse_object, path_split, _add_result, _multi_status_data
+from ...tracing import _traced
 from ...connection import server
 from ...error import KepHTTPError, KepError
 from typing import Union
@@ -31,7 +32,8 @@ def _create_url(device_path, name = None):
     else:
         return '{}/{}/{}'.format(device_root, NAMES_ROOT, _url_parse_object(name))
 
-def add_name_resolution(server: server, device_path: str, DATA: Union[dict, list]) -> Union[bool, list]:
+@_traced
+def add_name_resolution(server: server, device_path: str, DATA: Union[dict, list], *, multi_status: bool = False) -> Union[bool, list]:
     '''Add a `"name resolution"` or multiple `"name resolution"` objects to Kepware. This allows you to 
     create a name resolution or multiple name resolutions all in one function, if desired.
 
@@ -40,6 +42,8 @@ def add_name_resolution(server: server, device_path: str, DATA: Union[dict, list
     notation string such as `"channel1.device1"`
     :param DATA: Dict or List of Dicts of name resolutions
     expected by Kepware Configuration API
+    :param multi_status: *(optional)* If True, returns a `MultiStatusResult` with the status of every object instead of 
+    True or the list of failures. (default= False)
 
     :return: True - If a "HTTP 201 - Created" is received from Kepware server
     :return: If a "HTTP 207 - Multi-Status" is received from Kepware with a list of dict error responses for all 
@@ -49,17 +53,11 @@ def add_name_resolution(server: server, device_path: str, DATA: Union[dict, list
     :raises KepURLError: If urllib provides an URLError
     '''
 
+    DATA = _multi_status_data(DATA, multi_status)
     r = server._config_add(server.url + _create_url(device_path), DATA)
-    if r.code == 201: return True
-    elif r.code == 207:
-        errors = [] 
-        for item in r.payload:
-            if item['code'] != 201:
-                errors.append(item)
-        return errors
-    else: 
-        raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+    return _add_result(r, DATA, multi_status, lambda items: add_name_resolution(server, device_path, items, multi_status= True))
 
+@_traced
 def del_name_resolution(server: server, device_path: str, name: str) -> bool:
     '''Delete a `"name resolution"` object in Kepware.
     
@@ -76,8 +74,9 @@ def del_name_resolution(server: server, device_path: str, name: str) -> bool:
 
     r = server._config_del(server.url + _create_url(device_path, name))
     if r.code == 200: return True 
-    else: raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+    else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
 
+@_traced
 def modify_name_resolution(server: server, device_path: str, DATA: dict, *, name: str = None, force: bool = False) -> bool:
     '''Modify a `"name resolution"` object and it's properties in Kepware. If a `"name"` is not provided as an input,
     you need to identify the name resolution in the *'common.ALLTYPES_NAME'* property field in the `"DATA"`. It will 
@@ -101,15 +100,16 @@ def modify_name_resolution(server: server, device_path: str, DATA: dict, *, name
         try:
             r = server._config_update(server.url + _create_url(device_path, name_data['common.ALLTYPES_NAME']), name_data)
             if r.code == 200: return True 
-            else: raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+            else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
         except KeyError as err:
             err_msg = f'Error: No name resolution identified in DATA | Key Error: {type(DATA)}'
             raise KepError(err_msg) 
     else:
         r = server._config_update(server.url + _create_url(device_path, name), name_data)
         if r.code == 200: return True 
-        else: raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+        else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
 
+@_traced
 def get_name_resolution(server: server, device_path: str, name: str = None, *, options: dict = None) -> Union[dict, list]:
     '''Returns the properties of the `"name resolution"` object or a list of all name resolutions.
     
@@ -13,7 +13,8 @@ from typing import Union
 from .. import egd as EGD
 from ...connection import server
 from ...error import KepError, KepHTTPError
-from ...utils import _url_parse_object
+from ...utils import _url_parse_object, _add_result, _multi_status_data
+from ...tracing import _traced
 
 RANGES_ROOT = '/ranges'
 
@@ -30,7 +31,8 @@ def _create_url(device_path, ex_type, exchange_name, range = None):
     else:
         return '{}{}/{}'.format(exchange_root, RANGES_ROOT, _url_parse_object(range))
 
-def add_range(server: server, device_path: str, ex_type: str, exchange_name: str, DATA: Union[dict, list]) -> Union[bool, list]:
+@_traced
+def add_range(server: server, device_path: str, ex_type: str, exchange_name: str, DATA: Union[dict, list], *, multi_status: bool = False) -> Union[bool, list]:
     '''Add a `"range"` or multiple `"range"` objects to Kepware. This allows you to 
     create a range or multiple ranges all in one function, if desired.
 
@@ -43,6 +45,8 @@ def add_range(server: server, device_path: str, ex_type: str, exchange_name: str
     :param ex_type: type of exchange, either `CONSUMER` or `PRODUCER`
     :param exchange_name: name of exchange that range is located
     :param DATA: Dict or List of Dicts of the range(s) to add
+    :param multi_status: *(optional)* If True, returns a `MultiStatusResult` with the status of every object instead of 
+    True or the list of failures. (default= False)
 
     :return: True - If a "HTTP 201 - Created" is received from Kepware server
     :return: If a "HTTP 207 - Multi-Status" is received from Kepware with a list of dict error responses for all 
@@ -52,16 +56,11 @@ def add_range(server: server, device_path: str, ex_type: str, exchange_name: str
     :raises KepURLError: If urllib provides an URLError
     '''
 
+    DATA = _multi_status_data(DATA, multi_status)
     r = server._config_add(server.url + _create_url(device_path, ex_type, exchange_name), DATA)
-    if r.code == 201: return True
-    elif r.code == 207:
-        errors = [] 
-        for item in r.payload:
-            if item['code'] != 201:
-                errors.append(item)
-        return errors
-    else: raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+    return _add_result(r, DATA, multi_status, lambda items: add_range(server, device_path, ex_type, exchange_name, items, multi_status= True))
 
+@_traced
 def del_range(server: server, device_path: str, ex_type: str, exchange_name: str, range_name: str) -> bool:
     '''Delete a `"range"` object in Kepware.
     
@@ -80,8 +79,9 @@ def del_range(server: server, device_path: str, ex_type: str, exchange_name: str
 
     r = server._config_del(server.url + _create_url(device_path, ex_type, exchange_name, range_name))
     if r.code == 200: return True 
-    else: raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+    else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
 
+@_traced
 def modify_range(server: server, device_path: str, ex_type: str, exchange_name: str, DATA: dict, *, range_name: str = None, force: bool = False) -> bool:
     '''Modify a `"range"` object and it's properties in Kepware. If a `"range_name"` is not provided as an input,
     you need to identify the range in the *'common.ALLTYPES_NAME'* property field in the `"DATA"`. It will 
@@ -107,15 +107,16 @@ def modify_range(server: server, device_path: str, ex_type: str, exchange_name:
         try:
             r = server._config_update(server.url + _create_url(device_path, ex_type, exchange_name, range_data['common.ALLTYPES_NAME']), range_data)
             if r.code == 200: return True 
-            else: raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+            else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
         except KeyError as err:
             err_msg = 'Error: No range identified in DATA | Key Error: {}'.format(err)
             raise KepError(err_msg)
     else:
         r = server._config_update(server.url + _create_url(device_path, ex_type, exchange_name, range_name), range_data)
         if r.code == 200: return True 
-        else: raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+        else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
 
+@_traced
 def get_range(server: server, device_path: str, ex_type: str, exchange_name: str, range_name: str = None, *, options: dict = None) -> Union[dict, list]:
     '''Returns the properties of the `"range"` object or a list of all ranges.
     
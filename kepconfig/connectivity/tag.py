@@ -10,11 +10,18 @@ tag and tag group objects within the Kepware Configuration API
 """
 
 from ..connection import server
-from ..error import KepError, KepHTTPError
-from ..utils import _url_parse_object, path_split
-from typing import Union
+from ..error import KepError, KepHTTPError, KepURLError
+from ..utils import _url_parse_object, path_split, _add_result, _multi_status_data, _iter_pages
+from ..structures import MultiStatusResult
+from ..tracing import _traced
+from typing import Union, Iterator
 from . import channel, device
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+import contextvars
+import threading
+from collections import deque
 import inspect
+import json
 
 TAGS_ROOT = '/tags'
 TAG_GRP_ROOT = '/tag_groups'
@@ -41,14 +48,19 @@ def _create_tag_groups_url(tag_group = None):
     else: 
         return '{}/{}'.format(TAG_GRP_ROOT,_url_parse_object(tag_group))
 
-def add_tag(server: server, tag_path: str, DATA: Union[dict, list]) -> Union[bool, list]:
+@_traced
+def add_tag(server: server, tag_path: str, DATA: Union[dict, list], *, multi_status: bool = False) -> Union[bool, list]:
     '''Add `"tag"` or multiple `"tag"` objects to a specific path in Kepware. 
     Can be used to pass a list of tags to be added at one path location.
 
     :param server: instance of the `server` class
     :param device_path: path identifying where to add tag(s). Standard Kepware address decimal 
     notation string that tags exists such as "channel1.device1.tag_group1" or "channel1.device1"
-    :param DATA: Dict or List of Dicts of the tag(s) to add
+    :param DATA: Dict or List of Dicts of the tag(s) to add. Any other iterable of Dicts, such as a generator, is 
+    encoded as it is consumed and sent with chunked transfer encoding. These requests are not retried and can't be 
+    used with `multi_status`.
+    :param multi_status: *(optional)* If True, returns a `MultiStatusResult` with the status of every object instead of 
+    True or the list of failures. (default= False)
 
     :return: True - If a "HTTP 201 - Created" is received from Kepware server
     :return: If a "HTTP 207 - Multi-Status" is received from Kepware with a list of dict error responses for all 
@@ -71,17 +83,12 @@ def add_tag(server: server, tag_path: str, DATA: Union[dict, list]) -> Union[boo
     except Exception as e:
         err_msg = 'Error: Error with {}: {}'.format(inspect.currentframe().f_code.co_name, str(e))
         raise KepError(err_msg)
+    DATA = _multi_status_data(DATA, multi_status)
     r = server._config_add(url, DATA)
-    if r.code == 201: return True 
-    elif r.code == 207:
-        errors = [] 
-        for item in r.payload:
-            if item['code'] != 201:
-                errors.append(item)
-        return errors
-    else: raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
-
-def add_tag_group(server: server, tag_group_path: str, DATA: Union[dict, list]) -> Union[bool, list]:
+    return _add_result(r, DATA, multi_status, lambda items: add_tag(server, tag_path, items, multi_status= True))
+
+@_traced
+def add_tag_group(server: server, tag_group_path: str, DATA: Union[dict, list], *, multi_status: bool = False) -> Union[bool, list]:
     '''Add `"tag_group"` or multiple `"tag_group"` objects to a specific path in Kepware. 
     Can be used to pass a list of tag_groups and children (tags or tag groups) to be added at one 
     path location.
@@ -90,6 +97,8 @@ def add_tag_group(server: server, tag_group_path: str, DATA: Union[dict, list])
     :param tag_group_path: path identifying where to add tag group(s). Standard Kepware address decimal 
     notation string that tag groups exists such as "channel1.device1.tag_group1" or "channel1.device1"
     :param DATA: Dict or List of Dicts of the tag group(s) to add and it's children (tags or tag groups)
+    :param multi_status: *(optional)* If True, returns a `MultiStatusResult` with the status of every object instead of 
+    True or the list of failures. (default= False)
 
     :return: True - If a "HTTP 201 - Created" is received from Kepware server
     :return: If a "HTTP 207 - Multi-Status" is received from Kepware with a list of dict error responses for all 
@@ -112,16 +121,11 @@ def add_tag_group(server: server, tag_group_path: str, DATA: Union[dict, list])
     except Exception as e:
         err_msg = 'Error: Error with {}: {}'.format(inspect.currentframe().f_code.co_name, str(e))
         raise KepError(err_msg)
+    DATA = _multi_status_data(DATA, multi_status)
     r = server._config_add(url, DATA)
-    if r.code == 201: return True 
-    elif r.code == 207:
-        errors = [] 
-        for item in r.payload:
-            if item['code'] != 201:
-                errors.append(item)
-        return errors
-    else: raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+    return _add_result(r, DATA, multi_status, lambda items: add_tag_group(server, tag_group_path, items, multi_status= True))
 
+@_traced
 def add_all_tags(server: server, ch_dev_path: str, DATA: dict) -> Union[bool, list]:
     '''Add `"tag"` and `"tag group"` objects to a device in Kepware. To be used to 
     pass a list of tags, tag groups and/or children of tag groups (tags and tag 
@@ -184,6 +188,72 @@ def add_all_tags(server: server, ch_dev_path: str, DATA: dict) -> Union[bool, li
         # mixed results from both tags and tag groups
         return [tags_result, tag_groups_result]
 
+@_traced
+def bulk_add_tags(server: server, DATA: dict, *, max_items: int = 500, max_bytes: int = 1048576, max_workers: int = 4) -> MultiStatusResult:
+    '''Add large numbers of `"tag"` and `"tag group"` objects to one or many devices in Kepware. The lists of 
+    tags and tag groups are split into chunks of at most `max_items` objects and `max_bytes` bytes of JSON, 
+    which are added one after another for each device. Devices are processed in parallel with at most 
+    `max_workers` requests in flight.
+
+    A tag group that by itself is larger than a chunk is added without its children first and its tags 
+    and tag groups are then added in chunks below it. Children of a tag group that fails to be added are not added.
+
+    Example DATA:
+
+        {
+            'channel1.device1': {
+                'tags': [tag1_dict, tag2_dict,...],
+                'tag_groups':[tag_group1_dict, tag_group2_dict,...]
+            },
+            'channel1.device2.tag_group1': [tag1_dict, tag2_dict,...]
+        }
+
+    :param server: instance of the `server` class
+    :param DATA: Dict keyed by the path to add objects at, such as "channel1.device1" or "channel1.device1.tag_group1". 
+    Values are either a dict with `"tags"` and/or `"tag_groups"` lists, in the same format as `add_all_tags`, or a list of tags.
+    :param max_items: *(optional)* Maximum number of objects added with one request (default= 500)
+    :param max_bytes: *(optional)* Maximum size of the JSON body of one request (default= 1048576)
+    :param max_workers: *(optional)* Maximum number of devices that objects are added to at the same time. Consider 
+    setting `server.pool_size` to at least this value so connections are reused. (default= 4)
+
+    :return: `MultiStatusResult` of the objects, keyed by the full path of each object such as 
+    "channel1.device1.tag_group1.tag1". A chunk that fails as a whole, including with a connection error, is 
+    recorded as a failure of each of its objects. `retry_failed` re-submits the failed objects with `bulk_add_tags`.
+
+    :raises KepHTTPError: If urllib provides an HTTPError
+    :raises KepURLError: If urllib provides an URLError
+    '''
+    work = _bulk_work_by_device(DATA)
+    sources = {}
+    result = MultiStatusResult(resubmit= lambda items: bulk_add_tags(server, _bulk_resubmit_data(items, sources), 
+                                max_items= max_items, max_bytes= max_bytes, max_workers= max_workers))
+    lock = threading.Lock()
+
+    def add_to_device(queue):
+        while queue:
+            path, kind, items = queue.popleft()
+            url = _create_path_url(server, path) + (_create_tags_url() if kind == 'tags' else _create_tag_groups_url())
+            for chunk, deferred in _bulk_chunks(items, kind, max_items, max_bytes):
+                try:
+                    r = server._config_add(url, chunk)
+                except (KepHTTPError, KepURLError) as err:
+                    r = err
+                with lock:
+                    queue.extend(_bulk_record_result(path, kind, chunk, deferred, r, result, sources))
+
+    with ThreadPoolExecutor(max_workers= max_workers) as executor:
+        # Workers run in a copy of the caller's context so their requests are traced as children of this call
+        futures = [executor.submit(contextvars.copy_context().run, add_to_device, queue) for queue in work.values()]
+        try:
+            for future in futures:
+                future.result()
+        except Exception:
+            for future in futures:
+                future.cancel()
+            raise
+    return result
+
+@_traced
 def modify_tag(server: server, full_tag_path: str, DATA: dict, force: bool = False) -> bool:
     '''Modify a `"tag"` object and it's properties in Kepware.
 
@@ -215,8 +285,9 @@ def modify_tag(server: server, full_tag_path: str, DATA: dict, force: bool = Fal
         raise KepError(err_msg)
     r = server._config_update(url, tag_data)
     if r.code == 200: return True 
-    else: raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+    else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
 
+@_traced
 def modify_tag_group(server: server, tag_group_path: str, DATA: dict, force: bool = False) -> bool:
     '''Modify a `"tag group"` object and it's properties in Kepware.
 
@@ -247,8 +318,9 @@ def modify_tag_group(server: server, tag_group_path: str, DATA: dict, force: boo
         raise KepError(err_msg)
     r = server._config_update(url, tag_group_data)
     if r.code == 200: return True 
-    else: raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+    else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
 
+@_traced
 def del_tag(server: server, full_tag_path: str) -> bool:
     '''Delete `"tag"` object at a specific path in Kepware.
 
@@ -276,8 +348,9 @@ def del_tag(server: server, full_tag_path: str) -> bool:
         raise KepError(err_msg)
     r = server._config_del(url)
     if r.code == 200: return True 
-    else: raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+    else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
 
+@_traced
 def del_tag_group(server: server, tag_group_path: str) -> bool:
     '''Delete `"tag group"` object at a specific path in Kepware.
 
@@ -304,8 +377,9 @@ def del_tag_group(server: server, tag_group_path: str) -> bool:
         raise KepError(err_msg)
     r = server._config_del(url)
     if r.code == 200: return True 
-    else: raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+    else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
 
+@_traced
 def get_tag(server: server, full_tag_path: str) -> dict:
     '''Returns the properties of the `"tag"` object at a specific path in Kepware. 
 
@@ -334,6 +408,7 @@ def get_tag(server: server, full_tag_path: str) -> dict:
     r = server._config_get(url)
     return r.payload
 
+@_traced
 def get_all_tags(server: server, full_tag_path: str, *, options: dict = None) -> list:
     '''Returns the properties of all `"tag"` object at a specific path in Kepware. 
 
@@ -365,6 +440,28 @@ def get_all_tags(server: server, full_tag_path: str, *, options: dict = None) ->
     r = server._config_get(url, params= options)
     return r.payload
 
+def iter_all_tags(server: server, full_tag_path: str, *, options: dict = None, page_size: int = 100, prefetch: bool = True) -> Iterator[dict]:
+    '''Returns a generator of all `"tag"` objects and their properties. The tags are read from Kepware 
+    one page at a time and the next page is requested while the current page is processed, so large 
+    collections don't have to be held in memory.
+
+    :param server: instance of the `server` class
+    :param full_tag_path: path identifying location to retreive tag list. Standard Kepware address decimal 
+    notation string including the tag such as "channel1.device1.tag_group1.tag1"
+    :param options: *(optional)* Dict of parameters to filter or sort the list of tags. Options are `filter`, 
+        `sortOrder` and `sortProperty`. `pageNumber` sets the first page to read
+    :param page_size: *(optional)* Number of tags read per request, or None to read all tags with one 
+        request that is parsed as it is received (default= 100)
+    :param prefetch: *(optional)* Request the next page while the current page is processed (default= True)
+
+    :return: Generator of the data for each tag
+
+    :raises KepHTTPError: If urllib provides an HTTPError
+    :raises KepURLError: If urllib provides an URLError
+    '''
+    return _iter_pages(lambda o: get_all_tags(server, full_tag_path, options= o), options, page_size, prefetch)
+
+@_traced
 def get_tag_group(server: server, tag_group_path: str) -> dict:
     '''Returns the properties of the "tag group" object at a specific 
     path in Kepware. Returned object is JSON.
@@ -392,6 +489,7 @@ def get_tag_group(server: server, tag_group_path: str) -> dict:
     r = server._config_get(url)
     return r.payload
 
+@_traced
 def get_all_tag_groups(server:server, tag_group_path: str, *, options: dict = None) -> list:
     '''Returns the properties of all `"tag group"` objects at a specific 
     path in Kepware.
@@ -423,7 +521,29 @@ def get_all_tag_groups(server:server, tag_group_path: str, *, options: dict = No
     r = server._config_get(url, params= options)
     return r.payload
 
-def get_full_tag_structure(server: server, path: str, *, recursive: bool = False, options: dict = None) -> dict:
+def iter_all_tag_groups(server:server, tag_group_path: str, *, options: dict = None, page_size: int = 100, prefetch: bool = True) -> Iterator[dict]:
+    '''Returns a generator of all `"tag group"` objects and their properties. The tag groups are read from Kepware 
+    one page at a time and the next page is requested while the current page is processed, so large 
+    collections don't have to be held in memory.
+
+    :param server: instance of the `server` class
+    :param tag_group_path: path identifying location to retrieve tag group list and properties. Standard Kepware address decimal 
+    notation string that tag groups exists such as "channel1.device1.tag_group1"
+    :param options: *(optional)* Dict of parameters to filter or sort the list of tag groups. Options are `filter`, 
+        `sortOrder` and `sortProperty`. `pageNumber` sets the first page to read
+    :param page_size: *(optional)* Number of tag groups read per request, or None to read all tag groups with one 
+        request that is parsed as it is received (default= 100)
+    :param prefetch: *(optional)* Request the next page while the current page is processed (default= True)
+
+    :return: Generator of the data for each tag group
+
+    :raises KepHTTPError: If urllib provides an HTTPError
+    :raises KepURLError: If urllib provides an URLError
+    '''
+    return _iter_pages(lambda o: get_all_tag_groups(server, tag_group_path, options= o), options, page_size, prefetch)
+
+@_traced
+def get_full_tag_structure(server: server, path: str, *, recursive: bool = False, options: dict = None, max_workers: int = None, serialize: bool = False) -> dict:
     '''Returns the properties of all `"tag"` and `"tag group"` objects at a specific 
     path in Kepware. Returned object is a dict of tag list and tag group list.
 
@@ -463,6 +583,13 @@ def get_full_tag_structure(server: server, path: str, *, recursive: bool = False
     children. (default= False)
     :param options: *(optional)* Dict of parameters to filter, sort or pagenate the list of tags and tag groups. 
     Options are 'filter', 'sortOrder', and 'sortProperty' only.
+    :param max_workers: *(optional)* If `recursive` is True and this is greater than 1, the tag group tree is walked 
+    breadth-first and the tags and tag groups of sibling groups are requested in parallel with at most `max_workers` 
+    requests in flight. The result is the same as the serial walk. Consider setting `server.pool_size` to at least 
+    this value so connections are reused. (default= None, serial walk)
+    :param serialize: *(optional)* If `recursive` is True and no `options` are provided, the complete structure is 
+    requested in a single call using serialized content. Falls back to walking the tag groups if the Kepware 
+    instance doesn't support serialized content for the object. (default= False)
 
     :return: Dict of data for the tag structure requested at "path" location
 
@@ -475,11 +602,161 @@ def get_full_tag_structure(server: server, path: str, *, recursive: bool = False
     if options is not None:
         remove_list = ['pageNumber','pageSize']
         [options.pop(x) for x in remove_list]
+
+    if recursive and serialize and not options:
+        res = server._config_get_serialized(_create_path_url(server, path))
+        if _has_tag_children(res):
+            _normalize_tag_structure(res)
+            return {'tags': res['tags'], 'tag_groups': res['tag_groups']}
+
+    if recursive and max_workers is not None and max_workers > 1:
+        return _get_full_tag_structure_concurrent(server, path, options, max_workers)
     
     r['tags'] = get_all_tags(server, path, options= options)
     r['tag_groups'] = get_all_tag_groups(server, path, options= options)
     if recursive:
         for group in r['tag_groups']:
-            res = get_full_tag_structure(server, path + '.' + group['common.ALLTYPES_NAME'], recursive= recursive, options= options)
+            res = get_full_tag_structure(server, path + '.' + group['common.ALLTYPES_NAME'], recursive= recursive, options= options, serialize= False)
             group.update(res)
     return r
+
+def _get_full_tag_structure_concurrent(server: server, path: str, options: dict, max_workers: int) -> dict:
+    '''Breadth-first version of the recursive `get_full_tag_structure` walk. Each tag group needs two 
+    requests (tags and tag groups); these are run on a thread pool of *max_workers* threads and the 
+    children of a tag group are queued as soon as its tag group list is returned.
+    '''
+    r = {}
+    pending = {}
+    with ThreadPoolExecutor(max_workers= max_workers) as executor:
+        def queue(node, node_path):
+            # Placeholders keep the key order the same as the serial walk
+            node['tags'] = None
+            node['tag_groups'] = None
+            # Workers run in a copy of the caller's context so their requests are traced as children of this call
+            pending[executor.submit(contextvars.copy_context().run, get_all_tags, server, node_path, options= options)] = (node, node_path, 'tags')
+            pending[executor.submit(contextvars.copy_context().run, get_all_tag_groups, server, node_path, options= options)] = (node, node_path, 'tag_groups')
+
+        queue(r, path)
+        try:
+            while pending:
+                done, _ = wait(pending, return_when= FIRST_COMPLETED)
+                for future in done:
+                    node, node_path, key = pending.pop(future)
+                    node[key] = future.result()
+                    if key == 'tag_groups':
+                        for group in node[key]:
+                            queue(group, node_path + '.' + group['common.ALLTYPES_NAME'])
+        except Exception:
+            for future in pending:
+                future.cancel()
+            raise
+    return r
+
+def _create_path_url(server: server, path: str) -> str:
+    '''Creates the full url of the device or tag group identified by *path*.'''
+    path_obj = path_split(path)
+    try:
+        url = f"{server.url}{channel._create_url(path_obj['channel'])}{device._create_url(path_obj['device'])}"
+        if 'tag_path' in path_obj:
+            for tg in path_obj['tag_path']:
+                url += _create_tag_groups_url(tag_group=tg)
+    except KeyError as err:
+        err_msg = 'Error: No key {} identified | Function: {}'.format(err, inspect.currentframe().f_code.co_name)
+        raise KepError(err_msg)
+    except Exception as e:
+        err_msg = 'Error: Error with {}: {}'.format(inspect.currentframe().f_code.co_name, str(e))
+        raise KepError(err_msg)
+    return url
+
+def _has_tag_children(obj) -> bool:
+    '''Serialized content omits empty collections. A device or tag group without any tags or tag 
+    groups can't be told apart from a server that ignored the request for serialized content, so 
+    only a response with children is trusted.'''
+    return obj is not None and ('tags' in obj or 'tag_groups' in obj)
+
+def _normalize_tag_structure(obj: dict):
+    '''Adds the empty `tags` and `tag_groups` lists that serialized content leaves out so the 
+    structure matches the one built by walking the tag groups.'''
+    obj.setdefault('tags', [])
+    obj.setdefault('tag_groups', [])
+    for group in obj['tag_groups']:
+        _normalize_tag_structure(group)
+
+def _bulk_work_by_device(DATA: dict) -> dict:
+    '''Groups the objects to add by device. Returns a dict keyed by "channel.device" with a queue of 
+    (path, "tags" or "tag_groups", list of objects) entries.'''
+    work = {}
+    for path, objects in DATA.items():
+        path_obj = path_split(path)
+        if 'device' not in path_obj:
+            err_msg = 'Error: No key {} identified | Function: {}'.format("'device'", 'bulk_add_tags')
+            raise KepError(err_msg)
+        queue = work.setdefault(f"{path_obj['channel']}.{path_obj['device']}", deque())
+        if isinstance(objects, list):
+            objects = {'tags': objects}
+        for kind in ('tags', 'tag_groups'):
+            if objects.get(kind):
+                queue.append((path, kind, objects[kind]))
+    return work
+
+def _bulk_chunks(items: list, kind: str, max_items: int, max_bytes: int):
+    '''Splits *items* into chunks of at most *max_items* objects and about *max_bytes* bytes of JSON. Yields 
+    tuples of (chunk, deferred) where deferred maps the position of a tag group in the chunk to a tuple of the 
+    submitted tag group and the children that were removed from it because the tag group was too large to add 
+    in one request.'''
+    chunk = []
+    deferred = {}
+    size = 2
+    for item in items:
+        item_size = len(json.dumps(item)) + 1
+        original = item
+        children = None
+        if kind == 'tag_groups' and (item_size > max_bytes or len(item.get('tags', [])) + len(item.get('tag_groups', [])) > max_items):
+            children = {key: item[key] for key in ('tags', 'tag_groups') if item.get(key)}
+            item = {key: value for key, value in item.items() if key not in ('tags', 'tag_groups')}
+            item_size = len(json.dumps(item)) + 1
+        if chunk and (len(chunk) >= max_items or size + item_size > max_bytes):
+            yield chunk, deferred
+            chunk = []
+            deferred = {}
+            size = 2
+        if children:
+            deferred[len(chunk)] = (original, children)
+        chunk.append(item)
+        size += item_size
+    if chunk:
+        yield chunk, deferred
+
+def _bulk_record_result(path: str, kind: str, chunk: list, deferred: dict, r, result: MultiStatusResult, sources: dict) -> list:
+    '''Records the outcome of the objects of *chunk* in *result*, keyed by the full path of the object, and 
+    the path and kind of each submitted object in *sources*. *r* is the response of the request or the 
+    KepHTTPError or KepURLError it raised. Returns the work entries for the children of tag groups that 
+    were added without them.'''
+    if isinstance(r, KepHTTPError):
+        results = [{'code': r.code, 'message': r.payload}] * len(chunk)
+    elif isinstance(r, KepURLError):
+        results = [{'code': None, 'message': str(r)}] * len(chunk)
+    elif r.code == 201 or not isinstance(r.payload, list):
+        results = [{'code': 201}] * len(chunk)
+    else:
+        results = r.payload
+    work = []
+    for x, item in enumerate(chunk):
+        response = results[x] if x < len(results) else {'code': 201}
+        name = item.get('common.ALLTYPES_NAME', str(x))
+        # The tag group is recorded as submitted so it is re-submitted with its children
+        original = deferred[x][0] if x in deferred else item
+        sources[id(original)] = (path, kind)
+        result._add([original], [response], keys= [f'{path}.{name}'])
+        if response.get('code') == 201 and x in deferred:
+            for child_kind, objects in deferred[x][1].items():
+                work.append((f'{path}.{name}', child_kind, objects))
+    return work
+
+def _bulk_resubmit_data(items: list, sources: dict) -> dict:
+    '''Returns the DATA for `bulk_add_tags` that adds *items* again at the path they were submitted to.'''
+    DATA = {}
+    for item in items:
+        path, kind = sources[id(item)]
+        DATA.setdefault(path, {}).setdefault(kind, []).append(item)
+    return DATA
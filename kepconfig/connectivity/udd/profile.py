@@ -10,17 +10,22 @@ profile objects for the UDD Profile Library plug-in within the Kepware Configura
 """
 
 from ...connection import server
+from ...utils import _add_result, _multi_status_data, _iter_pages
+from ...tracing import _traced
 from ...error import KepHTTPError, KepError
-from typing import Union
+from typing import Union, Iterator
 
 PROFILE_ROOT = '/project/_profile_library/profiles'
 
-def add_profile(server: server, DATA: Union[dict, list]) -> Union[bool, list]:
+@_traced
+def add_profile(server: server, DATA: Union[dict, list], *, multi_status: bool = False) -> Union[bool, list]:
     '''Add a `"profile"` or a list of `"profile"` objects to the UDD Profile Library plug-in for Kepware. 
 
     :param server: instance of the `server` class
     :param DATA: Dict or List of Dicts of the profiles to add to the Profile Library 
     through Kepware Configuration API
+    :param multi_status: *(optional)* If True, returns a `MultiStatusResult` with the status of every object instead of 
+    True or the list of failures. (default= False)
 
     :return: True - If a "HTTP 201 - Created" is received from Kepware server
     :return: If a "HTTP 207 - Multi-Status" is received from Kepware with a list of dict error responses for all 
@@ -30,17 +35,11 @@ def add_profile(server: server, DATA: Union[dict, list]) -> Union[bool, list]:
     :raises KepURLError: If urllib provides an URLError
     '''
 
+    DATA = _multi_status_data(DATA, multi_status)
     r = server._config_add(f'{server.url}{PROFILE_ROOT}', DATA)
-    if r.code == 201: return True
-    elif r.code == 207:
-        errors = [] 
-        for item in r.payload:
-            if item['code'] != 201:
-                errors.append(item)
-        return errors
-    else: 
-        raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+    return _add_result(r, DATA, multi_status, lambda items: add_profile(server, items, multi_status= True))
 
+@_traced
 def del_profile(server: server, profile_name: str) -> bool:
     '''Delete a `"profile"` object in UDD Profile Library plug-in for Kepware.
     
@@ -55,8 +54,9 @@ def del_profile(server: server, profile_name: str) -> bool:
 
     r = server._config_del(f'{server.url}{PROFILE_ROOT}/{profile_name}')
     if r.code == 200: return True 
-    else: raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+    else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
 
+@_traced
 def modify_profile(server: server, DATA: dict, profile_name: str = None, force: bool = False) -> bool:
     '''Modify a `"profile"` object and it's properties in Kepware. If a `"profile_name"` is not provided as an input,
     you need to identify the profile in the *'common.ALLTYPES_NAME'* property field in the `"DATA"`. It will 
@@ -78,15 +78,16 @@ def modify_profile(server: server, DATA: dict, profile_name: str = None, force:
         try:
             r = server._config_update(f"{server.url}{PROFILE_ROOT}/{profile_data['common.ALLTYPES_NAME']}", profile_data)
             if r.code == 200: return True 
-            else: raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+            else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
         except KeyError as err:
             err_msg = 'Error: No profile identified in DATA | Key Error: {}'.format(err)
             raise KepError(err_msg)
     else:
         r = server._config_update(f'{server.url}{PROFILE_ROOT}/{profile_name}', profile_data)
         if r.code == 200: return True 
-        else: raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+        else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
 
+@_traced
 def get_profile(server: server, profile_name: str = None, *, options: dict = None) -> Union[dict, list]:
     '''Returns the properties of the profile object or a list of all profiles and their 
     properties. Will return a list if `"profile_name"` is not provided.
@@ -110,6 +111,7 @@ def get_profile(server: server, profile_name: str = None, *, options: dict = Non
         r = server._config_get(f'{server.url}{PROFILE_ROOT}/{profile_name}')
     return r.payload
 
+@_traced
 def get_all_profiles(server: server, *, options: dict = None):
     '''Returns list of all profile objects and their properties. Returned object is JSON list.
     
@@ -122,4 +124,23 @@ def get_all_profiles(server: server, *, options: dict = None):
     :raises KepHTTPError: If urllib provides an HTTPError
     :raises KepURLError: If urllib provides an URLError
     '''
-    return get_profile(server, options= options)
\ No newline at end of file
+    return get_profile(server, options= options)
+
+def iter_all_profiles(server: server, *, options: dict = None, page_size: int = 100, prefetch: bool = True) -> Iterator[dict]:
+    '''Returns a generator of all `"profile"` objects and their properties. The profiles are read from Kepware 
+    one page at a time and the next page is requested while the current page is processed, so large 
+    collections don't have to be held in memory.
+
+    :param server: instance of the `server` class
+    :param options: *(optional)* Dict of parameters to filter or sort the list of profiles. Options are `filter`, 
+        `sortOrder` and `sortProperty`. `pageNumber` sets the first page to read
+    :param page_size: *(optional)* Number of profiles read per request, or None to read all profiles with one 
+        request that is parsed as it is received (default= 100)
+    :param prefetch: *(optional)* Request the next page while the current page is processed (default= True)
+
+    :return: Generator of the data for each profile
+
+    :raises KepHTTPError: If urllib provides an HTTPError
+    :raises KepURLError: If urllib provides an URLError
+    '''
+    return _iter_pages(lambda o: get_all_profiles(server, options= o), options, page_size, prefetch)
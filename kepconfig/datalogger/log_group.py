@@ -7,10 +7,11 @@
 r"""`log_group` exposes an API to allow modifications (add, delete, modify) to 
 log group objects in DataLogger within the Kepware Configuration API
 """
-from typing import Union
+from typing import Union, Iterator
 from ..connection import KepServiceResponse, server
 from ..error import KepError, KepHTTPError
-from ..utils import _url_parse_object
+from ..utils import _url_parse_object, _add_result, _multi_status_data, _iter_pages
+from ..tracing import _traced
 
 ENABLE_PROPERTY = 'datalogger.LOG_GROUP_ENABLED'
 LOG_GROUP_ROOT = '/project/_datalogger/log_groups'
@@ -28,12 +29,15 @@ def _create_url(log_group = None):
         return '{}/{}'.format(LOG_GROUP_ROOT, _url_parse_object(log_group))
 
 
-def add_log_group(server: server, DATA: Union[dict, list]) -> Union[bool, list]:
+@_traced
+def add_log_group(server: server, DATA: Union[dict, list], *, multi_status: bool = False) -> Union[bool, list]:
     '''Add a `"log group"` or multiple `"log groups"` objects to Kepware's DataLogger. It can be used 
     to pass a list of log groups to be added all at once.
 
     :param server: instance of the `server` class
     :param DATA: Dict or a list of the log groups to add through Kepware Configuration API
+    :param multi_status: *(optional)* If True, returns a `MultiStatusResult` with the status of every object instead of 
+    True or the list of failures. (default= False)
 
     :return: True - If a "HTTP 201 - Created" is received from Kepware server
     :return: If a "HTTP 207 - Multi-Status" is received from Kepware with a list of dict error responses for all 
@@ -43,16 +47,11 @@ def add_log_group(server: server, DATA: Union[dict, list]) -> Union[bool, list]:
     :raises KepURLError: If urllib provides an URLError
     '''
 
+    DATA = _multi_status_data(DATA, multi_status)
     r = server._config_add(server.url + _create_url(), DATA)
-    if r.code == 201: return True 
-    elif r.code == 207:
-        errors = [] 
-        for item in r.payload:
-            if item['code'] != 201:
-                errors.append(item)
-        return errors
-    else: raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+    return _add_result(r, DATA, multi_status, lambda items: add_log_group(server, items, multi_status= True))
 
+@_traced
 def del_log_group(server: server, log_group: str) -> bool:
     '''Delete a `"log group"` object in Kepware's Datalogger.
     
@@ -66,8 +65,9 @@ def del_log_group(server: server, log_group: str) -> bool:
     '''
     r = server._config_del(server.url + _create_url(log_group))
     if r.code == 200: return True 
-    else: raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+    else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
 
+@_traced
 def modify_log_group(server: server, DATA: dict, *, log_group: str = None, force: bool = False) -> bool:
     '''Modify a `"log group"` object and it's properties in Kepware's Datalogger. If a `"log group"` is not provided as an input,
     you need to identify the log group in the *'common.ALLTYPES_NAME'* property field in the `"DATA"`. It will 
@@ -90,15 +90,16 @@ def modify_log_group(server: server, DATA: dict, *, log_group: str = None, force
         try:
             r = server._config_update(server.url + _create_url(log_group_data['common.ALLTYPES_NAME']), log_group_data)
             if r.code == 200: return True 
-            else: raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+            else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
         except KeyError as err:
             err_msg = 'Error: No log group identified in DATA | Key Error: {}'.format(err)
             raise KepError(err_msg)
     else:
         r = server._config_update(server.url + _create_url(log_group), log_group_data)
         if r.code == 200: return True 
-        else: raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+        else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
 
+@_traced
 def get_log_group(server: server, log_group: str) -> dict:
     '''Returns the properties of the `"log group"` object.
     
@@ -113,6 +114,7 @@ def get_log_group(server: server, log_group: str) -> dict:
     r = server._config_get(server.url + _create_url(log_group))
     return r.payload
 
+@_traced
 def get_all_log_groups(server: server, *, options: dict = None) -> list:
     '''Returns the properties of all log group objects for Kepware's Datalogger. Returned object is JSON list.
     
@@ -128,6 +130,26 @@ def get_all_log_groups(server: server, *, options: dict = None) -> list:
     r = server._config_get(f'{server.url}{_create_url()}', params= options)
     return r.payload
 
+def iter_all_log_groups(server: server, *, options: dict = None, page_size: int = 100, prefetch: bool = True) -> Iterator[dict]:
+    '''Returns a generator of all `"log group"` objects and their properties. The log groups are read from Kepware 
+    one page at a time and the next page is requested while the current page is processed, so large 
+    collections don't have to be held in memory.
+
+    :param server: instance of the `server` class
+    :param options: *(optional)* Dict of parameters to filter or sort the list of log groups. Options are `filter`, 
+        `sortOrder` and `sortProperty`. `pageNumber` sets the first page to read
+    :param page_size: *(optional)* Number of log groups read per request, or None to read all log groups with one 
+        request that is parsed as it is received (default= 100)
+    :param prefetch: *(optional)* Request the next page while the current page is processed (default= True)
+
+    :return: Generator of the data for each log group
+
+    :raises KepHTTPError: If urllib provides an HTTPError
+    :raises KepURLError: If urllib provides an URLError
+    '''
+    return _iter_pages(lambda o: get_all_log_groups(server, options= o), options, page_size, prefetch)
+
+@_traced
 def enable_log_group(server: server, log_group: str) -> bool:
     '''Enable the `"log group"`.
     
@@ -142,6 +164,7 @@ def enable_log_group(server: server, log_group: str) -> bool:
     DATA = {ENABLE_PROPERTY: True}
     return modify_log_group(server, DATA, log_group= log_group)
 
+@_traced
 def disable_log_group(server: server, log_group: str) -> bool:
     '''Disable the log group. Returned object is JSON.
     
@@ -156,6 +179,7 @@ def disable_log_group(server: server, log_group: str) -> bool:
     DATA = {ENABLE_PROPERTY: False}
     return modify_log_group(server, DATA, log_group= log_group)
 
+@_traced
 def reset_column_mapping_service(server: server, log_group: str, job_ttl: int = None) -> KepServiceResponse:
     '''Executes a ResetColumnMapping serivce call to the log group
 
@@ -171,4 +195,4 @@ def reset_column_mapping_service(server: server, log_group: str, job_ttl: int =
 
     url = server.url + _create_url(log_group) + SERVICES_ROOT + '/ResetColumnMapping'
     job = server._kep_service_execute(url, None, job_ttl)
-    return job
\ No newline at end of file
+    return job
@@ -7,11 +7,12 @@
 r"""`log_items` exposes an API to allow modifications (add, delete, modify) to 
 log item (tag) objects in a Datalogger log group within the Kepware Configuration API
 """
-from typing import Union
+from typing import Union, Iterator
 from . import log_group as Log_Group
 from ..error import KepError, KepHTTPError
 from ..connection import server
-from ..utils import _url_parse_object
+from ..utils import _url_parse_object, _add_result, _multi_status_data, _iter_pages
+from ..tracing import _traced
 
 LOG_ITEMS_ROOT = '/log_items'
 
@@ -28,13 +29,16 @@ def _create_url(log_item = None):
         return '{}/{}'.format(LOG_ITEMS_ROOT, _url_parse_object(log_item))
 
 
-def add_log_item(server: server, log_group: str, DATA: Union[dict, list]) -> Union[bool, list]:
+@_traced
+def add_log_item(server: server, log_group: str, DATA: Union[dict, list], *, multi_status: bool = False) -> Union[bool, list]:
     '''Add a `"log item"` or multiple `"log item"` objects to a log group in Kepware's Datalogger. It can 
     be used to pass a list of log items to be added all at once.
 
     :param server: instance of the `server` class
     :param log_group: name of log group that the log items will be added
     :param DATA: Dict or a list of the log items to add through Kepware Configuration API
+    :param multi_status: *(optional)* If True, returns a `MultiStatusResult` with the status of every object instead of 
+    True or the list of failures. (default= False)
 
     :return: True - If a "HTTP 201 - Created" is received from Kepware server
     :return: If a "HTTP 207 - Multi-Status" is received from Kepware with a list of dict error responses for all 
@@ -44,16 +48,11 @@ def add_log_item(server: server, log_group: str, DATA: Union[dict, list]) -> Uni
     :raises KepURLError: If urllib provides an URLError
     '''
 
+    DATA = _multi_status_data(DATA, multi_status)
     r = server._config_add(server.url + Log_Group._create_url(log_group) + _create_url(), DATA)
-    if r.code == 201: return True
-    elif r.code == 207:
-        errors = [] 
-        for item in r.payload:
-            if item['code'] != 201:
-                errors.append(item)
-        return errors 
-    else: raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+    return _add_result(r, DATA, multi_status, lambda items: add_log_item(server, log_group, items, multi_status= True))
 
+@_traced
 def del_log_item(server: server, log_group: str, log_item: str) -> bool:
     '''Delete a `"log item"` object of a log group in Kepware's Datalogger.
     
@@ -68,8 +67,9 @@ def del_log_item(server: server, log_group: str, log_item: str) -> bool:
     '''
     r = server._config_del(server.url + Log_Group._create_url(log_group) + _create_url(log_item))
     if r.code == 200: return True 
-    else: raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+    else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
 
+@_traced
 def modify_log_item(server: server, log_group: str, DATA: dict, *, log_item: str = None, force: bool = False) -> bool:
     '''Modify a `"log_item"` object and it's properties in Kepware. If a `"log_item"` is not provided as an input,
     you need to identify the log_item in the *'common.ALLTYPES_NAME'* property field in the `"DATA"`. It will 
@@ -93,15 +93,16 @@ def modify_log_item(server: server, log_group: str, DATA: dict, *, log_item: str
         try:
             r = server._config_update(server.url + Log_Group._create_url(log_group) + _create_url(log_item_data['common.ALLTYPES_NAME']), log_item_data)
             if r.code == 200: return True 
-            else: raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+            else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
         except KeyError as err:
             err_msg ='Error: No log item identified in DATA | Key Error: {}'.format(err)
             raise KepError(err_msg)
     else:
         r = server._config_update(server.url + Log_Group._create_url(log_group) + _create_url(log_item), log_item_data)
         if r.code == 200: return True 
-        else: raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+        else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
 
+@_traced
 def get_log_item(server, log_group, log_item) -> dict:
     '''Returns the properties of the `"log item"` object.
     
@@ -117,6 +118,7 @@ def get_log_item(server, log_group, log_item) -> dict:
     r = server._config_get(server.url + Log_Group._create_url(log_group) + _create_url(log_item))
     return r.payload
 
+@_traced
 def get_all_log_items(server: server, log_group: str, *, options: dict = None) -> list:
     '''Returns the properties of all `"log item"` objects for a log group.
     
@@ -132,3 +134,23 @@ def get_all_log_items(server: server, log_group: str, *, options: dict = None) -
     '''
     r = server._config_get(f'{server.url}{Log_Group._create_url(log_group)}{_create_url()}', params= options)
     return r.payload
+
+def iter_all_log_items(server: server, log_group: str, *, options: dict = None, page_size: int = 100, prefetch: bool = True) -> Iterator[dict]:
+    '''Returns a generator of all `"log item"` objects and their properties. The log items are read from Kepware 
+    one page at a time and the next page is requested while the current page is processed, so large 
+    collections don't have to be held in memory.
+
+    :param server: instance of the `server` class
+    :param log_group: name of log group that log item exists
+    :param options: *(optional)* Dict of parameters to filter or sort the list of log items. Options are `filter`, 
+        `sortOrder` and `sortProperty`. `pageNumber` sets the first page to read
+    :param page_size: *(optional)* Number of log items read per request, or None to read all log items with one 
+        request that is parsed as it is received (default= 100)
+    :param prefetch: *(optional)* Request the next page while the current page is processed (default= True)
+
+    :return: Generator of the data for each log item
+
+    :raises KepHTTPError: If urllib provides an HTTPError
+    :raises KepURLError: If urllib provides an URLError
+    '''
+    return _iter_pages(lambda o: get_all_log_items(server, log_group, options= o), options, page_size, prefetch)
@@ -11,7 +11,9 @@ column mapping objects in a Datalogger log group within the Kepware Configuratio
 from . import log_group as Log_Group
 from ..error import KepError, KepHTTPError
 from ..connection import server
-from ..utils import _url_parse_object
+from ..utils import _url_parse_object, _iter_pages
+from ..tracing import _traced
+from typing import Iterator
 
 MAPPING_ROOT = '/column_mappings'
 
@@ -27,6 +29,7 @@ def _create_url(mapping = None):
     else:
         return '{}/{}'.format(MAPPING_ROOT, _url_parse_object(mapping))
 
+@_traced
 def modify_mapping(server: server, log_group: str, DATA: dict, *, mapping: str = None, force: bool = False) -> bool:
     '''Modify a column `"mapping"` object and it's properties in Kepware. If a `"mapping"` is not provided as an input,
     you need to identify the column mapping in the *'common.ALLTYPES_NAME'* property field in the `"DATA"`. It will 
@@ -50,15 +53,16 @@ def modify_mapping(server: server, log_group: str, DATA: dict, *, mapping: str =
         try:
             r = server._config_update(server.url + Log_Group._create_url(log_group) + _create_url(mapping_data['common.ALLTYPES_NAME']), mapping_data)
             if r.code == 200: return True 
-            else: raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+            else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
         except KeyError as err:
             err_msg = 'Error: No column mapping identified in DATA | Key Error: {}'.format(err)
             raise KepError(err_msg)
     else:
         r = server._config_update(server.url + Log_Group._create_url(log_group) + _create_url(mapping), mapping_data)
         if r.code == 200: return True 
-        else: raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+        else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
 
+@_traced
 def get_mapping(server: server, log_group: str, mapping: str) -> dict:
     '''Returns the properties of the `"mapping"` object.
     
@@ -74,6 +78,7 @@ def get_mapping(server: server, log_group: str, mapping: str) -> dict:
     r = server._config_get(server.url + Log_Group._create_url(log_group) + _create_url(mapping))
     return r.payload
 
+@_traced
 def get_all_mappings(server: server, log_group: str, *, options: dict = None) -> list:
     '''Returns the properties of all column `"mapping"` objects for a log group.
     
@@ -89,3 +94,23 @@ def get_all_mappings(server: server, log_group: str, *, options: dict = None) ->
     '''
     r = server._config_get(f'{server.url}{Log_Group._create_url(log_group)}{_create_url()}', params= options)
     return r.payload
+
+def iter_all_mappings(server: server, log_group: str, *, options: dict = None, page_size: int = 100, prefetch: bool = True) -> Iterator[dict]:
+    '''Returns a generator of all `"mapping"` objects and their properties. The mappings are read from Kepware 
+    one page at a time and the next page is requested while the current page is processed, so large 
+    collections don't have to be held in memory.
+
+    :param server: instance of the `server` class
+    :param log_group: name of log group for the mapping
+    :param options: *(optional)* Dict of parameters to filter or sort the list of mappings. Options are `filter`, 
+        `sortOrder` and `sortProperty`. `pageNumber` sets the first page to read
+    :param page_size: *(optional)* Number of mappings read per request, or None to read all mappings with one 
+        request that is parsed as it is received (default= 100)
+    :param prefetch: *(optional)* Request the next page while the current page is processed (default= True)
+
+    :return: Generator of the data for each mapping
+
+    :raises KepHTTPError: If urllib provides an HTTPError
+    :raises KepURLError: If urllib provides an URLError
+    '''
+    return _iter_pages(lambda o: get_all_mappings(server, log_group, options= o), options, page_size, prefetch)
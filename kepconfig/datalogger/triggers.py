@@ -8,11 +8,12 @@ r"""`triggers` exposes an API to allow modifications (add, delete, modify) to
 trigger objects in a Datalogger log group within the Kepware Configuration API
 """
 
-from typing import Union
+from typing import Union, Iterator
 from . import log_group as Log_Group
 from ..error import KepError, KepHTTPError
 from ..connection import server
-from ..utils import _url_parse_object
+from ..utils import _url_parse_object, _add_result, _multi_status_data, _iter_pages
+from ..tracing import _traced
 
 TRIGGERS_ROOT = '/triggers'
 
@@ -29,13 +30,16 @@ def _create_url(trigger = None):
         return '{}/{}'.format(TRIGGERS_ROOT, _url_parse_object(trigger))
 
 
-def add_trigger(server: server, log_group: str, DATA: Union[dict, list]) -> Union[bool, list]:
+@_traced
+def add_trigger(server: server, log_group: str, DATA: Union[dict, list], *, multi_status: bool = False) -> Union[bool, list]:
     '''Add a `"trigger"` or multiple `"trigger"` objects to a log group in Kepware's Datalogger. It can 
     be used to pass a list of triggers to be added all at once.
 
     :param server: instance of the `server` class
     :param log_group: name of log group for the trigger items
     :param DATA: Dict or a list of the trigger items to add through Kepware Configuration API
+    :param multi_status: *(optional)* If True, returns a `MultiStatusResult` with the status of every object instead of 
+    True or the list of failures. (default= False)
 
     :return: True - If a "HTTP 201 - Created" is received from Kepware server
     :return: If a "HTTP 207 - Multi-Status" is received from Kepware with a list of dict error responses for all 
@@ -45,16 +49,11 @@ def add_trigger(server: server, log_group: str, DATA: Union[dict, list]) -> Unio
     :raises KepURLError: If urllib provides an URLError
     '''
 
+    DATA = _multi_status_data(DATA, multi_status)
     r = server._config_add(server.url + Log_Group._create_url(log_group) + _create_url(), DATA)
-    if r.code == 201: return True
-    elif r.code == 207:
-        errors = [] 
-        for item in r.payload:
-            if item['code'] != 201:
-                errors.append(item)
-        return errors 
-    else: raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+    return _add_result(r, DATA, multi_status, lambda items: add_trigger(server, log_group, items, multi_status= True))
 
+@_traced
 def del_trigger(server: server, log_group: str, trigger: str) -> bool:
     '''Delete a `"trigger"` object of a log group in Kepware's Datalogger.
     
@@ -69,8 +68,9 @@ def del_trigger(server: server, log_group: str, trigger: str) -> bool:
     '''
     r = server._config_del(server.url + Log_Group._create_url(log_group) + _create_url(trigger))
     if r.code == 200: return True
-    else: raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+    else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
 
+@_traced
 def modify_trigger(server: server, log_group: str, DATA: dict, *, trigger: str = None, force: bool = False)  -> bool:
     '''Modify a `"trigger"` object and it's properties in Kepware. If a `"trigger"` is not provided as an input,
     you need to identify the trigger in the *'common.ALLTYPES_NAME'* property field in the `"DATA"`. It will 
@@ -94,7 +94,7 @@ def modify_trigger(server: server, log_group: str, DATA: dict, *, trigger: str =
         try:
             r = server._config_update(server.url + Log_Group._create_url(log_group) + _create_url(trigger_data['common.ALLTYPES_NAME']), trigger_data)
             if r.code == 200: return True 
-            else: raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+            else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
         except KeyError as err:
             err_msg = 'Error: No trigger identified in DATA | Key Error: {}'.format(err)
             raise KepError(err_msg)
@@ -103,8 +103,9 @@ def modify_trigger(server: server, log_group: str, DATA: dict, *, trigger: str =
     else:
         r = server._config_update(server.url + Log_Group._create_url(log_group) + _create_url(trigger), trigger_data)
         if r.code == 200: return True 
-        else: raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+        else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
 
+@_traced
 def get_trigger(server, log_group, trigger) -> dict:
     '''Returns the properties of the `"trigger"` object.
     
@@ -120,6 +121,7 @@ def get_trigger(server, log_group, trigger) -> dict:
     r = server._config_get(server.url + Log_Group._create_url(log_group) + _create_url(trigger))
     return r.payload
 
+@_traced
 def get_all_triggers(server: server, log_group: str, *, options: dict = None) -> list:
     '''Returns the properties of all `"trigger"` objects for a log group.
     
@@ -140,3 +142,23 @@ def get_all_triggers(server: server, log_group: str, *, options: dict = None) ->
     '''
     r = server._config_get(f'{server.url}{Log_Group._create_url(log_group)}{_create_url()}', params= options)
     return r.payload
+
+def iter_all_triggers(server: server, log_group: str, *, options: dict = None, page_size: int = 100, prefetch: bool = True) -> Iterator[dict]:
+    '''Returns a generator of all `"trigger"` objects and their properties. The triggers are read from Kepware 
+    one page at a time and the next page is requested while the current page is processed, so large 
+    collections don't have to be held in memory.
+
+    :param server: instance of the `server` class
+    :param log_group: name of log group for the trigger items
+    :param options: *(optional)* Dict of parameters to filter or sort the list of triggers. Options are `filter`, 
+        `sortOrder` and `sortProperty`. `pageNumber` sets the first page to read
+    :param page_size: *(optional)* Number of triggers read per request, or None to read all triggers with one 
+        request that is parsed as it is received (default= 100)
+    :param prefetch: *(optional)* Request the next page while the current page is processed (default= True)
+
+    :return: Generator of the data for each trigger
+
+    :raises KepHTTPError: If urllib provides an HTTPError
+    :raises KepURLError: If urllib provides an URLError
+    '''
+    return _iter_pages(lambda o: get_all_triggers(server, log_group, options= o), options, page_size, prefetch)
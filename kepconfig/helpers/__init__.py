@@ -0,0 +1,9 @@
+# -------------------------------------------------------------------------
+# Copyright (c) PTC Inc. and/or all its affiliates. All rights reserved.
+# See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+r"""`helpers` contains internal support code used by the Kepconfig package. Nothing in
+this package is part of the public API and it may change between releases.
+"""
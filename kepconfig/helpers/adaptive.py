@@ -0,0 +1,141 @@
+# -------------------------------------------------------------------------
+# Copyright (c) PTC Inc. and/or all its affiliates. All rights reserved.
+# See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+r"""`adaptive` provides the AIMD (additive increase, multiplicative decrease) limiter
+used by the `server` classes to apply an `AdaptiveConcurrency` setting.
+"""
+
+import asyncio
+import socket
+import threading
+import time
+from collections import deque
+from urllib import parse
+from ..error import KepHTTPError, KepURLError
+from ..metrics import _endpoint_template
+
+# Weight of the newest sample in the average latency
+_LATENCY_ALPHA = 0.1
+# Number of samples of a latency class needed before its latency spikes are detected
+_LATENCY_WARMUP = 10
+
+class _AdaptiveLimiter:
+    '''Limits requests in flight to a window that grows while requests succeed and shrinks
+    on overload. Can be used from threads (`acquire`) and coroutines (`acquire_async`) at the same time.
+
+    `acquire` returns the start time of the request, which is passed back to `release` with
+    the error raised by the request, if any, and the latency class of the request. The latency of 
+    a request is only compared with the average of its own class, see `_latency_class`.
+    '''
+    def __init__(self, config):
+        self.config = config
+        self._window = float(config.initial_limit)
+        self._in_flight = 0
+        self._latency = None
+        self._baselines = {}
+        self._last_decrease = 0.0
+        self._increases = 0
+        self._decreases = 0
+        self._cond = threading.Condition()
+        self._async_waiters = deque()
+
+    def _try_acquire(self):
+        if self._in_flight < int(self._window):
+            self._in_flight += 1
+            return True
+        return False
+
+    def acquire(self) -> float:
+        with self._cond:
+            while not self._try_acquire():
+                self._cond.wait()
+        return time.monotonic()
+
+    async def acquire_async(self) -> float:
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._cond:
+                if self._try_acquire():
+                    return time.monotonic()
+                waiter = loop.create_future()
+                self._async_waiters.append((loop, waiter))
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                # Pass on a wake up that may have been meant for this task
+                with self._cond:
+                    self._wake()
+                raise
+
+    def release(self, start, error = None, key = None):
+        now = time.monotonic()
+        latency = now - start
+        with self._cond:
+            self._in_flight -= 1
+            baseline = self._baselines.get(key)
+            if self._is_overload(error, latency, baseline):
+                # Only the first overload signal after a decrease counts. Requests that were
+                # already in flight when the window was cut would otherwise cut it again.
+                if start >= self._last_decrease:
+                    self._window = max(self.config.min_limit, self._window * self.config.decrease_factor)
+                    self._last_decrease = now
+                    self._decreases += 1
+            elif error is None:
+                if self._window < self.config.max_limit:
+                    self._window = min(self.config.max_limit, self._window + 1 / self._window)
+                    self._increases += 1
+            if error is None:
+                self._latency = _average(self._latency, latency)
+                if baseline is None:
+                    self._baselines[key] = [latency, 1]
+                else:
+                    baseline[0] = _average(baseline[0], latency)
+                    baseline[1] += 1
+            self._wake()
+
+    def _is_overload(self, error, latency, baseline):
+        if isinstance(error, KepHTTPError):
+            return error.code in self.config.overload_codes
+        if isinstance(error, KepURLError):
+            return isinstance(error.msg, (socket.timeout, TimeoutError, asyncio.TimeoutError))
+        if error is None and baseline is not None and baseline[1] >= _LATENCY_WARMUP:
+            return latency > baseline[0] * self.config.latency_tolerance
+        return False
+
+    def _wake(self):
+        free = int(self._window) - self._in_flight
+        if free <= 0:
+            return
+        self._cond.notify(free)
+        while self._async_waiters and free > 0:
+            loop, waiter = self._async_waiters.popleft()
+            if not waiter.done():
+                loop.call_soon_threadsafe(_set_waiter, waiter)
+                free -= 1
+
+    def as_dict(self) -> dict:
+        with self._cond:
+            return {
+                'window': int(self._window),
+                'in_flight': self._in_flight,
+                'average_latency': self._latency,
+                'increases': self._increases,
+                'decreases': self._decreases
+            }
+
+def _average(average, latency):
+    return latency if average is None else average + _LATENCY_ALPHA * (latency - average)
+
+def _latency_class(method, url):
+    '''Returns the latency class of a request: its method, endpoint and requested content. Serialized 
+    structures, project loads and other service calls take far longer than a read of a single object, 
+    so each class keeps its own average latency.'''
+    content = parse.parse_qs(parse.urlsplit(url).query).get('content')
+    return (method, _endpoint_template(url), content[0] if content else None)
+
+def _set_waiter(waiter):
+    if not waiter.done():
+        waiter.set_result(None)
@@ -0,0 +1,386 @@
+# -------------------------------------------------------------------------
+# Copyright (c) PTC Inc. and/or all its affiliates. All rights reserved.
+# See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+r"""`async_connection_pool` provides the non-blocking HTTP/1.1 transport used by the
+`AsyncServer` class. It is built on asyncio streams and keeps keep-alive connections
+per scheme/host/port so that many concurrent requests can share one event loop.
+
+GET and HEAD requests follow redirects the same way as `connection_pool`. Every read and write 
+on a connection fails with `asyncio.TimeoutError` if it doesn't complete within the timeout 
+of the pool. A response can be streamed, in which case its body is received and decompressed 
+as it is read instead of being held in memory in full.
+"""
+
+import asyncio
+import email.parser
+import http.client
+import time
+from collections import deque
+from urllib import parse
+from .json_body import _is_replayable
+from .connection_pool import _get_decoder, _redirect_location, _MAX_REDIRECTS
+
+# Default time in seconds allowed for every read and write on a connection
+_DEFAULT_TIMEOUT = 60.0
+# Size of the reads of a body that is read completely
+_READ_SIZE = 65536
+
+# Errors that indicate a kept-alive connection was closed by the server while idle.
+_STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError,
+                            ConnectionAbortedError, BrokenPipeError)
+
+class _AsyncResponse:
+    '''Response returned by the async pool. Unless the request was sent with *stream* set, the body has 
+    been fully read and decompressed into `body`. Otherwise the body is read with `read`, decompressed 
+    as it is read, and the connection is returned to its pool, or closed, by `release`.'''
+    def __init__(self, pool, conn, url, status, reason, headers, will_close, body_reader):
+        self._pool = pool
+        self._conn = conn
+        self.url = url
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self.body = None
+        self._will_close = will_close
+        self._body_reader = body_reader
+        self._decoder = _get_decoder(headers)
+        self._pending = b''
+
+    async def read(self, amt = None) -> bytes:
+        '''Reads up to *amt* bytes of the decompressed body, or the rest of it if *amt* is None. Returns 
+        an empty bytes object at the end of the body.'''
+        if self._conn is None:
+            return b''
+        try:
+            if amt is None:
+                data = self._pending + await self._body_reader.read_all()
+                self._pending = b''
+                return data if self._decoder is None else self._decoder.decompress(data) + self._decoder.flush()
+            if self._decoder is None:
+                return await self._body_reader.read(amt)
+            while True:
+                data = self._pending or await self._body_reader.read(amt)
+                if not data:
+                    return self._decoder.flush()
+                # Output is limited to *amt* bytes, the rest of the input is kept for the next read
+                out = self._decoder.decompress(data, amt)
+                self._pending = self._decoder.unconsumed_tail
+                if out:
+                    return out
+        except BaseException:
+            self._will_close = True
+            self.release()
+            raise
+
+    def release(self):
+        '''Returns the connection to its pool if the body was read completely, otherwise closes it.'''
+        if self._conn is None:
+            return
+        conn, self._conn = self._conn, None
+        self._pool._release(conn, self._will_close or not self._body_reader.done)
+
+class _BodyReader:
+    '''Reads the body of a response from a connection, based on its Content-Length or chunked 
+    Transfer-Encoding, or until the connection is closed if it has neither.'''
+    def __init__(self, conn, length = None, chunked = False):
+        self._conn = conn
+        self._remaining = length
+        self._chunked = chunked
+        self._chunk_left = 0
+        self.done = length == 0
+
+    async def read(self, amt) -> bytes:
+        if self.done:
+            return b''
+        wait = self._conn._wait
+        reader = self._conn.reader
+        if self._chunked:
+            if self._chunk_left == 0:
+                line = await wait(reader.readline())
+                try:
+                    self._chunk_left = int(line.split(b';', 1)[0].strip(), 16)
+                except ValueError:
+                    raise http.client.IncompleteRead(b'')
+                if self._chunk_left == 0:
+                    # Discard any trailers
+                    while (await wait(reader.readline())) not in (b'\r\n', b'\n', b''):
+                        pass
+                    self.done = True
+                    return b''
+            data = await wait(reader.read(min(amt, self._chunk_left)))
+            if not data:
+                raise http.client.IncompleteRead(b'')
+            self._chunk_left -= len(data)
+            if self._chunk_left == 0:
+                await wait(reader.readexactly(2))
+            return data
+        if self._remaining is None:
+            data = await wait(reader.read(amt))
+            self.done = not data
+            return data
+        data = await wait(reader.read(min(amt, self._remaining)))
+        if not data:
+            raise http.client.IncompleteRead(b'', self._remaining)
+        self._remaining -= len(data)
+        self.done = self._remaining == 0
+        return data
+
+    async def read_all(self) -> bytes:
+        if self._remaining is not None and not self._chunked and not self.done:
+            data = await self._conn._wait(self._conn.reader.readexactly(self._remaining))
+            self._remaining = 0
+            self.done = True
+            return data
+        chunks = []
+        while True:
+            data = await self.read(_READ_SIZE)
+            if not data:
+                return b''.join(chunks)
+            chunks.append(data)
+
+class _AsyncConnection:
+    '''Single HTTP/1.1 connection over an asyncio stream pair. Every read and write waits at most 
+    *timeout* seconds, or without limit if *timeout* is None.'''
+    def __init__(self, reader, writer, timeout = None):
+        self.reader = reader
+        self.writer = writer
+        self.timeout = timeout
+        self.last_used = time.monotonic()
+
+    async def _wait(self, aw):
+        if self.timeout is None:
+            return await aw
+        return await asyncio.wait_for(aw, self.timeout)
+
+    def is_dropped(self):
+        return self.reader.at_eof() or self.writer.is_closing()
+
+    def close(self):
+        self.writer.close()
+
+    async def request(self, method, target, host, headers, body):
+        '''Sends the request and reads the status line and headers of the response. Returns a tuple of
+        (status, reason, headers, will_close, body reader).'''
+        lines = [f'{method} {target} HTTP/1.1', f'Host: {host}']
+        for key, value in headers.items():
+            lines.append(f'{key}: {value}')
+        chunked = body is not None and not isinstance(body, (bytes, bytearray)) and not hasattr(body, '__len__')
+        if chunked:
+            lines.append('Transfer-Encoding: chunked')
+        elif body is not None:
+            lines.append(f'Content-Length: {len(body)}')
+        elif method in ('POST', 'PUT', 'PATCH'):
+            lines.append('Content-Length: 0')
+        self.writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1'))
+        if isinstance(body, (bytes, bytearray)):
+            self.writer.write(body)
+        elif body is not None:
+            # Iterable bodies are written a chunk at a time so the whole body is never held in memory
+            for chunk in body:
+                if not chunk:
+                    continue
+                if chunked:
+                    self.writer.write(b'%x\r\n' % len(chunk) + chunk + b'\r\n')
+                else:
+                    self.writer.write(chunk)
+                await self._wait(self.writer.drain())
+            if chunked:
+                self.writer.write(b'0\r\n\r\n')
+        await self._wait(self.writer.drain())
+
+        status_line = await self._wait(self.reader.readline())
+        if not status_line:
+            raise http.client.RemoteDisconnected('Remote end closed connection without response')
+        try:
+            version, status, reason = status_line.decode('latin-1').rstrip('\r\n').split(' ', 2)
+        except ValueError:
+            try:
+                version, status = status_line.decode('latin-1').rstrip('\r\n').split(' ', 1)
+                reason = ''
+            except ValueError:
+                raise http.client.BadStatusLine(status_line)
+        if not version.startswith('HTTP/'):
+            raise http.client.BadStatusLine(status_line)
+        status = int(status)
+
+        header_lines = []
+        while True:
+            line = await self._wait(self.reader.readline())
+            if line in (b'\r\n', b'\n', b''):
+                break
+            header_lines.append(line.decode('latin-1'))
+        resp_headers = email.parser.Parser(_class=http.client.HTTPMessage).parsestr(''.join(header_lines))
+
+        will_close = version == 'HTTP/1.0' or 'close' in resp_headers.get('Connection', '').lower()
+        if method == 'HEAD' or status in (204, 304) or 100 <= status < 200:
+            body_reader = _BodyReader(self, length=0)
+        elif 'chunked' in resp_headers.get('Transfer-Encoding', '').lower():
+            body_reader = _BodyReader(self, chunked=True)
+        elif resp_headers.get('Content-Length') is not None:
+            body_reader = _BodyReader(self, length=int(resp_headers['Content-Length']))
+        else:
+            body_reader = _BodyReader(self)
+            will_close = True
+        return status, reason, resp_headers, will_close, body_reader
+
+class _AsyncConnectionPool:
+    '''Keep-alive connections to a single scheme/host/port. At most *max_connections*
+    requests are in flight at once; further requests wait for a connection to be released.
+    '''
+    def __init__(self, scheme, host, port, *, maxsize, max_connections, idle_timeout, ssl_context, timeout):
+        self.scheme = scheme
+        self.host = host
+        self.port = port
+        self.maxsize = maxsize
+        self.max_connections = max_connections
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+        self._ssl_context = ssl_context
+        self._idle = deque()
+        self._closed = False
+        # Created on first use so the semaphore belongs to the running event loop
+        self._semaphore = None
+
+    async def _new_conn(self):
+        if self.scheme == 'https':
+            connect = asyncio.open_connection(self.host, self.port, ssl=self._ssl_context, server_hostname=self.host)
+        else:
+            connect = asyncio.open_connection(self.host, self.port)
+        reader, writer = await (connect if self.timeout is None else asyncio.wait_for(connect, self.timeout))
+        return _AsyncConnection(reader, writer, self.timeout)
+
+    async def _get_conn(self):
+        now = time.monotonic()
+        while self._idle:
+            conn = self._idle.pop()
+            if now - conn.last_used > self.idle_timeout or conn.is_dropped():
+                conn.close()
+                continue
+            return conn, True
+        return await self._new_conn(), False
+
+    def _put_conn(self, conn):
+        if not self._closed and len(self._idle) < self.maxsize:
+            self._idle.append(conn)
+        else:
+            conn.close()
+
+    async def urlopen(self, method, url, body = None, headers = None) -> _AsyncResponse:
+        '''Sends the request and returns an `_AsyncResponse` once the headers are received. The request 
+        counts towards *max_connections* until the response is released.'''
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_connections)
+        parsed = parse.urlsplit(url)
+        target = parsed.path or '/'
+        if parsed.query:
+            target = f'{target}?{parsed.query}'
+        await self._semaphore.acquire()
+        try:
+            while True:
+                conn, reused = await self._get_conn()
+                try:
+                    status, reason, resp_headers, will_close, body_reader = await conn.request(method, target, parsed.netloc, headers or {}, body)
+                except _STALE_CONNECTION_ERRORS:
+                    conn.close()
+                    if reused and _is_replayable(body):
+                        continue
+                    raise
+                except BaseException:
+                    conn.close()
+                    raise
+                return _AsyncResponse(self, conn, url, status, reason, resp_headers, will_close, body_reader)
+        except BaseException:
+            self._semaphore.release()
+            raise
+
+    def _release(self, conn, close):
+        conn.last_used = time.monotonic()
+        if close:
+            conn.close()
+        else:
+            self._put_conn(conn)
+        self._semaphore.release()
+
+    def close(self):
+        self._closed = True
+        idle, self._idle = self._idle, deque()
+        for conn in idle:
+            conn.close()
+
+class _AsyncPoolManager:
+    '''Keeps one `_AsyncConnectionPool` per scheme/host/port combination. A pool is created again when 
+    it is used with another SSL context.'''
+    def __init__(self, maxsize = 10, max_connections = 100, idle_timeout = 30.0, timeout = _DEFAULT_TIMEOUT):
+        self._maxsize = maxsize
+        self._max_connections = max_connections
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+        self._pools = {}
+
+    @property
+    def maxsize(self):
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, val):
+        self._maxsize = val
+        for pool in self._pools.values():
+            pool.maxsize = val
+
+    @property
+    def max_connections(self):
+        return self._max_connections
+
+    @max_connections.setter
+    def max_connections(self, val):
+        # Only applies to pools created after the change since in flight requests hold the semaphore
+        self._max_connections = val
+        self.clear()
+
+    def _pool_for(self, scheme, host, port, ssl_context):
+        key = (scheme, host, port)
+        pool = self._pools.get(key)
+        if pool is not None and pool._ssl_context is not ssl_context:
+            pool.close()
+            pool = None
+        if pool is None:
+            pool = _AsyncConnectionPool(scheme, host, port, maxsize=self._maxsize,
+                                        max_connections=self._max_connections, idle_timeout=self.idle_timeout,
+                                        ssl_context=ssl_context, timeout=self.timeout)
+            self._pools[key] = pool
+        return pool
+
+    async def urlopen(self, method, url, body = None, headers = None, *, ssl_context = None, stream = False) -> _AsyncResponse:
+        '''Sends the request and returns an `_AsyncResponse`. With *stream* set the body is left to be read 
+        with `read` and the response must be released, otherwise it is read into `body`.'''
+        redirects = 0
+        while True:
+            parsed = parse.urlsplit(url)
+            port = parsed.port or (443 if parsed.scheme == 'https' else 80)
+            pool = self._pool_for(parsed.scheme, parsed.hostname, port, ssl_context)
+            response = await pool.urlopen(method, url, body, headers)
+            location = _redirect_location(method, response.status, response.headers, url)
+            if location is not None and redirects < _MAX_REDIRECTS:
+                # The body of the redirect is read so the connection can be reused
+                try:
+                    await response.read()
+                finally:
+                    response.release()
+                url = location
+                redirects += 1
+                continue
+            if not stream:
+                try:
+                    response.body = await response.read()
+                finally:
+                    response.release()
+            return response
+
+    def clear(self):
+        '''Closes all idle connections and forgets all pools.'''
+        pools, self._pools = self._pools, {}
+        for pool in pools.values():
+            pool.close()
@@ -0,0 +1,137 @@
+# -------------------------------------------------------------------------
+# Copyright (c) PTC Inc. and/or all its affiliates. All rights reserved.
+# See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+r"""`cache` provides the in-memory read-through cache used by the `server` classes to
+apply a `CachePolicy` to GET requests.
+"""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from urllib import parse
+
+# Only configuration objects are cached. Services, job status, logs and runtime status
+# change without a configuration write.
+_CACHEABLE_PREFIXES = ('/project', '/admin')
+_UNCACHEABLE_PREFIXES = ('/project/services', '/project/backups')
+
+def _cache_key(url):
+    '''Returns (key, path) for *url*. The key has the scheme and host in lower case and the
+    query parameters sorted so equivalent requests share an entry.'''
+    parsed = parse.urlsplit(url)
+    query = parse.urlencode(sorted(parse.parse_qsl(parsed.query, keep_blank_values=True)))
+    path = parsed.path.rstrip('/')
+    return f'{parsed.scheme.lower()}://{parsed.netloc.lower()}{path}?{query}', path
+
+def _is_related(path, other):
+    '''True if one path is the other path or one of its ancestors.'''
+    if len(path) > len(other):
+        path, other = other, path
+    return other == path or other.startswith(path + '/')
+
+class _ResponseCache:
+    '''LRU cache of GET payloads with an optional time to live. Entries are invalidated
+    when a write touches the same object, one of its children or one of its parents, and
+    all entries are dropped when Kepware reports a PROJECT_ID that wasn't caused by a
+    write made through this cache. All entries are also dropped when the project is replaced, 
+    and nothing is stored again until a new PROJECT_ID is reported.'''
+    def __init__(self, policy, root_path):
+        self.policy = policy
+        self._root_path = root_path
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._project_id = None
+        self._pending_writes = 0
+        self._replaced = False
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+        self._evictions = 0
+
+    def _relative_path(self, path):
+        return path[len(self._root_path):] if path.startswith(self._root_path) else path
+
+    def is_cacheable(self, url):
+        path = self._relative_path(parse.urlsplit(url).path)
+        return (any(path == prefix or path.startswith(prefix + '/') for prefix in _CACHEABLE_PREFIXES) and
+                not any(path == prefix or path.startswith(prefix + '/') for prefix in _UNCACHEABLE_PREFIXES))
+
+    def get(self, url):
+        '''Returns (payload, generation). payload is None on a miss; the generation is passed
+        back to `put` so a response that raced with a write isn't stored.'''
+        key, _ = _cache_key(url)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (entry[0] is None or entry[0] > time.monotonic()):
+                self._entries.move_to_end(key)
+                self._hits += 1
+                payload = entry[2]
+            else:
+                if entry is not None:
+                    del self._entries[key]
+                self._misses += 1
+                return None, self._generation
+        return copy.deepcopy(payload), None
+
+    def put(self, url, payload, generation):
+        key, path = _cache_key(url)
+        value = copy.deepcopy(payload)
+        expires = None if self.policy.ttl is None else time.monotonic() + self.policy.ttl
+        with self._lock:
+            # Nothing is stored while a project is loaded, until the PROJECT_ID of the new project is reported
+            if generation != self._generation or self._replaced:
+                return
+            self._entries[key] = (expires, path, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.policy.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, url):
+        '''Drops the entries of the object at *url*, its children and its parents.'''
+        _, path = _cache_key(url)
+        with self._lock:
+            self._generation += 1
+            self._pending_writes += 1
+            stale = [key for key, entry in self._entries.items() if _is_related(entry[1], path)]
+            for key in stale:
+                del self._entries[key]
+            self._invalidations += len(stale)
+
+    def note_project_id(self, project_id):
+        '''Drops all entries if the project was changed by another client.'''
+        with self._lock:
+            if project_id == self._project_id:
+                return
+            changed_elsewhere = (self._project_id is not None and self._pending_writes == 0) or self._replaced
+            self._project_id = project_id
+            self._pending_writes = 0
+            self._replaced = False
+            if changed_elsewhere:
+                self._generation += 1
+                self._invalidations += len(self._entries)
+                self._entries.clear()
+
+    def clear(self, replaced = False):
+        '''Drops all entries. If *replaced* is True the project is being replaced, so reads aren't 
+        stored until a new PROJECT_ID is reported.'''
+        with self._lock:
+            self._replaced = self._replaced or replaced
+            self._generation += 1
+            self._invalidations += len(self._entries)
+            self._entries.clear()
+
+    def as_dict(self) -> dict:
+        with self._lock:
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'entries': len(self._entries),
+                'invalidations': self._invalidations,
+                'evictions': self._evictions
+            }
@@ -0,0 +1,60 @@
+# -------------------------------------------------------------------------
+# Copyright (c) PTC Inc. and/or all its affiliates. All rights reserved.
+# See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+r"""`codec` provides the `JsonCodec` implementations for the optional JSON libraries that
+are used by the `server` classes when they are installed.
+"""
+
+import codecs
+from ..structures import JsonCodec
+
+_BOM = codecs.BOM_UTF8
+
+class _OrjsonCodec(JsonCodec):
+    '''Codec using orjson. Objects orjson can't encode, such as integers over 64 bits, are 
+    encoded with the standard library.'''
+    name = 'orjson'
+
+    def __init__(self):
+        import orjson
+        self._orjson = orjson
+
+    def encode(self, obj) -> bytes:
+        try:
+            return self._orjson.dumps(obj)
+        except TypeError:
+            return super().encode(obj)
+
+    def decode(self, data: bytes):
+        if data[:3] == _BOM:
+            # orjson reads a memoryview in place, so the byte order mark is skipped without a copy
+            data = memoryview(data)[3:]
+        return self._orjson.loads(data)
+
+class _UjsonCodec(JsonCodec):
+    '''Codec using ujson.'''
+    name = 'ujson'
+
+    def __init__(self):
+        import ujson
+        self._ujson = ujson
+
+    def encode(self, obj) -> bytes:
+        return self._ujson.dumps(obj, escape_forward_slashes=False).encode('utf-8')
+
+    def decode(self, data: bytes):
+        if data[:3] == _BOM:
+            data = data[3:]
+        return self._ujson.loads(data)
+
+def _default_codec() -> JsonCodec:
+    '''Returns the codec for the fastest JSON library installed.'''
+    for codec in (_OrjsonCodec, _UjsonCodec):
+        try:
+            return codec()
+        except ImportError:
+            pass
+    return JsonCodec()
@@ -0,0 +1,310 @@
+# -------------------------------------------------------------------------
+# Copyright (c) PTC Inc. and/or all its affiliates. All rights reserved.
+# See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+r"""`connection_pool` provides the persistent (keep-alive) HTTP transport used by the
+`server` class. Connections are kept per scheme/host/port so that consecutive
+Configuration API calls reuse the same TCP (and TLS) session instead of opening
+a new socket for every request.
+
+Like `urllib.request`, GET and HEAD requests follow 301, 302, 303, 307 and 308 redirects, up to 
+10 of them. Redirects of other methods are returned as they are received, since their body 
+can't always be sent again.
+"""
+
+import http.client
+import select
+import socket
+import threading
+import time
+import zlib
+from base64 import b64encode
+from collections import deque
+from urllib import parse, request
+from .json_body import _is_replayable
+
+# Errors that indicate a kept-alive connection was closed by the server while idle.
+# A request that fails with one of these on a reused connection is retried once
+# on a fresh connection.
+_STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError,
+                            ConnectionAbortedError, BrokenPipeError)
+# Redirects followed for GET and HEAD requests, at most _MAX_REDIRECTS times like urllib
+_REDIRECT_CODES = (301, 302, 303, 307, 308)
+_REDIRECT_METHODS = ('GET', 'HEAD')
+_MAX_REDIRECTS = 10
+
+class _ContentDecoder:
+    '''Streaming decompressor for a response body sent with a gzip or deflate Content-Encoding.'''
+    def __init__(self, encoding):
+        self.encoding = encoding
+        # Accepts both the gzip and the zlib header
+        self._obj = zlib.decompressobj(zlib.MAX_WBITS | 32)
+        self._started = False
+
+    def decompress(self, data, max_length = 0) -> bytes:
+        try:
+            try:
+                out = self._obj.decompress(data, max_length)
+            except zlib.error:
+                if self._started or self.encoding != 'deflate':
+                    raise
+                # Some servers send deflate without the zlib header
+                self._obj = zlib.decompressobj(-zlib.MAX_WBITS)
+                out = self._obj.decompress(data, max_length)
+        except zlib.error as err:
+            raise http.client.HTTPException(f'Invalid {self.encoding} response body: {err}')
+        self._started = True
+        return out
+
+    @property
+    def unconsumed_tail(self) -> bytes:
+        return self._obj.unconsumed_tail
+
+    def flush(self) -> bytes:
+        return self._obj.flush()
+
+class _PooledResponse:
+    '''HTTP response returned by the pool. The connection that produced the response is
+    returned to its pool when the response is released, provided the body was fully read
+    and the server did not ask for the connection to be closed. A gzip or deflate encoded 
+    body is decompressed as it is read.
+    '''
+    def __init__(self, pool, conn, response, url):
+        self._pool = pool
+        self._conn = conn
+        self._response = response
+        self.url = url
+        self.status = response.status
+        self.reason = response.reason
+        self.headers = response.headers
+        self._decoder = _get_decoder(response.headers)
+        self._pending = b''
+
+    def read(self, amt = None) -> bytes:
+        if self._decoder is None:
+            return self._response.read(amt)
+        if amt is None:
+            data = self._pending + self._response.read()
+            self._pending = b''
+            return self._decoder.decompress(data) + self._decoder.flush()
+        while True:
+            data = self._pending or self._response.read(amt)
+            if not data:
+                return self._decoder.flush()
+            # Output is limited to *amt* bytes, the rest of the input is kept for the next read
+            out = self._decoder.decompress(data, amt)
+            self._pending = self._decoder.unconsumed_tail
+            if out:
+                return out
+
+    def release(self):
+        if self._conn is None:
+            return
+        conn, self._conn = self._conn, None
+        if self._response.isclosed() and not self._response.will_close:
+            self._pool._put_conn(conn)
+        else:
+            self._response.close()
+            conn.close()
+
+    def close(self):
+        self.release()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
+
+class _ConnectionPool:
+    '''Bounded set of reusable connections to a single scheme/host/port. At most *maxsize*
+    idle connections are kept, connections idle for more than *idle_timeout* seconds are
+    discarded. Checkout is thread safe; when all pooled connections are in use a new
+    connection is opened and closed again if the pool is full when it is returned.
+    '''
+    def __init__(self, scheme, host, port, *, maxsize, idle_timeout, ssl_context, timeout, proxy = None):
+        self.scheme = scheme
+        self.host = host
+        self.port = port
+        self.maxsize = maxsize
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+        self._ssl_context = ssl_context
+        self._proxy = proxy
+        self._idle = deque()
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def _new_conn(self):
+        if self._proxy is not None:
+            proxy_host, proxy_port, proxy_headers = self._proxy
+            if self.scheme == 'https':
+                conn = http.client.HTTPSConnection(proxy_host, proxy_port, timeout=self.timeout, context=self._ssl_context)
+                conn.set_tunnel(self.host, self.port, headers=proxy_headers)
+            else:
+                conn = http.client.HTTPConnection(proxy_host, proxy_port, timeout=self.timeout)
+            return conn
+        if self.scheme == 'https':
+            return http.client.HTTPSConnection(self.host, self.port, timeout=self.timeout, context=self._ssl_context)
+        return http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+
+    def _get_conn(self):
+        '''Returns a tuple of (connection, reused).'''
+        now = time.monotonic()
+        with self._lock:
+            while self._idle:
+                conn, last_used = self._idle.pop()
+                if now - last_used > self.idle_timeout or _is_dropped(conn):
+                    conn.close()
+                    continue
+                return conn, True
+        return self._new_conn(), False
+
+    def _put_conn(self, conn):
+        now = time.monotonic()
+        with self._lock:
+            # Evict connections that have exceeded the idle timeout, oldest first
+            while self._idle and now - self._idle[0][1] > self.idle_timeout:
+                self._idle.popleft()[0].close()
+            if not self._closed and len(self._idle) < self.maxsize:
+                self._idle.append((conn, now))
+                return
+        conn.close()
+
+    def urlopen(self, method, url, body = None, headers = None) -> _PooledResponse:
+        '''Sends the request and returns a `_PooledResponse`. Raises OSError or
+        http.client.HTTPException on transport failures.
+        '''
+        parsed = parse.urlsplit(url)
+        if self._proxy is not None and self.scheme == 'http':
+            # Plain HTTP through a proxy uses the absolute URL as the request target
+            target = url
+            headers = {**(headers or {}), **self._proxy[2]}
+        else:
+            target = parsed.path or '/'
+            if parsed.query:
+                target = f'{target}?{parsed.query}'
+        while True:
+            conn, reused = self._get_conn()
+            try:
+                conn.request(method, target, body=body, headers=headers or {})
+                response = conn.getresponse()
+            except _STALE_CONNECTION_ERRORS:
+                conn.close()
+                if reused and _is_replayable(body):
+                    continue
+                raise
+            except BaseException:
+                conn.close()
+                raise
+            return _PooledResponse(self, conn, response, url)
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, deque()
+        for conn, _ in idle:
+            conn.close()
+
+class _PoolManager:
+    '''Keeps one `_ConnectionPool` per scheme/host/port combination.'''
+    def __init__(self, maxsize = 10, idle_timeout = 30.0, timeout = socket._GLOBAL_DEFAULT_TIMEOUT):
+        self._maxsize = maxsize
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+        self._pools = {}
+        self._lock = threading.Lock()
+
+    @property
+    def maxsize(self):
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, val):
+        self._maxsize = val
+        with self._lock:
+            for pool in self._pools.values():
+                pool.maxsize = val
+
+    def _pool_for(self, scheme, host, port, ssl_context):
+        key = (scheme, host, port)
+        with self._lock:
+            pool = self._pools.get(key)
+            if pool is None:
+                pool = _ConnectionPool(scheme, host, port, maxsize=self._maxsize, idle_timeout=self.idle_timeout,
+                                       ssl_context=ssl_context, timeout=self.timeout, proxy=_get_proxy(scheme, host))
+                self._pools[key] = pool
+            return pool
+
+    def urlopen(self, method, url, body = None, headers = None, *, ssl_context = None) -> _PooledResponse:
+        redirects = 0
+        while True:
+            parsed = parse.urlsplit(url)
+            port = parsed.port or (443 if parsed.scheme == 'https' else 80)
+            pool = self._pool_for(parsed.scheme, parsed.hostname, port, ssl_context)
+            response = pool.urlopen(method, url, body, headers)
+            location = _redirect_location(method, response.status, response.headers, url)
+            if location is None or redirects == _MAX_REDIRECTS:
+                return response
+            # The body of the redirect is read so the connection can be reused
+            with response:
+                response.read()
+            url = location
+            redirects += 1
+
+    def clear(self):
+        '''Closes all idle connections and forgets all pools.'''
+        with self._lock:
+            pools, self._pools = self._pools, {}
+        for pool in pools.values():
+            pool.close()
+
+#
+# Supporting Functions
+#
+
+def _get_decoder(headers):
+    '''Returns a `_ContentDecoder` for the Content-Encoding of a response, or None if the body is not encoded.'''
+    encoding = (headers.get('Content-Encoding') or '').strip().lower()
+    if encoding in ('gzip', 'x-gzip', 'deflate'):
+        return _ContentDecoder('deflate' if encoding == 'deflate' else 'gzip')
+    return None
+
+def _redirect_location(method, status, headers, url):
+    '''Returns the absolute URL a GET or HEAD request to *url* is redirected to, or None if the 
+    response is not a redirect that is followed.'''
+    if method not in _REDIRECT_METHODS or status not in _REDIRECT_CODES:
+        return None
+    location = headers.get('Location')
+    if not location:
+        return None
+    return parse.urljoin(url, location)
+
+def _is_dropped(conn):
+    '''An idle connection that is readable has either been closed by the server or
+    has unexpected data pending. Either way it can't be reused.'''
+    sock = conn.sock
+    if sock is None:
+        return True
+    try:
+        readable, _, _ = select.select([sock], [], [], 0)
+    except (OSError, ValueError):
+        return True
+    return bool(readable)
+
+def _get_proxy(scheme, host):
+    '''Returns (host, port, headers) of the proxy configured in the environment for
+    *scheme*, matching the proxy handling of urllib, or None if a proxy is not used.'''
+    proxy_url = request.getproxies().get(scheme)
+    if not proxy_url or request.proxy_bypass(host):
+        return None
+    if '://' not in proxy_url:
+        proxy_url = f'http://{proxy_url}'
+    parsed = parse.urlsplit(proxy_url)
+    headers = {}
+    if parsed.username is not None:
+        creds = f'{parse.unquote(parsed.username)}:{parse.unquote(parsed.password or "")}'
+        headers['Proxy-Authorization'] = 'Basic %s' % b64encode(creds.encode('latin1')).decode('ascii')
+    return (parsed.hostname, parsed.port or 80, headers)
@@ -0,0 +1,97 @@
+# -------------------------------------------------------------------------
+# Copyright (c) PTC Inc. and/or all its affiliates. All rights reserved.
+# See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+r"""`disk_cache` provides the on-disk cache used by the `server` classes to apply a
+`DiskCache` setting to serialized structure reads.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+
+class _DiskStructureCache:
+    '''Stores serialized structure reads as JSON files named after a hash of the user, URL
+    and PROJECT_ID. A file is only used while Kepware reports the same PROJECT_ID, so an
+    entry never has to be invalidated; files of older projects are removed once more
+    than `max_files` are kept.'''
+    def __init__(self, config):
+        self.config = config
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._stores = 0
+
+    def _path(self, user, url, project_id):
+        digest = hashlib.sha256(f'{user}\n{url}\n{project_id}'.encode('utf-8')).hexdigest()
+        return os.path.join(self.config.directory, f'{digest}.json')
+
+    def load(self, user, url, project_id):
+        '''Returns the cached payload or None.'''
+        path = self._path(user, url, project_id)
+        try:
+            with open(path, 'rb') as f:
+                payload = json.loads(f.read())
+            os.utime(path)
+        except (OSError, ValueError):
+            payload = None
+        with self._lock:
+            if payload is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        return payload
+
+    def store(self, user, url, project_id, payload):
+        '''Writes the payload to a temporary file first so readers never see a partial file.
+        Failures to write are ignored since the cache is only an optimization.'''
+        path = self._path(user, url, project_id)
+        try:
+            os.makedirs(self.config.directory, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.config.directory, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(json.dumps(payload).encode('utf-8'))
+                os.replace(tmp, path)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+        except OSError:
+            return
+        with self._lock:
+            self._stores += 1
+        self._prune()
+
+    def clear(self):
+        '''Removes all files, used when the project is replaced since a new project could be reported 
+        with the PROJECT_ID of a stored one.'''
+        try:
+            for entry in os.scandir(self.config.directory):
+                if entry.name.endswith('.json') and entry.is_file():
+                    os.unlink(entry.path)
+        except OSError:
+            pass
+
+    def _prune(self):
+        try:
+            entries = []
+            for entry in os.scandir(self.config.directory):
+                if entry.name.endswith('.json') and entry.is_file():
+                    entries.append((entry.stat().st_mtime, entry.path))
+            entries.sort()
+            for _, path in entries[:max(0, len(entries) - self.config.max_files)]:
+                os.unlink(path)
+        except OSError:
+            pass
+
+    def as_dict(self) -> dict:
+        with self._lock:
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'stores': self._stores
+            }
@@ -0,0 +1,69 @@
+# -------------------------------------------------------------------------
+# Copyright (c) PTC Inc. and/or all its affiliates. All rights reserved.
+# See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+r"""`json_body` provides the request bodies used by the `server` classes to send large
+payloads without encoding them into one string first.
+"""
+
+import json
+
+_CHUNK_SIZE = 65536
+_encoder = json.JSONEncoder()
+
+def _chunks(pieces, chunk_size):
+    '''Joins the str *pieces* of an encoded document into UTF-8 chunks of about *chunk_size* bytes.'''
+    buf = []
+    size = 0
+    for piece in pieces:
+        buf.append(piece)
+        size += len(piece)
+        if size >= chunk_size:
+            yield ''.join(buf).encode('utf-8')
+            buf = []
+            size = 0
+    if buf:
+        yield ''.join(buf).encode('utf-8')
+
+class _JsonBody:
+    '''Request body that encodes *data* in chunks every time it is iterated, so it can be sent
+    again by retries. It is sent with chunked encoding, so it is only encoded once per attempt. 
+    The encoded size is known once it has been sent.'''
+    def __init__(self, data, chunk_size = _CHUNK_SIZE):
+        self.data = data
+        self.chunk_size = chunk_size
+        self._length = None
+
+    def __iter__(self):
+        size = 0
+        for chunk in _chunks(_encoder.iterencode(self.data), self.chunk_size):
+            size += len(chunk)
+            yield chunk
+        self._length = size
+
+def _iter_json_array(items, chunk_size = _CHUNK_SIZE):
+    '''Generator of the chunks of a JSON array of *items*, an iterable that is consumed as the
+    body is sent. Sent with chunked encoding and can't be sent again.'''
+    def pieces():
+        yield '['
+        first = True
+        for item in items:
+            if not first:
+                yield ','
+            first = False
+            yield from _encoder.iterencode(item)
+        yield ']'
+    return _chunks(pieces(), chunk_size)
+
+def _encode_json(data, codec):
+    '''Request body for *data*. A dict or list is encoded at once with *codec*, any other iterable 
+    is sent as a JSON array that is encoded as the items are consumed.'''
+    if isinstance(data, (dict, list)):
+        return codec.encode(data)
+    return _iter_json_array(data)
+
+def _is_replayable(body):
+    '''True if *body* can be sent again after a failed attempt.'''
+    return body is None or isinstance(body, (bytes, bytearray, str, _JsonBody))
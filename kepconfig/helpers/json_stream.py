@@ -0,0 +1,319 @@
+# -------------------------------------------------------------------------
+# Copyright (c) PTC Inc. and/or all its affiliates. All rights reserved.
+# See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+r"""`json_stream` provides the incremental JSON parsing used by the `server` class to
+process large responses as they are received instead of loading the whole body, and
+the raw body iteration used to write responses directly to a file. The async versions
+are used the same way by the `AsyncServer` class.
+"""
+
+import asyncio
+import codecs
+import contextvars
+import http.client
+import itertools
+import json
+import re
+from json.decoder import scanstring
+from ..error import KepError, KepURLError
+
+# Set by the iter_all_* functions so the GET request made by the get_all_* call they wrap
+# returns a generator of the objects in the response instead of the decoded body.
+_stream_response = contextvars.ContextVar('kepconfig_stream_response', default=False)
+
+_CHUNK_SIZE = 65536
+# Number of objects decoded by the worker thread of `_aiter_response` before they are handed to the event loop
+_BATCH_SIZE = 256
+# Errors raised by the async transport while a body is read
+_ASYNC_READ_ERRORS = (OSError, EOFError, asyncio.TimeoutError, http.client.HTTPException)
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_decoder = json.JSONDecoder()
+
+class _JsonStreamParser:
+    '''Pull parser over an iterable of byte chunks. Only the text of the value being decoded
+    is kept in memory.
+
+    `items` yields the elements of a top level array. `tree` splits the document at every array 
+    of objects stored under a key without a `.` (Kepware collections such as `channels`, `devices`, 
+    `tags` or `tag_groups`, as opposed to properties which are namespaced) and yields a tuple of 
+    (path, collection, object) for every object once it is complete, without its collections. 
+    *path* is the tuple of the names of the objects it is nested in. Children are yielded before 
+    their parent and the document itself is yielded last with an empty path and a collection of None.
+    '''
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._text_decoder = codecs.getincrementaldecoder('utf-8-sig')()
+        self._buf = ''
+        self._pos = 0
+        self._eof = False
+
+    def _error(self, msg):
+        return json.JSONDecodeError(msg, self._buf, self._pos)
+
+    def _fill(self):
+        '''Reads more of the body. Returns False if the body has been read completely.'''
+        if self._eof:
+            return False
+        self._buf = self._buf[self._pos:]
+        self._pos = 0
+        for chunk in self._chunks:
+            text = self._text_decoder.decode(chunk)
+            if text:
+                self._buf += text
+                return True
+        self._buf += self._text_decoder.decode(b'', True)
+        self._eof = True
+        return True
+
+    def _peek(self):
+        '''Skips whitespace and returns the next character, or an empty string at the end of the body.'''
+        while True:
+            self._pos = _WHITESPACE.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ''
+
+    def _expect(self, chars, msg):
+        c = self._peek()
+        if c not in chars or c == '':
+            raise self._error(msg)
+        self._pos += 1
+        return c
+
+    def _leaf(self):
+        '''Decodes a complete value with the C accelerated decoder, reading more of the body until
+        the value is complete.'''
+        self._peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # A number at the end of the buffer may continue in the next chunk
+            if end == len(self._buf) and not self._eof:
+                self._fill()
+                continue
+            self._pos = end
+            return value
+
+    def _string(self):
+        while True:
+            try:
+                value, end = scanstring(self._buf, self._pos + 1, True)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            self._pos = end
+            return value
+
+    def _object(self, path):
+        '''Parses an object, yielding the objects of its collections. Returns the object.'''
+        self._pos += 1
+        obj = {}
+        c = self._peek()
+        if c == '}':
+            self._pos += 1
+            return obj
+        while True:
+            if c != '"':
+                raise self._error('Expecting property name enclosed in double quotes')
+            key = self._string()
+            self._expect(':', "Expecting ':' delimiter")
+            c = self._peek()
+            if c == '[' and '.' not in key:
+                self._pos += 1
+                if self._peek() == '{':
+                    name = obj.get('common.ALLTYPES_NAME')
+                    yield from self._collection(key, path if name is None else path + (name,))
+                else:
+                    obj[key] = self._array_rest()
+            elif c == '{':
+                obj[key] = yield from self._tree_object(path)
+            else:
+                obj[key] = self._leaf()
+            if self._expect(',}', "Expecting ',' delimiter") == '}':
+                return obj
+            c = self._peek()
+
+    def _collection(self, key, path):
+        '''Yields the objects of an array of objects. The opening bracket has been read.'''
+        while True:
+            if self._peek() == '{':
+                item = yield from self._tree_object(path)
+            else:
+                item = self._leaf()
+            yield path, key, item
+            if self._expect(',]', "Expecting ',' delimiter") == ']':
+                return
+
+    def _tree_object(self, path):
+        '''Parses an object, yielding the objects of its collections. Objects that are already 
+        buffered completely, such as tags, are decoded at once and split afterwards.'''
+        try:
+            obj, end = _decoder.raw_decode(self._buf, self._pos)
+        except json.JSONDecodeError:
+            return (yield from self._object(path))
+        self._pos = end
+        yield from _split(obj, path)
+        return obj
+
+    def _array_rest(self):
+        '''Decodes an array. The opening bracket has been read.'''
+        items = []
+        if self._peek() == ']':
+            self._pos += 1
+            return items
+        while True:
+            items.append(self._leaf())
+            if self._expect(',]', "Expecting ',' delimiter") == ']':
+                return items
+
+    def _end(self):
+        if self._peek() != '':
+            raise self._error('Extra data')
+
+    def items(self):
+        if self._peek() != '[':
+            yield self._leaf()
+            self._end()
+            return
+        self._pos += 1
+        if self._peek() == ']':
+            self._pos += 1
+        else:
+            while True:
+                yield self._leaf()
+                if self._expect(',]', "Expecting ',' delimiter") == ']':
+                    break
+        self._end()
+
+    def tree(self):
+        c = self._peek()
+        if c == '{':
+            root = yield from self._tree_object(())
+            yield (), None, root
+        elif c == '[':
+            self._pos += 1
+            if self._peek() == ']':
+                self._pos += 1
+            else:
+                yield from self._collection(None, ())
+        else:
+            yield (), None, self._leaf()
+        self._end()
+
+def _iter_body(response, chunk_size = _CHUNK_SIZE):
+    '''Generator of the raw chunks of the body of a pooled *response*, without a UTF-8 byte order 
+    mark. The connection is released once the body has been read or the generator is closed.'''
+    try:
+        first = True
+        while True:
+            try:
+                chunk = response.read(chunk_size)
+            except (OSError, http.client.HTTPException) as err:
+                raise KepURLError(msg=err, url=response.url)
+            if not chunk:
+                return
+            if first:
+                chunk = chunk[len(codecs.BOM_UTF8):] if chunk.startswith(codecs.BOM_UTF8) else chunk
+                first = False
+            yield chunk
+    finally:
+        response.release()
+
+def _split(obj, path):
+    '''Removes the collections of a decoded object and yields their objects the same way as 
+    `_JsonStreamParser.tree`.'''
+    name = obj.get('common.ALLTYPES_NAME')
+    child_path = path if name is None else path + (name,)
+    for key, value in list(obj.items()):
+        if isinstance(value, dict):
+            yield from _split(value, path)
+        elif isinstance(value, list) and value and isinstance(value[0], dict) and '.' not in key:
+            del obj[key]
+            for item in value:
+                if isinstance(item, dict):
+                    yield from _split(item, child_path)
+                yield child_path, key, item
+
+def _iter_response(response, tree = False):
+    '''Generator of the objects in the body of a pooled *response*, see `_JsonStreamParser`. The 
+    connection is released once the body has been read or the generator is closed.'''
+    def chunks():
+        while True:
+            try:
+                chunk = response.read(_CHUNK_SIZE)
+            except (OSError, http.client.HTTPException) as err:
+                raise KepURLError(msg=err, url=response.url)
+            if not chunk:
+                return
+            yield chunk
+    try:
+        yield from _parse(chunks(), response.url, tree)
+    finally:
+        response.release()
+
+async def _aiter_body(response, chunk_size = _CHUNK_SIZE):
+    '''Async version of `_iter_body` for a streamed response of the async pool.'''
+    try:
+        first = True
+        while True:
+            try:
+                chunk = await response.read(chunk_size)
+            except _ASYNC_READ_ERRORS as err:
+                raise KepURLError(msg=err, url=response.url)
+            if not chunk:
+                return
+            if first:
+                chunk = chunk[len(codecs.BOM_UTF8):] if chunk.startswith(codecs.BOM_UTF8) else chunk
+                first = False
+            yield chunk
+    finally:
+        response.release()
+
+async def _aiter_response(response, tree = False):
+    '''Async version of `_iter_response` for a streamed response of the async pool. The parser runs in 
+    a worker thread that reads the body through the event loop, so the body is received and decoded 
+    as the objects are consumed without blocking the loop.'''
+    loop = asyncio.get_running_loop()
+    def chunks():
+        while True:
+            try:
+                chunk = asyncio.run_coroutine_threadsafe(response.read(_CHUNK_SIZE), loop).result()
+            except _ASYNC_READ_ERRORS as err:
+                raise KepURLError(msg=err, url=response.url)
+            if not chunk:
+                return
+            yield chunk
+    objects = _parse(chunks(), response.url, tree)
+    batch = None
+    try:
+        while True:
+            batch = loop.run_in_executor(None, lambda: list(itertools.islice(objects, _BATCH_SIZE)))
+            items = await batch
+            for item in items:
+                yield item
+            if len(items) < _BATCH_SIZE:
+                return
+    finally:
+        if batch is not None and not batch.done():
+            # Reads of a released response return nothing, so the worker thread stops
+            response.release()
+            await asyncio.wait([batch])
+        objects.close()
+        response.release()
+
+def _parse(chunks, url, tree = False):
+    '''Generator of the objects in the JSON document made of *chunks*, see `_JsonStreamParser`.'''
+    parser = _JsonStreamParser(chunks)
+    try:
+        yield from (parser.tree() if tree else parser.items())
+    except ValueError as err:
+        raise KepError(f'Error: Invalid JSON in response from {url} | {err}')
@@ -0,0 +1,69 @@
+# -------------------------------------------------------------------------
+# Copyright (c) PTC Inc. and/or all its affiliates. All rights reserved.
+# See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+r"""`project_id` provides the PROJECT_ID tracking used by the `server` classes to
+fill in the PROJECT_ID of modify calls without reading the project properties
+before every call.
+"""
+
+import contextvars
+import threading
+
+# The DATA dict of the modify call in progress whose PROJECT_ID was filled in by the tracker.
+# A context variable keeps concurrent threads and asyncio tasks apart.
+_autofilled = contextvars.ContextVar('kepconfig_autofilled', default=None)
+
+class _ProjectIdTracker:
+    '''Keeps the last PROJECT_ID reported by Kepware. Any response that returns a PROJECT_ID 
+    refreshes it. Kepware increments the PROJECT_ID with every change, so a successful write that 
+    doesn't report the new PROJECT_ID advances it by one. A modify rejected because the PROJECT_ID 
+    is outdated anyway, such as after a change by another client, reads the current one and is sent again.'''
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._project_id = None
+        self._hits = 0
+        self._refreshes = 0
+        self._conflicts = 0
+
+    def get(self):
+        with self._lock:
+            if self._project_id is not None:
+                self._hits += 1
+            return self._project_id
+
+    def set(self, project_id):
+        with self._lock:
+            self._project_id = project_id
+
+    def note_refresh(self):
+        with self._lock:
+            self._refreshes += 1
+
+    def note_conflict(self):
+        with self._lock:
+            self._conflicts += 1
+
+    def note_response(self, payload):
+        project_id = payload.get('PROJECT_ID') if isinstance(payload, dict) else None
+        if project_id is not None:
+            with self._lock:
+                self._project_id = project_id
+
+    def note_write(self, payload):
+        if isinstance(payload, dict) and payload.get('PROJECT_ID') is not None:
+            return
+        with self._lock:
+            if isinstance(self._project_id, int):
+                self._project_id += 1
+
+    def as_dict(self) -> dict:
+        with self._lock:
+            return {
+                'project_id': self._project_id,
+                'hits': self._hits,
+                'refreshes': self._refreshes,
+                'conflicts': self._conflicts
+            }
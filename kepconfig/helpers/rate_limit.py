@@ -0,0 +1,73 @@
+# -------------------------------------------------------------------------
+# Copyright (c) PTC Inc. and/or all its affiliates. All rights reserved.
+# See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+r"""`rate_limit` provides the token bucket and concurrency limits used by the `server`
+classes to apply a `RateLimit` to the requests they send.
+"""
+
+import asyncio
+import threading
+import time
+
+class _TokenBucket:
+    '''Thread safe token bucket. Callers reserve a token and wait for the returned delay,
+    so concurrent callers are spaced out in the order they arrived.'''
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        '''Takes a token and returns the number of seconds to wait before it can be used.'''
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+class _RequestLimiter:
+    '''Applies a `RateLimit` to requests. Use `acquire`/`release` around a request from threads
+    and `acquire_async`/`release_async` from coroutines.'''
+    def __init__(self, limit):
+        self.limit = limit
+        self._bucket = _TokenBucket(limit.rate, limit.burst) if limit.rate is not None else None
+        self._semaphore = threading.BoundedSemaphore(limit.max_concurrent) if limit.max_concurrent is not None else None
+        # asyncio semaphores can only be used by the loop they were first used on
+        self._async_semaphore = None
+        self._loop = None
+
+    def acquire(self):
+        if self._bucket is not None:
+            delay = self._bucket.reserve()
+            if delay > 0:
+                time.sleep(delay)
+        if self._semaphore is not None:
+            self._semaphore.acquire()
+
+    def release(self):
+        if self._semaphore is not None:
+            self._semaphore.release()
+
+    async def acquire_async(self):
+        if self._bucket is not None:
+            delay = self._bucket.reserve()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        if self.limit.max_concurrent is not None:
+            loop = asyncio.get_running_loop()
+            if self._loop is not loop:
+                self._loop = loop
+                self._async_semaphore = asyncio.Semaphore(self.limit.max_concurrent)
+            await self._async_semaphore.acquire()
+
+    def release_async(self):
+        if self._async_semaphore is not None:
+            self._async_semaphore.release()
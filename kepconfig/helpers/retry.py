@@ -0,0 +1,67 @@
+# -------------------------------------------------------------------------
+# Copyright (c) PTC Inc. and/or all its affiliates. All rights reserved.
+# See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+r"""`retry` provides the bookkeeping used by the `server` classes to retry requests
+that Kepware rejects as too busy (HTTP 429).
+"""
+
+import datetime
+import threading
+from email.utils import parsedate_to_datetime
+
+class _RetryStats:
+    '''Thread safe counters of the retries done by a server instance.'''
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._retried_requests = 0
+            self._retries = 0
+            self._exhausted = 0
+            self._wait_time = 0.0
+
+    def record_retry(self, attempt, delay):
+        with self._lock:
+            if attempt == 1:
+                self._retried_requests += 1
+            self._retries += 1
+            self._wait_time += delay
+
+    def record_exhausted(self):
+        with self._lock:
+            self._exhausted += 1
+
+    def as_dict(self) -> dict:
+        with self._lock:
+            return {
+                'retried_requests': self._retried_requests,
+                'retries': self._retries,
+                'exhausted': self._exhausted,
+                'wait_time': self._wait_time
+            }
+
+def _parse_retry_after(hdrs):
+    '''Returns the delay in seconds requested by a `Retry-After` header, which is either a number
+    of seconds or an HTTP date, or None if the header is missing or invalid.'''
+    if hdrs is None:
+        return None
+    value = hdrs.get('Retry-After')
+    if value is None:
+        return None
+    value = value.strip()
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=datetime.timezone.utc)
+    return max((date - datetime.datetime.now(datetime.timezone.utc)).total_seconds(), 0.0)
@@ -0,0 +1,96 @@
+# -------------------------------------------------------------------------
+# Copyright (c) PTC Inc. and/or all its affiliates. All rights reserved.
+# See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+r"""`singleflight` provides the coalescing of concurrent identical GET requests used by
+the `server` classes when `coalesce_reads` is enabled.
+"""
+
+import asyncio
+import copy
+import threading
+
+class _Flight:
+    '''A request in flight and the callers waiting for its result.'''
+    def __init__(self):
+        self.done = threading.Event()
+        self.task = None
+        self.waiters = 0
+        self.result = None
+        self.error = None
+
+class _SingleFlight:
+    '''Runs one request per key at a time; callers asking for a key that is already in
+    flight wait for that request and get a copy of its result. Every caller gets its own
+    copy since results are mutable and callers are free to change them.
+
+    Requests that start after `invalidate` is called (after a write) don't join requests
+    started before, so a read following a write always reflects the write.'''
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights = {}
+        self._generation = 0
+        self._requests = 0
+        self._coalesced = 0
+
+    def invalidate(self):
+        with self._lock:
+            self._generation += 1
+
+    def _join(self, key):
+        '''Returns (flight, key, leader).'''
+        with self._lock:
+            key = (self._generation, key)
+            flight = self._flights.get(key)
+            if flight is None:
+                flight = self._flights[key] = _Flight()
+                self._requests += 1
+                return flight, key, True
+            flight.waiters += 1
+            self._coalesced += 1
+            return flight, key, False
+
+    def _leave(self, key):
+        with self._lock:
+            del self._flights[key]
+
+    def do(self, key, fn):
+        flight, key, leader = self._join(key)
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return copy.deepcopy(flight.result)
+        try:
+            flight.result = fn()
+        except BaseException as err:
+            flight.error = err
+            raise
+        finally:
+            self._leave(key)
+            # No one can join anymore, keep the original for the waiters to copy
+            result = copy.deepcopy(flight.result) if flight.waiters and flight.error is None else flight.result
+            flight.done.set()
+        return result
+
+    async def do_async(self, key, fn):
+        flight, key, leader = self._join(key)
+        if leader:
+            async def run():
+                try:
+                    return await fn()
+                finally:
+                    self._leave(key)
+            flight.task = asyncio.ensure_future(run())
+        # Shielded so a cancelled caller doesn't cancel the request for the other callers
+        result = await asyncio.shield(flight.task)
+        return copy.deepcopy(result) if flight.waiters else result
+
+    def as_dict(self) -> dict:
+        with self._lock:
+            return {
+                'requests': self._requests,
+                'coalesced': self._coalesced
+            }
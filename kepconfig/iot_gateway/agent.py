@@ -10,12 +10,13 @@ Iot Gateway agent objects within the Kepware Configuration API
 """
 
 # from .. import connection 
-from typing import Union
+from typing import Union, Iterator
 from ..connection import server
 from .. import iot_gateway as IOT
 from ..error import KepError, KepHTTPError
 import inspect
-from ..utils import _url_parse_object
+from ..utils import _url_parse_object, _add_result, _multi_status_data, _iter_pages
+from ..tracing import _traced
 
 IOT_ROOT_URL = '/project/_iot_gateway'
 MQTT_CLIENT_URL = '/mqtt_clients'
@@ -54,7 +55,8 @@ def _create_url(agent_type, agent = None):
             pass
 
 
-def add_iot_agent(server: server, DATA: Union[dict, list], agent_type: str = None) -> Union[bool, list]:
+@_traced
+def add_iot_agent(server: server, DATA: Union[dict, list], agent_type: str = None, *, multi_status: bool = False) -> Union[bool, list]:
     '''Add a  `"agent"` or multiple `"agent"` objects of a specific type to Kepware's IoT Gateway. Can be used to pass children of an
     agent object such as iot items. This allows you to create an agent and iot items if desired. Multiple Agents need to be of the 
     same type.
@@ -66,6 +68,8 @@ def add_iot_agent(server: server, DATA: Union[dict, list], agent_type: str = Non
     expected by Kepware Configuration API
     :param agent_type: *(optional)* agent type to add to IoT Gateway. Only needed if not existing in `"DATA"`. Valid values are 
     `MQTT Client`, `REST Client` or `REST Server`
+    :param multi_status: *(optional)* If True, returns a `MultiStatusResult` with the status of every object instead of 
+    True or the list of failures. (default= False)
 
     :return: True - If a "HTTP 201 - Created" is received from Kepware server
     :return: If a "HTTP 207 - Multi-Status" is received from Kepware with a list of dict error responses for all 
@@ -84,16 +88,11 @@ def add_iot_agent(server: server, DATA: Union[dict, list], agent_type: str = Non
             err_msg = 'Error: No agent identified in DATA | Key Error: {}'.format(err)
             raise KepError(err_msg)
     
+    DATA = _multi_status_data(DATA, multi_status)
     r = server._config_add(server.url + _create_url(agent_type), DATA)
-    if r.code == 201: return True 
-    elif r.code == 207:
-        errors = [] 
-        for item in r.payload:
-            if item['code'] != 201:
-                errors.append(item)
-        return errors
-    else: raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+    return _add_result(r, DATA, multi_status, lambda items: add_iot_agent(server, items, agent_type, multi_status= True))
 
+@_traced
 def del_iot_agent(server: server, agent: str, agent_type: str) -> bool:
     '''Delete a `"agent"` object in Kepware. This will delete all children as well
     
@@ -109,8 +108,9 @@ def del_iot_agent(server: server, agent: str, agent_type: str) -> bool:
     '''
     r = server._config_del(server.url + _create_url(agent_type, agent))
     if r.code == 200: return True 
-    else: raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+    else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
 
+@_traced
 def modify_iot_agent(server: server, DATA: dict, *, agent: str = None, agent_type: str = None, force: bool = False) -> bool:
     '''Modify a `"agent"` object and it's properties in Kepware. If a `"agent"` is not provided as an input,
     you need to identify the agent in the *'common.ALLTYPES_NAME'* property field in the `"DATA"`. It will 
@@ -141,15 +141,16 @@ def modify_iot_agent(server: server, DATA: dict, *, agent: str = None, agent_typ
         try:
             r = server._config_update(server.url + _create_url(agent_type, agent_data['common.ALLTYPES_NAME']), agent_data)
             if r.code == 200: return True 
-            else: raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+            else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
         except KeyError as err:
             err_msg = 'Error: No agent identified in DATA | Key Error: {}'.format(err)
             raise KepError(err_msg)
     else:
         r = server._config_update(server.url + _create_url(agent_type, agent), agent_data)
         if r.code == 200: return True 
-        else: raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+        else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
 
+@_traced
 def get_iot_agent(server: server, agent: str, agent_type: str) -> dict:
     '''Returns the properties of the `"agent"` object.
     
@@ -166,6 +167,7 @@ def get_iot_agent(server: server, agent: str, agent_type: str) -> dict:
     r = server._config_get(server.url + _create_url(agent_type, agent))
     return r.payload
 
+@_traced
 def get_all_iot_agents(server: server, agent_type: str, *, options: dict = None) -> list:
     '''Returns the properties of all `"agent"` objects for a specific agent type. Returned object is JSON list.
     
@@ -181,3 +183,23 @@ def get_all_iot_agents(server: server, agent_type: str, *, options: dict = None)
     '''
     r = server._config_get(f'{server.url}{_create_url(agent_type)}', params= options)
     return r.payload
+
+def iter_all_iot_agents(server: server, agent_type: str, *, options: dict = None, page_size: int = 100, prefetch: bool = True) -> Iterator[dict]:
+    '''Returns a generator of all `"IoT agent"` objects and their properties. The IoT agents are read from Kepware 
+    one page at a time and the next page is requested while the current page is processed, so large 
+    collections don't have to be held in memory.
+
+    :param server: instance of the `server` class
+    :param agent_type: agent type. Valid values are `MQTT Client`, `REST Client` or `REST Server`
+    :param options: *(optional)* Dict of parameters to filter or sort the list of IoT agents. Options are `filter`, 
+        `sortOrder` and `sortProperty`. `pageNumber` sets the first page to read
+    :param page_size: *(optional)* Number of IoT agents read per request, or None to read all IoT agents with one 
+        request that is parsed as it is received (default= 100)
+    :param prefetch: *(optional)* Request the next page while the current page is processed (default= True)
+
+    :return: Generator of the data for each IoT agent
+
+    :raises KepHTTPError: If urllib provides an HTTPError
+    :raises KepURLError: If urllib provides an URLError
+    '''
+    return _iter_pages(lambda o: get_all_iot_agents(server, agent_type, options= o), options, page_size, prefetch)
@@ -9,12 +9,13 @@ r"""`iot_items` exposes an API to allow modifications (add, delete, modify) to
 iot_items objects within the Kepware Configuration API
 """
 
-from typing import Union
+from typing import Union, Iterator
 from .. import utils
 from ..connection import server
 from .. import iot_gateway as IOT
 from ..error import KepError, KepHTTPError
-from ..utils import _url_parse_object
+from ..utils import _url_parse_object, _add_result, _multi_status_data, _iter_pages
+from ..tracing import _traced
 
 IOT_ITEMS_ROOT = '/iot_items'
 
@@ -31,7 +32,8 @@ def _create_url(tag = None):
         return '{}/{}'.format(IOT_ITEMS_ROOT, _url_parse_object(normalized_tag))
 
 
-def add_iot_item(server: server, DATA: Union[dict, list], agent: str, agent_type: str) -> Union[bool, list]:
+@_traced
+def add_iot_item(server: server, DATA: Union[dict, list], agent: str, agent_type: str, *, multi_status: bool = False) -> Union[bool, list]:
     '''Add a `"iot item"` or multiple `"iot item"` objects to Kepware's IoT Gateway agent. Additionally 
     it can be used to pass a list of iot items to be added to an agent all at once.
 
@@ -40,6 +42,8 @@ def add_iot_item(server: server, DATA: Union[dict, list], agent: str, agent_type
     expected by Kepware Configuration API
     :param agent: name of IoT Agent
     :param agent_type: agent type. Valid values are `MQTT Client`, `REST Client` or `REST Server`
+    :param multi_status: *(optional)* If True, returns a `MultiStatusResult` with the status of every object instead of 
+    True or the list of failures. (default= False)
 
     :return: True - If a "HTTP 201 - Created" is received from Kepware server
     :return: If a "HTTP 207 - Multi-Status" is received from Kepware with a list of dict error responses for all 
@@ -48,16 +52,11 @@ def add_iot_item(server: server, DATA: Union[dict, list], agent: str, agent_type
     :raises KepHTTPError: If urllib provides an HTTPError
     :raises KepURLError: If urllib provides an URLError
     '''
+    DATA = _multi_status_data(DATA, multi_status)
     r = server._config_add(server.url + IOT.agent._create_url(agent_type, agent) + _create_url(), DATA)
-    if r.code == 201: return True
-    elif r.code == 207:
-            errors = [] 
-            for item in r.payload:
-                if item['code'] != 201:
-                    errors.append(item)
-            return errors 
-    else: raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+    return _add_result(r, DATA, multi_status, lambda items: add_iot_item(server, items, agent, agent_type, multi_status= True))
 
+@_traced
 def del_iot_item(server: server, iot_item: str, agent: str, agent_type: str) -> bool:
     '''Delete an `"iot item"` object in Kepware.
 
@@ -73,8 +72,9 @@ def del_iot_item(server: server, iot_item: str, agent: str, agent_type: str) ->
     '''
     r = server._config_del(server.url + IOT.agent._create_url(agent_type, agent) + _create_url(iot_item))
     if r.code == 200: return True 
-    else: raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+    else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
 
+@_traced
 def modify_iot_item(server: server, DATA: dict, agent: str, agent_type: str, *, iot_item: str = None, force: bool = False) -> bool:
     '''Modify an `"iot item"` object and it's properties in Kepware. If a `"iot item"` is not provided as an input,
     you need to identify the iot item in the *'common.ALLTYPES_NAME'* property field in the `"DATA"`. It will 
@@ -98,15 +98,16 @@ def modify_iot_item(server: server, DATA: dict, agent: str, agent_type: str, *,
         try:
             r = server._config_update(server.url + IOT.agent._create_url(agent_type, agent) + _create_url(agent_data['common.ALLTYPES_NAME']), agent_data)
             if r.code == 200: return True 
-            else: raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+            else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
         except KeyError as err:
             err_msg = 'Error: No agent identified in DATA | Key Error: {}'.format(err)
             raise KepError(err_msg)
     else:
         r = server._config_update(server.url + IOT.agent._create_url(agent_type, agent) + _create_url(iot_item), agent_data)
         if r.code == 200: return True 
-        else: raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+        else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
 
+@_traced
 def get_iot_item(server: server, iot_item: str, agent: str, agent_type: str)-> dict:
     '''Returns the properties of the `"iot item"` object.
 
@@ -123,6 +124,7 @@ def get_iot_item(server: server, iot_item: str, agent: str, agent_type: str)-> d
     r = server._config_get(server.url + IOT.agent._create_url(agent_type, agent) + _create_url(iot_item))
     return r.payload
 
+@_traced
 def get_all_iot_items(server: server, agent: str, agent_type: str, *, options: dict = None) -> list:
     '''Returns the properties of all `"iot item"` objects for an agent.
     
@@ -139,4 +141,25 @@ def get_all_iot_items(server: server, agent: str, agent_type: str, *, options: d
     :raises KepURLError: If urllib provides an URLError
     '''
     r = server._config_get(f'{server.url}{IOT.agent._create_url(agent_type, agent)}{_create_url()}', params= options)
-    return r.payload
\ No newline at end of file
+    return r.payload
+
+def iter_all_iot_items(server: server, agent: str, agent_type: str, *, options: dict = None, page_size: int = 100, prefetch: bool = True) -> Iterator[dict]:
+    '''Returns a generator of all `"IoT item"` objects and their properties. The IoT items are read from Kepware 
+    one page at a time and the next page is requested while the current page is processed, so large 
+    collections don't have to be held in memory.
+
+    :param server: instance of the `server` class
+    :param agent: name of IoT Agent
+    :param agent_type: agent type. Valid values are `MQTT Client`, `REST Client` or `REST Server`
+    :param options: *(optional)* Dict of parameters to filter or sort the list of IoT items. Options are `filter`, 
+        `sortOrder` and `sortProperty`. `pageNumber` sets the first page to read
+    :param page_size: *(optional)* Number of IoT items read per request, or None to read all IoT items with one 
+        request that is parsed as it is received (default= 100)
+    :param prefetch: *(optional)* Request the next page while the current page is processed (default= True)
+
+    :return: Generator of the data for each IoT item
+
+    :raises KepHTTPError: If urllib provides an HTTPError
+    :raises KepURLError: If urllib provides an URLError
+    '''
+    return _iter_pages(lambda o: get_all_iot_items(server, agent, agent_type, options= o), options, page_size, prefetch)
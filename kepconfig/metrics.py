@@ -0,0 +1,156 @@
+# -------------------------------------------------------------------------
+# Copyright (c) PTC Inc. and/or all its affiliates. All rights reserved.
+# See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+r"""`metrics` provides the `MetricsRegistry` class that records the requests sent by
+`server` instances. Assign an instance to `server.metrics` to enable it.
+
+Requests are grouped by HTTP method and endpoint template, which is the path of the request
+below the version of the Configuration API with object names replaced by `{name}`, such as
+`/project/channels/{name}/devices/{name}/tags`.
+"""
+
+import threading
+from urllib import parse
+
+# Upper bounds of the latency histogram buckets in seconds
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Path segments that are followed by another collection or a service instead of an object name
+_NAMESPACES = {'project', 'admin', 'services'}
+
+class _EndpointMetrics:
+    '''Counters for one method and endpoint template.'''
+    def __init__(self, bucket_count):
+        self.codes = {}
+        self.buckets = [0] * bucket_count
+        self.count = 0
+        self.duration = 0.0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.retries = 0
+
+class MetricsRegistry:
+    '''A class to represent a registry of metrics for the requests sent to Kepware. For every HTTP method
+    and endpoint template the registry counts the requests by status code, retries, bytes sent and received,
+    and keeps a histogram of the request latency. One registry can be shared by several `server` instances.
+
+    :param buckets: *(optional)* Upper bounds in seconds of the latency histogram buckets (default= `DEFAULT_BUCKETS`)
+
+    **Methods**
+
+    :meth:`as_dict` - return the recorded metrics as a dict
+
+    :meth:`to_openmetrics` - return the recorded metrics in OpenMetrics text format
+
+    :meth:`reset` - drop all recorded metrics
+    '''
+    def __init__(self, buckets: tuple = DEFAULT_BUCKETS):
+        if not buckets or list(buckets) != sorted(buckets):
+            raise ValueError('buckets must be a non-empty sorted sequence')
+        self.buckets = tuple(float(b) for b in buckets)
+        self._endpoints = {}
+        self._lock = threading.Lock()
+
+    def record(self, info):
+        '''Records a completed or failed request described by a `RequestInfo`.'''
+        key = (info.method, info.endpoint)
+        code = 'error' if info.status is None else str(info.status)
+        with self._lock:
+            m = self._endpoints.get(key)
+            if m is None:
+                m = self._endpoints[key] = _EndpointMetrics(len(self.buckets))
+            m.codes[code] = m.codes.get(code, 0) + 1
+            m.count += 1
+            m.duration += info.duration
+            for i, bound in enumerate(self.buckets):
+                if info.duration <= bound:
+                    m.buckets[i] += 1
+                    break
+            m.request_bytes += info.request_bytes or 0
+            m.response_bytes += info.response_bytes or 0
+            if info.attempt > 1:
+                m.retries += 1
+
+    def as_dict(self) -> dict:
+        '''Returns the recorded metrics as a dict keyed by "METHOD endpoint". Each entry has the number of
+        `requests` by status code, `count`, total `duration` in seconds, `request_bytes`, `response_bytes`,
+        `retries` and the cumulative latency histogram `buckets` keyed by upper bound.'''
+        with self._lock:
+            result = {}
+            for (method, endpoint), m in sorted(self._endpoints.items()):
+                result[f'{method} {endpoint}'] = {
+                    'requests': dict(m.codes),
+                    'count': m.count,
+                    'duration': m.duration,
+                    'request_bytes': m.request_bytes,
+                    'response_bytes': m.response_bytes,
+                    'retries': m.retries,
+                    'buckets': dict(zip(self.buckets, _cumulative(m.buckets)))
+                }
+            return result
+
+    def to_openmetrics(self) -> str:
+        '''Returns the recorded metrics in OpenMetrics text format, ready to be served to a Prometheus scraper.'''
+        requests = ['# TYPE kepconfig_requests counter', '# HELP kepconfig_requests Requests sent to the Configuration API.']
+        retries = ['# TYPE kepconfig_request_retries counter', '# HELP kepconfig_request_retries Requests that were retries of a previous attempt.']
+        sent = ['# TYPE kepconfig_request_bytes counter', '# HELP kepconfig_request_bytes Bytes sent in request bodies.']
+        received = ['# TYPE kepconfig_response_bytes counter', '# HELP kepconfig_response_bytes Bytes received in response bodies.']
+        latency = ['# TYPE kepconfig_request_duration_seconds histogram', '# HELP kepconfig_request_duration_seconds Latency of requests.']
+        with self._lock:
+            for (method, endpoint), m in sorted(self._endpoints.items()):
+                labels = f'method="{_escape(method)}",endpoint="{_escape(endpoint)}"'
+                for code, count in sorted(m.codes.items()):
+                    requests.append(f'kepconfig_requests_total{{{labels},code="{code}"}} {count}')
+                retries.append(f'kepconfig_request_retries_total{{{labels}}} {m.retries}')
+                sent.append(f'kepconfig_request_bytes_total{{{labels}}} {m.request_bytes}')
+                received.append(f'kepconfig_response_bytes_total{{{labels}}} {m.response_bytes}')
+                for bound, count in zip(self.buckets, _cumulative(m.buckets)):
+                    latency.append(f'kepconfig_request_duration_seconds_bucket{{{labels},le="{bound}"}} {count}')
+                latency.append(f'kepconfig_request_duration_seconds_bucket{{{labels},le="+Inf"}} {m.count}')
+                latency.append(f'kepconfig_request_duration_seconds_count{{{labels}}} {m.count}')
+                latency.append(f'kepconfig_request_duration_seconds_sum{{{labels}}} {m.duration}')
+        return '\n'.join(requests + retries + sent + received + latency + ['# EOF']) + '\n'
+
+    def reset(self):
+        '''Drops all recorded metrics.'''
+        with self._lock:
+            self._endpoints = {}
+
+    def __str__(self):
+        return '{"buckets": %s}' % list(self.buckets)
+
+#
+# Supporting Functions
+#
+
+def _cumulative(counts):
+    total = 0
+    result = []
+    for count in counts:
+        total += count
+        result.append(total)
+    return result
+
+def _escape(value):
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def _endpoint_template(url) -> str:
+    '''Returns the path of *url* below the API version with object names replaced by `{name}`.'''
+    path = parse.urlsplit(url).path
+    segments = [s for s in path.split('/') if s]
+    if segments[:2] == ['config', 'v1']:
+        segments = segments[2:]
+    result = []
+    expect_name = False
+    for seg in segments:
+        if expect_name:
+            result.append('{name}')
+            expect_name = False
+            continue
+        result.append(seg)
+        # Collections are followed by the name of an object, namespaces such as _iot_gateway are not
+        expect_name = not (seg.startswith('_') or seg in _NAMESPACES)
+    return '/' + '/'.join(result)
@@ -8,6 +8,12 @@ r"""`structures` provides general data structures to help manage
 various objects for Kepware's configuration
 """
 from enum import Enum
+import asyncio
+import inspect
+import json
+import random
+import time
+from .error import KepHTTPError
 
 class KepServiceResponse:
     '''A class to represent a return object when calling a "service" API of Kepware. This is
@@ -47,11 +53,391 @@ class KepServiceStatus:
     def __str__(self):
         return '{"complete": %s, "status": %s, "message": %s}' % (self.complete, self.status, self.message)
 
+class RetryPolicy:
+    '''A class to represent the retry behavior of a `server` instance when Kepware responds that it is
+    too busy to process a request (HTTP 429). Retries apply to all configuration and service calls. 
+    Assign an instance to `server.retry_policy`, or None to disable retries.
+
+    The delay before retry *n* is `backoff_factor * 2 ** (n - 1)` seconds, limited to `max_backoff`. 
+    With `jitter` a random delay between zero and that value is used instead so that many 
+    clients don't retry in lock step. A `Retry-After` header sent by Kepware takes precedence 
+    over the calculated delay when `respect_retry_after` is True.
+
+    :param max_attempts: Total number of attempts for a request, including the first (Default: 3)
+
+    :param backoff_factor: Base delay in seconds (Default: 0.5)
+
+    :param max_backoff: Maximum delay in seconds between attempts (Default: 30.0)
+
+    :param jitter: Randomize the delay between attempts (Default: True)
+
+    :param respect_retry_after: Use the delay from a `Retry-After` header when provided (Default: True)
+
+    :param status_codes: HTTP codes that are retried (Default: (429,))
+    '''
+    def __init__(self, max_attempts: int = 3, backoff_factor: float = 0.5, max_backoff: float = 30.0, jitter: bool = True,
+                 respect_retry_after: bool = True, status_codes: tuple = (429,)):
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.respect_retry_after = respect_retry_after
+        self.status_codes = tuple(status_codes)
+
+    def is_retry(self, code: int, attempt: int) -> bool:
+        '''Returns True if a request that failed with HTTP *code* on attempt number *attempt* should be retried.'''
+        return code in self.status_codes and attempt < self.max_attempts
+
+    def get_backoff(self, attempt: int, retry_after: float = None) -> float:
+        '''Returns the delay in seconds before the next attempt after attempt number *attempt* failed.
+
+        :param attempt: number of the attempt that failed, starting at 1
+        :param retry_after: *(optional)* delay in seconds requested by the server
+        '''
+        if retry_after is not None and self.respect_retry_after:
+            return min(max(retry_after, 0.0), self.max_backoff)
+        delay = min(self.backoff_factor * (2 ** (attempt - 1)), self.max_backoff)
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+    def __str__(self):
+        return '{"max_attempts": %s, "backoff_factor": %s, "max_backoff": %s, "jitter": %s, "respect_retry_after": %s, "status_codes": %s}' % (
+            self.max_attempts, self.backoff_factor, self.max_backoff, self.jitter, self.respect_retry_after, list(self.status_codes))
+
+class RateLimit:
+    '''A class to represent a client side limit on the requests a `server` instance sends to Kepware. 
+    Assign an instance to `server.read_limit` (GET requests) or `server.write_limit` (POST, PUT and 
+    DELETE requests). The limit is shared by every thread or task using the `server` instance.
+
+    :param rate: Maximum sustained number of requests per second, or None for no rate limit (Default: None)
+
+    :param burst: Number of requests that can be sent at once before `rate` applies. Defaults to 
+        `rate` rounded up, with a minimum of 1 (Default: None)
+
+    :param max_concurrent: Maximum number of requests in flight at once, or None for no limit (Default: None)
+    '''
+    def __init__(self, rate: float = None, burst: int = None, max_concurrent: int = None):
+        if rate is not None and rate <= 0:
+            raise ValueError('rate must be greater than 0')
+        if max_concurrent is not None and max_concurrent < 1:
+            raise ValueError('max_concurrent must be at least 1')
+        self.rate = rate
+        if burst is None and rate is not None:
+            burst = max(1, int(-(-rate // 1)))
+        self.burst = burst
+        self.max_concurrent = max_concurrent
+
+    def __str__(self):
+        return '{"rate": %s, "burst": %s, "max_concurrent": %s}' % (self.rate, self.burst, self.max_concurrent)
+
+class AdaptiveConcurrency:
+    '''A class to represent an adaptive limit on the number of requests a `server` instance has in 
+    flight. Assign an instance to `server.adaptive_concurrency` to enable it.
+
+    The window of requests in flight is increased by about one for every window's worth of 
+    successful requests (additive increase) and multiplied by `decrease_factor` when a request is 
+    rejected as too busy, times out, or takes longer than `latency_tolerance` times the average 
+    latency of requests with the same method, endpoint and requested content (multiplicative decrease). 
+    The current window is available in `server.adaptive_stats`.
+
+    :param initial_limit: Window of requests in flight to start with (Default: 4)
+
+    :param min_limit: Smallest window (Default: 1)
+
+    :param max_limit: Largest window (Default: 64)
+
+    :param decrease_factor: Factor applied to the window on overload (Default: 0.5)
+
+    :param latency_tolerance: A request slower than this multiple of the average latency of the same 
+        endpoint is treated as overload (Default: 2.0)
+
+    :param overload_codes: HTTP codes treated as overload (Default: (429, 503))
+    '''
+    def __init__(self, initial_limit: int = 4, min_limit: int = 1, max_limit: int = 64, decrease_factor: float = 0.5,
+                 latency_tolerance: float = 2.0, overload_codes: tuple = (429, 503)):
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError('limits must satisfy 1 <= min_limit <= initial_limit <= max_limit')
+        if not 0 < decrease_factor < 1:
+            raise ValueError('decrease_factor must be between 0 and 1')
+        self.initial_limit = initial_limit
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self.overload_codes = tuple(overload_codes)
+
+    def __str__(self):
+        return '{"initial_limit": %s, "min_limit": %s, "max_limit": %s, "decrease_factor": %s, "latency_tolerance": %s, "overload_codes": %s}' % (
+            self.initial_limit, self.min_limit, self.max_limit, self.decrease_factor, self.latency_tolerance, list(self.overload_codes))
+
+class CachePolicy:
+    '''A class to represent the client side cache of configuration reads of a `server` instance. 
+    Assign an instance to `server.cache_policy` to enable it.
+
+    Reads (GET) of project and admin objects are cached. A write through the same `server` instance 
+    drops the cached objects it touches, including its children and parents, and all cached objects 
+    are dropped when Kepware reports a PROJECT_ID changed by another client. Changes made by other 
+    clients can still be returned for up to `ttl` seconds. Counters are available in `server.cache_stats`.
+
+    :param max_entries: Maximum number of cached responses, the least recently used are dropped first (Default: 1024)
+
+    :param ttl: Seconds a cached response is used for, or None to keep responses until they are 
+        invalidated or dropped (Default: 30.0)
+    '''
+    def __init__(self, max_entries: int = 1024, ttl: float = 30.0):
+        if max_entries < 1:
+            raise ValueError('max_entries must be at least 1')
+        if ttl is not None and ttl <= 0:
+            raise ValueError('ttl must be greater than 0')
+        self.max_entries = max_entries
+        self.ttl = ttl
+
+    def __str__(self):
+        return '{"max_entries": %s, "ttl": %s}' % (self.max_entries, self.ttl)
+
+class DiskCache:
+    '''A class to represent a cache of structure reads on local disk, so a new process connecting to an 
+    unchanged project doesn't have to read the project tree again. Assign an instance to 
+    `server.disk_cache` to enable it.
+
+    Serialized reads done by `export_project_configuration`, `get_channel_structure`, `get_device_structure` 
+    and `get_full_tag_structure` are stored under the current PROJECT_ID of the project. Before each of 
+    these reads the PROJECT_ID is read from Kepware and the stored copy is used if the project hasn't 
+    changed. Counters are available in `server.disk_cache_stats`.
+
+    :param directory: Directory for the cache files. It is created if it doesn't exist
+
+    :param max_files: Maximum number of files kept, the oldest are removed first (Default: 32)
+    '''
+    def __init__(self, directory: str, max_files: int = 32):
+        if max_files < 1:
+            raise ValueError('max_files must be at least 1')
+        self.directory = directory
+        self.max_files = max_files
+
+    def __str__(self):
+        return '{"directory": "%s", "max_files": %s}' % (self.directory, self.max_files)
+
+class JsonCodec:
+    '''A class to represent the JSON encoding of request bodies and decoding of response bodies. This 
+    implementation uses the `json` module of the standard library. By default `server.json_codec` uses 
+    orjson or ujson if one of them is installed and this class otherwise.
+
+    To use another JSON library, subclass this class, override `encode` and `decode` and assign an 
+    instance to `server.json_codec`.
+
+    **Methods**
+
+    :meth:`encode` - encode an object to UTF-8 JSON bytes
+
+    :meth:`decode` - decode UTF-8 JSON bytes, which may start with a byte order mark, to an object
+    '''
+    name = 'json'
+
+    def encode(self, obj) -> bytes:
+        '''Returns *obj* encoded as UTF-8 JSON bytes.'''
+        return json.dumps(obj).encode('utf-8')
+
+    def decode(self, data: bytes):
+        '''Returns the object in the UTF-8 JSON *data*. Raises ValueError if *data* is not valid JSON.'''
+        # json detects and skips the UTF-8 byte order mark of bytes input as it decodes them
+        return json.loads(data)
+
+    def __str__(self):
+        return '{"name": "%s"}' % self.name
+
+class RequestInfo:
+    '''A class to represent a single HTTP request sent to Kepware, passed to the hooks added with 
+    `server.add_hook`. The same instance is passed to the "before" hook and to the "after" or "error" hook 
+    of the request. Each attempt of a retried request is a separate request.
+
+    :param method: HTTP method
+
+    :param url: URL of the request
+
+    :param endpoint: Path of the request with object names replaced by `{name}`, such as 
+    `/project/channels/{name}/devices`
+
+    :param attempt: Attempt number, greater than 1 for retries
+
+    :param request_bytes: Size of the request body, or None if unknown
+
+    :param status: HTTP status code of the response, or None if no response was received
+
+    :param response_bytes: Size of the response body, or None if unknown
+
+    :param duration: Time in seconds from sending the request to receiving the response
+
+    :param error: `KepHTTPError` or `KepURLError` raised for the request, or None
+    '''
+    def __init__(self, method: str, url: str, endpoint: str, attempt: int = 1):
+        self.method = method
+        self.url = url
+        self.endpoint = endpoint
+        self.attempt = attempt
+        self.request_bytes = None
+        self.status = None
+        self.response_bytes = None
+        self.duration = None
+        self.error = None
+        self.start = None
+
+    def __str__(self):
+        return '{"method": "%s", "endpoint": "%s", "attempt": %s, "status": %s, "duration": %s}' % (self.method, 
+            self.endpoint, self.attempt, self.status, self.duration)
+
+class MultiStatusResult:
+    '''A class to represent the status of every object submitted with an add call, such as `add_tag` or 
+    `add_device` called with `multi_status=True`. Objects are indexed by their name (`common.ALLTYPES_NAME`), 
+    or by their position in the submitted list if they don't have a name.
+
+    :param items: List of the objects that were submitted
+
+    :param successes: Dict of the objects that were added, keyed by name
+
+    :param failures: Dict of the error responses from Kepware for the objects that failed, keyed by name
+
+    :param failed_items: List of the submitted objects that failed
+
+    :param failures_by_code: Dict of the names of the objects that failed, keyed by HTTP code
+
+    :param errors: List of the error responses, as returned by the add calls when `multi_status` is False
+
+    **Methods**
+
+    :meth:`retry_failed` - re-submit the objects that failed
+
+    :meth:`retry_failed_async` - coroutine version of `retry_failed` for results of `kepconfig.aio` calls
+    '''
+    def __init__(self, items: list = None, responses: list = None, resubmit = None):
+        self.items = []
+        self.successes = {}
+        self.failures = {}
+        self._failed_items = {}
+        self._keys = []
+        self._resubmit = resubmit
+        self._add(items or [], responses)
+
+    def _add(self, items, responses, keys = None):
+        '''Records the outcome of *items*. Objects are indexed by *keys* when set, such as the full path 
+        of each object, otherwise by name or position.'''
+        if isinstance(items, dict):
+            items = [items]
+        for x, item in enumerate(items):
+            response = responses[x] if responses is not None and x < len(responses) else {'code': 201}
+            if keys is not None:
+                name = keys[x]
+            else:
+                name = item.get('common.ALLTYPES_NAME', str(len(self.items))) if isinstance(item, dict) else str(len(self.items))
+            self.items.append(item)
+            self._keys.append(name)
+            if response.get('code') == 201:
+                self.successes[name] = item
+                self.failures.pop(name, None)
+                self._failed_items.pop(name, None)
+            else:
+                self.failures[name] = response
+                self._failed_items[name] = item
+
+    @property
+    def all_succeeded(self) -> bool:
+        return len(self.failures) == 0
+
+    @property
+    def failed_items(self) -> list:
+        return list(self._failed_items.values())
+
+    @property
+    def failures_by_code(self) -> dict:
+        codes = {}
+        for name, response in self.failures.items():
+            codes.setdefault(response.get('code'), []).append(name)
+        return codes
+
+    @property
+    def errors(self) -> list:
+        return list(self.failures.values())
+
+    def _pending(self, codes):
+        '''Returns the list of (name, object) of the failed objects to re-submit.'''
+        return [(name, item) for name, item in self._failed_items.items() if codes is None or self.failures[name].get('code') in codes]
+
+    def _merge(self, pending, result):
+        '''Records the outcome of re-submitting *pending*. *result* is the `MultiStatusResult` of the objects in 
+        the order they were re-submitted, or the KepHTTPError if the request failed as a whole.'''
+        if isinstance(result, MultiStatusResult):
+            # Re-submitted objects are found by identity, their index in *result* can differ from the index in this result
+            keys = {id(item): key for key, item in zip(result._keys, result.items)}
+        for x, (name, item) in enumerate(pending):
+            if isinstance(result, MultiStatusResult):
+                key = keys.get(id(item), result._keys[x] if x < len(result._keys) else None)
+                if key is None:
+                    continue
+                response = result.failures.get(key)
+            else:
+                response = {'code': result.code, 'message': result.payload}
+            if response is None:
+                self.successes[name] = item
+                self.failures.pop(name, None)
+                self._failed_items.pop(name, None)
+            else:
+                self.failures[name] = response
+
+    def retry_failed(self, codes: list = None, *, max_attempts: int = 1, backoff: float = 0.0) -> 'MultiStatusResult':
+        '''Re-submits the objects that failed, without the objects that were already added. Updates this result 
+        with the outcome and returns it.
+
+        :param codes: *(optional)* Only re-submit objects that failed with one of these HTTP codes (default= None, all failures)
+        :param max_attempts: *(optional)* Number of times to re-submit the remaining failures (default= 1)
+        :param backoff: *(optional)* Delay in seconds before the first attempt, doubled for each further attempt (default= 0.0)
+
+        :return: This `MultiStatusResult` instance
+
+        :raises KepHTTPError: If urllib provides an HTTPError
+        :raises KepURLError: If urllib provides an URLError
+        :raises TypeError: If the result was returned by a `kepconfig.aio` add call, use `retry_failed_async` instead
+        '''
+        for attempt in range(max_attempts):
+            pending = self._pending(codes)
+            if not pending or self._resubmit is None:
+                break
+            if backoff:
+                time.sleep(backoff * 2 ** attempt)
+            try:
+                result = self._resubmit([item for _, item in pending])
+            except KepHTTPError as err:
+                result = err
+            if inspect.isawaitable(result):
+                result.close()
+                raise TypeError('Results of kepconfig.aio add calls are re-submitted with retry_failed_async')
+            self._merge(pending, result)
+        return self
+
+    async def retry_failed_async(self, codes: list = None, *, max_attempts: int = 1, backoff: float = 0.0) -> 'MultiStatusResult':
+        '''Coroutine version of `retry_failed` for results returned by `kepconfig.aio` add calls.'''
+        for attempt in range(max_attempts):
+            pending = self._pending(codes)
+            if not pending or self._resubmit is None:
+                break
+            if backoff:
+                await asyncio.sleep(backoff * 2 ** attempt)
+            try:
+                result = await self._resubmit([item for _, item in pending])
+            except KepHTTPError as err:
+                result = err
+            self._merge(pending, result)
+        return self
+
+    def __str__(self):
+        return '{"successes": %s, "failures": %s}' % (list(self.successes), self.failures)
+
 class _HttpDataAbstract:
     def __init__(self):
         self.payload = ''
         self.code = ''
         self.reason = ''
+        self.size = None
 
 class FilterModifierEnum(Enum):
     '''Enum class to represent the various filter types that can be used in the Kepware API'''
@@ -0,0 +1,25 @@
+# -------------------------------------------------------------------------
+# Copyright (c) PTC Inc. and/or all its affiliates. All rights reserved.
+# See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+r"""`testing` provides tools to test and benchmark applications built with Kepconfig without a
+Kepware instance. `StandInServer` is a local stand-in for the Configuration API that runs in the
+current process. `ProjectSpec` and `generate_project` build synthetic projects of any size to load
+into the stand-in or a Kepware instance, and `write_project` streams them to a file.
+
+Example:
+
+    from kepconfig.testing import StandInServer, ProjectSpec, generate_project
+    from kepconfig.connectivity import channel
+
+    with StandInServer(latency= 0.002) as stand_in:
+        server = stand_in.client()
+        channel.add_channel(server, {"common.ALLTYPES_NAME": "Channel1", "servermain.MULTIPLE_TYPES_DEVICE_DRIVER": "Simulator"})
+        stand_in.inject_error(429, path= "/project/channels/*")
+        stand_in.load_project(generate_project(ProjectSpec.parse("2x10x5x100,seed=1")))
+"""
+
+from .stand_in import StandInServer
+from .generator import ProjectSpec, generate_project, iter_project_json, write_project
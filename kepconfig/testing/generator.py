@@ -0,0 +1,302 @@
+# -------------------------------------------------------------------------
+# Copyright (c) PTC Inc. and/or all its affiliates. All rights reserved.
+# See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+r"""`generator` creates synthetic Kepware projects for scale testing from a compact `ProjectSpec`.
+
+Projects contain channels of devices with tags and nested tag groups, and optionally IoT Gateway
+agents, Datalogger log groups and Advanced Tags that reference the generated tags. The same spec
+and seed always produce the same project. `iter_project_json` and `write_project` encode the
+project one object at a time, so projects of millions of tags and several GB are written with
+constant memory.
+
+Example:
+
+    from kepconfig.testing import ProjectSpec, write_project
+
+    # 10 channels of 100 devices, each with 50 tags and 4 tag groups nested 2 levels deep of 50 tags
+    spec = ProjectSpec.parse('10x100x4/2x50,iot=2x1000,log=1x500,adv=100,seed=7')
+    print(spec.tag_count)
+    write_project(spec, 'project.json.gz')
+"""
+
+import random
+import re
+from types import GeneratorType
+from typing import Iterator
+
+from ..helpers.json_body import _CHUNK_SIZE, _chunks, _encoder
+
+_NAME = 'common.ALLTYPES_NAME'
+_DESCRIPTION = 'common.ALLTYPES_DESCRIPTION'
+_DRIVER = 'Simulator'
+
+# Data types of the Simulator driver and the register type used to address them
+_DATA_TYPES = [(1, 'B'), (4, 'R'), (5, 'R'), (6, 'R'), (7, 'R'), (8, 'K'), (9, 'K')]
+_SCAN_RATES = [100, 250, 500, 1000, 5000]
+_ADV_TAG_TYPES = ['derived_tags', 'average_tags', 'min_tags', 'max_tags', 'link_tags']
+_RUN_TAG = '_System._Time_Second'
+
+_SPEC_PATTERN = re.compile(r'^(\d+)x(\d+)x(\d+)(?:/(\d+))?x(\d+)$')
+_PAIR_PATTERN = re.compile(r'^(\d+)x(\d+)$')
+
+class ProjectSpec:
+    '''A class to represent the size of a synthetic project created by `generate_project`, `iter_project_json`
+    or `write_project`.
+
+    Every device holds *tags* tags and *tag_groups* tag groups, and every tag group holds *tags* tags and
+    *tag_groups* child groups down to *group_depth* levels of groups. A device therefore holds
+    `tags * (1 + tag_groups + tag_groups^2 + ... + tag_groups^group_depth)` tags.
+
+    IoT items, log items and Advanced Tags reference the generated tags in order, starting over from the
+    first tag when there are more of them than tags.
+
+    :param channels: *(optional)* number of channels (default= 1)
+    :param devices: *(optional)* number of devices in every channel (default= 1)
+    :param tag_groups: *(optional)* number of tag groups in every device and tag group (default= 0)
+    :param tags: *(optional)* number of tags in every device and tag group (default= 10)
+    :param group_depth: *(optional)* levels of nested tag groups (default= 1)
+    :param iot_agents: *(optional)* number of MQTT Client agents (default= 0)
+    :param iot_items: *(optional)* number of IoT items in every agent (default= 0)
+    :param log_groups: *(optional)* number of Datalogger log groups (default= 0)
+    :param log_items: *(optional)* number of log items in every log group (default= 0)
+    :param advanced_tags: *(optional)* number of Advanced Tags, spread over the derived, average, minimum,
+        maximum and link tag types (default= 0)
+    :param seed: *(optional)* seed of the random tag properties (default= 0)
+
+    The compact form used by `parse` and `__str__` is `CxDxG/DEPTHxT` followed by optional comma separated
+    `iot=AGENTSxITEMS`, `log=GROUPSxITEMS`, `adv=TAGS` and `seed=SEED` parts, such as `4x25x3/2x100,iot=1x500`.
+    '''
+    def __init__(self, channels: int = 1, devices: int = 1, tag_groups: int = 0, tags: int = 10, *, group_depth: int = 1,
+                 iot_agents: int = 0, iot_items: int = 0, log_groups: int = 0, log_items: int = 0, advanced_tags: int = 0,
+                 seed: int = 0):
+        counts = {'channels': channels, 'devices': devices, 'tag_groups': tag_groups, 'tags': tags, 'group_depth': group_depth,
+            'iot_agents': iot_agents, 'iot_items': iot_items, 'log_groups': log_groups, 'log_items': log_items,
+            'advanced_tags': advanced_tags}
+        for name, value in counts.items():
+            if not isinstance(value, int) or value < 0:
+                raise ValueError(f'{name} must be a non-negative integer')
+        self.channels = channels
+        self.devices = devices
+        self.tag_groups = tag_groups
+        self.tags = tags
+        self.group_depth = group_depth
+        self.iot_agents = iot_agents
+        self.iot_items = iot_items
+        self.log_groups = log_groups
+        self.log_items = log_items
+        self.advanced_tags = advanced_tags
+        self.seed = seed
+        if self.tag_count == 0 and (iot_agents and iot_items or log_groups and log_items or advanced_tags):
+            raise ValueError('IoT items, log items and Advanced Tags require a project with tags')
+
+    @classmethod
+    def parse(cls, text: str) -> 'ProjectSpec':
+        '''Returns the spec described by its compact form, such as `10x100x4/2x50,iot=2x1000,log=1x500,adv=100,seed=7`.
+
+        :raises ValueError: If *text* is not a valid compact form
+        '''
+        parts = [p.strip() for p in text.replace(' ', '').lower().split(',')]
+        match = _SPEC_PATTERN.match(parts[0])
+        if match is None:
+            raise ValueError(f'Invalid project size "{parts[0]}", expected CHANNELSxDEVICESxGROUPS[/DEPTH]xTAGS')
+        channels, devices, groups, depth, tags = match.groups()
+        kwargs = {'group_depth': int(depth) if depth is not None else 1}
+        for part in parts[1:]:
+            key, _, value = part.partition('=')
+            pair = _PAIR_PATTERN.match(value)
+            if key == 'iot' and pair is not None:
+                kwargs['iot_agents'], kwargs['iot_items'] = int(pair.group(1)), int(pair.group(2))
+            elif key == 'log' and pair is not None:
+                kwargs['log_groups'], kwargs['log_items'] = int(pair.group(1)), int(pair.group(2))
+            elif key in ('adv', 'seed') and value.isdigit():
+                kwargs['advanced_tags' if key == 'adv' else 'seed'] = int(value)
+            else:
+                raise ValueError(f'Invalid project size part "{part}"')
+        return cls(int(channels), int(devices), int(groups), int(tags), **kwargs)
+
+    @property
+    def containers_per_device(self) -> int:
+        '''Number of objects holding tags in every device: the device and all of its tag groups.'''
+        return sum(self.tag_groups ** level for level in range(self.group_depth + 1)) if self.tag_groups else 1
+
+    @property
+    def tag_count(self) -> int:
+        '''Total number of tags in the channels of the project.'''
+        return self.channels * self.devices * self.containers_per_device * self.tags
+
+    def tag_path(self, index: int) -> str:
+        '''Returns the full path of tag number *index* of the project, in the order the tags are written,
+        such as `Channel1.Device1.Group1.Group2.Tag3`.'''
+        if not 0 <= index < self.tag_count:
+            raise IndexError('tag index out of range')
+        per_device = self.containers_per_device * self.tags
+        device, rem = divmod(index, per_device)
+        channel, device = divmod(device, self.devices)
+        groups = _container_path(self.tag_groups, self.group_depth, rem // self.tags)
+        return '.'.join([f'Channel{channel + 1}', f'Device{device + 1}'] + [f'Group{g + 1}' for g in groups] + [f'Tag{rem % self.tags + 1}'])
+
+    def __str__(self):
+        text = f'{self.channels}x{self.devices}x{self.tag_groups}'
+        if self.group_depth != 1:
+            text += f'/{self.group_depth}'
+        text += f'x{self.tags}'
+        if self.iot_agents or self.iot_items:
+            text += f',iot={self.iot_agents}x{self.iot_items}'
+        if self.log_groups or self.log_items:
+            text += f',log={self.log_groups}x{self.log_items}'
+        if self.advanced_tags:
+            text += f',adv={self.advanced_tags}'
+        if self.seed:
+            text += f',seed={self.seed}'
+        return text
+
+def generate_project(spec: ProjectSpec) -> dict:
+    '''Returns the project described by *spec* as a dict in the format of `server.export_project_configuration`,
+    which can be passed to `server.import_project_configuration` or `StandInServer.load_project`. Use
+    `write_project` for projects too large to be held in memory.'''
+    return _materialize(_project(spec))
+
+def iter_project_json(spec: ProjectSpec, chunk_size: int = _CHUNK_SIZE) -> Iterator[bytes]:
+    '''Returns a generator of the UTF-8 JSON of the project described by *spec* in chunks of about *chunk_size*
+    bytes. Objects are created and encoded one at a time, so memory use doesn't grow with the project size.'''
+    return _chunks(_encode(_project(spec)), chunk_size)
+
+def write_project(spec: ProjectSpec, filename: str, *, compress: bool = None) -> int:
+    '''Writes the project described by *spec* to a JSON project file with constant memory. The file is written
+    under a temporary name and only replaces *filename* once it is complete.
+
+    :param spec: `ProjectSpec` of the project
+    :param filename: path of the file to write
+    :param compress: *(optional)* gzip compress the file. If None the file is compressed when *filename*
+        ends with ".gz" (default= None)
+
+    :return: Number of bytes of JSON written
+    '''
+    from ..connection import _write_chunks
+    return _write_chunks(filename, iter_project_json(spec), compress)
+
+#
+# Project structure - collections are generators so objects are created as they are encoded
+#
+
+def _project(spec):
+    rnd = random.Random(spec.seed)
+    project = {_DESCRIPTION: f'Synthetic project {spec}', 'servermain.PROJECT_TITLE': 'Synthetic project',
+        'channels': (_channel(spec, rnd, c) for c in range(spec.channels))}
+    if spec.iot_agents:
+        project['_iot_gateway'] = [{'mqtt_clients': (_iot_agent(spec, a) for a in range(spec.iot_agents))}]
+    if spec.log_groups:
+        project['_datalogger'] = [{'log_groups': (_log_group(spec, g) for g in range(spec.log_groups))}]
+    if spec.advanced_tags:
+        project['_advancedtags'] = [{kind: _advanced_tags(spec, i, kind) for i, kind in enumerate(_ADV_TAG_TYPES)
+            if i < spec.advanced_tags}]
+    return {'project': project}
+
+def _channel(spec, rnd, c):
+    return {_NAME: f'Channel{c + 1}', 'servermain.MULTIPLE_TYPES_DEVICE_DRIVER': _DRIVER,
+        'devices': (_device(spec, rnd, d) for d in range(spec.devices))}
+
+def _device(spec, rnd, d):
+    device = {_NAME: f'Device{d + 1}', 'servermain.MULTIPLE_TYPES_DEVICE_DRIVER': _DRIVER, 'servermain.DEVICE_ID_STRING': str(d + 1)}
+    return _add_children(spec, rnd, device, spec.group_depth)
+
+def _tag_group(spec, rnd, g, depth):
+    return _add_children(spec, rnd, {_NAME: f'Group{g + 1}'}, depth)
+
+def _add_children(spec, rnd, obj, depth):
+    if spec.tags:
+        obj['tags'] = (_tag(rnd, t) for t in range(spec.tags))
+    if spec.tag_groups and depth:
+        obj['tag_groups'] = (_tag_group(spec, rnd, g, depth - 1) for g in range(spec.tag_groups))
+    return obj
+
+def _tag(rnd, t):
+    data_type, register = rnd.choice(_DATA_TYPES)
+    return {_NAME: f'Tag{t + 1}', 'servermain.TAG_ADDRESS': f'{register}{rnd.randrange(10000):04d}',
+        'servermain.TAG_DATA_TYPE': data_type, 'servermain.TAG_READ_WRITE_ACCESS': rnd.randrange(2),
+        'servermain.TAG_SCAN_RATE_MILLISECONDS': rnd.choice(_SCAN_RATES)}
+
+def _iot_agent(spec, a):
+    return {_NAME: f'Agent{a + 1}', 'iot_gateway.AGENTTYPES_TYPE': 'MQTT Client', 'iot_gateway.AGENTTYPES_ENABLED': False,
+        'iot_gateway.MQTT_CLIENT_URL': 'tcp://localhost:1883', 'iot_gateway.MQTT_CLIENT_TOPIC': f'agent{a + 1}',
+        'iot_items': (_iot_item(spec, i) for i in range(spec.iot_items))}
+
+def _iot_item(spec, i):
+    tag = spec.tag_path(i % spec.tag_count)
+    # Kepware names IoT items after their server tag
+    return {_NAME: tag.replace('.', '_'), 'iot_gateway.IOT_ITEM_SERVER_TAG': tag, 'iot_gateway.IOT_ITEM_SCAN_RATE_MS': 1000,
+        'iot_gateway.IOT_ITEM_ENABLED': True}
+
+def _log_group(spec, g):
+    return {_NAME: f'LogGroup{g + 1}', 'datalogger.LOG_GROUP_ENABLED': False,
+        'log_items': ({_NAME: f'LogItem{i + 1}', 'datalogger.LOG_ITEM_ID': spec.tag_path(i % spec.tag_count)}
+            for i in range(spec.log_items))}
+
+def _advanced_tags(spec, offset, kind):
+    for i in range(offset, spec.advanced_tags, len(_ADV_TAG_TYPES)):
+        tag = spec.tag_path(i % spec.tag_count)
+        obj = {_NAME: f'AdvancedTag{i + 1}', 'advanced_tags.ENABLED': True}
+        if kind == 'derived_tags':
+            obj.update({'advanced_tags.DERIVED_EXPRESSION': f'{tag} * 2', 'advanced_tags.DATATYPE': 9})
+        elif kind == 'link_tags':
+            obj.update({'advanced_tags.LINK_INPUT_TAG': tag, 'advanced_tags.LINK_OUTPUT_TAG': spec.tag_path((i + 1) % spec.tag_count)})
+        else:
+            key = {'average_tags': 'AVERAGE_TAG', 'min_tags': 'MINIMUM_TAG', 'max_tags': 'MAXIMUM_TAG'}[kind]
+            obj.update({f'advanced_tags.{key}': tag, 'advanced_tags.RUN_TAG': _RUN_TAG, 'advanced_tags.DATATYPE': 9})
+        yield obj
+
+#
+# Supporting Functions
+#
+
+def _container_path(groups, depth, index):
+    '''Returns the indexes of the tag groups leading to container *index* of a device, where the containers
+    are numbered in the order they are written: the device, then each tag group followed by its children.'''
+    path = []
+    level_size = sum(groups ** level for level in range(depth)) if groups else 0
+    while index:
+        # Skip the tags of the current container, then find the child group holding the index
+        index -= 1
+        child, index = divmod(index, level_size)
+        path.append(child)
+        level_size = (level_size - 1) // groups
+    return path
+
+def _materialize(obj):
+    if isinstance(obj, dict):
+        return {k: _materialize(v) for k, v in obj.items()}
+    if isinstance(obj, (list, GeneratorType)):
+        return [_materialize(v) for v in obj]
+    return obj
+
+def _encode(obj):
+    '''Generator of the str pieces of the JSON of *obj*, where collections may be generators.'''
+    if isinstance(obj, dict):
+        if not any(isinstance(value, (dict, list, GeneratorType)) for value in obj.values()):
+            # Objects without children, such as tags, are encoded in one call
+            yield _encoder.encode(obj)
+            return
+        yield '{'
+        first = True
+        for key, value in obj.items():
+            yield ('' if first else ',') + _encoder.encode(key) + ':'
+            first = False
+            if isinstance(value, (dict, list, GeneratorType)):
+                yield from _encode(value)
+            else:
+                yield _encoder.encode(value)
+        yield '}'
+    elif isinstance(obj, (list, GeneratorType)):
+        yield '['
+        first = True
+        for item in obj:
+            if not first:
+                yield ','
+            first = False
+            yield from _encode(item)
+        yield ']'
+    else:
+        yield _encoder.encode(obj)
@@ -0,0 +1,565 @@
+# -------------------------------------------------------------------------
+# Copyright (c) PTC Inc. and/or all its affiliates. All rights reserved.
+# See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+r"""`resources` holds the in-memory configuration served by `StandInServer` and implements the
+Configuration API semantics on it: the project and admin object trees, collections with paging
+and sorting, Multi-Status responses for list adds, PROJECT_ID checks on modify, service jobs and
+the event, transaction and audit logs.
+
+The tree is generic: below `/project` and `/admin` path segments alternate between a collection
+and the name of an object in it, segments starting with `_` (such as `_iot_gateway`) are plug-in
+namespaces and `services` is followed by the name of a service. Any collection accepts any object,
+so every part of the Configuration API used by the SDK is supported without a schema.
+"""
+
+import datetime
+import itertools
+import threading
+import time
+from collections import deque
+
+_NAME = 'common.ALLTYPES_NAME'
+_JOB_URL = '/config/v1/project/services/jobs/'
+
+_PROJECT_DEFAULTS = {
+    'common.ALLTYPES_DESCRIPTION': '',
+    'servermain.PROJECT_TITLE': '',
+    'servermain.PROJECT_TAGS_DEFINED': 0
+}
+_ADMIN_DEFAULTS = {
+    'libadminsettings.LICENSING_SERVER_PORT': 7070,
+    'libadminsettings.LICENSING_SERVER_NAME': '',
+    'libadminsettings.LICENSING_CHECK_PERIOD_MINS': 5,
+    'libadminsettings.LICENSING_SERVER_SSL_PORT': 1883,
+    'libadminsettings.LICENSING_SERVER_ALLOW_INSECURE_COMMS': False,
+    'libadminsettings.LICENSING_SERVER_ALLOW_SELF_SIGNED_CERTS': False,
+    'libadminsettings.LICENSING_CLIENT_ALIAS': '',
+    'libadminsettings.LICENSING_SERVER_ENABLE': False
+}
+_ABOUT = {
+    'product_name': 'Kepware Config API Stand-in',
+    'product_id': '000',
+    'product_version': '6.17.0.0',
+    'product_version_major': 6,
+    'product_version_minor': 17,
+    'product_version_build': 0,
+    'product_version_patch': 0
+}
+# Objects that exist in Kepware without being added
+_FIXED_OBJECTS = {
+    'consumer_exchange_groups': 'consumer exchanges',
+    'producer_exchange_groups': 'producer exchanges',
+    'name_resolution_groups': 'Name Resolutions',
+    'ua_client_interfaces': 'Client Interface',
+    'ua_server_interfaces': 'Server Interface',
+    'client_instance_certificates': 'Client Instance Certificate',
+    'server_instance_certificates': 'Server Instance Certificate',
+    'certificates': 'Instance Certificate'
+}
+
+# Child collections of objects reported by content=type_definition, in addition to the ones in use
+_CHILD_COLLECTIONS = {
+    'project': ['channels', 'aliases', 'client_interfaces'],
+    '_iot_gateway': ['mqtt_clients', 'rest_clients', 'rest_servers', 'thingworx_clients'],
+    '_datalogger': ['log_groups'],
+    '_advancedtags': ['advanced_tag_groups', 'average_tags', 'derived_tags', 'complex_tags', 'cumulative_tags', 'min_tags', 'max_tags', 'link_tags'],
+    'channels': ['devices'],
+    'devices': ['tag_groups', 'tags'],
+    'tag_groups': ['tag_groups', 'tags'],
+    'log_groups': ['log_items', 'column_mappings', 'triggers']
+}
+
+# IoT items are named after the server tag they publish
+_IOT_ITEMS = 'iot_items'
+_SERVER_TAG = 'iot_gateway.IOT_ITEM_SERVER_TAG'
+_SYSTEM_TAGS = {'_ActiveTagCount', '_ClientCount', '_Date', '_DateTime', '_DateTimeLocal', '_Date_Day', '_Date_DayOfWeek',
+    '_Date_Month', '_Date_Year2', '_Date_Year4', '_ExpiredFeatures', '_FullProjectName', '_IsDemo', '_OpcClientNames',
+    '_ProductName', '_ProductVersion', '_ProjectName', '_ProjectTitle', '_Time', '_Time_Hour', '_Time_Hour24',
+    '_Time_Minute', '_Time_PM', '_Time_Second', '_TotalTagCount'}
+
+# Objects Kepware creates with every object added to a collection, as (collection, name format)
+_DERIVED_OBJECTS = {
+    'log_items': ('column_mappings', '{}_Mapping')
+}
+
+class _RequestError(Exception):
+    '''Error response of the stand-in with an HTTP status code.'''
+    def __init__(self, code, message, payload = None):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+        self.payload = payload if payload is not None else {'code': code, 'message': message}
+
+class _Node:
+    '''Object in the tree with its properties, collections of child objects and plug-in namespaces. Like
+    in Kepware, object names are not case sensitive, so collections are keyed by the lower case name.'''
+    __slots__ = ('props', 'collections', 'namespaces')
+
+    def __init__(self, props = None):
+        self.props = props if props is not None else {}
+        self.collections = {}
+        self.namespaces = {}
+
+    def collection(self, name):
+        return self.collections.setdefault(name, {})
+
+    def namespace(self, name):
+        node = self.namespaces.get(name)
+        if node is None:
+            node = self.namespaces[name] = _Node({_NAME: name})
+        return node
+
+    def child(self, collection, name):
+        children = self.collections.get(collection)
+        node = None if children is None else children.get(name.lower())
+        fixed = _FIXED_OBJECTS.get(collection)
+        if node is None and fixed is not None and fixed.lower() == name.lower():
+            node = self.collection(collection)[fixed.lower()] = _Node({_NAME: fixed})
+        return node
+
+def _build(obj) -> _Node:
+    '''Builds a node from a JSON object, including the child objects in its collections.'''
+    if not isinstance(obj, dict):
+        raise _RequestError(400, 'Object definition must be a JSON object')
+    node = _Node()
+    for key, value in obj.items():
+        if key in ('PROJECT_ID', 'FORCE_UPDATE'):
+            continue
+        if '.' not in key and isinstance(value, list) and all(isinstance(v, dict) for v in value):
+            if key.startswith('_'):
+                ns = _build(value[0]) if value else _Node()
+                ns.props[_NAME] = key
+                node.namespaces[key] = ns
+                continue
+            children = node.collection(key)
+            for item in value:
+                child = _build(item)
+                name = _validate_name(_object_name(key, child))
+                if name.lower() in children:
+                    raise _RequestError(400, f"The name '{name}' is already used.")
+                children[name.lower()] = child
+        else:
+            node.props[key] = value
+    return node
+
+def _dump(node: _Node) -> dict:
+    '''Returns the JSON object of *node* with all of its children, as returned with `content=serialize`.'''
+    obj = dict(node.props)
+    for key, children in node.collections.items():
+        if children:
+            obj[key] = [_dump(child) for child in children.values()]
+    for key, ns in node.namespaces.items():
+        ns_obj = _dump(ns)
+        if len(ns_obj) > 1:
+            obj[key] = [ns_obj]
+    return obj
+
+def _count(node: _Node) -> int:
+    return 1 + sum(_count(c) for children in node.collections.values() for c in children.values()) + \
+        sum(_count(ns) for ns in node.namespaces.values())
+
+def _object_name(collection, node):
+    '''Returns the name of a new object. IoT items are named after their server tag without the leading
+    underscore of system tags, such as `System__Date` for `_System._Date`.'''
+    tag = node.props.get(_SERVER_TAG) if collection == _IOT_ITEMS else None
+    if isinstance(tag, str) and tag:
+        node.props[_NAME] = tag.replace('.', '_').lstrip('_')
+    return node.props.get(_NAME)
+
+def _validate_name(name):
+    if not isinstance(name, str) or not name:
+        raise _RequestError(400, f'Missing required property {_NAME}')
+    if '.' in name or name.startswith('_'):
+        raise _RequestError(400, f"The name '{name}' is not valid. Names can't start with '_' or contain '.'")
+    return name
+
+class _Target:
+    '''Result of resolving a request path.'''
+    def __init__(self, kind, node = None, parent = None, collection = None, name = None):
+        self.kind = kind
+        self.node = node
+        self.parent = parent
+        self.collection = collection
+        self.name = name
+
+class _Job:
+    def __init__(self, job_id, service, duration, ttl):
+        self.job_id = job_id
+        self.service = service
+        self.start = time.monotonic()
+        self.duration = duration
+        self.ttl = ttl
+        self.status = 'Success'
+        self.message = ''
+
+    @property
+    def complete(self):
+        return time.monotonic() - self.start >= self.duration
+
+    def expired(self, now):
+        return now - self.start >= self.duration + self.ttl
+
+class _State:
+    '''Configuration of the stand-in. All access is serialized by `lock`.'''
+    def __init__(self, job_duration = 0.05, max_log_entries = 10000):
+        self.lock = threading.RLock()
+        self.job_duration = job_duration
+        self.max_log_entries = max_log_entries
+        self._job_ids = itertools.count(1)
+        self._log_ids = itertools.count(1)
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.project_id = 1
+            self.project = _Node(dict(_PROJECT_DEFAULTS))
+            self.admin = _Node(dict(_ADMIN_DEFAULTS))
+            self.jobs = {}
+            self.backups = []
+            self.event_log = deque(maxlen=self.max_log_entries)
+            self.transaction_log = deque(maxlen=self.max_log_entries)
+            self.audit_log = deque(maxlen=self.max_log_entries)
+
+    def load_project(self, project: dict):
+        '''Replaces the project with *project*, a dict in the format of a JSON project file.'''
+        if not isinstance(project, dict) or not isinstance(project.get('project'), dict):
+            raise _RequestError(400, "Project definition must contain a 'project' object")
+        node = _build(project['project'])
+        with self.lock:
+            self.project = node
+            self.project_id += 1
+
+    def populate_logs(self, count):
+        '''Adds *count* entries to each of the event, transaction and audit logs.'''
+        with self.lock:
+            for i in range(count):
+                self._log('Administrator', f'Log entry {i + 1}', 'Project Edit')
+
+    def export_project(self) -> dict:
+        with self.lock:
+            return {'project': _dump(self.project)}
+
+    def object_count(self) -> int:
+        with self.lock:
+            return _count(self.project)
+
+    def handle(self, method, segments, query, body, user):
+        '''Handles a request for the path *segments* below /config/v1. Returns (status code, payload) or
+        raises `_RequestError`.'''
+        with self.lock:
+            if not segments:
+                raise _RequestError(404, 'Not Found')
+            head = segments[0]
+            if head in ('status', 'about', 'event_log', 'log', 'audit_log') and len(segments) == 1:
+                if method != 'GET':
+                    raise _RequestError(405, 'Method Not Allowed')
+                return 200, self._read_info(head, query)
+            if head == 'doc':
+                if method != 'GET':
+                    raise _RequestError(405, 'Method Not Allowed')
+                return 200, _doc(segments[1:])
+            if segments == ['project', 'backups']:
+                if method != 'GET':
+                    raise _RequestError(405, 'Method Not Allowed')
+                return 200, [dict(b) for b in self.backups]
+            if head not in ('project', 'admin'):
+                raise _RequestError(404, 'Not Found')
+            target = self._resolve(self.project if head == 'project' else self.admin, segments[1:])
+            if target.kind == 'job':
+                if method != 'GET':
+                    raise _RequestError(405, 'Method Not Allowed')
+                return 200, self._job_status(target.name)
+            if target.kind == 'service':
+                if method != 'PUT':
+                    raise _RequestError(405, 'Method Not Allowed')
+                return self._run_service(target, body, user)
+            if method == 'GET':
+                return 200, self._read(target, query, head == 'project' and len(segments) == 1)
+            if method == 'POST' and target.kind == 'collection':
+                return self._add(target, body, user)
+            if method == 'PUT' and target.kind == 'object':
+                return self._modify(target, body, user)
+            if method == 'DELETE' and target.kind == 'object' and target.parent is not None:
+                return self._delete(target, user)
+            raise _RequestError(405, 'Method Not Allowed')
+
+    #
+    # Path resolution
+    #
+
+    def _resolve(self, node, segments) -> _Target:
+        parent = collection = name = None
+        i = 0
+        while i < len(segments):
+            seg = segments[i]
+            if seg == 'services':
+                if i + 1 >= len(segments):
+                    raise _RequestError(404, 'Not Found')
+                if segments[i + 1] == 'jobs' and i + 2 < len(segments):
+                    return _Target('job', name= segments[i + 2])
+                if i + 2 != len(segments):
+                    raise _RequestError(404, 'Not Found')
+                return _Target('service', node= node, name= segments[i + 1])
+            if seg.startswith('_'):
+                node = node.namespace(seg)
+                i += 1
+                continue
+            if i + 1 == len(segments):
+                return _Target('collection', node= node, collection= seg)
+            child = node.child(seg, segments[i + 1])
+            if child is None:
+                raise _RequestError(404, f"Object '{segments[i + 1]}' not found in '{seg}'")
+            parent, collection, name, node = node, seg, segments[i + 1], child
+            i += 2
+        return _Target('object', node= node, parent= parent, collection= collection, name= name)
+
+    #
+    # Reads
+    #
+
+    def _read(self, target, query, is_project):
+        if query.get('content') == 'type_definition':
+            return _type_definition(target, is_project)
+        serialize = query.get('content') == 'serialize'
+        if target.kind == 'collection':
+            children = target.node.collections.get(target.collection, {})
+            text = query.get('filter', '').lower()
+            items = [_dump(c) if serialize else self._props(c) for name, c in children.items() if text in name]
+            return _page(_sort(items, query), query)
+        if serialize:
+            return {'project': _dump(target.node)} if is_project else _dump(target.node)
+        return self._props(target.node)
+
+    def _props(self, node):
+        return {'PROJECT_ID': self.project_id, **node.props}
+
+    def _read_info(self, head, query):
+        if head == 'status':
+            return [{'Name': 'ConfigAPI REST Service', 'Healthy': True}]
+        if head == 'about':
+            return dict(_ABOUT)
+        log = {'event_log': self.event_log, 'log': self.transaction_log, 'audit_log': self.audit_log}[head]
+        entries = _filter_log(list(log), query)
+        if 'limit' in query:
+            entries = entries[-int(query['limit']):]
+        entries = _sort(entries, query)
+        if 'pageSize' not in query:
+            return entries
+        # Paged log reads end with the pagination information
+        size = int(query['pageSize'])
+        return _page(entries, query) + [{'pagination': {'pageNumber': int(query.get('pageNumber', 1)), 'pageSize': size,
+            'totalCount': len(entries), 'totalPages': -(-len(entries) // size)}}]
+
+    #
+    # Writes
+    #
+
+    def _add(self, target, body, user):
+        if not isinstance(body, (dict, list)):
+            raise _RequestError(400, 'Request body must be a JSON object or array')
+        children = target.node.collection(target.collection)
+        results = []
+        added = 0
+        for index, item in enumerate(body if isinstance(body, list) else [body]):
+            try:
+                node = _build(item)
+                name = _validate_name(_object_name(target.collection, node))
+                if target.collection == _IOT_ITEMS:
+                    self._check_server_tag(node.props.get(_SERVER_TAG))
+                if name.lower() in children:
+                    raise _RequestError(400, f"The name '{name}' is already used.")
+                children[name.lower()] = node
+                self._add_derived(target, name)
+                added += 1
+                results.append({'code': 201, 'message': 'Created'})
+            except _RequestError as err:
+                results.append({'property': _NAME, 'description': err.message, 'error_line': index + 1,
+                    'code': err.code, 'message': f'Validation failed on property {_NAME} in object definition at line {index + 1}: {err.message}'})
+        if added:
+            self._changed(user, f'Added {added} object(s) to {target.collection}')
+        if isinstance(body, dict):
+            if results[0]['code'] != 201:
+                raise _RequestError(results[0]['code'], results[0]['message'])
+            return 201, None
+        if added == len(results):
+            return 201, None
+        if not added:
+            raise _RequestError(400, 'No objects were added', results)
+        return 207, results
+
+    def _modify(self, target, body, user):
+        if not isinstance(body, dict):
+            raise _RequestError(400, 'Request body must be a JSON object')
+        self._check_project_id(body)
+        props = {k: v for k, v in body.items() if k not in ('PROJECT_ID', 'FORCE_UPDATE')}
+        new_name = props.get(_NAME)
+        old_key = target.name.lower() if target.name else None
+        if target.parent is not None and new_name is not None and _validate_name(new_name).lower() != old_key:
+            children = target.parent.collections[target.collection]
+            if new_name.lower() in children:
+                raise _RequestError(400, f"The name '{new_name}' is already used.")
+            # Keep the position of the renamed object in its collection
+            items = [(new_name.lower() if k == old_key else k, v) for k, v in children.items()]
+            children.clear()
+            children.update(items)
+        target.node.props.update(props)
+        self._changed(user, f'Modified {target.name or "properties"}')
+        return 200, None
+
+    def _delete(self, target, user):
+        del target.parent.collections[target.collection][target.name.lower()]
+        derived = _DERIVED_OBJECTS.get(target.collection)
+        if derived is not None:
+            target.parent.collection(derived[0]).pop(derived[1].format(target.name).lower(), None)
+        self._changed(user, f'Deleted {target.name} from {target.collection}')
+        return 200, None
+
+    def _check_project_id(self, body):
+        if body.get('FORCE_UPDATE') is True or 'PROJECT_ID' not in body:
+            return
+        if body['PROJECT_ID'] != self.project_id:
+            raise _RequestError(400, f"Validation failed on property PROJECT_ID: The project has been modified "
+                f"(current PROJECT_ID {self.project_id})")
+
+    def _check_server_tag(self, tag):
+        '''Rejects IoT items for tags that are not system tags or static tags of the project.'''
+        if not isinstance(tag, str) or not tag:
+            raise _RequestError(400, f'Missing required property {_SERVER_TAG}')
+        path = tag.split('.')
+        if path[0] == '_System':
+            if len(path) == 2 and path[1] in _SYSTEM_TAGS:
+                return
+        elif len(path) >= 3:
+            node = self.project.child('channels', path[0])
+            node = node and node.child('devices', path[1])
+            for group in path[2:-1]:
+                node = node and node.child('tag_groups', group)
+            if node is not None and node.child('tags', path[-1]) is not None:
+                return
+        raise _RequestError(400, f"Validation failed on property {_SERVER_TAG}: The tag '{tag}' does not exist")
+
+    def _add_derived(self, target, name):
+        derived = _DERIVED_OBJECTS.get(target.collection)
+        if derived is not None:
+            derived_name = derived[1].format(name)
+            target.node.collection(derived[0])[derived_name.lower()] = _Node({_NAME: derived_name})
+
+    def _changed(self, user, details, action = 'Project Edit'):
+        self.project_id += 1
+        self._log(user, details, action)
+
+    def _log(self, user, details, action):
+        now = _now()
+        self.event_log.append({'timestamp': now, 'event': 'Information', 'source': 'Configuration API', 'message': details})
+        entry = {'id': next(self._log_ids), 'timestamp': now, 'action': action, 'user': user, 'interface': 'Config API REST',
+            'details': details, 'data': ''}
+        self.transaction_log.append(entry)
+        self.audit_log.append(dict(entry))
+
+    #
+    # Services
+    #
+
+    def _run_service(self, target, body, user):
+        now = time.monotonic()
+        for job_id in [j for j, job in self.jobs.items() if job.expired(now)]:
+            del self.jobs[job_id]
+        if any(not job.complete for job in self.jobs.values()):
+            raise _RequestError(429, 'The server is busy processing another service request. Try again later.')
+        body = body if isinstance(body, dict) else {}
+        ttl = body.get('servermain.JOB_TIME_TO_LIVE_SECONDS', 15)
+        if target.name == 'JsonProjectLoad':
+            self.load_project({'project': body.get('project')} if 'project' in body else {})
+            self._changed(user, 'Loaded project from JSON', 'Project Load')
+        elif target.name == 'CreateBackup':
+            self.backups.append({_NAME: f'Backup{len(self.backups) + 1}', 'servermain.BACKUP_TIMESTAMP': _now()})
+        job = _Job(f'{target.name}-{next(self._job_ids)}', target.name, self.job_duration, ttl)
+        self.jobs[job.job_id] = job
+        return 202, {'code': 202, 'message': 'Accepted', 'href': _JOB_URL + job.job_id}
+
+    def _job_status(self, job_id):
+        job = self.jobs.get(job_id)
+        if job is None:
+            raise _RequestError(404, f"Job '{job_id}' not found")
+        return {'servermain.JOB_COMPLETE': job.complete, 'servermain.JOB_STATUS': job.status if job.complete else 'Pending',
+            'servermain.JOB_STATUS_MSG': job.message}
+
+#
+# Supporting Functions
+#
+
+def _now():
+    return datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='milliseconds').replace('+00:00', 'Z')
+
+def _parse_time(value):
+    when = datetime.datetime.fromisoformat(value.replace('Z', '+00:00'))
+    return when if when.tzinfo is not None else when.replace(tzinfo=datetime.timezone.utc)
+
+def _type_definition(target, is_project):
+    if target.kind == 'collection':
+        kind, children = target.collection, []
+    else:
+        kind = 'project' if is_project else target.node.props.get(_NAME) if target.collection is None else target.collection
+        children = list(_CHILD_COLLECTIONS.get(kind, []))
+        children += [c for c in target.node.collections if c not in children]
+    return {'name': kind, 'collection': target.collection or kind, 'can_create': True, 'can_delete': True,
+        'can_modify': True, 'child_collections': children}
+
+def _doc(segments):
+    '''Returns the documentation of /doc/drivers and the drivers below it. Every driver is reported as installed.'''
+    if not segments or segments[0] != 'drivers':
+        raise _RequestError(404, 'Not Found')
+    if len(segments) == 1:
+        return [{'display_name': 'Simulator', 'display_description': ''}]
+    collection = segments[2] if len(segments) > 2 else 'channels'
+    return {'type_definition': {'name': collection, 'collection': collection, 'can_create': True, 'can_delete': True,
+        'can_modify': True, 'child_collections': _CHILD_COLLECTIONS.get(collection, [])}, 'property_definitions': []}
+
+def _sort(items, query):
+    prop = query.get('sortProperty')
+    if not prop:
+        return items
+    return sorted(items, key= lambda item: str(item.get(prop, '')), reverse= query.get('sortOrder', '').lower() == 'descending')
+
+def _page(items, query):
+    if 'pageSize' not in query:
+        return items
+    size = int(query['pageSize'])
+    page = int(query.get('pageNumber', 1))
+    return items[(page - 1) * size: page * size]
+
+_MATCHERS = {
+    'eq': lambda a, b: a == b,
+    'neq': lambda a, b: a != b,
+    'gt': lambda a, b: a > b,
+    'lt': lambda a, b: a < b,
+    'gte': lambda a, b: a >= b,
+    'lte': lambda a, b: a <= b,
+    'contains': lambda a, b: b in a,
+    'ncontains': lambda a, b: b not in a,
+    'starts_with': lambda a, b: a.startswith(b),
+    'nstarts_with': lambda a, b: not a.startswith(b),
+    'ends_with': lambda a, b: a.endswith(b),
+    'nends_with': lambda a, b: not a.endswith(b)
+}
+
+def _filter_log(entries, query):
+    '''Applies the start and end times and the filter[field][modifier] parameters of a log query.'''
+    if 'start' in query:
+        start = _parse_time(query['start'])
+        entries = [e for e in entries if _parse_time(e['timestamp']) >= start]
+    if 'end' in query:
+        end = _parse_time(query['end'])
+        entries = [e for e in entries if _parse_time(e['timestamp']) <= end]
+    for key, value in query.items():
+        if not key.startswith('filter['):
+            continue
+        field, _, modifier = key[len('filter['):].rstrip(']').partition('][')
+        match = _MATCHERS.get(modifier)
+        if match is None:
+            raise _RequestError(400, f'Unknown filter modifier {modifier}')
+        entries = [e for e in entries if field in e and match(str(e[field]), value)]
+    return entries
@@ -0,0 +1,358 @@
+# -------------------------------------------------------------------------
+# Copyright (c) PTC Inc. and/or all its affiliates. All rights reserved.
+# See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+r"""`stand_in` provides the `StandInServer` class, an HTTP server that runs in the current process
+and answers Configuration API requests like a Kepware instance would.
+"""
+
+import base64
+import fnmatch
+import gzip
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib import parse
+
+from .resources import _RequestError, _State
+
+_ROOT = '/config/v1'
+_REASONS = {200: 'OK', 201: 'Created', 202: 'Accepted', 207: 'Multi-Status', 400: 'Bad Request', 401: 'Unauthorized',
+    404: 'Not Found', 405: 'Method Not Allowed', 429: 'Too Many Requests', 500: 'Internal Server Error',
+    503: 'Service Unavailable'}
+# Responses smaller than this are not compressed
+_MIN_COMPRESS_SIZE = 1024
+
+class _Injection:
+    '''Error response to return for the next *count* matching requests.'''
+    def __init__(self, code, count, method, path, retry_after):
+        self.code = code
+        self.count = count
+        self.method = method
+        self.path = path
+        self.retry_after = retry_after
+
+    def matches(self, method, path):
+        return (self.method is None or self.method == method) and (self.path is None or fnmatch.fnmatchcase(path, self.path))
+
+class _HTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # Headers and body are written separately, which would otherwise wait for delayed ACKs
+    disable_nagle_algorithm = True
+    stand_in = None
+
+    def do_GET(self):
+        self.stand_in._handle(self)
+
+    do_POST = do_PUT = do_DELETE = do_GET
+
+    def log_message(self, format, *args):
+        pass
+
+    def read_body(self) -> bytes:
+        if self.headers.get('Transfer-Encoding', '').lower() == 'chunked':
+            parts = []
+            while True:
+                size = int(self.rfile.readline().split(b';')[0].strip(), 16)
+                if size == 0:
+                    # Skip trailers up to the empty line
+                    while self.rfile.readline() not in (b'\r\n', b'\n', b''):
+                        pass
+                    return b''.join(parts)
+                parts.append(self.rfile.read(size))
+                self.rfile.readline()
+        length = int(self.headers.get('Content-Length') or 0)
+        return self.rfile.read(length) if length else b''
+
+class StandInServer:
+    '''A class to represent a local stand-in for the Kepware Configuration API, for testing and benchmarking
+    applications and the SDK without a Kepware instance. The stand-in serves the `/config/v1` tree over HTTP
+    from a thread of the current process and keeps the configuration in memory.
+
+    The project and admin trees accept any collection and object, so the connectivity, IoT Gateway, Datalogger,
+    Advanced Tags, UA Gateway and admin functions of the SDK all work against it. The stand-in follows the
+    behaviour of Kepware that the SDK depends on:
+
+    - Adding a list of objects returns HTTP 207 (Multi-Status) with a result per object when some of them fail
+    - Every change increments the PROJECT_ID, and a modify with an outdated PROJECT_ID is rejected unless forced
+    - Service calls return a job href that reports completion after *job_duration*, and service calls made while
+      a job is running are rejected with HTTP 429
+    - Objects are returned with their children when requested with `content=serialize`
+    - Collections and the event, transaction and audit logs support paging, sorting and filters
+
+    Requests can be delayed with *latency* and failed on demand with `inject_error` or at random with
+    *error_rate* to test error handling, retries and rate limiting.
+
+    :param host: *(optional)* host name or IP address to listen on (default= "127.0.0.1")
+    :param port: *(optional)* port to listen on, 0 to use a free port (default= 0)
+    :param user: *(optional)* user name required with HTTP basic authentication, None to accept any
+        request (default= None)
+    :param password: *(optional)* password required with *user* (default= "")
+    :param latency: *(optional)* delay in seconds added to every request, or a (min, max) tuple for a random
+        delay (default= None)
+    :param error_rate: *(optional)* fraction of requests, between 0 and 1, that fail with *error_code* (default= 0)
+    :param error_code: *(optional)* HTTP code returned by requests failed by *error_rate* (default= 429)
+    :param job_duration: *(optional)* time in seconds service jobs take to complete (default= 0.05)
+    :param max_log_entries: *(optional)* number of entries kept in each log (default= 10000)
+    :param compress: *(optional)* gzip responses to clients that accept it (default= True)
+    :param seed: *(optional)* seed of the random latency and errors, for repeatable runs (default= None)
+
+    **Methods**
+
+    :meth:`start` - start serving requests
+
+    :meth:`stop` - stop serving requests
+
+    :meth:`client` - return a `server` instance connected to the stand-in
+
+    :meth:`async_client` - return an `AsyncServer` instance connected to the stand-in
+
+    :meth:`inject_error` - fail the next matching requests with an HTTP error
+
+    :meth:`clear_errors` - remove all pending injected errors
+
+    :meth:`load_project` - replace the project configuration
+
+    :meth:`export_project` - return the project configuration
+
+    :meth:`populate_logs` - add entries to the event, transaction and audit logs
+
+    :meth:`reset` - restore the initial configuration and clear the logs, jobs and statistics
+
+    The stand-in is also a context manager that starts on enter and stops on exit.
+    '''
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, *, user: str = None, password: str = '',
+                 latency = None, error_rate: float = 0.0, error_code: int = 429, job_duration: float = 0.05,
+                 max_log_entries: int = 10000, compress: bool = True, seed: int = None):
+        if latency is not None:
+            low, high = latency if isinstance(latency, (tuple, list)) else (latency, latency)
+            if low < 0 or high < low:
+                raise ValueError('latency must be a non-negative number or a (min, max) tuple')
+            latency = (low, high)
+        if not 0 <= error_rate <= 1:
+            raise ValueError('error_rate must be between 0 and 1')
+        if job_duration < 0:
+            raise ValueError('job_duration must not be negative')
+        self.host = host
+        self._port = port
+        self.user = user
+        self.password = password
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_code = error_code
+        self.compress = compress
+        self._state = _State(job_duration, max_log_entries)
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._injections = []
+        self._stats = {}
+        self._httpd = None
+        self._thread = None
+
+    @property
+    def port(self) -> int:
+        '''Port the stand-in listens on. When started with port 0 this is the port chosen by the system.'''
+        return self._httpd.server_address[1] if self._httpd is not None else self._port
+
+    @property
+    def url(self) -> str:
+        '''Base url of the Configuration API of the stand-in.'''
+        return f'http://{self.host}:{self.port}{_ROOT}'
+
+    @property
+    def project_id(self) -> int:
+        '''Current PROJECT_ID of the project.'''
+        return self._state.project_id
+
+    @property
+    def object_count(self) -> int:
+        '''Number of objects in the project, including the project itself.'''
+        return self._state.object_count()
+
+    @property
+    def stats(self) -> dict:
+        '''Dict of the number of requests received keyed by "METHOD code", such as "POST 201".'''
+        with self._lock:
+            return dict(self._stats)
+
+    def start(self):
+        '''Starts serving requests from a background thread. Returns the stand-in.'''
+        if self._httpd is not None:
+            return self
+        handler = type('_BoundHandler', (_Handler,), {'stand_in': self})
+        self._httpd = _HTTPServer((self.host, self._port), handler)
+        self._thread = threading.Thread(target= self._httpd.serve_forever, name= 'kepconfig-stand-in', daemon= True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        '''Stops serving requests and closes the listening socket.'''
+        if self._httpd is None:
+            return
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        self._thread.join()
+        self._httpd = None
+        self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def client(self):
+        '''Returns a `kepconfig.connection.server` instance connected to the stand-in.'''
+        from ..connection import server
+        return server(self.host, self.port, self.user or 'Administrator', self.password, https= False)
+
+    def async_client(self, **kwargs):
+        '''Returns a `kepconfig.aio.AsyncServer` instance connected to the stand-in. Keyword arguments,
+        such as *max_connections*, are passed to the `AsyncServer` constructor.'''
+        from ..aio import AsyncServer
+        return AsyncServer(self.host, self.port, self.user or 'Administrator', self.password, https= False, **kwargs)
+
+    def inject_error(self, code: int, count: int = 1, *, method: str = None, path: str = None, retry_after: float = None):
+        '''Fails the next *count* requests that match *method* and *path* with HTTP error *code*. Injected
+        errors are checked in the order they were added.
+
+        :param code: HTTP status code to return, such as 429, 500 or 503
+        :param count: *(optional)* number of requests to fail (default= 1)
+        :param method: *(optional)* HTTP method to match, None for any method (default= None)
+        :param path: *(optional)* shell-style pattern matched against the path below `/config/v1`, such as
+            "/project/channels/*", None for any path (default= None)
+        :param retry_after: *(optional)* value in seconds of the `Retry-After` header of the response (default= None)
+        '''
+        if count < 1:
+            raise ValueError('count must be at least 1')
+        with self._lock:
+            self._injections.append(_Injection(code, count, method.upper() if method else None, path, retry_after))
+
+    def clear_errors(self):
+        '''Removes all pending injected errors.'''
+        with self._lock:
+            self._injections.clear()
+
+    def load_project(self, project: dict):
+        '''Replaces the project configuration with *project*, a dict in the format returned by
+        `server.export_project_configuration`.
+
+        :raises ValueError: If *project* is not a valid project definition
+        '''
+        try:
+            self._state.load_project(project)
+        except _RequestError as err:
+            raise ValueError(err.message)
+
+    def export_project(self) -> dict:
+        '''Returns the project configuration in the format of `server.export_project_configuration`.'''
+        return self._state.export_project()
+
+    def populate_logs(self, count: int):
+        '''Adds *count* entries to each of the event, transaction and audit logs, to test reading large logs.
+        Only the most recent *max_log_entries* entries are kept.'''
+        self._state.populate_logs(count)
+
+    def reset(self):
+        '''Restores the initial configuration and clears the logs, jobs, statistics and injected errors.'''
+        self._state.reset()
+        with self._lock:
+            self._injections.clear()
+            self._stats.clear()
+
+    def __str__(self):
+        return '{"url": "%s", "latency": %s, "error_rate": %s}' % (self.url, list(self.latency) if self.latency else None,
+            self.error_rate)
+
+    #
+    # Request handling
+    #
+
+    def _handle(self, handler: _Handler):
+        split = parse.urlsplit(handler.path)
+        method = handler.command
+        path = split.path
+        headers = {}
+        try:
+            body = handler.read_body()
+            self._delay()
+            if not (path == _ROOT or path.startswith(_ROOT + '/')):
+                raise _RequestError(404, 'Not Found')
+            path = path[len(_ROOT):] or '/'
+            user = self._authenticate(handler.headers.get('Authorization'))
+            injected = self._injected(method, path)
+            if injected is not None:
+                if injected.retry_after is not None:
+                    headers['Retry-After'] = str(injected.retry_after)
+                raise _RequestError(injected.code, _REASONS.get(injected.code, 'Injected error'))
+            try:
+                data = json.loads(body.decode('utf-8-sig')) if body else None
+            except ValueError:
+                raise _RequestError(400, 'Request body is not valid JSON')
+            query = dict(parse.parse_qsl(split.query, keep_blank_values= True))
+            segments = [parse.unquote(s) for s in path.split('/') if s]
+            code, payload = self._state.handle(method, segments, query, data, user)
+        except _RequestError as err:
+            code, payload = err.code, err.payload
+            if code == 401:
+                headers['WWW-Authenticate'] = 'Basic realm="Kepware"'
+        with self._lock:
+            key = f'{method} {code}'
+            self._stats[key] = self._stats.get(key, 0) + 1
+        self._respond(handler, code, payload, headers)
+
+    def _respond(self, handler, code, payload, headers):
+        body = b'' if payload is None else json.dumps(payload).encode()
+        if self.compress and len(body) >= _MIN_COMPRESS_SIZE and 'gzip' in handler.headers.get('Accept-Encoding', ''):
+            body = gzip.compress(body, compresslevel= 1)
+            headers['Content-Encoding'] = 'gzip'
+        handler.send_response(code, _REASONS.get(code))
+        if payload is not None:
+            handler.send_header('Content-Type', 'application/json')
+        handler.send_header('Content-Length', str(len(body)))
+        for name, value in headers.items():
+            handler.send_header(name, value)
+        handler.end_headers()
+        if handler.command != 'HEAD':
+            handler.wfile.write(body)
+
+    def _delay(self):
+        if self.latency is None:
+            return
+        low, high = self.latency
+        with self._lock:
+            delay = low if low == high else self._random.uniform(low, high)
+        time.sleep(delay)
+
+    def _authenticate(self, header):
+        if self.user is None:
+            if header and header.startswith('Basic '):
+                try:
+                    return base64.b64decode(header[6:]).decode().partition(':')[0]
+                except ValueError:
+                    pass
+            return 'Administrator'
+        expected = 'Basic ' + base64.b64encode(f'{self.user}:{self.password}'.encode()).decode()
+        if header != expected:
+            raise _RequestError(401, 'Unauthorized')
+        return self.user
+
+    def _injected(self, method, path):
+        with self._lock:
+            for injection in self._injections:
+                if injection.matches(method, path):
+                    injection.count -= 1
+                    if injection.count == 0:
+                        self._injections.remove(injection)
+                    return injection
+            if self.error_rate and self._random.random() < self.error_rate:
+                return _Injection(self.error_code, 1, None, None, None)
+        return None
@@ -0,0 +1,233 @@
+# -------------------------------------------------------------------------
+# Copyright (c) PTC Inc. and/or all its affiliates. All rights reserved.
+# See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+r"""`tracing` provides the `Tracer` class that records nested spans for the calls made with
+a `server` instance. Assign an instance to `server.tracer` to enable it.
+
+Every public function of the `connectivity`, `iot_gateway`, `datalogger`, `adv_tags`,
+`ua_gateway` and `admin` packages (and their `kepconfig.aio` versions) records a span named
+after the function, such as `connectivity.channel.get_channel_structure`. Functions called by
+it and the HTTP requests it sends are recorded as child spans, so the slow part of a large
+operation can be found. Spans can be exported as Chrome trace JSON, which can be opened in
+chrome://tracing or https://ui.perfetto.dev, or to OpenTelemetry when it is installed.
+"""
+
+import asyncio
+import contextlib
+import functools
+import inspect
+import itertools
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar
+
+# Span of the operation running in the current thread or task
+_current_span = ContextVar('kepconfig_current_span', default=None)
+
+class Span:
+    '''A class to represent a finished or running span recorded by a `Tracer`.
+
+    :param name: Name of the operation, such as `connectivity.channel.get_channel_structure` or
+    `HTTP GET /project/channels/{name}` for requests
+
+    :param span_id: Identifier of the span, unique within the tracer
+
+    :param parent_id: `span_id` of the enclosing span, or None for a top level span
+
+    :param start: Start time in seconds, from `time.perf_counter`
+
+    :param end: End time in seconds, from `time.perf_counter`, or None while the span is running
+
+    :param attributes: Dict of details of the span, such as the status code of a request or the
+    error raised by the operation
+    '''
+    def __init__(self, name: str, span_id: int, parent_id: int = None, start: float = None, attributes: dict = None):
+        self.name = name
+        self.span_id = span_id
+        self.parent_id = parent_id
+        self.start = time.perf_counter() if start is None else start
+        self.end = None
+        self.attributes = attributes or {}
+        self.lane = _lane()
+
+    @property
+    def duration(self):
+        return None if self.end is None else self.end - self.start
+
+    def __str__(self):
+        return '{"name": "%s", "span_id": %s, "parent_id": %s, "duration": %s}' % (self.name, self.span_id,
+            self.parent_id, self.duration)
+
+class Tracer:
+    '''A class to represent a recorder of tracing spans. One tracer can be shared by several `server`
+    instances. Only the most recent *max_spans* finished spans are kept.
+
+    :param max_spans: *(optional)* Maximum number of finished spans kept (default= 100000)
+
+    **Methods**
+
+    :meth:`span` - context manager that records a span around a block of code
+
+    :meth:`spans` - return the finished spans, oldest first
+
+    :meth:`to_chrome_trace` - return the finished spans in Chrome trace event format
+
+    :meth:`write_chrome_trace` - write the finished spans to a Chrome trace JSON file
+
+    :meth:`export_opentelemetry` - send the finished spans to OpenTelemetry
+
+    :meth:`clear` - drop all finished spans
+    '''
+    def __init__(self, max_spans: int = 100000):
+        if max_spans < 1:
+            raise ValueError('max_spans must be at least 1')
+        self.max_spans = max_spans
+        self._spans = deque(maxlen=max_spans)
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        # Offset to convert perf_counter times to wall clock times
+        self._epoch = time.time() - time.perf_counter()
+
+    @contextlib.contextmanager
+    def span(self, name: str, **attributes):
+        '''Context manager that records a span named *name* around the block. Spans started in the
+        block, including in tasks created by it, are recorded as its children. If the block raises an
+        exception it is recorded in the `error` attribute. Yields the `Span`.'''
+        span = Span(name, next(self._ids), self._parent_id(), attributes= attributes)
+        token = _current_span.set((self, span))
+        try:
+            yield span
+        except BaseException as err:
+            span.attributes['error'] = f'{type(err).__name__}: {err}'
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end = time.perf_counter()
+            self._finish(span)
+
+    def record_request(self, info):
+        '''Records the HTTP request described by a `RequestInfo` as a child of the current span.'''
+        span = Span(f'HTTP {info.method} {info.endpoint}', next(self._ids), self._parent_id(), start= info.start,
+            attributes= {'url': info.url, 'attempt': info.attempt, 'status': info.status})
+        if info.error is not None:
+            span.attributes['error'] = f'{type(info.error).__name__}: {info.error}'
+        span.end = info.start + info.duration
+        self._finish(span)
+
+    def spans(self) -> list:
+        '''Returns the list of finished `Span` objects, oldest first.'''
+        with self._lock:
+            return list(self._spans)
+
+    def to_chrome_trace(self) -> dict:
+        '''Returns the finished spans as a dict in Chrome trace event format. Spans are shown on one row
+        per thread or asyncio task.'''
+        pid = os.getpid()
+        events = []
+        for span in self.spans():
+            args = dict(span.attributes, span_id= span.span_id, parent_id= span.parent_id)
+            events.append({
+                'name': span.name,
+                'cat': 'http' if span.name.startswith('HTTP ') else 'kepconfig',
+                'ph': 'X',
+                'ts': (self._epoch + span.start) * 1e6,
+                'dur': span.duration * 1e6,
+                'pid': pid,
+                'tid': span.lane,
+                'args': {k: v if isinstance(v, (str, int, float, bool, type(None))) else str(v) for k, v in args.items()}
+            })
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def write_chrome_trace(self, filename: str):
+        '''Writes the finished spans to *filename* as Chrome trace JSON.'''
+        with open(filename, 'w') as f:
+            json.dump(self.to_chrome_trace(), f)
+
+    def export_opentelemetry(self, tracer = None):
+        '''Sends the finished spans to OpenTelemetry with their original start and end times and nesting.
+        The OpenTelemetry SDK configured by the application exports them.
+
+        :param tracer: *(optional)* OpenTelemetry tracer to use (default= `opentelemetry.trace.get_tracer("kepconfig")`)
+
+        :raises ImportError: If the opentelemetry-api package is not installed
+        '''
+        from opentelemetry import trace
+        if tracer is None:
+            tracer = trace.get_tracer('kepconfig')
+        spans = self.spans()
+        known = {span.span_id for span in spans}
+        children = {}
+        for span in spans:
+            parent = span.parent_id if span.parent_id in known else None
+            children.setdefault(parent, []).append(span)
+        def export(span, context):
+            otel_span = tracer.start_span(span.name, context= context, start_time= self._time_ns(span.start),
+                attributes= {k: v for k, v in span.attributes.items() if v is not None})
+            child_context = trace.set_span_in_context(otel_span)
+            for child in children.get(span.span_id, []):
+                export(child, child_context)
+            otel_span.end(end_time= self._time_ns(span.end))
+        for span in children.get(None, []):
+            export(span, None)
+
+    def clear(self):
+        '''Drops all finished spans.'''
+        with self._lock:
+            self._spans.clear()
+
+    def __str__(self):
+        return '{"max_spans": %s}' % self.max_spans
+
+    def _parent_id(self):
+        current = _current_span.get()
+        if current is None or current[0] is not self:
+            return None
+        return current[1].span_id
+
+    def _finish(self, span):
+        with self._lock:
+            self._spans.append(span)
+
+    def _time_ns(self, t):
+        return int((self._epoch + t) * 1e9)
+
+#
+# Supporting Functions
+#
+
+def _lane():
+    '''Identifies the asyncio task or thread a span runs in.'''
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:
+        task = None
+    return id(task) if task is not None else threading.get_ident()
+
+def _traced(fn):
+    '''Decorator that records a span around *fn* when the `server` passed as its first argument has
+    a tracer. The span is named after the module and function, without the `kepconfig.` prefix.'''
+    module = fn.__module__
+    name = f'{module[len("kepconfig."):] if module.startswith("kepconfig.") else module}.{fn.__name__}'
+    if inspect.iscoroutinefunction(fn):
+        @functools.wraps(fn)
+        async def async_wrapper(server, *args, **kwargs):
+            tracer = getattr(server, '_tracer', None)
+            if tracer is None:
+                return await fn(server, *args, **kwargs)
+            with tracer.span(name):
+                return await fn(server, *args, **kwargs)
+        return async_wrapper
+    @functools.wraps(fn)
+    def wrapper(server, *args, **kwargs):
+        tracer = getattr(server, '_tracer', None)
+        if tracer is None:
+            return fn(server, *args, **kwargs)
+        with tracer.span(name):
+            return fn(server, *args, **kwargs)
+    return wrapper
@@ -10,6 +10,7 @@ UA Gateway plug-in instance certificate objects within the Kepware Configuration
 
 from ..connection import server
 from ..error import KepHTTPError
+from ..tracing import _traced
 from ..ua_gateway.common import _INTER_TYPE, _create_url_cert, INSTANCE_CERTIFICATE
 
 import warnings
@@ -20,6 +21,7 @@ from ..helpers.deprecation_utils import _deprecated
 warnings.simplefilter('always', DeprecationWarning)
 
 @_deprecated("This function is deprecated and will be removed in a future release. Use `get_instance_certificate()` in UAG client or server module instead.")
+@_traced
 def get_instance_certificate(server: server) -> dict:
     '''
     DEPRECATED: This function is deprecated and will be removed in a future release. Use `get_instance_certificate()` 
@@ -39,6 +41,7 @@ def get_instance_certificate(server: server) -> dict:
     return r.payload
 
 @_deprecated("This function is deprecated and will be removed in a future release. Use `TBD` instead.")
+@_traced
 def reissue_self_signed_instance_certificate(server: server) -> bool:
     '''
     DEPRECATED: This function is deprecated and will be removed in a future release. Use `get_instance_certificate()` 
@@ -57,4 +60,4 @@ def reissue_self_signed_instance_certificate(server: server) -> bool:
     r = server._config_del(server.url + _create_url_cert(_INTER_TYPE.CERTS, INSTANCE_CERTIFICATE))
     if r.code == 200: return True 
     else: 
-        raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
\ No newline at end of file
+        raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
\ No newline at end of file
@@ -10,7 +10,9 @@ Certificate store read, remove and trust functionality is also available for the
 client connections.
 """
 
-from typing import Union
+from typing import Union, Iterator
+from ..utils import _add_result, _multi_status_data, _iter_pages
+from ..tracing import _traced
 
 from kepconfig.structures import KepServiceResponse
 from ..connection import server
@@ -19,6 +21,7 @@ from ..ua_gateway.common import _INTER_TYPE, _change_cert_trust,  _create_url_ce
 
 CLIENT_INSTANCE_CERTIFICATE = "Client Instance Certificate"
 
+@_traced
 def get_ua_client_connection(server: server, ua_client_connection: str) -> dict:
     '''Returns the properties of the UAG client connection object.
     
@@ -33,6 +36,7 @@ def get_ua_client_connection(server: server, ua_client_connection: str) -> dict:
     r = server._config_get(server.url + _create_url_client(ua_client_connection))
     return r.payload
 
+@_traced
 def get_all_ua_client_connections(server: server,  *, options: dict = None) -> dict:
     '''Returns list of all UAG client connection objects and their properties.
     
@@ -48,7 +52,8 @@ def get_all_ua_client_connections(server: server,  *, options: dict = None) -> d
     r = server._config_get(server.url + _create_url_client())
     return r.payload
 
-def add_ua_client_connection(server: server, DATA: Union[dict, list]) -> Union[bool, list]:
+@_traced
+def add_ua_client_connection(server: server, DATA: Union[dict, list], *, multi_status: bool = False) -> Union[bool, list]:
     '''Add a `"UAG client connection"` or multiple `"UAG client connection"` objects to Kepware. This allows you 
     to create a client connection with all needed properties.
 
@@ -57,6 +62,8 @@ def add_ua_client_connection(server: server, DATA: Union[dict, list]) -> Union[b
     :param server: instance of the `server` class
     :param DATA: Dict of the connection or a list of connections
     expected by Kepware Configuration API
+    :param multi_status: *(optional)* If True, returns a `MultiStatusResult` with the status of every object instead of 
+    True or the list of failures. (default= False)
 
     :return: True - If a "HTTP 201 - Created" is received from Kepware server
     :return: If a "HTTP 207 - Multi-Status" is received from Kepware with a list of dict error responses for all 
@@ -65,17 +72,11 @@ def add_ua_client_connection(server: server, DATA: Union[dict, list]) -> Union[b
     :raises KepHTTPError: If urllib provides an HTTPError
     :raises KepURLError: If urllib provides an URLError
     '''
+    DATA = _multi_status_data(DATA, multi_status)
     r = server._config_add(server.url + _create_url_client(), DATA)
-    if r.code == 201: return True
-    elif r.code == 207:
-        errors = [] 
-        for item in r.payload:
-            if item['code'] != 201:
-                errors.append(item)
-        return errors
-    else: 
-        raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+    return _add_result(r, DATA, multi_status, lambda items: add_ua_client_connection(server, items, multi_status= True))
     
+@_traced
 def modify_ua_client_connection(server: server, DATA: dict, *, ua_client_connection: str = None, force: bool = False) -> bool:
     '''Modify a UAG client connection object and it's properties in Kepware. If a `"ua_client_connection"` is not provided as an input,
     you need to identify the client connection in the *'common.ALLTYPES_NAME'* property field in `"DATA"`. It will 
@@ -96,7 +97,7 @@ def modify_ua_client_connection(server: server, DATA: dict, *, ua_client_connect
         try:
             r = server._config_update(server.url + _create_url_client(client_data['common.ALLTYPES_NAME']), client_data)
             if r.code == 200: return True 
-            else: raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+            else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
         except KeyError as err:
             err_msg = 'Error: No Channel identified in DATA | Key Error: {}'.format(err)
             raise KepError(err_msg)
@@ -106,8 +107,9 @@ def modify_ua_client_connection(server: server, DATA: dict, *, ua_client_connect
         r = server._config_update(server.url + _create_url_client(ua_client_connection), client_data)
         if r.code == 200: return True 
         else: 
-            raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+            raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
         
+@_traced
 def del_ua_client_connection(server: server, ua_client_connection: str) -> bool:
     '''Delete a `"UAG client connection"` object in Kepware.
     
@@ -122,8 +124,9 @@ def del_ua_client_connection(server: server, ua_client_connection: str) -> bool:
     r = server._config_del(server.url + _create_url_client(ua_client_connection))
     if r.code == 200: return True 
     else: 
-        raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+        raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
 
+@_traced
 def get_certificate(server: server, certificate: str) -> dict:
     '''Returns the properties of the UAG client connection certificate object in the UAG client connection 
     certificate store. These are UA server instance certificates that are used by UAG client connections for
@@ -140,6 +143,7 @@ def get_certificate(server: server, certificate: str) -> dict:
     r = server._config_get(server.url + _create_url_cert(_INTER_TYPE.CLIENT, certificate))
     return r.payload
 
+@_traced
 def get_all_certificates(server: server,  *, options: dict = None) -> list:
     '''Returns list of all UAG client connection certificate objects and their properties. These are UA server instance 
     certificates that are used by UAG client connections for trust purposes in the UA security model.
@@ -156,6 +160,26 @@ def get_all_certificates(server: server,  *, options: dict = None) -> list:
     r = server._config_get(server.url + _create_url_cert(_INTER_TYPE.CLIENT), params= options)
     return r.payload
 
+def iter_all_certificates(server: server, *, options: dict = None, page_size: int = 100, prefetch: bool = True) -> Iterator[dict]:
+    '''Returns a generator of all `"certificate"` objects and their properties. The certificates are read from Kepware 
+    one page at a time and the next page is requested while the current page is processed, so large 
+    collections don't have to be held in memory.
+
+    :param server: instance of the `server` class
+    :param options: *(optional)* Dict of parameters to filter or sort the list of certificates. Options are `filter`, 
+        `sortOrder` and `sortProperty`. `pageNumber` sets the first page to read
+    :param page_size: *(optional)* Number of certificates read per request, or None to read all certificates with one 
+        request that is parsed as it is received (default= 100)
+    :param prefetch: *(optional)* Request the next page while the current page is processed (default= True)
+
+    :return: Generator of the data for each certificate
+
+    :raises KepHTTPError: If urllib provides an HTTPError
+    :raises KepURLError: If urllib provides an URLError
+    '''
+    return _iter_pages(lambda o: get_all_certificates(server, options= o), options, page_size, prefetch)
+
+@_traced
 def trust_certificate(server: server, certificate: str) -> bool:
     '''Trusts the certificate in the UAG client connection certifcate store. This is updating the trust state of UA server instance 
     certificates that are used by UAG client connections for trust purposes in the UA security model.
@@ -170,6 +194,7 @@ def trust_certificate(server: server, certificate: str) -> bool:
     '''
     return _change_cert_trust(server, _INTER_TYPE.CLIENT, certificate, True)
     
+@_traced
 def reject_certificate(server: server, certificate: str) -> bool:
     '''Rejects the certificate in the UAG client connection certifcate store. This is updating the trust state of UA server instance 
     certificates that are used by UAG client connections for trust purposes in the UA security model.
@@ -185,6 +210,7 @@ def reject_certificate(server: server, certificate: str) -> bool:
 
     return _change_cert_trust(server, _INTER_TYPE.CLIENT, certificate, False)
 
+@_traced
 def delete_certificate(server: server, certificate: str) -> bool:
     '''Deletes the certificate in the UAG client endpoint certificate store.
 
@@ -198,6 +224,7 @@ def delete_certificate(server: server, certificate: str) -> bool:
     '''
     return _delete_cert_truststore(server, _INTER_TYPE.CLIENT, certificate)
 
+@_traced
 def get_instance_certificate(server: server) -> dict:
     '''Returns the properties of the UAG client instance certificate object in the UAG certificate store. 
     These are UAG instance certificates that are used by UAG for trust purposes in the UA security model.
@@ -212,6 +239,7 @@ def get_instance_certificate(server: server) -> dict:
     r = server._config_get(server.url + _create_url_inst_cert(_INTER_TYPE.CLIENT, CLIENT_INSTANCE_CERTIFICATE))
     return r.payload
 
+@_traced
 def reissue_self_signed_instance_certificate(server: server, job_ttl: int = None) -> KepServiceResponse:
     '''Deletes and reissues a self-signed UAG server instance certificate object in the UAG certificate store. 
     This is the UAG instance certificate that are used by UAG for trust purposes in the UA security model.
@@ -229,4 +257,4 @@ def reissue_self_signed_instance_certificate(server: server, job_ttl: int = None
         job = server._kep_service_execute(url, TTL= job_ttl)
         return job
     except Exception as err:
-        raise err
\ No newline at end of file
+        raise err
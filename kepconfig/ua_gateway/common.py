@@ -81,13 +81,13 @@ def _change_cert_trust(server: server, inter_type, certificate: str, trust: bool
     r = server._config_update(server.url + _create_url_cert(inter_type, certificate), cert_data)
     if r.code == 200: return True 
     else: 
-        raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+        raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
     
 def _delete_cert_truststore(server: server, inter_type, certificate: str):
     r = server._config_del(server.url + _create_url_cert(inter_type, certificate))
     if r.code == 200: return True 
     else: 
-        raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+        raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
 
 def _create_url_server(ua_server_endpoint = None):
     '''Creates url object for the "ua_server_endpoints" branch of Kepware's UA Gateway. Used 
@@ -10,7 +10,9 @@ Certificate store read, remove and trust functionality is also available for the
 server endpoints.
 """
 
-from typing import Union
+from typing import Union, Iterator
+from ..utils import _add_result, _multi_status_data, _iter_pages
+from ..tracing import _traced
 
 from kepconfig.structures import KepServiceResponse
 from ..connection import server
@@ -19,6 +21,7 @@ from ..ua_gateway.common import _INTER_TYPE, _change_cert_trust, _create_url_cer
 
 SERVER_INSTANCE_CERTIFICATE = 'Server Instance Certificate'
 
+@_traced
 def get_uag_server_interface_properties(server: server) -> dict:
     ''' Get the UAG Server Interface Properties of the Kepware instance. These properties expose User Identify
     Policy, Security Policy and other Communication properties that are applied across all UAG server endpoints.
@@ -32,6 +35,7 @@ def get_uag_server_interface_properties(server: server) -> dict:
     r = server._config_get(server.url + SERVER_ROOT)
     return r.payload
 
+@_traced
 def modify_uag_server_interface_properties(server: server, DATA: dict, force: bool = False) -> bool:
     ''' Modify the UAG Server Interface Properties of the Kepware instance. These properties expose User Identify
     Policy, Security Policy and other Communication properties that are applied across all UAG server endpoints.
@@ -48,9 +52,10 @@ def modify_uag_server_interface_properties(server: server, DATA: dict, force: bo
     prop_data = server._force_update_check(force, DATA)
     r = server._config_update(server.url + SERVER_ROOT, prop_data)
     if r.code == 200: return True 
-    else: raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+    else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
 
 
+@_traced
 def get_ua_server_endpoint(server: server, ua_server_endpoint: str) -> dict:
     '''Returns the properties of the UAG server endpoint object.
     
@@ -65,6 +70,7 @@ def get_ua_server_endpoint(server: server, ua_server_endpoint: str) -> dict:
     r = server._config_get(server.url + _create_url_server(ua_server_endpoint))
     return r.payload
 
+@_traced
 def get_all_ua_server_endpoints(server: server,  *, options: dict = None) -> dict:
     '''Returns list of all UAG server endpoint objects and their properties.
     
@@ -80,7 +86,8 @@ def get_all_ua_server_endpoints(server: server,  *, options: dict = None) -> dic
     r = server._config_get(server.url + _create_url_server())
     return r.payload
 
-def add_ua_server_endpoint(server: server, DATA: Union[dict, list]) -> Union[bool, list]:
+@_traced
+def add_ua_server_endpoint(server: server, DATA: Union[dict, list], *, multi_status: bool = False) -> Union[bool, list]:
     '''Add a `"UAG server endpoint"` or multiple `"UAG server endpoint"` objects to Kepware. This allows you 
     to create a server endpoint with all needed properties.
 
@@ -89,6 +96,8 @@ def add_ua_server_endpoint(server: server, DATA: Union[dict, list]) -> Union[boo
     :param server: instance of the `server` class
     :param DATA: Dict of the endpoint or a list of endpoints
     expected by Kepware Configuration API
+    :param multi_status: *(optional)* If True, returns a `MultiStatusResult` with the status of every object instead of 
+    True or the list of failures. (default= False)
 
     :return: True - If a "HTTP 201 - Created" is received from Kepware server
     :return: If a "HTTP 207 - Multi-Status" is received from Kepware with a list of dict error responses for all 
@@ -97,17 +106,11 @@ def add_ua_server_endpoint(server: server, DATA: Union[dict, list]) -> Union[boo
     :raises KepHTTPError: If urllib provides an HTTPError
     :raises KepURLError: If urllib provides an URLError
     '''
+    DATA = _multi_status_data(DATA, multi_status)
     r = server._config_add(server.url + _create_url_server(), DATA)
-    if r.code == 201: return True
-    elif r.code == 207:
-        errors = [] 
-        for item in r.payload:
-            if item['code'] != 201:
-                errors.append(item)
-        return errors
-    else: 
-        raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+    return _add_result(r, DATA, multi_status, lambda items: add_ua_server_endpoint(server, items, multi_status= True))
     
+@_traced
 def modify_ua_server_endpoint(server: server, DATA: dict, *, ua_server_endpoint: str = None, force: bool = False) -> bool:
     '''Modify a UAG server endpoint object and it's properties in Kepware. If a `"ua_server_endpoint"` is not provided as an input,
     you need to identify the client connection in the *'common.ALLTYPES_NAME'* property field in `"DATA"`. It will 
@@ -129,7 +132,7 @@ def modify_ua_server_endpoint(server: server, DATA: dict, *, ua_server_endpoint:
         try:
             r = server._config_update(server.url + _create_url_server(server_data['common.ALLTYPES_NAME']), server_data)
             if r.code == 200: return True 
-            else: raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+            else: raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
         except KeyError as err:
             err_msg = 'Error: No Channel identified in DATA | Key Error: {}'.format(err)
             raise KepError(err_msg)
@@ -139,8 +142,9 @@ def modify_ua_server_endpoint(server: server, DATA: dict, *, ua_server_endpoint:
         r = server._config_update(server.url + _create_url_server(ua_server_endpoint), server_data)
         if r.code == 200: return True 
         else: 
-            raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+            raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
         
+@_traced
 def del_ua_server_endpoint(server: server, ua_server_endpoint: str) -> bool:
     '''Delete a `"UAG server endpoint"` object in Kepware.
     
@@ -155,8 +159,9 @@ def del_ua_server_endpoint(server: server, ua_server_endpoint: str) -> bool:
     r = server._config_del(server.url + _create_url_server(ua_server_endpoint))
     if r.code == 200: return True 
     else: 
-        raise KepHTTPError(r.url, r.code, r.msg, r.hdrs, r.payload)
+        raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
 
+@_traced
 def get_certificate(server: server, certificate: str) -> dict:
     '''Returns the properties of the UAG server endpoint certificate object in the UAG client connection 
     certificate store. These are UA client instance certificates that are used by UAG server endpoints for
@@ -173,6 +178,7 @@ def get_certificate(server: server, certificate: str) -> dict:
     r = server._config_get(server.url + _create_url_cert(_INTER_TYPE.SERVER, certificate))
     return r.payload
 
+@_traced
 def get_all_certificates(server: server, *, options: dict = None) -> list:
     '''Returns list of all UAG server endpoint certificate objects and their properties.This is updating the trust state of UA client instance 
     certificates that are used by UAG server endpoints for trust purposes in the UA security model. These are UA client instance certificates 
@@ -190,6 +196,26 @@ def get_all_certificates(server: server, *, options: dict = None) -> list:
     r = server._config_get(server.url + _create_url_cert(_INTER_TYPE.SERVER), params= options)
     return r.payload
 
+def iter_all_certificates(server: server, *, options: dict = None, page_size: int = 100, prefetch: bool = True) -> Iterator[dict]:
+    '''Returns a generator of all `"certificate"` objects and their properties. The certificates are read from Kepware 
+    one page at a time and the next page is requested while the current page is processed, so large 
+    collections don't have to be held in memory.
+
+    :param server: instance of the `server` class
+    :param options: *(optional)* Dict of parameters to filter or sort the list of certificates. Options are `filter`, 
+        `sortOrder` and `sortProperty`. `pageNumber` sets the first page to read
+    :param page_size: *(optional)* Number of certificates read per request, or None to read all certificates with one 
+        request that is parsed as it is received (default= 100)
+    :param prefetch: *(optional)* Request the next page while the current page is processed (default= True)
+
+    :return: Generator of the data for each certificate
+
+    :raises KepHTTPError: If urllib provides an HTTPError
+    :raises KepURLError: If urllib provides an URLError
+    '''
+    return _iter_pages(lambda o: get_all_certificates(server, options= o), options, page_size, prefetch)
+
+@_traced
 def trust_certificate(server: server, certificate: str) -> bool:
     '''Trusts the certificate in the UAG server endpoint certificate store. This is updating the trust state of UA client instance 
     certificates that are used by UAG server endpoints for trust purposes in the UA security model.
@@ -204,6 +230,7 @@ def trust_certificate(server: server, certificate: str) -> bool:
     '''
     return _change_cert_trust(server, _INTER_TYPE.SERVER, certificate, True)
 
+@_traced
 def reject_certificate(server: server, certificate: str) -> bool:
     '''Rejects the certificate in the UAG server endpoint certificate store.
 
@@ -217,6 +244,7 @@ def reject_certificate(server: server, certificate: str) -> bool:
     '''
     return _change_cert_trust(server, _INTER_TYPE.SERVER, certificate, False)
 
+@_traced
 def delete_certificate(server: server, certificate: str) -> bool:
     '''Deletes the certificate in the UAG server endpoint certificate store.
 
@@ -230,6 +258,7 @@ def delete_certificate(server: server, certificate: str) -> bool:
     '''
     return _delete_cert_truststore(server, _INTER_TYPE.SERVER, certificate)
 
+@_traced
 def get_instance_certificate(server: server) -> dict:
     '''Returns the properties of the UAG server instance certificate object in the UAG certificate store. 
     These are UAG instance certificates that are used by UAG for trust purposes in the UA security model.
@@ -244,6 +273,7 @@ def get_instance_certificate(server: server) -> dict:
     r = server._config_get(server.url + _create_url_inst_cert(_INTER_TYPE.SERVER, SERVER_INSTANCE_CERTIFICATE))
     return r.payload
 
+@_traced
 def reissue_self_signed_instance_certificate(server: server, job_ttl: int = None) -> KepServiceResponse:
     '''Deletes and reissues a self-signed UAG server instance certificate object in the UAG certificate store. 
     This is the UAG instance certificate that are used by UAG for trust purposes in the UA security model.
@@ -261,4 +291,4 @@ def reissue_self_signed_instance_certificate(server: server, job_ttl: int = None
         job = server._kep_service_execute(url, TTL= job_ttl)
         return job
     except Exception as err:
-        raise err
\ No newline at end of file
+        raise err
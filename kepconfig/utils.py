@@ -8,7 +8,13 @@ r"""`utils` provides general utilities to help manage
 various objects for Kepware's configuration
 """
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import contextvars
 from urllib import parse
+from .error import KepHTTPError
+from .structures import MultiStatusResult
+from .helpers.json_stream import _stream_response
 
 def path_split(path: str):
     '''Used to split the standard Kepware address decimal notation into a dict that contains the 
@@ -52,3 +58,128 @@ def _url_parse_object(object):
     
     Reserved character list that Kepware allows in object names: :/?#[]@!$&'()*+,;='''
     return parse.quote(object, safe='')
+
+def _multi_status_data(DATA, multi_status: bool = False):
+    '''Returns DATA as a list if *multi_status* is True and DATA is an iterable other than a dict or list, so
+    the objects sent are still available to build the `MultiStatusResult` after the request.'''
+    if multi_status and not isinstance(DATA, (dict, list)):
+        return list(DATA)
+    return DATA
+
+def _add_result(r, DATA, multi_status: bool = False, resubmit = None):
+    '''Common handling of the response of an add call. Returns True if all objects were created (HTTP 201) 
+    or the list of error responses for the objects that failed (HTTP 207). Returns a `MultiStatusResult` 
+    instead if *multi_status* is True, which uses *resubmit* to retry failed objects.'''
+    if r.code not in (201, 207):
+        raise KepHTTPError(code=r.code, msg=r.reason, payload=r.payload)
+    if multi_status:
+        return MultiStatusResult(DATA, r.payload if r.code == 207 else None, resubmit)
+    if r.code == 201:
+        return True
+    return [item for item in r.payload if item['code'] != 201]
+
+def _page_options(options, page_size):
+    '''Returns (options without paging, first page number, page size) for the iter_all_* functions.'''
+    options = dict(options or {})
+    page = int(options.pop('pageNumber', 1))
+    page_size = int(options.pop('pageSize', page_size))
+    if page_size < 1:
+        raise ValueError('page_size must be at least 1')
+    return options, page, page_size
+
+def _split_page(items: list):
+    '''Returns (objects, total count) of a page. The total count is taken from the pagination information that 
+    Kepware adds to the end of paged log reads, or None if the page doesn't include it.'''
+    if items and isinstance(items[-1], dict) and isinstance(items[-1].get('pagination'), dict):
+        return items[:-1], items[-1]['pagination'].get('totalCount')
+    return items, None
+
+def _is_last_page(items: list, total, page: int, page_size: int) -> bool:
+    '''True if no objects are left to read after *page*. A page with more objects than requested means paging 
+    was ignored, so there is nothing left to read either.'''
+    if total is not None and page * page_size >= total:
+        return True
+    return len(items) != page_size
+
+def _iter_pages(get_page, options = None, page_size: int = 100, prefetch: bool = True):
+    '''Generator used by the iter_all_* functions. *get_page* is called with the options of each page and 
+    returns the list of objects of that page. Iteration stops once the total count reported with the page is 
+    reached, or otherwise after a page with fewer than *page_size* objects. If *prefetch* is True the next page 
+    is requested in a background thread while the current page is consumed.
+    
+    If *page_size* is None all objects are read with one request and yielded as the response is parsed.'''
+    if page_size is None and 'pageSize' not in (options or {}):
+        token = _stream_response.set(True)
+        try:
+            items = get_page(options)
+        finally:
+            _stream_response.reset(token)
+        yield from items
+        return
+    options, page, page_size = _page_options(options, page_size)
+    fetch = lambda n: _split_page(get_page({**options, 'pageNumber': n, 'pageSize': page_size}) or [])
+    if not prefetch:
+        while True:
+            items, total = fetch(page)
+            yield from items
+            if _is_last_page(items, total, page, page_size):
+                return
+            page += 1
+    executor = ThreadPoolExecutor(max_workers=1)
+    # Pages are read in a copy of the caller's context so their requests are traced as children of the caller
+    submit = lambda n: executor.submit(contextvars.copy_context().run, fetch, n)
+    future = None
+    try:
+        future = submit(page)
+        while True:
+            items, total = future.result()
+            last = _is_last_page(items, total, page, page_size)
+            future = None
+            if not last:
+                page += 1
+                future = submit(page)
+            yield from items
+            if last:
+                return
+    finally:
+        # A prefetched page that is no longer needed is cancelled, or waited for if it was already sent
+        if future is not None:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+async def _iter_pages_async(get_page, options = None, page_size: int = 100, prefetch: bool = True):
+    '''Async generator version of `_iter_pages`. *get_page* is a coroutine function and the next page 
+    is requested in a separate task while the current page is consumed. If *page_size* is None all 
+    objects are read with one request and decoded as the response is received.'''
+    if page_size is None and 'pageSize' not in (options or {}):
+        token = _stream_response.set(True)
+        try:
+            items = await get_page(options)
+        finally:
+            _stream_response.reset(token)
+        async for item in items:
+            yield item
+        return
+    options, page, page_size = _page_options(options, page_size)
+    async def fetch(n):
+        return _split_page(await get_page({**options, 'pageNumber': n, 'pageSize': page_size}) or [])
+    task = asyncio.ensure_future(fetch(page))
+    try:
+        while True:
+            items, total = await task
+            last = _is_last_page(items, total, page, page_size)
+            task = None
+            if not last:
+                page += 1
+                task = asyncio.ensure_future(fetch(page)) if prefetch else None
+            for item in items:
+                yield item
+            if last:
+                return
+            if task is None:
+                task = asyncio.ensure_future(fetch(page))
+    finally:
+        # A prefetched page that is no longer needed is cancelled and waited for so its request is released
+        if task is not None and not task.done():
+            task.cancel()
+            await asyncio.wait([task])
@@ -0,0 +1,175 @@
+# -------------------------------------------------------------------------
+# Copyright (c) PTC Inc. All rights reserved.
+# See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+# Asyncio Test - Test to exectute various calls through the AsyncServer class
+# and the coroutine versions of the Kepware configuration API
+
+import os, sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import asyncio
+import gzip
+import json
+import socket
+from kepconfig import error, connection
+from kepconfig.aio import AsyncServer
+from kepconfig.aio import connectivity
+import pytest
+
+
+# Channel and Device name to be used
+ch_name = 'AsyncChannel'
+dev_name = 'AsyncDevice'
+tag_count = 20
+
+def initialize(server):
+    pass
+
+def complete(server):
+    async def cleanup():
+        async with server:
+            try:
+                await connectivity.channel.del_channel(server, ch_name)
+            except error.KepHTTPError:
+                pass
+    asyncio.run(cleanup())
+
+@pytest.fixture(scope="module")
+def server(kepware_server):
+    sync_server = kepware_server[0]
+    server = AsyncServer(sync_server.host, sync_server.port, sync_server.username, sync_server.password, sync_server.SSL_on)
+    server.SSL_trust_all_certs = sync_server.SSL_trust_all_certs
+    global server_type
+    server_type = kepware_server[1]
+
+    # Initialize any configuration before testing in module
+    initialize(server)
+
+    # Everything below yield is run after module tests are completed
+    yield server
+    complete(server)
+
+def test_async_server_info(server: AsyncServer):
+    async def run():
+        async with server:
+            info, status, props = await asyncio.gather(server.get_info(), server.get_status(), server.get_project_properties())
+            return info, status, props
+    info, status, props = asyncio.run(run())
+    assert type(info) == dict
+    assert type(status) == list
+    assert type(props) == dict
+
+def test_async_connectivity(server: AsyncServer):
+    async def run():
+        async with server:
+            channel_data = {"common.ALLTYPES_NAME": ch_name,"servermain.MULTIPLE_TYPES_DEVICE_DRIVER": "Simulator"}
+            assert await connectivity.channel.add_channel(server, channel_data)
+            device_data = {"common.ALLTYPES_NAME": dev_name,"servermain.MULTIPLE_TYPES_DEVICE_DRIVER": "Simulator"}
+            assert await connectivity.device.add_device(server, ch_name, device_data)
+            tags = [{"common.ALLTYPES_NAME": f'Tag{x}', "servermain.TAG_ADDRESS": f'R{x}'} for x in range(tag_count)]
+            assert await connectivity.tag.add_tag(server, f'{ch_name}.{dev_name}', tags)
+
+            # Concurrent reads of all tags
+            results = await asyncio.gather(*[connectivity.tag.get_tag(server, f'{ch_name}.{dev_name}.Tag{x}') for x in range(tag_count)])
+            assert all(type(r) == dict for r in results)
+
+            # Results of async add calls are re-submitted with retry_failed_async
+            r = await connectivity.tag.add_tag(server, f'{ch_name}.{dev_name}', [{"common.ALLTYPES_NAME": "Tag0"}, 
+                                                {"common.ALLTYPES_NAME": "Retry1", "servermain.TAG_ADDRESS": "R100"}], multi_status= True)
+            assert list(r.failures) == ['Tag0']
+            with pytest.raises(TypeError):
+                r.retry_failed()
+            assert list((await r.retry_failed_async()).failures) == ['Tag0']
+
+            assert type(await connectivity.channel.get_channel_structure(server, ch_name)) == dict
+            assert await connectivity.device.modify_device(server, f'{ch_name}.{dev_name}', {"servermain.DEVICE_SCAN_MODE_RATE_MS": 2000})
+
+            with pytest.raises(error.KepHTTPError):
+                await connectivity.device.get_device(server, f'{ch_name}.NotADevice')
+
+            # Failed writes raise KepHTTPError with the status of the response
+            with pytest.raises(error.KepHTTPError) as err:
+                await connectivity.device.del_device(server, f'{ch_name}.NotADevice')
+            assert err.value.code == 404
+            with pytest.raises(error.KepHTTPError) as err:
+                await connectivity.device.modify_device(server, f'{ch_name}.{dev_name}', {"common.ALLTYPES_NAME": "bad.name"})
+            assert err.value.code == 400
+            assert await connectivity.channel.del_channel(server, ch_name)
+    asyncio.run(run())
+
+def test_async_service(server: AsyncServer):
+    async def run():
+        async with server:
+            job = await server.reinitialize()
+            assert type(job) == connection.KepServiceResponse
+            await asyncio.sleep(1)
+            status = await server.service_status(job)
+            assert type(status) == connection.KepServiceStatus
+            statuses = await server.wait_for_jobs([await server.reinitialize(), await server.reinitialize()], timeout=30)
+            assert all(s.complete for s in statuses)
+    asyncio.run(run())
+
+def test_async_connection_settings(server: AsyncServer):
+    # Requests to a server that doesn't respond fail once the timeout expires
+    listener = socket.socket()
+    listener.bind(('127.0.0.1', 0))
+    listener.listen()
+    try:
+        async def run():
+            async with AsyncServer('127.0.0.1', listener.getsockname()[1], 'Administrator', '', timeout= 0.2) as silent:
+                with pytest.raises(error.KepURLError):
+                    await silent.get_info()
+        asyncio.run(run())
+    finally:
+        listener.close()
+
+    # Connections are established again after the SSL settings change
+    async def run():
+        async with server:
+            assert type(await server.get_info()) == dict
+            current = server.SSL_trust_all_certs
+            server.SSL_trust_all_certs = not current
+            server.SSL_trust_all_certs = current
+            assert type(await server.get_info()) == dict
+    asyncio.run(run())
+
+def test_async_streaming(server: AsyncServer, tmp_path):
+    async def run():
+        async with AsyncServer(server.host, server.port, server.username, server.password, server.SSL_on, max_connections= 1) as client:
+            client.SSL_trust_all_certs = server.SSL_trust_all_certs
+            channel_data = {"common.ALLTYPES_NAME": ch_name,"servermain.MULTIPLE_TYPES_DEVICE_DRIVER": "Simulator"}
+            assert await connectivity.channel.add_channel(client, channel_data)
+            device_data = {"common.ALLTYPES_NAME": dev_name,"servermain.MULTIPLE_TYPES_DEVICE_DRIVER": "Simulator"}
+            assert await connectivity.device.add_device(client, ch_name, device_data)
+            tags = [{"common.ALLTYPES_NAME": f'Tag{x}', "servermain.TAG_ADDRESS": f'R{x}'} for x in range(tag_count)]
+            assert await connectivity.tag.add_tag(client, f'{ch_name}.{dev_name}', tags)
+
+            # Responses are parsed as they are received, also when they are compressed
+            for compress in (False, True):
+                client.compress_responses = compress
+                names = [t['common.ALLTYPES_NAME'] async for t in connectivity.tag.iter_all_tags(client, f'{ch_name}.{dev_name}', page_size=None)]
+                assert names == [t['common.ALLTYPES_NAME'] for t in tags]
+                objects = [item async for item in client.iter_project_configuration()]
+                assert objects[-1][1] is None and 'project' in objects[-1][2]
+                assert ((ch_name, dev_name), 'tags', tags[0]) in [(path, collection, {k: v for k, v in obj.items() if k in tags[0]}) 
+                                                                   for path, collection, obj in objects]
+
+            # The project is written to the file as it is received
+            for filename in ('project.json', 'project.json.gz'):
+                path = os.path.join(tmp_path, filename)
+                size = await client.export_project_to_file(path)
+                opener = gzip.open if filename.endswith('.gz') else open
+                with opener(path, 'rb') as f:
+                    data = f.read()
+                assert len(data) == size
+                assert json.loads(data) == await client.export_project_configuration()
+            assert sorted(os.listdir(tmp_path)) == ['project.json', 'project.json.gz']
+
+            # The connection is released when iteration stops early, so the next request can use it
+            async for item in client.iter_project_configuration():
+                break
+            assert type(await asyncio.wait_for(client.get_info(), 5)) == dict
+            assert await connectivity.channel.del_channel(client, ch_name)
+    asyncio.run(run())
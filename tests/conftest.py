@@ -10,8 +10,20 @@ import pytest, sys, os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 import kepconfig
 
+# Set KEPCONFIG_STAND_IN=1 to run the tests against a local stand-in instead of a Kepware instance
+@pytest.fixture(scope="session")
+def stand_in():
+    if not os.environ.get('KEPCONFIG_STAND_IN'):
+        yield None
+        return
+    from kepconfig.testing import StandInServer
+    with StandInServer() as stand_in:
+        yield stand_in
+
 @pytest.fixture(scope="module")
-def kepware_server():
+def kepware_server(stand_in):
+    if stand_in is not None:
+        return [stand_in.client(), 'TKS']
     return [kepconfig.connection.server(host = '127.0.0.1', port = 57412, user = 'Administrator', pw = '', https = False), 'TKS']
     
     # server = kepconfig.connection.server(host = '127.0.0.1', port = 57513, user = 'Administrator', pw = '', https = True)
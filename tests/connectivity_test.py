@@ -10,6 +10,7 @@
 import os, sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from kepconfig import connectivity, error, connection
+from kepconfig.structures import MultiStatusResult
 import json
 import time
 import datetime
@@ -311,6 +312,131 @@ def test_tag_group_add(server):
     tag_path = '{}.{}'.format(ch_name, dev_name)
     assert connectivity.tag.add_tag_group(server, tag_path, tag_group_info)
 
+def test_tag_bulk_add(server):
+    # Large tag group is added without its tags first and the tags are added in chunks
+    bulk_group = {
+        "common.ALLTYPES_NAME": "BulkGroup",
+        "tags": [{"common.ALLTYPES_NAME": f"Bulk{x}", "servermain.TAG_ADDRESS": f"R{x}"} for x in range(120)]
+    }
+    dev_path = '{}.{}'.format(ch_name, dev_name)
+    bulk_data = {
+        dev_path: {
+            'tags': [{"common.ALLTYPES_NAME": f"BulkTag{x}", "servermain.TAG_ADDRESS": f"K{x}"} for x in range(30)],
+            'tag_groups': [bulk_group]
+        }
+    }
+    r = connectivity.tag.bulk_add_tags(server, bulk_data, max_items=25, max_workers=2)
+    assert type(r) == MultiStatusResult
+    assert r.all_succeeded
+    assert f'{dev_path}.BulkGroup.Bulk119' in r.successes
+    assert len(connectivity.tag.get_all_tags(server, f'{dev_path}.BulkGroup')) == 120
+
+    # Failures are keyed by the path of the tag. "Temp" already exists at the device level
+    r = connectivity.tag.bulk_add_tags(server, {dev_path: [{"common.ALLTYPES_NAME": "Temp", "servermain.TAG_ADDRESS": "R0"}]})
+    assert not r.all_succeeded
+    assert f'{dev_path}.Temp' in r.failures
+
+    assert connectivity.tag.del_tag_group(server, f'{dev_path}.BulkGroup')
+
+def test_tag_bulk_add_transport_error(server, monkeypatch):
+    # A chunk that fails with a connection error is recorded as failed and the other chunks are still added
+    dev_path = '{}.{}'.format(ch_name, dev_name)
+    config_add = server._config_add
+    calls = []
+    def flaky_add(url, DATA):
+        calls.append(url)
+        if len(calls) == 2:
+            raise error.KepURLError(url=url, msg='connection reset')
+        return config_add(url, DATA)
+    monkeypatch.setattr(server, '_config_add', flaky_add)
+    tags = [{"common.ALLTYPES_NAME": f"Flaky{x}", "servermain.TAG_ADDRESS": f"R{x}"} for x in range(30)]
+    r = connectivity.tag.bulk_add_tags(server, {dev_path: tags}, max_items=10, max_workers=1)
+    assert len(calls) == 3
+    assert sorted(r.failures) == sorted(f'{dev_path}.Flaky{x}' for x in range(10, 20))
+    assert r.failures[f'{dev_path}.Flaky10']['code'] == None
+    assert len(r.successes) == 20
+
+    # The failed chunk is re-submitted at the path it was added to
+    r.retry_failed()
+    assert r.all_succeeded
+    assert len(r.successes) == 30
+    for x in range(30):
+        assert connectivity.tag.del_tag(server, f'{dev_path}.Flaky{x}')
+
+def test_tag_add_multi_status(server):
+    dev_path = '{}.{}'.format(ch_name, dev_name)
+    tag_info = [
+        {"common.ALLTYPES_NAME": "Multi1", "servermain.TAG_ADDRESS": "R10"},
+        {"common.ALLTYPES_NAME": "Temp", "servermain.TAG_ADDRESS": "R0"},
+        {"common.ALLTYPES_NAME": "Multi2", "servermain.TAG_ADDRESS": "R11"}
+    ]
+    r = connectivity.tag.add_tag(server, dev_path, tag_info, multi_status=True)
+    assert type(r) == MultiStatusResult
+    assert set(r.successes) == {'Multi1', 'Multi2'}
+    assert list(r.failures) == ['Temp']
+    assert r.all_succeeded == False
+    assert r.failed_items == [tag_info[1]]
+    assert len(r.errors) == 1
+    for code, names in r.failures_by_code.items():
+        assert names == ['Temp']
+
+    # Only the failed tag is re-submitted and it still fails since it exists
+    r.retry_failed()
+    assert list(r.failures) == ['Temp']
+    assert set(r.successes) == {'Multi1', 'Multi2'}
+
+    assert connectivity.tag.del_tag(server, f'{dev_path}.Multi1')
+    assert connectivity.tag.del_tag(server, f'{dev_path}.Multi2')
+
+    # Objects passed as a generator are kept to build the result
+    r = connectivity.tag.add_tag(server, dev_path, (tag for tag in tag_info), multi_status=True)
+    assert set(r.successes) == {'Multi1', 'Multi2'}
+    assert r.failed_items == [tag_info[1]]
+
+    assert connectivity.tag.del_tag(server, f'{dev_path}.Multi1')
+    assert connectivity.tag.del_tag(server, f'{dev_path}.Multi2')
+
+def test_multi_status_request_failure():
+    # Unnamed objects are indexed by position and are marked as failed when a re-submit fails as a whole
+    tag_info = [{"servermain.TAG_ADDRESS": "R10"}, {"common.ALLTYPES_NAME": "Multi1", "servermain.TAG_ADDRESS": "R11"}]
+    def resubmit(items):
+        raise error.KepHTTPError(code=503, msg='Service Unavailable', payload='Service Unavailable')
+    r = MultiStatusResult(tag_info, [{'code': 400, 'message': 'Invalid'}] * 2, resubmit)
+    r.retry_failed()
+    assert r.failures_by_code == {503: ['0', 'Multi1']}
+    assert r.successes == {}
+
+    # The outcome of unnamed objects is matched by their position in the re-submitted list
+    r = MultiStatusResult(tag_info, [{'code': 201}, {'code': 400, 'message': 'Invalid'}],
+                          lambda items: MultiStatusResult(items, [{'code': 201}]))
+    r.retry_failed()
+    assert r.all_succeeded
+    assert set(r.successes) == {'0', 'Multi1'}
+
+def test_tag_add_streamed(server):
+    dev_path = '{}.{}'.format(ch_name, dev_name)
+    # A generator is sent as a JSON array as it is consumed
+    tag_info = ({"common.ALLTYPES_NAME": f"Stream{x}", "servermain.TAG_ADDRESS": f"R{20 + x}"} for x in range(10))
+    assert connectivity.tag.add_tag(server, dev_path, tag_info) == True
+    for x in range(10):
+        assert connectivity.tag.del_tag(server, f'{dev_path}.Stream{x}')
+
+def test_tracing(server, tmp_path):
+    from kepconfig.tracing import Tracer
+    server.tracer = Tracer()
+    try:
+        connectivity.channel.get_channel_structure(server, ch_name, serialize= False)
+        spans = server.tracer.spans()
+        root = spans[-1]
+        assert root.name == 'connectivity.channel.get_channel_structure' and root.parent_id is None
+        # Every HTTP request is recorded below the top level call
+        requests = [s for s in spans if s.name.startswith('HTTP GET')]
+        assert requests and all(s.parent_id is not None for s in requests)
+        server.tracer.write_chrome_trace(str(tmp_path / 'trace.json'))
+        assert len(server.tracer.to_chrome_trace()['traceEvents']) == len(spans)
+    finally:
+        server.tracer = None
+
     #
     # Examples of reading properties for various objects (channels, devices, tags, etc)
     #
@@ -326,7 +452,11 @@ def test_channel_get(server):
     assert len(r) == 1
 
 def test_channel_struct_get(server):
-    assert type(connectivity.channel.get_channel_structure(server,ch_name)) == dict
+    r = connectivity.channel.get_channel_structure(server,ch_name, serialize=True)
+    assert type(r) == dict
+    # Recursive walk without serialized content
+    walked = connectivity.channel.get_channel_structure(server,ch_name, serialize=False)
+    assert [d['common.ALLTYPES_NAME'] for d in r['device']] == [d['common.ALLTYPES_NAME'] for d in walked['device']]
 
 def test_device_get(server):
     # Get Device
@@ -349,7 +479,11 @@ def test_device_tag_all_get(server):
     # props = server.get_project_properties()
     # proj_id = props['PROJECT_ID']
     dev_path = '{}.{}'.format(ch_name, dev_name)
-    assert type(connectivity.device.get_device_structure(server, dev_path)) == dict
+    r = connectivity.device.get_device_structure(server, dev_path, serialize=True)
+    assert type(r) == dict
+    walked = connectivity.device.get_device_structure(server, dev_path, serialize=False)
+    assert len(r['tags']) == len(walked['tags'])
+    assert len(r['tag_groups']) == len(walked['tag_groups'])
 
 def test_tag_get(server):
     # Get Tag
@@ -371,6 +505,42 @@ def test_tag_get(server):
     tag_path = '{}.{}'.format(ch_name, dev_name)
     assert type(connectivity.tag.get_all_tags(server, tag_path)) == list
 
+    # Iterate All Tags one page at a time, with and without prefetching the next page
+    all_tags = connectivity.tag.get_all_tags(server, tag_path)
+    names = [t['common.ALLTYPES_NAME'] for t in all_tags]
+    assert [t['common.ALLTYPES_NAME'] for t in connectivity.tag.iter_all_tags(server, tag_path, page_size=2)] == names
+    assert len(list(connectivity.tag.iter_all_tags(server, tag_path, page_size=2, prefetch=False))) == len(all_tags)
+    # Without paging the response is parsed as it is received
+    assert [t['common.ALLTYPES_NAME'] for t in connectivity.tag.iter_all_tags(server, tag_path, page_size=None)] == names
+
+def test_iter_pages():
+    from kepconfig.utils import _iter_pages
+    import threading
+    objects = [{"common.ALLTYPES_NAME": f"Tag{x}"} for x in range(6)]
+    requested = []
+    def get_page(options):
+        requested.append(options['pageNumber'])
+        start = (options['pageNumber'] - 1) * options['pageSize']
+        return objects[start:start + options['pageSize']] + [{'pagination': {'totalCount': len(objects)}}]
+    # No page is requested past the total count, also when it is a multiple of the page size
+    for prefetch in (True, False):
+        requested.clear()
+        assert list(_iter_pages(get_page, page_size=3, prefetch=prefetch)) == objects
+        assert requested == [1, 2]
+
+    # The prefetched page is cancelled or has completed once iteration stops early
+    running = threading.Event()
+    def slow_page(options):
+        running.set()
+        time.sleep(0.1)
+        running.clear()
+        return objects[:2]
+    pages = _iter_pages(slow_page, page_size=2)
+    next(pages)
+    time.sleep(0.05)
+    pages.close()
+    assert not running.is_set()
+
 def test_tag_group_get(server):
     # Get Tag Group
     tag_group_path = '{}.{}.{}'.format(ch_name, dev_name, f'{taggrpnm}.ALARM2')
@@ -398,7 +568,11 @@ def test_tag_struct_get(server):
     # props = server.get_project_properties()
     # proj_id = props['PROJECT_ID']
     tag_path = '{}.{}'.format(ch_name, dev_name)
-    assert type(connectivity.tag.get_full_tag_structure(server, tag_path, recursive=True)) == dict
+    assert type(connectivity.tag.get_full_tag_structure(server, tag_path, recursive=True, serialize=True)) == dict
+    serial = connectivity.tag.get_full_tag_structure(server, tag_path, recursive=True, serialize=False)
+    assert type(serial) == dict
+    # Parallel walk returns the same structure
+    assert connectivity.tag.get_full_tag_structure(server, tag_path, recursive=True, max_workers=4, serialize=False) == serial
     tag_path = '{}.{}.{}'.format(ch_name, dev_name, f'{taggrpnm}.ALARM2')
     assert type(connectivity.tag.get_full_tag_structure(server, tag_path)) == dict
 
@@ -13,7 +13,9 @@ import kepconfig
 import time
 import datetime
 import pytest
-from kepconfig.structures import Filter, FilterFieldEnum, FilterModifierEnum
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from kepconfig.structures import Filter, FilterFieldEnum, FilterModifierEnum, RetryPolicy, RateLimit, AdaptiveConcurrency, CachePolicy, DiskCache, JsonCodec
 
 
 # Channel and Device name to be used
@@ -82,6 +84,256 @@ def test_connection_params(server: kepconfig.connection.server):
 
     server.SSL_trust_all_certs = current[0]
     server.SSL_ignore_hostname = current[1]
+
+def test_connection_pool(server: kepconfig.connection.server):
+    current = server.pool_size
+    server.pool_size = 2
+    assert server.pool_size == 2
+    # Invalid values are ignored
+    server.pool_size = 0
+    assert server.pool_size == 2
+
+    # Requests continue to work on reused and re-established connections
+    assert type(server.get_info()) == dict
+    assert type(server.get_info()) == dict
+    server.close()
+    assert type(server.get_info()) == dict
+
+    server.pool_size = current
+
+def test_redirect(server: kepconfig.connection.server):
+    # GET requests follow redirects to the Kepware instance
+    class Redirect(BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.send_response(307)
+            self.send_header('Location', server.url[:server.url.find('/config')] + self.path)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+        def log_message(self, *args):
+            pass
+    redirect = ThreadingHTTPServer(('127.0.0.1', 0), Redirect)
+    threading.Thread(target=redirect.serve_forever, daemon=True).start()
+    try:
+        client = kepconfig.connection.server('127.0.0.1', redirect.server_address[1], server.username, server.password)
+        assert client.get_info() == server.get_info()
+    finally:
+        redirect.shutdown()
+        redirect.server_close()
+
+def test_retry_policy(server: kepconfig.connection.server):
+    current = server.retry_policy
+    assert type(current) == RetryPolicy
+
+    policy = RetryPolicy(max_attempts=5, backoff_factor=0.1, max_backoff=1.0, jitter=False)
+    server.retry_policy = policy
+    assert server.retry_policy is policy
+    # Invalid values are ignored
+    server.retry_policy = 5
+    assert server.retry_policy is policy
+
+    assert policy.is_retry(429, 1)
+    assert not policy.is_retry(429, 5)
+    assert not policy.is_retry(404, 1)
+    assert policy.get_backoff(1) == 0.1
+    assert policy.get_backoff(3) == 0.4
+    assert policy.get_backoff(10) == 1.0
+    assert policy.get_backoff(1, retry_after=0.5) == 0.5
+
+    assert type(server.get_info()) == dict
+    stats = server.retry_stats
+    assert set(stats) == {'retried_requests', 'retries', 'exhausted', 'wait_time'}
+
+    server.retry_policy = None
+    assert server.retry_policy is None
+    assert type(server.get_info()) == dict
+    server.retry_policy = current
+
+def test_rate_limit(server: kepconfig.connection.server):
+    limit = RateLimit(rate=5, max_concurrent=2)
+    assert limit.burst == 5
+    server.read_limit = limit
+    server.write_limit = RateLimit(rate=2, max_concurrent=1)
+    assert server.read_limit is limit
+    assert server.write_limit.max_concurrent == 1
+    with pytest.raises(ValueError):
+        RateLimit(rate=0)
+
+    # Requests beyond the burst are spaced out by the rate
+    start = time.perf_counter()
+    for _ in range(7):
+        assert type(server.get_info()) == dict
+    assert time.perf_counter() - start >= 0.3
+
+    server.read_limit = None
+    server.write_limit = None
+    assert server.read_limit is None
+
+def test_adaptive_concurrency(server: kepconfig.connection.server):
+    assert server.adaptive_concurrency is None
+    assert server.adaptive_stats is None
+    with pytest.raises(ValueError):
+        AdaptiveConcurrency(initial_limit=10, max_limit=5)
+
+    server.adaptive_concurrency = AdaptiveConcurrency(initial_limit=2, max_limit=8)
+    for _ in range(10):
+        assert type(server.get_info()) == dict
+    stats = server.adaptive_stats
+    assert 2 <= stats['window'] <= 8
+    assert stats['in_flight'] == 0
+    assert stats['increases'] > 0
+
+    server.adaptive_concurrency = None
+    assert server.adaptive_stats is None
+
+def test_adaptive_latency_class():
+    from kepconfig.helpers.adaptive import _AdaptiveLimiter, _latency_class
+    limiter = _AdaptiveLimiter(AdaptiveConcurrency(initial_limit=4, max_limit=4))
+    read = _latency_class('GET', 'http://host/config/v1/project/channels/Channel1')
+    serialized = _latency_class('GET', 'http://host/config/v1/project/channels/Channel1?content=serialize')
+    assert read == _latency_class('GET', 'http://host/config/v1/project/channels/Channel2')
+    assert read != serialized
+    def release(key, latency):
+        limiter.acquire()
+        limiter.release(time.monotonic() - latency, None, key)
+    for _ in range(20):
+        release(read, 0.001)
+    # A slow serialized read is compared with the latency of its own class and isn't an overload
+    for _ in range(20):
+        release(serialized, 0.5)
+    assert limiter.as_dict()['decreases'] == 0
+    release(read, 0.5)
+    assert limiter.as_dict()['decreases'] == 1
+
+def test_project_id_tracking(server: kepconfig.connection.server):
+    assert server.project_id_tracking == False
+    assert server.project_id_stats is None
+    server.project_id_tracking = True
+    assert server.project_id_tracking == True
+
+    props = server.get_project_properties()
+    assert server.project_id_stats['project_id'] == props['PROJECT_ID']
+    # Uses the tracked PROJECT_ID and reads it again after the project changed
+    assert server.modify_project_properties({"servermain.PROJECT_TITLE": "Tracked"})
+    assert server.modify_project_properties({"servermain.PROJECT_TITLE": "Tracked2"})
+    stats = server.project_id_stats
+    assert stats['hits'] >= 1
+
+    # Outdated PROJECT_ID is corrected by reading it again
+    server._project_id_tracker.set(-1)
+    assert server.modify_project_properties({"servermain.PROJECT_TITLE": ""})
+    assert server.project_id_stats['conflicts'] == stats['conflicts'] + 1
+
+    server.project_id_tracking = False
+    assert server.project_id_stats is None
+
+def test_response_cache(server: kepconfig.connection.server):
+    assert server.cache_policy is None
+    assert server.cache_stats is None
+    server.cache_policy = CachePolicy(max_entries=10, ttl=60)
+
+    props = server.get_project_properties()
+    props['servermain.PROJECT_TITLE'] = 'Changed locally'
+    # Second read is served from the cache and isn't affected by changes to the first result
+    assert server.get_project_properties() != props
+    assert server.cache_stats['hits'] == 1
+
+    # Writes invalidate the object, so the next read returns the new value
+    assert server.modify_project_properties({"servermain.PROJECT_TITLE": "Cached"})
+    assert server.get_project_properties()['servermain.PROJECT_TITLE'] == 'Cached'
+    assert server.cache_stats['invalidations'] >= 1
+    assert server.modify_project_properties({"servermain.PROJECT_TITLE": ""})
+
+    server.clear_cache()
+    assert server.cache_stats['entries'] == 0
+    server.cache_policy = None
+    assert server.cache_stats is None
+
+def test_disk_cache(server: kepconfig.connection.server, tmp_path):
+    assert server.disk_cache is None
+    assert server.disk_cache_stats is None
+    server.disk_cache = DiskCache(str(tmp_path))
+
+    project = server.export_project_configuration()
+    assert server.disk_cache_stats['stores'] == 1
+    # A new instance loads the unchanged project from disk
+    other = kepconfig.connection.server(server.host, server.port, server.username, server.password, server.SSL_on)
+    other.SSL_trust_all_certs = server.SSL_trust_all_certs
+    other.disk_cache = DiskCache(str(tmp_path))
+    assert other.export_project_configuration() == project
+    assert other.disk_cache_stats['hits'] == 1
+
+    # Changing the project changes the PROJECT_ID so the copy on disk isn't used
+    assert server.modify_project_properties({"servermain.PROJECT_TITLE": "DiskCache"})
+    assert other.export_project_configuration()['project']['servermain.PROJECT_TITLE'] == 'DiskCache'
+    assert other.disk_cache_stats['misses'] == 1
+    assert server.modify_project_properties({"servermain.PROJECT_TITLE": ""})
+    server.disk_cache = None
+
+def test_coalesce_reads(server: kepconfig.connection.server):
+    from concurrent.futures import ThreadPoolExecutor
+    assert server.coalesce_reads == False
+    assert server.coalesce_stats is None
+    server.coalesce_reads = True
+    assert server.coalesce_reads == True
+    stats = server.coalesce_stats
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        results = list(executor.map(lambda _: server.get_project_properties(), range(10)))
+    # Every caller gets its own copy of the same result
+    assert all(r == results[0] for r in results)
+    assert len({id(r) for r in results}) == len(results)
+    new_stats = server.coalesce_stats
+    assert new_stats['requests'] + new_stats['coalesced'] == stats['requests'] + stats['coalesced'] + 10
+
+    server.coalesce_reads = False
+    assert server.coalesce_stats is None
+    assert type(server.get_project_properties()) == dict
+
+def test_json_codec(server: kepconfig.connection.server):
+    default = server.json_codec
+    assert isinstance(default, JsonCodec)
+    props = server.get_project_properties()
+    # The standard library codec decodes to the same result
+    server.json_codec = JsonCodec()
+    assert server.json_codec.name == 'json'
+    assert server.get_project_properties() == props
+    server.json_codec = None
+    assert server.json_codec.name == default.name
+
+def test_compress_responses(server: kepconfig.connection.server):
+    assert server.compress_responses == False
+    project = server.export_project_configuration()
+    server.compress_responses = True
+    try:
+        # Same result whether or not Kepware compresses the response
+        assert server.export_project_configuration() == project
+        assert type(server.get_event_log(10)) == list
+    finally:
+        server.compress_responses = False
+
+def test_hooks_and_metrics(server: kepconfig.connection.server):
+    from kepconfig.metrics import MetricsRegistry
+    events = []
+    before = lambda info: events.append(('before', info.method, info.endpoint))
+    after = lambda info: events.append(('after', info.status))
+    server.add_hook('before', before)
+    server.add_hook('after', after)
+    server.metrics = MetricsRegistry()
+    try:
+        server.get_project_properties()
+        assert ('before', 'GET', '/project') in events
+        assert ('after', 200) in events
+        stats = server.metrics.as_dict()['GET /project']
+        assert stats['requests']['200'] >= 1
+        assert stats['response_bytes'] > 0
+        text = server.metrics.to_openmetrics()
+        assert 'kepconfig_requests_total{method="GET",endpoint="/project",code="200"}' in text
+        assert text.endswith('# EOF\n')
+    finally:
+        server.remove_hook('before', before)
+        server.remove_hook('after', after)
+        server.metrics = None
+    with pytest.raises(ValueError):
+        server.add_hook('unknown', before)
     
 
 def test_reinitialize_service_status(server: kepconfig.connection.server):
@@ -93,6 +345,23 @@ def test_reinitialize_service_status(server: kepconfig.connection.server):
     job = server.reinitialize(60)
     assert type(job) == kepconfig.connection.KepServiceResponse
 
+def test_wait_for_jobs(server: kepconfig.connection.server):
+    job = server.reinitialize()
+    status = server.wait_for_jobs(job, timeout=30)
+    assert type(status) == kepconfig.connection.KepServiceStatus
+    assert status.complete
+
+    jobs = [server.reinitialize(), server.backup_project(), kepconfig.connection.KepServiceResponse(429, 'Busy', '')]
+    results = server.wait_for_jobs(jobs, timeout=[30, 30, 30])
+    assert len(results) == 3
+    assert all(type(r) == kepconfig.connection.KepServiceStatus for r in results)
+    # Job that never started
+    assert results[2].complete == False
+    assert results[2].message == 'Busy'
+
+    with pytest.raises(kepconfig.error.KepError):
+        server.wait_for_jobs(jobs, timeout=[30])
+
 
 def test_project_props(server: kepconfig.connection.server):
     # Get Project Properties
@@ -247,6 +516,27 @@ def test_get_info(server: kepconfig.connection.server):
 
 def test_export_project_config(server: kepconfig.connection.server):
     assert type(server.export_project_configuration()) == dict
+
+def test_export_project_to_file(server: kepconfig.connection.server, tmp_path):
+    import json, gzip
+    project = server.export_project_configuration()
+    assert server.export_project_to_file(str(tmp_path / 'project.json')) > 0
+    with open(tmp_path / 'project.json') as f:
+        assert json.load(f)['project'].keys() == project['project'].keys()
+    # Compressed based on the file name
+    assert server.export_project_to_file(str(tmp_path / 'project.json.gz')) > 0
+    with gzip.open(tmp_path / 'project.json.gz') as f:
+        assert json.load(f)['project'].keys() == project['project'].keys()
+
+def test_iter_project_config(server: kepconfig.connection.server):
+    project = server.export_project_configuration()
+    items = list(server.iter_project_configuration())
+    # The project is returned last, without its collections
+    path, collection, obj = items[-1]
+    assert path == () and collection is None
+    assert 'channels' not in obj['project']
+    channels = [o['common.ALLTYPES_NAME'] for p, c, o in items if c == 'channels']
+    assert channels == [ch['common.ALLTYPES_NAME'] for ch in project['project'].get('channels', [])]
     
 def test_import_project_config(server: kepconfig.connection.server):
     project = server.export_project_configuration()
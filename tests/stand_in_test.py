@@ -0,0 +1,243 @@
+# -------------------------------------------------------------------------
+# Copyright (c) PTC Inc. All rights reserved.
+# See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+# Stand-in Test - Test the behaviour of the local Configuration API stand-in
+# that does not depend on a Kepware instance
+
+import os, sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import asyncio
+import json
+import time
+from kepconfig import error
+from kepconfig.connectivity import channel, device, tag
+from kepconfig.aio.connectivity import channel as aio_channel
+from kepconfig.structures import RetryPolicy, CachePolicy, DiskCache
+from kepconfig.testing import ProjectSpec, StandInServer, generate_project, iter_project_json
+import pytest
+
+ch_name = 'Channel1'
+dev_name = 'Device1'
+
+@pytest.fixture(scope="module")
+def stand_in():
+    with StandInServer(job_duration= 0.2) as stand_in:
+        yield stand_in
+
+@pytest.fixture
+def server(stand_in: StandInServer):
+    stand_in.reset()
+    server = stand_in.client()
+    channel.add_channel(server, {"common.ALLTYPES_NAME": ch_name, "servermain.MULTIPLE_TYPES_DEVICE_DRIVER": "Simulator"})
+    device.add_device(server, ch_name, {"common.ALLTYPES_NAME": dev_name, "servermain.MULTIPLE_TYPES_DEVICE_DRIVER": "Simulator"})
+    return server
+
+def test_multi_status(server, stand_in: StandInServer):
+    tags = [{"common.ALLTYPES_NAME": "Tag1"}, {"common.ALLTYPES_NAME": "Tag2"}]
+    assert tag.add_tag(server, f'{ch_name}.{dev_name}', tags)
+    # Names are not case sensitive, so only Tag3 is added
+    r = tag.add_tag(server, f'{ch_name}.{dev_name}', [{"common.ALLTYPES_NAME": "TAG1"}, {"common.ALLTYPES_NAME": "Tag3"}])
+    assert type(r) == list
+    assert stand_in.stats['POST 207'] == 1
+    assert len(tag.get_all_tags(server, f'{ch_name}.{dev_name}')) == 3
+
+def test_project_id(server, stand_in: StandInServer):
+    project_id = stand_in.project_id
+    assert device.get_device(server, f'{ch_name}.{dev_name}')['PROJECT_ID'] == project_id
+    with pytest.raises(error.KepHTTPError) as err:
+        device.modify_device(server, f'{ch_name}.{dev_name}', {"PROJECT_ID": project_id - 1, "servermain.DEVICE_SCAN_MODE_RATE_MS": 2000})
+    assert err.value.code == 400
+    assert device.modify_device(server, f'{ch_name}.{dev_name}', {"servermain.DEVICE_SCAN_MODE_RATE_MS": 2000})
+    assert stand_in.project_id == project_id + 1
+
+def test_project_id_tracking(server, stand_in: StandInServer):
+    server.project_id_tracking = True
+    dev_path = f'{ch_name}.{dev_name}'
+    device.get_device(server, dev_path)
+    stats = stand_in.stats
+    count = 5
+    for x in range(count):
+        assert device.modify_device(server, dev_path, {"servermain.DEVICE_SCAN_MODE_RATE_MS": 1000 + x})
+    sent = {key: value - stats.get(key, 0) for key, value in stand_in.stats.items()}
+    # The project isn't read before a modify and the tracked ID is advanced after each write
+    assert sent['PUT 200'] == count
+    assert sent.get('PUT 400', 0) == 0
+    assert sent.get('GET 200', 0) == 0
+    assert server.project_id_stats['hits'] == count
+    assert server.project_id_stats['conflicts'] == server.project_id_stats['refreshes'] == 0
+    assert server.project_id_stats['project_id'] == stand_in.project_id
+
+    # A change by another client is a conflict, the current ID is read and the modify sent again
+    stand_in.client().modify_project_properties({"servermain.PROJECT_TITLE": "Other"}, force= True)
+    assert device.modify_device(server, dev_path, {"servermain.DEVICE_SCAN_MODE_RATE_MS": 2000})
+    assert server.project_id_stats['conflicts'] == 1
+    assert server.project_id_stats['project_id'] == stand_in.project_id
+
+    # Other validation errors are raised without reading the PROJECT_ID
+    with pytest.raises(error.KepHTTPError):
+        device.modify_device(server, dev_path, {"common.ALLTYPES_NAME": "bad.name"})
+    assert server.project_id_stats['refreshes'] == 1
+
+def test_disk_cache_project_id(server, stand_in: StandInServer, tmp_path):
+    server.disk_cache = DiskCache(str(tmp_path))
+    def reads():
+        return stand_in.stats.get('GET 200', 0)
+
+    # The PROJECT_ID is read before and after the structure, a hit only reads it once
+    before = reads()
+    project = server.export_project_configuration()
+    assert reads() == before + 3
+    before = reads()
+    assert server.export_project_configuration() == project
+    assert reads() == before + 1
+
+    # The tracked PROJECT_ID is used without reading it
+    server.project_id_tracking = True
+    device.get_device(server, f'{ch_name}.{dev_name}')
+    before = reads()
+    assert server.export_project_configuration() == project
+    assert reads() == before
+    assert device.modify_device(server, f'{ch_name}.{dev_name}', {"servermain.DEVICE_SCAN_MODE_RATE_MS": 2000})
+    before = reads()
+    server.export_project_configuration()
+    assert reads() == before + 1
+    assert server.disk_cache_stats['stores'] == 2
+    assert server.disk_cache_stats['hits'] == 2
+
+def test_service_jobs(server, stand_in: StandInServer):
+    server.retry_policy = None
+    job = server.reinitialize()
+    assert job.code == 202
+    # A second service call is rejected while the first job runs
+    assert server.reinitialize().code == 429
+    assert not server.service_status(job).complete
+    assert server.wait_for_jobs([job], timeout= 5)[0].complete
+
+def test_project_load(server, stand_in: StandInServer):
+    project = server.export_project_configuration()
+    project['project']['channels'].append({"common.ALLTYPES_NAME": "Channel2"})
+    job = server.import_project_configuration(project)
+    assert server.wait_for_jobs([job], timeout= 5)[0].complete
+    assert len(channel.get_all_channels(server)) == 2
+    assert stand_in.export_project()['project']['channels'][1]['common.ALLTYPES_NAME'] == 'Channel2'
+
+def test_project_load_body(server, stand_in: StandInServer):
+    # The project is sent as one buffered body by default. When streamed, it is encoded once while it is 
+    # sent with chunked encoding and its size is counted as it is sent
+    sent = []
+    server.add_hook('after', lambda info: sent.append(info))
+    project = server.export_project_configuration()
+    for stream in (False, True):
+        job = server.import_project_configuration(project, stream= stream)
+        assert server.wait_for_jobs([job], timeout= 5)[0].complete
+    load = [info for info in sent if info.endpoint.endswith('JsonProjectLoad')]
+    assert load[0].request_bytes is not None
+    assert load[1].request_bytes == len(json.dumps(project).encode('utf-8'))
+
+def test_project_load_cache(server, stand_in: StandInServer, tmp_path):
+    server.cache_policy = CachePolicy(ttl= 60)
+    server.disk_cache = DiskCache(str(tmp_path))
+    project = server.export_project_configuration()
+    assert len(channel.get_all_channels(server)) == 1
+    assert channel.get_channel(server, ch_name)['common.ALLTYPES_NAME'] == ch_name
+    project['project']['channels'] = []
+    job = server.import_project_configuration(project)
+    # Reads sent while the project is loaded are not cached
+    channel.get_all_channels(server)
+    assert server.wait_for_jobs([job], timeout= 5)[0].complete
+    assert channel.get_all_channels(server) == []
+    with pytest.raises(error.KepHTTPError) as err:
+        channel.get_channel(server, ch_name)
+    assert err.value.code == 404
+    assert server.export_project_configuration()['project'].get('channels', []) == []
+    assert server.disk_cache_stats['hits'] == 0
+
+def test_inject_error(server, stand_in: StandInServer):
+    stand_in.inject_error(503, method= 'GET', path= '/project/channels/*')
+    with pytest.raises(error.KepHTTPError) as err:
+        channel.get_channel(server, ch_name)
+    assert err.value.code == 503
+    assert type(channel.get_channel(server, ch_name)) == dict
+
+    # Injected 429 responses are retried by the SDK
+    server.retry_policy = RetryPolicy(max_attempts= 3, backoff_factor= 0.01)
+    stand_in.inject_error(429, 2, path= '/project/channels/*', retry_after= 0)
+    assert type(channel.get_channel(server, ch_name)) == dict
+    assert stand_in.stats['GET 429'] == 2
+
+def test_unexpected_status(server, stand_in: StandInServer):
+    # Responses with a status that the call doesn't expect raise KepHTTPError from both clients
+    stand_in.inject_error(202, 2, method= 'DELETE')
+    with pytest.raises(error.KepHTTPError) as err:
+        device.del_device(server, f'{ch_name}.{dev_name}')
+    assert err.value.code == 202
+
+    async def run():
+        async with stand_in.async_client() as server:
+            with pytest.raises(error.KepHTTPError) as err:
+                await aio_channel.del_channel(server, ch_name)
+            assert err.value.code == 202
+    asyncio.run(run())
+    assert type(channel.get_channel(server, ch_name)) == dict
+
+def test_log_paging(server, stand_in: StandInServer):
+    # 2 entries are logged for the channel and device added by the fixture
+    stand_in.populate_logs(23)
+    # Paged log reads end with the pagination information
+    r = server.get_event_log(options= {'pageSize': 10, 'pageNumber': 3})
+    assert len(r) == 6
+    assert r[-1]['pagination']['totalPages'] == 3
+
+def test_latency():
+    with StandInServer(latency= 0.05) as stand_in:
+        server = stand_in.client()
+        start = time.perf_counter()
+        server.get_info()
+        assert time.perf_counter() - start >= 0.05
+
+def test_authentication():
+    with StandInServer(user= 'User1', password= 'Password1') as stand_in:
+        assert type(stand_in.client().get_info()) == dict
+        server = stand_in.client()
+        server.password = 'Wrong'
+        with pytest.raises(error.KepHTTPError) as err:
+            server.get_info()
+        assert err.value.code == 401
+
+def test_project_generator(server, stand_in: StandInServer):
+    spec = ProjectSpec.parse('1x2x2/2x5,iot=1x4,log=1x3,adv=2,seed=3')
+    assert str(spec) == '1x2x2/2x5,iot=1x4,log=1x3,adv=2,seed=3'
+    project = generate_project(spec)
+    assert project == generate_project(ProjectSpec.parse(str(spec)))
+    assert json.loads(b''.join(iter_project_json(spec, 64))) == project
+    with pytest.raises(ValueError):
+        ProjectSpec(tags= 0, iot_agents= 1, iot_items= 1)
+
+    stand_in.load_project(project)
+    assert len(tag.get_all_tags(server, f'{ch_name}.{dev_name}')) == 5
+    for i in (0, spec.tag_count - 1):
+        assert type(tag.get_tag(server, spec.tag_path(i))) == dict
+
+def test_serialize_fallback(server, stand_in: StandInServer):
+    dev_path = f'{ch_name}.{dev_name}'
+    tag.add_tag(server, dev_path, [{"common.ALLTYPES_NAME": "Tag1"}])
+    def reads():
+        return stand_in.stats.get('GET 200', 0)
+
+    # An error for the object is raised and doesn't stop serialized reads
+    stand_in.inject_error(400, method= 'GET', path= '/project/channels/*')
+    with pytest.raises(error.KepHTTPError):
+        device.get_device_structure(server, dev_path, serialize= True)
+    before = reads()
+    assert len(device.get_device_structure(server, dev_path, serialize= True)['tags']) == 1
+    assert reads() == before + 1
+
+    # Kepware versions without serialized content fall back to walking the device
+    stand_in.inject_error(501, method= 'GET', path= '/project/channels/*')
+    assert len(device.get_device_structure(server, dev_path, serialize= True)['tags']) == 1
+    before = reads()
+    device.get_device_structure(server, dev_path, serialize= True)
+    assert reads() > before + 1